@@ -0,0 +1,16 @@
+"""Capacity entity.
+
+The maximum sustainable throughput of the databases can be searched.
+"""
+
+from flask import Flask
+from flask_restx import Api
+
+BASE_ROUTE: str = "capacity"
+
+
+def register_routes(api: Api, app: Flask, root: str) -> None:
+    """Register all capacity routes."""
+    from .controller import api as capacity_api
+
+    api.add_namespace(capacity_api, path=f"{root}/{BASE_ROUTE}")
@@ -0,0 +1,40 @@
+"""Controllers of the capacity search."""
+from typing import Union
+
+from flask import request
+from flask.wrappers import Response
+from flask_accepts import accepts, responds
+from flask_restx import Namespace, Resource
+
+from .interface import CapacitySearchInterface
+from .model import CapacityResult
+from .schema import CapacityResultSchema, CapacitySearchSchema
+from .service import CapacityService
+
+api = Namespace("Capacity", description="Search the maximum sustainable throughput.")
+
+
+@api.route("/")
+class CapacityController(Resource):
+    """Controller of the capacity search."""
+
+    @api.response(404, "No capacity search was started.")
+    @responds(schema=CapacityResultSchema, api=api)
+    def get(self) -> Union[CapacityResult, Response]:
+        """Get the state and the capacities of the last search."""
+        result = CapacityService.get_result()
+        return Response(status=404) if result is None else result
+
+    @api.response(400, "No database is active or the configuration is invalid.")
+    @api.response(404, "A Workload with the given type doesn't exist.")
+    @api.response(409, "A capacity search is already running.")
+    @accepts(schema=CapacitySearchSchema, api=api)
+    def post(self) -> Response:
+        """Start a capacity search on all active databases."""
+        interface: CapacitySearchInterface = request.parsed_obj  # type: ignore
+        return Response(status=CapacityService.start_search(interface))
+
+    @api.response(404, "No capacity search is running.")
+    def delete(self) -> Response:
+        """Stop the running capacity search."""
+        return Response(status=CapacityService.stop_search())
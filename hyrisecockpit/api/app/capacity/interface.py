@@ -0,0 +1,39 @@
+"""Interface of a capacity search."""
+from typing import Dict, List, Optional, TypedDict
+
+
+class CapacitySearchInterface(TypedDict):
+    """Interface of the configuration of a capacity search."""
+
+    workload_type: str
+    scale_factor: float
+    weights: Dict[str, float]
+    latency_slo: float
+    max_queue_growth: float
+    min_frequency: int
+    max_frequency: int
+    tolerance: float
+    settle_duration: float
+    probe_duration: float
+
+
+class DatabaseCapacityInterface(TypedDict):
+    """Interface of the capacity of a database."""
+
+    id: str
+    max_sustainable_frequency: int
+    failed_frequency: Optional[int]
+    bounded: bool
+    throughput: Optional[float]
+    latency: Optional[float]
+    queue_growth: Optional[float]
+
+
+class CapacityResultInterface(TypedDict):
+    """Interface of the result of a capacity search."""
+
+    status: str
+    startts: int
+    frequency: Optional[int]
+    probes: int
+    databases: List[DatabaseCapacityInterface]
@@ -0,0 +1,44 @@
+"""Model of a capacity search."""
+from typing import List, Optional
+
+
+class DatabaseCapacity:
+    """Model of the capacity of a database."""
+
+    def __init__(
+        self,
+        id: str,
+        max_sustainable_frequency: int,
+        failed_frequency: Optional[int],
+        bounded: bool,
+        throughput: Optional[float],
+        latency: Optional[float],
+        queue_growth: Optional[float],
+    ):
+        """Initialize a database capacity model."""
+        self.id: str = id
+        self.max_sustainable_frequency: int = max_sustainable_frequency
+        self.failed_frequency: Optional[int] = failed_frequency
+        self.bounded: bool = bounded
+        self.throughput: Optional[float] = throughput
+        self.latency: Optional[float] = latency
+        self.queue_growth: Optional[float] = queue_growth
+
+
+class CapacityResult:
+    """Model of the result of a capacity search."""
+
+    def __init__(
+        self,
+        status: str,
+        startts: int,
+        frequency: Optional[int],
+        probes: int,
+        databases: List[DatabaseCapacity],
+    ):
+        """Initialize a capacity result model."""
+        self.status: str = status
+        self.startts: int = startts
+        self.frequency: Optional[int] = frequency
+        self.probes: int = probes
+        self.databases: List[DatabaseCapacity] = databases
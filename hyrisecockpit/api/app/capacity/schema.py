@@ -0,0 +1,119 @@
+"""Schema of a capacity search."""
+from marshmallow import Schema
+from marshmallow.fields import Boolean, Dict, Float, Integer, List, Nested, String
+
+
+class CapacitySearchSchema(Schema):
+    """Schema of the configuration of a capacity search."""
+
+    workload_type = String(
+        description="Name of the workload that is probed.",
+        required=True,
+        example="tpcc",
+    )
+    scale_factor = Float(
+        description="Scale factor of the workload.", required=True, example=5.0
+    )
+    weights = Dict(
+        keys=String(description="Name of the query."),
+        values=Float(description="Weight of the query."),
+        description="Weights of queries used for generation.",
+    )
+    latency_slo = Float(
+        description="Highest sustainable mean latency in milliseconds.",
+        required=True,
+        example=50.0,
+    )
+    max_queue_growth = Float(
+        description="Highest sustainable growth of the queue in tasks per second.",
+        required=True,
+        example=10.0,
+    )
+    min_frequency = Integer(
+        description="Lowest probed number of queries per second.",
+        required=True,
+        example=100,
+    )
+    max_frequency = Integer(
+        description="Highest probed number of queries per second.",
+        required=True,
+        example=10000,
+    )
+    tolerance = Float(
+        description="Relative width of the frequency interval that ends the search.",
+        example=0.05,
+    )
+    settle_duration = Float(
+        description="Seconds between setting a frequency and measuring it.",
+        example=5.0,
+    )
+    probe_duration = Float(
+        description="Seconds a frequency is measured.",
+        example=20.0,
+    )
+
+
+class DatabaseCapacitySchema(Schema):
+    """Schema of the capacity of a database."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    max_sustainable_frequency = Integer(
+        description="Highest frequency the database sustained.",
+        required=True,
+        example=2400,
+    )
+    failed_frequency = Integer(
+        description="Lowest frequency the database didn't sustain.",
+        allow_none=True,
+        example=2500,
+    )
+    bounded = Boolean(
+        description="The database failed a frequency, otherwise the maximum "
+        "frequency is only a lower bound of its capacity.",
+        required=True,
+        example=True,
+    )
+    throughput = Float(
+        description="Mean throughput at the highest sustained frequency.",
+        allow_none=True,
+        example=2398.5,
+    )
+    latency = Float(
+        description="Mean latency in milliseconds at the highest sustained frequency.",
+        allow_none=True,
+        example=31.2,
+    )
+    queue_growth = Float(
+        description="Queue growth in tasks per second at the highest sustained frequency.",
+        allow_none=True,
+        example=0.4,
+    )
+
+
+class CapacityResultSchema(Schema):
+    """Schema of the result of a capacity search."""
+
+    status = String(
+        description="State of the search: running, finished, stopped or failed.",
+        required=True,
+        example="finished",
+    )
+    startts = Integer(
+        description="Timestamp in nanoseconds since epoch the search started.",
+        required=True,
+        example=1585762457000000000,
+    )
+    frequency = Integer(
+        description="Frequency that is currently probed.",
+        allow_none=True,
+        example=None,
+    )
+    probes = Integer(
+        description="Number of measured frequencies.", required=True, example=9
+    )
+    databases = List(Nested(DatabaseCapacitySchema))
@@ -0,0 +1,220 @@
+"""Search of the maximum sustainable throughput of the databases.
+
+All databases execute the same published workload, so every probed
+frequency is measured on all databases at once. A database sustains a
+frequency if its mean latency stays within the latency SLO and its queue
+grows by at most the allowed tasks per second. Every database keeps its own
+interval between the highest sustained and the lowest failed frequency.
+Until a database fails, the frequency is doubled. Afterwards the frequency
+in the middle of the widest interval is probed, until every interval is
+narrower than the tolerance. A database that sustains the maximum frequency
+is reported with the maximum as a lower bound of its capacity, a database
+that fails the minimum frequency with a capacity of zero.
+"""
+from threading import Event, Lock, Thread
+from time import time_ns
+from typing import Callable, Dict, List, Optional, TypedDict
+
+from .interface import CapacitySearchInterface
+
+
+class ProbeMeasurement(TypedDict):
+    """Measurement of a database during a probe."""
+
+    latency: float
+    queue_growth: float
+    throughput: float
+
+
+class DatabaseInterval:
+    """Sustained and failed frequencies of a database."""
+
+    def __init__(self) -> None:
+        """Initialize a DatabaseInterval."""
+        self.sustained: Dict[int, ProbeMeasurement] = {}
+        self.failed: List[int] = []
+
+    def get_upper(self) -> Optional[int]:
+        """Return the lowest failed frequency."""
+        return min(self.failed, default=None)
+
+    def get_lower(self) -> int:
+        """Return the highest sustained frequency below the lowest failed one."""
+        upper = self.get_upper()
+        return max(
+            (
+                frequency
+                for frequency in self.sustained
+                if upper is None or frequency < upper
+            ),
+            default=0,
+        )
+
+
+class CapacitySearch(Thread):
+    """Probes frequencies until the capacity of every database is found."""
+
+    def __init__(
+        self,
+        configuration: CapacitySearchInterface,
+        databases: List[str],
+        set_frequency: Callable[[int], None],
+        measure: Callable[[int, int], Dict[str, ProbeMeasurement]],
+        get_queue_lengths: Callable[[], Dict[str, int]],
+        on_finish: Callable[[], None],
+    ) -> None:
+        """Initialize a CapacitySearch.
+
+        Args:
+            configuration: SLO, frequency range and durations of the search.
+            databases: IDs of the searched databases.
+            set_frequency: Publishes the workload with a frequency.
+            measure: Returns the measurements of the databases in a time range.
+            get_queue_lengths: Returns the current queue lengths of the databases.
+            on_finish: Called when the search ends, e.g. to restore the workload.
+        """
+        super().__init__(daemon=True)
+        self._configuration: CapacitySearchInterface = configuration
+        self._set_frequency: Callable[[int], None] = set_frequency
+        self._measure: Callable[[int, int], Dict[str, ProbeMeasurement]] = measure
+        self._get_queue_lengths: Callable[[], Dict[str, int]] = get_queue_lengths
+        self._on_finish: Callable[[], None] = on_finish
+        self._intervals: Dict[str, DatabaseInterval] = {
+            database: DatabaseInterval() for database in databases
+        }
+        self._lock: Lock = Lock()
+        self._stop_event: Event = Event()
+        self._status: str = "running"
+        self._frequency: Optional[int] = None
+        self._probes: int = 0
+        self._startts: int = time_ns()
+
+    def _sustains(self, measurement: Optional[ProbeMeasurement]) -> bool:
+        if measurement is None:
+            return False
+        return (
+            measurement["latency"] <= self._configuration["latency_slo"] * 1_000_000
+            and measurement["queue_growth"] <= self._configuration["max_queue_growth"]
+        )
+
+    def get_next_frequency(self) -> Optional[int]:
+        """Return the next frequency to probe or None if the search is done."""
+        maximum = self._configuration["max_frequency"]
+        unbounded = [
+            interval.get_lower()
+            for interval in self._intervals.values()
+            if interval.get_upper() is None and interval.get_lower() < maximum
+        ]
+        if unbounded:
+            lower = max(unbounded)
+            if lower == 0:
+                return self._configuration["min_frequency"]
+            return min(lower * 2, maximum)
+        gaps = [
+            (interval.get_upper() - interval.get_lower(), interval)  # type: ignore
+            for interval in self._intervals.values()
+            if interval.get_upper() is not None
+            and interval.get_upper() > self._configuration["min_frequency"]  # type: ignore
+        ]
+        gap, widest = max(gaps, key=lambda gap: gap[0], default=(0, None))
+        if widest is None or gap <= max(
+            self._configuration["tolerance"] * widest.get_upper(), 1  # type: ignore
+        ):
+            return None
+        return (widest.get_lower() + widest.get_upper()) // 2  # type: ignore
+
+    def record_probe(
+        self, frequency: int, measurements: Dict[str, ProbeMeasurement]
+    ) -> bool:
+        """Record the measurements of a probe and return if all sustained it."""
+        all_sustained = True
+        with self._lock:
+            self._probes += 1
+            for database, interval in self._intervals.items():
+                measurement = measurements.get(database)
+                if self._sustains(measurement):
+                    interval.sustained[frequency] = measurement  # type: ignore
+                else:
+                    interval.failed.append(frequency)
+                    all_sustained = False
+        return all_sustained
+
+    def _drain(self) -> None:
+        """Pause the workload until the queues of the failed probe are empty."""
+        self._set_frequency(0)
+        timeout = time_ns() + int(self._configuration["probe_duration"] * 1e9)
+        while time_ns() < timeout and any(self._get_queue_lengths().values()):
+            if self._stop_event.wait(1.0):
+                return
+
+    def _probe(self, frequency: int) -> Optional[Dict[str, ProbeMeasurement]]:
+        """Publish a frequency and measure it after the settle time."""
+        with self._lock:
+            self._frequency = frequency
+        self._set_frequency(frequency)
+        if self._stop_event.wait(self._configuration["settle_duration"]):
+            return None
+        startts = time_ns()
+        if self._stop_event.wait(self._configuration["probe_duration"]):
+            return None
+        return self._measure(startts, time_ns())
+
+    def run(self) -> None:
+        """Probe frequencies until the search is done or stopped."""
+        status = "finished"
+        try:
+            frequency = self.get_next_frequency()
+            while frequency is not None:
+                measurements = self._probe(frequency)
+                if measurements is None:
+                    status = "stopped"
+                    break
+                if not self.record_probe(frequency, measurements):
+                    self._drain()
+                frequency = self.get_next_frequency()
+            if self._stop_event.is_set():
+                status = "stopped"
+        except Exception:  # noqa
+            status = "failed"
+        finally:
+            self._on_finish()
+            with self._lock:
+                self._status = status
+                self._frequency = None
+
+    def stop(self) -> None:
+        """Stop the search and wait for it."""
+        self._stop_event.set()
+        self.join()
+
+    def get_result(self) -> Dict:
+        """Return the state and the capacities found so far."""
+        with self._lock:
+            databases = []
+            for database, interval in self._intervals.items():
+                lower = interval.get_lower()
+                measurement = interval.sustained.get(lower)
+                databases.append(
+                    {
+                        "id": database,
+                        "max_sustainable_frequency": lower,
+                        "failed_frequency": interval.get_upper(),
+                        "bounded": interval.get_upper() is not None,
+                        "throughput": None
+                        if measurement is None
+                        else measurement["throughput"],
+                        "latency": None
+                        if measurement is None
+                        else measurement["latency"] / 1_000_000,
+                        "queue_growth": None
+                        if measurement is None
+                        else measurement["queue_growth"],
+                    }
+                )
+            return {
+                "status": self._status,
+                "startts": self._startts,
+                "frequency": self._frequency,
+                "probes": self._probes,
+                "databases": databases,
+            }
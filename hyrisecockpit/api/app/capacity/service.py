@@ -0,0 +1,231 @@
+"""Services of the capacity search.
+
+The search runs in a thread of the API. It sets the frequency of the probed
+workload through the workload generator, reads the latency, queue length and
+throughput series the continuous jobs write to the storage, and asks the
+database manager for the live queue lengths while the queues drain. When the
+search ends, the workload is restored.
+"""
+from functools import partial
+from threading import Lock
+from typing import Dict, List, Optional
+
+from hyrisecockpit.api.app.connection_manager import ManagerSocket, StorageConnection
+from hyrisecockpit.api.app.shared import _get_active_databases
+from hyrisecockpit.api.app.workload.interface import BaseWorkloadInterface
+from hyrisecockpit.api.app.workload.model import DetailedWorkload
+from hyrisecockpit.api.app.workload.service import WorkloadService
+from hyrisecockpit.request import Header, Request
+from influxdb import InfluxDBClient
+
+from .interface import CapacitySearchInterface
+from .model import CapacityResult, DatabaseCapacity
+from .search import CapacitySearch, ProbeMeasurement
+
+DEFAULT_TOLERANCE: float = 0.05
+DEFAULT_SETTLE_DURATION: float = 5.0
+DEFAULT_PROBE_DURATION: float = 20.0
+
+search_lock = Lock()
+capacity_search: Optional[CapacitySearch] = None
+
+
+def _is_valid(configuration: CapacitySearchInterface) -> bool:
+    return (
+        configuration["latency_slo"] > 0
+        and configuration["max_queue_growth"] >= 0
+        and 1 <= configuration["min_frequency"] <= configuration["max_frequency"]
+        and 0 < configuration["tolerance"] < 1
+        and configuration["settle_duration"] >= 0
+        and configuration["probe_duration"] > 0
+    )
+
+
+def _query_point(
+    client: InfluxDBClient, query: str, table: str, database: str, startts, endts
+) -> Optional[Dict]:
+    points = list(
+        client.query(
+            query,
+            database=database,
+            bind_params={"startts": startts, "endts": endts},
+            epoch=True,
+        )[table, None]
+    )
+    return points[0] if points else None
+
+
+class CapacityService:
+    """Services of the Capacity Controller."""
+
+    @staticmethod
+    def _send_message_to_dbm(message: Request) -> Dict:
+        """Send an IPC message to the database manager."""
+        with ManagerSocket() as socket:
+            return socket.send_message(message)
+
+    @staticmethod
+    def _get_workload(workload_type: str) -> Optional[DetailedWorkload]:
+        for workload in WorkloadService.get_all():
+            if workload.workload_type == workload_type:
+                return workload
+        return None
+
+    @staticmethod
+    def _measure_database(
+        client: InfluxDBClient, database: str, startts: int, endts: int
+    ) -> Optional[ProbeMeasurement]:
+        """Return the mean latency, queue growth and throughput of a database."""
+        where = "WHERE time >= $startts AND time < $endts"
+        latency = _query_point(
+            client,
+            f'SELECT mean("latency") AS "latency" FROM latency {where}',
+            "latency",
+            database,
+            startts,
+            endts,
+        )
+        queue_length = _query_point(
+            client,
+            f'SELECT first("queue_length") AS "first", last("queue_length") AS "last" FROM queue_length {where}',
+            "queue_length",
+            database,
+            startts,
+            endts,
+        )
+        throughput = _query_point(
+            client,
+            f'SELECT mean("throughput") AS "throughput" FROM throughput {where}',
+            "throughput",
+            database,
+            startts,
+            endts,
+        )
+        if latency is None or queue_length is None or latency["latency"] is None:
+            return None
+        return ProbeMeasurement(
+            latency=latency["latency"],
+            queue_growth=(queue_length["last"] - queue_length["first"])
+            * 1_000_000_000
+            / (endts - startts),
+            throughput=0.0 if throughput is None else throughput["throughput"],
+        )
+
+    @classmethod
+    def measure(
+        cls, databases: List[str], startts: int, endts: int
+    ) -> Dict[str, ProbeMeasurement]:
+        """Return the measurements of the databases with data in a time range."""
+        measurements: Dict[str, ProbeMeasurement] = {}
+        with StorageConnection() as client:
+            for database in databases:
+                measurement = cls._measure_database(client, database, startts, endts)
+                if measurement is not None:
+                    measurements[database] = measurement
+        return measurements
+
+    @classmethod
+    def get_queue_lengths(cls) -> Dict[str, int]:
+        """Return the live queue lengths of the databases."""
+        response = cls._send_message_to_dbm(
+            Request(header=Header(message="queue length"), body={})
+        )
+        return response["body"]["queue_length"]
+
+    @staticmethod
+    def set_frequency(configuration: CapacitySearchInterface, frequency: int) -> None:
+        """Publish the probed workload with a frequency."""
+        WorkloadService.update_by_id(
+            BaseWorkloadInterface(
+                workload_type=configuration["workload_type"],
+                frequency=frequency,
+                scale_factor=configuration["scale_factor"],
+                weights=configuration["weights"],
+            )
+        )
+
+    @staticmethod
+    def restore_workload(workload: DetailedWorkload) -> None:
+        """Restore the probed workload as it was before the search."""
+        if not workload.running:
+            WorkloadService.delete_by_id(workload.workload_type)
+            return
+        WorkloadService.update_by_id(
+            BaseWorkloadInterface(
+                workload_type=workload.workload_type,
+                frequency=workload.frequency,
+                scale_factor=workload.scale_factor,
+                weights=workload.weights,
+                profile=workload.profile,  # type: ignore
+            )
+        )
+
+    @classmethod
+    def start_search(cls, interface: CapacitySearchInterface) -> int:
+        """Start a capacity search on all active databases.
+
+        Returns 400 if the configuration is invalid or no database is active,
+        404 if the workload doesn't exist and 409 if a search is running.
+        """
+        global capacity_search
+        configuration = CapacitySearchInterface(  # type: ignore
+            {
+                "weights": {},
+                "tolerance": DEFAULT_TOLERANCE,
+                "settle_duration": DEFAULT_SETTLE_DURATION,
+                "probe_duration": DEFAULT_PROBE_DURATION,
+                **interface,
+            }
+        )
+        databases = list(_get_active_databases())
+        if not _is_valid(configuration) or not databases:
+            return 400
+        with search_lock:
+            if capacity_search is not None and capacity_search.is_alive():
+                return 409
+            workload = cls._get_workload(configuration["workload_type"])
+            if workload is None:
+                return 404
+            if configuration["scale_factor"] not in workload.supported_scale_factors:
+                return 400
+            capacity_search = CapacitySearch(
+                configuration,
+                databases,
+                partial(cls.set_frequency, configuration),
+                partial(cls.measure, databases),
+                cls.get_queue_lengths,
+                partial(cls.restore_workload, workload),
+            )
+            capacity_search.start()
+        return 200
+
+    @staticmethod
+    def stop_search() -> int:
+        """Stop the running capacity search.
+
+        Returns 404 if no search is running.
+        """
+        with search_lock:
+            if capacity_search is None or not capacity_search.is_alive():
+                return 404
+            capacity_search.stop()
+        return 200
+
+    @staticmethod
+    def get_result() -> Optional[CapacityResult]:
+        """Return the state and the capacities of the last search.
+
+        Returns None if no search was started.
+        """
+        if capacity_search is None:
+            return None
+        result = capacity_search.get_result()
+        return CapacityResult(
+            status=result["status"],
+            startts=result["startts"],
+            frequency=result["frequency"],
+            probes=result["probes"],
+            databases=[
+                DatabaseCapacity(**database) for database in result["databases"]
+            ],
+        )
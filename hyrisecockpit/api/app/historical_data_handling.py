@@ -3,6 +3,8 @@ from typing import Dict, List, Tuple, Union
 
 from influxdb import InfluxDBClient
 
+from hyrisecockpit.latency_histogram import LATENCY_PERCENTILES, LatencyHistogram
+
 from .shared import _get_active_databases
 
 
@@ -104,3 +106,74 @@ def get_historical_metric(
         }
         result.append(database_data)
     return result
+
+
+def _get_latency_percentile_entries(
+    startts: int, endts: int, precision_ns: int, points: List[Dict]
+) -> List[Dict[str, int]]:
+    """Get latency percentiles for every interval of the precision_ns length.
+
+    Percentiles can't be averaged, so the histograms of the seconds in an interval
+    are merged. A precision of one second uses the precalculated percentiles.
+    """
+    entries: List[Dict[str, int]] = []
+    if precision_ns == 1_000_000_000:
+        points_by_time: Dict[int, Dict] = {point["time"]: point for point in points}
+        for timestamp in range(startts, endts, precision_ns):
+            point = points_by_time.get(timestamp, {})
+            entry: Dict[str, int] = {"timestamp": timestamp}
+            for name in LATENCY_PERCENTILES:
+                entry[name] = point.get(name) or 0
+            entries.append(entry)
+        return entries
+
+    histograms: Dict[int, LatencyHistogram] = {}
+    for point in points:
+        interval = point["time"] - (point["time"] - startts) % precision_ns
+        histograms.setdefault(interval, LatencyHistogram()).merge(
+            LatencyHistogram.decode(point["latency_histogram"] or "")
+        )
+    for timestamp in range(startts, endts, precision_ns):
+        histogram = histograms.get(timestamp, LatencyHistogram())
+        entry = {"timestamp": timestamp}
+        entry.update(
+            {
+                name: histogram.get_percentile(percentile)
+                for name, percentile in LATENCY_PERCENTILES.items()
+            }
+        )
+        entries.append(entry)
+    return entries
+
+
+def get_historical_latency_percentiles(
+    startts: int,
+    endts: int,
+    precision_ns: int,
+    condition: str,
+    database: str,
+    client: InfluxDBClient,
+) -> Dict[Tuple[str, str], List[Dict[str, int]]]:
+    """Get historical latency percentiles per benchmark and query type.
+
+    The condition selects the rolled up series of the latency_percentiles table.
+    """
+    if precision_ns == 1_000_000_000:
+        fields = ",".join(f'"{name}"' for name in LATENCY_PERCENTILES)
+    else:
+        fields = '"latency_histogram"'
+    result = client.query(
+        f"""SELECT {fields}
+        FROM latency_percentiles
+        WHERE time >= $startts AND time < $endts AND {condition}
+        GROUP BY benchmark, query_no;""",
+        database=database,
+        bind_params={"startts": startts, "endts": endts},
+        epoch=True,
+    )
+    return {
+        (tags["benchmark"], tags["query_no"]): _get_latency_percentile_entries(
+            startts, endts, precision_ns, list(points)
+        )
+        for (_, tags), points in result.items()
+    }
@@ -14,19 +14,33 @@ from flask_accepts import accepts, responds
 from flask_restx import Namespace, Resource
 
 from .model import (
+    ConnectionStatistics,
+    DetailedLatencyPercentiles,
     DetailedQueryInformation,
+    EndToEndLatency,
     Latency,
+    LatencyPercentiles,
     NegativeThroughput,
     QueueLength,
+    QueueWaitTime,
+    ResponseTime,
+    TargetThroughput,
     Throughput,
     TimeInterval,
     MemoryFootprint,
 )
 from .schema import (
+    ConnectionStatisticsSchema,
+    DetailedLatencyPercentilesSchema,
     DetailedQueryInformationSchema,
+    EndToEndLatencySchema,
+    LatencyPercentilesSchema,
     LatencySchema,
     NegativeThroughputSchema,
     QueueLengthSchema,
+    QueueWaitTimeSchema,
+    ResponseTimeSchema,
+    TargetThroughputSchema,
     ThroughputSchema,
     MemoryFootprintSchema,
 )
@@ -77,6 +91,27 @@ class NegativeThroughputController(Resource):
         return MetricService.get_negative_throughput(time_interval)
 
 
+@api.route("/target_throughput")
+class TargetThroughputController(Resource):
+    """Controller of the throughput targeted by the workload generator."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=TargetThroughputSchema(many=True), api=api)
+    def get(self) -> List[TargetThroughput]:
+        """Get target throughput data for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_target_throughput(time_interval)
+
+
 @api.route("/latency")
 class LatencyController(Resource):
     """Controller for latency data."""
@@ -98,6 +133,90 @@ class LatencyController(Resource):
         return MetricService.get_latency(time_interval)
 
 
+@api.route("/response_time")
+class ResponseTimeController(Resource):
+    """Controller for response time data."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=ResponseTimeSchema(many=True), api=api)
+    def get(self) -> List[ResponseTime]:
+        """Get response time data for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_response_time(time_interval)
+
+
+@api.route("/queue_wait_time")
+class QueueWaitTimeController(Resource):
+    """Controller for queue wait time data."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=QueueWaitTimeSchema(many=True), api=api)
+    def get(self) -> List[QueueWaitTime]:
+        """Get queue wait time data for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_queue_wait_time(time_interval)
+
+
+@api.route("/connection_statistics")
+class ConnectionStatisticsController(Resource):
+    """Controller for connection statistics data."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=ConnectionStatisticsSchema(many=True), api=api)
+    def get(self) -> List[ConnectionStatistics]:
+        """Get connection statistics for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_connection_statistics(time_interval)
+
+
+@api.route("/end_to_end_latency")
+class EndToEndLatencyController(Resource):
+    """Controller for end-to-end latency data."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=EndToEndLatencySchema(many=True), api=api)
+    def get(self) -> List[EndToEndLatency]:
+        """Get end-to-end latency data for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_end_to_end_latency(time_interval)
+
+
 @api.route("/queue_length")
 class QueueLengthController(Resource):
     """Controller for queue length data."""
@@ -138,6 +257,69 @@ class MemoryFootprintController(Resource):
         return MetricService.get_memory_footprint(time_interval)
 
 
+@api.route("/latency_percentiles")
+class LatencyPercentilesController(Resource):
+    """Controller for latency percentiles."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=LatencyPercentilesSchema(many=True), api=api)
+    def get(self) -> List[LatencyPercentiles]:
+        """Get latency percentiles for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_latency_percentiles(time_interval)
+
+
+@api.route("/latency_percentiles/benchmark")
+class BenchmarkLatencyPercentilesController(Resource):
+    """Controller for latency percentiles per benchmark."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=DetailedLatencyPercentilesSchema(many=True), api=api)
+    def get(self) -> List[DetailedLatencyPercentiles]:
+        """Get latency percentiles per benchmark for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_benchmark_latency_percentiles(time_interval)
+
+
+@api.route("/latency_percentiles/query")
+class QueryLatencyPercentilesController(Resource):
+    """Controller for latency percentiles per query type."""
+
+    @accepts(
+        dict(name="startts", type=int),  # noqa
+        dict(name="endts", type=int),  # noqa
+        dict(name="precision", type=int),  # noqa
+        api=api,
+    )
+    @responds(schema=DetailedLatencyPercentilesSchema(many=True), api=api)
+    def get(self) -> List[DetailedLatencyPercentiles]:
+        """Get latency percentiles per query type for the requested time interval."""
+        time_interval: TimeInterval = TimeInterval(
+            startts=request.parsed_args["startts"],  # type: ignore
+            endts=request.parsed_args["endts"],  # type: ignore
+            precision=request.parsed_args["precision"],  # type: ignore
+        )
+        return MetricService.get_query_latency_percentiles(time_interval)
+
+
 @api.route("/detailed_query_information")
 class DetailedQueryInformationController(Resource):
     """Controller for detailed query information."""
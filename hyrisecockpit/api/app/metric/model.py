@@ -20,6 +20,7 @@ class DetailedQueryEntry:
         throughput: float,
         latency: float,
         scale_factor: float,
+        abort_rate: float,
     ):
         """Initialize a DetailedQueryEntry model."""
         self.benchmark: str = benchmark
@@ -27,6 +28,7 @@ class DetailedQueryEntry:
         self.scale_factor: float = scale_factor
         self.throughput: float = throughput
         self.latency: float = latency
+        self.abort_rate: float = abort_rate
 
 
 class DetailedQueryInformation:
@@ -86,6 +88,24 @@ class NegativeThroughput:
         self.negative_throughput: List[NegativeThroughputEntry] = negative_throughput
 
 
+class TargetThroughputEntry:
+    """Model of a target throughput entry."""
+
+    def __init__(self, timestamp: int, target_throughput: float):
+        """Initialize a target throughput entry model."""
+        self.timestamp: int = timestamp
+        self.target_throughput: float = target_throughput
+
+
+class TargetThroughput:
+    """Model of a target throughput."""
+
+    def __init__(self, id: str, target_throughput: List[TargetThroughputEntry]):
+        """Initialize a target throughput model."""
+        self.id: str = id
+        self.target_throughput: List[TargetThroughputEntry] = target_throughput
+
+
 class LatencyEntry:
     """Model of a latency entry."""
 
@@ -104,6 +124,90 @@ class Latency:
         self.latency: List[LatencyEntry] = latency
 
 
+class ResponseTimeEntry:
+    """Model of a response time entry."""
+
+    def __init__(self, timestamp: int, response_time: float):
+        """Initialize a response time entry model."""
+        self.timestamp: int = timestamp
+        self.response_time: float = response_time
+
+
+class ResponseTime:
+    """Model of a response time."""
+
+    def __init__(self, id: str, response_time: List[ResponseTimeEntry]):
+        """Initialize a response time model."""
+        self.id: str = id
+        self.response_time: List[ResponseTimeEntry] = response_time
+
+
+class QueueWaitTimeEntry:
+    """Model of a queue wait time entry."""
+
+    def __init__(self, timestamp: int, queue_wait_time: float):
+        """Initialize a queue wait time entry model."""
+        self.timestamp: int = timestamp
+        self.queue_wait_time: float = queue_wait_time
+
+
+class QueueWaitTime:
+    """Model of a queue wait time."""
+
+    def __init__(self, id: str, queue_wait_time: List[QueueWaitTimeEntry]):
+        """Initialize a queue wait time model."""
+        self.id: str = id
+        self.queue_wait_time: List[QueueWaitTimeEntry] = queue_wait_time
+
+
+class ConnectionStatisticsEntry:
+    """Model of a connection statistics entry."""
+
+    def __init__(
+        self,
+        timestamp: int,
+        reconnects: float,
+        rollbacks: float,
+        retries: float,
+        rollback_latency: float,
+    ):
+        """Initialize a connection statistics entry model."""
+        self.timestamp: int = timestamp
+        self.reconnects: float = reconnects
+        self.rollbacks: float = rollbacks
+        self.retries: float = retries
+        self.rollback_latency: float = rollback_latency
+
+
+class ConnectionStatistics:
+    """Model of connection statistics."""
+
+    def __init__(self, id: str, connection_statistics: List[ConnectionStatisticsEntry]):
+        """Initialize a connection statistics model."""
+        self.id: str = id
+        self.connection_statistics: List[
+            ConnectionStatisticsEntry
+        ] = connection_statistics
+
+
+class EndToEndLatencyEntry:
+    """Model of an end-to-end latency entry."""
+
+    def __init__(self, timestamp: int, end_to_end_latency: float):
+        """Initialize an end-to-end latency entry model."""
+        self.timestamp: int = timestamp
+        self.end_to_end_latency: float = end_to_end_latency
+
+
+class EndToEndLatency:
+    """Model of an end-to-end latency."""
+
+    def __init__(self, id: str, end_to_end_latency: List[EndToEndLatencyEntry]):
+        """Initialize an end-to-end latency model."""
+        self.id: str = id
+        self.end_to_end_latency: List[EndToEndLatencyEntry] = end_to_end_latency
+
+
 class QueueLengthEntry:
     """Model of a queue length entry."""
 
@@ -132,3 +236,52 @@ class MemoryFootprint:
     def __init__(self, id: str, memory_footprint: List[MemoryFootprintEntry]):
         self.id: str = id
         self.memory_footprint: List[MemoryFootprintEntry] = memory_footprint
+
+
+class LatencyPercentilesEntry:
+    """Model of a latency percentiles entry."""
+
+    def __init__(self, timestamp: int, p50: float, p95: float, p99: float, p999: float):
+        """Initialize a latency percentiles entry model."""
+        self.timestamp: int = timestamp
+        self.p50: float = p50
+        self.p95: float = p95
+        self.p99: float = p99
+        self.p999: float = p999
+
+
+class LatencyPercentiles:
+    """Model of latency percentiles."""
+
+    def __init__(self, id: str, latency_percentiles: List[LatencyPercentilesEntry]):
+        """Initialize a latency percentiles model."""
+        self.id: str = id
+        self.latency_percentiles: List[LatencyPercentilesEntry] = latency_percentiles
+
+
+class QueryLatencyPercentiles:
+    """Model of the latency percentiles of a benchmark or query type."""
+
+    def __init__(
+        self,
+        benchmark: str,
+        query_number: str,
+        latency_percentiles: List[LatencyPercentilesEntry],
+    ):
+        """Initialize a query latency percentiles model."""
+        self.benchmark: str = benchmark
+        self.query_number: str = query_number
+        self.latency_percentiles: List[LatencyPercentilesEntry] = latency_percentiles
+
+
+class DetailedLatencyPercentiles:
+    """Model of detailed latency percentiles."""
+
+    def __init__(
+        self, id: str, detailed_latency_percentiles: List[QueryLatencyPercentiles]
+    ):
+        """Initialize a detailed latency percentiles model."""
+        self.id: str = id
+        self.detailed_latency_percentiles: List[
+            QueryLatencyPercentiles
+        ] = detailed_latency_percentiles
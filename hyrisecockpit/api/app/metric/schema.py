@@ -13,12 +13,26 @@ from marshmallow import Schema, post_load
 from marshmallow.fields import Float, Integer, List, Nested, String
 
 from .model import (
+    ConnectionStatistics,
+    ConnectionStatisticsEntry,
+    DetailedLatencyPercentiles,
+    EndToEndLatency,
+    EndToEndLatencyEntry,
     Latency,
     LatencyEntry,
+    LatencyPercentiles,
+    LatencyPercentilesEntry,
     NegativeThroughput,
     NegativeThroughputEntry,
+    QueryLatencyPercentiles,
     QueueLength,
     QueueLengthEntry,
+    QueueWaitTime,
+    QueueWaitTimeEntry,
+    ResponseTime,
+    ResponseTimeEntry,
+    TargetThroughput,
+    TargetThroughputEntry,
     Throughput,
     ThroughputEntry,
     MemoryFootprint,
@@ -104,6 +118,45 @@ class NegativeThroughputSchema(Schema):
         return NegativeThroughput(**data)
 
 
+class TargetThroughputEntrySchema(Schema):
+    """Schema of a target throughput entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    target_throughput = Float(
+        title="Target throughput",
+        description="Throughput the workload generator targets",
+        required=True,
+        example=300.0,
+    )
+
+    @post_load
+    def make_target_throughput_entry(self, data, **kwargs):
+        """Return a target throughput entry object."""
+        return TargetThroughputEntry(**data)
+
+
+class TargetThroughputSchema(Schema):
+    """Schema of a target throughput metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    target_throughput = List(Nested(TargetThroughputEntrySchema))
+
+    @post_load
+    def make_target_throughput(self, data, **kwargs):
+        """Return a target throughput object."""
+        return TargetThroughput(**data)
+
+
 class LatencyEntrySchema(Schema):
     """Schema of a Latency entry."""
 
@@ -143,6 +196,180 @@ class LatencySchema(Schema):
         return Latency(**data)
 
 
+class ResponseTimeEntrySchema(Schema):
+    """Schema of a response time entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    response_time = Float(
+        title="Response time",
+        description="Average time (ns) from the intended start of the queries to their end.",
+        required=True,
+        example=273.9,
+    )
+
+    @post_load
+    def make_response_time_entry(self, data, **kwargs):
+        """Return a response time entry object."""
+        return ResponseTimeEntry(**data)
+
+
+class ResponseTimeSchema(Schema):
+    """Schema of a response time metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    response_time = List(Nested(ResponseTimeEntrySchema))
+
+    @post_load
+    def make_response_time(self, data, **kwargs):
+        """Return a response time object."""
+        return ResponseTime(**data)
+
+
+class QueueWaitTimeEntrySchema(Schema):
+    """Schema of a queue wait time entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    queue_wait_time = Float(
+        title="Queue wait time",
+        description="Average time (ns) the queries waited in the queue of the worker pool.",
+        required=True,
+        example=273.9,
+    )
+
+    @post_load
+    def make_queue_wait_time_entry(self, data, **kwargs):
+        """Return a queue wait time entry object."""
+        return QueueWaitTimeEntry(**data)
+
+
+class QueueWaitTimeSchema(Schema):
+    """Schema of a queue wait time metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    queue_wait_time = List(Nested(QueueWaitTimeEntrySchema))
+
+    @post_load
+    def make_queue_wait_time(self, data, **kwargs):
+        """Return a queue wait time object."""
+        return QueueWaitTime(**data)
+
+
+class ConnectionStatisticsEntrySchema(Schema):
+    """Schema of a connection statistics entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    reconnects = Float(
+        title="Reconnects",
+        description="Number of reconnects of the task workers per second.",
+        required=True,
+        example=0.0,
+    )
+    rollbacks = Float(
+        title="Rollbacks",
+        description="Number of rolled back transactions per second.",
+        required=True,
+        example=12.0,
+    )
+    retries = Float(
+        title="Retries",
+        description="Number of retried transactions per second.",
+        required=True,
+        example=10.0,
+    )
+    rollback_latency = Float(
+        title="Rollback latency",
+        description="Average time (ns) a rollback took.",
+        required=True,
+        example=48213.5,
+    )
+
+    @post_load
+    def make_connection_statistics_entry(self, data, **kwargs):
+        """Return a connection statistics entry object."""
+        return ConnectionStatisticsEntry(**data)
+
+
+class ConnectionStatisticsSchema(Schema):
+    """Schema of a connection statistics metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    connection_statistics = List(Nested(ConnectionStatisticsEntrySchema))
+
+    @post_load
+    def make_connection_statistics(self, data, **kwargs):
+        """Return a connection statistics object."""
+        return ConnectionStatistics(**data)
+
+
+class EndToEndLatencyEntrySchema(Schema):
+    """Schema of an end-to-end latency entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    end_to_end_latency = Float(
+        title="End-to-end latency",
+        description="Average time (ns) from the generation of the queries to their end.",
+        required=True,
+        example=273.9,
+    )
+
+    @post_load
+    def make_end_to_end_latency_entry(self, data, **kwargs):
+        """Return an end-to-end latency entry object."""
+        return EndToEndLatencyEntry(**data)
+
+
+class EndToEndLatencySchema(Schema):
+    """Schema of an end-to-end latency metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    end_to_end_latency = List(Nested(EndToEndLatencyEntrySchema))
+
+    @post_load
+    def make_end_to_end_latency(self, data, **kwargs):
+        """Return an end-to-end latency object."""
+        return EndToEndLatency(**data)
+
+
 class QueueLengthEntrySchema(Schema):
     """Schema of a Latency entry."""
 
@@ -183,7 +410,6 @@ class QueueLengthSchema(Schema):
 
 
 class MemoryFootprintEntrySchema(Schema):
-
     timestamp = Integer(
         title="Queue length",
         description="Timestamp in nanoseconds since epoch",
@@ -203,7 +429,6 @@ class MemoryFootprintEntrySchema(Schema):
 
 
 class MemoryFootprintSchema(Schema):
-
     id = String(
         title="Database ID",
         description="Used to identify a database.",
@@ -250,6 +475,12 @@ class DetailedQueryInformationEntrySchema(Schema):
         required=True,
         example=923.263,
     )
+    abort_rate = Float(
+        title="Abort rate",
+        description="Share of the executed queries that weren't committed.",
+        required=True,
+        example=0.02,
+    )
 
 
 class DetailedQueryInformationSchema(Schema):
@@ -262,3 +493,100 @@ class DetailedQueryInformationSchema(Schema):
         example="hyrise-1",
     )
     detailed_query_information = List(Nested(DetailedQueryInformationEntrySchema))
+
+
+class LatencyPercentilesEntrySchema(Schema):
+    """Schema of a latency percentiles entry."""
+
+    timestamp = Integer(
+        title="Timestamp",
+        description="Timestamp in nanoseconds since epoch",
+        required=True,
+        example=1585762457000000000,
+    )
+    p50 = Float(
+        title="p50",
+        description="Median query latency (ns) of the time interval.",
+        required=True,
+        example=923263.0,
+    )
+    p95 = Float(
+        title="p95",
+        description="95th percentile of the query latency (ns) of the time interval.",
+        required=True,
+        example=2015232.0,
+    )
+    p99 = Float(
+        title="p99",
+        description="99th percentile of the query latency (ns) of the time interval.",
+        required=True,
+        example=4128768.0,
+    )
+    p999 = Float(
+        title="p99.9",
+        description="99.9th percentile of the query latency (ns) of the time interval.",
+        required=True,
+        example=8388608.0,
+    )
+
+    @post_load
+    def make_latency_percentiles_entry(self, data, **kwargs):
+        """Return a latency percentiles entry object."""
+        return LatencyPercentilesEntry(**data)
+
+
+class LatencyPercentilesSchema(Schema):
+    """Schema of a latency percentiles metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    latency_percentiles = List(Nested(LatencyPercentilesEntrySchema))
+
+    @post_load
+    def make_latency_percentiles(self, data, **kwargs):
+        """Return a latency percentiles object."""
+        return LatencyPercentiles(**data)
+
+
+class QueryLatencyPercentilesSchema(Schema):
+    """Schema of the latency percentiles of a benchmark or query type."""
+
+    benchmark = String(
+        title="Benchmark",
+        description="Benchmark of the executed queries.",
+        required=True,
+        example="tpch_0.1",
+    )
+    query_number = String(
+        title="query_number",
+        description="Number of the executed query, all for the whole benchmark.",
+        required=True,
+        example="5",
+    )
+    latency_percentiles = List(Nested(LatencyPercentilesEntrySchema))
+
+    @post_load
+    def make_query_latency_percentiles(self, data, **kwargs):
+        """Return a query latency percentiles object."""
+        return QueryLatencyPercentiles(**data)
+
+
+class DetailedLatencyPercentilesSchema(Schema):
+    """Schema of a detailed latency percentiles metric."""
+
+    id = String(
+        title="Database ID",
+        description="Used to identify a database.",
+        required=True,
+        example="hyrise-1",
+    )
+    detailed_latency_percentiles = List(Nested(QueryLatencyPercentilesSchema))
+
+    @post_load
+    def make_detailed_latency_percentiles(self, data, **kwargs):
+        """Return a detailed latency percentiles object."""
+        return DetailedLatencyPercentiles(**data)
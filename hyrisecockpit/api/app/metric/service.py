@@ -5,29 +5,45 @@ fetching data from the influx or database manager. The data is then if needed
 deserialized into a Python entity (model) by using the corresponding schemas.
 """
 from time import time_ns
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from hyrisecockpit.api.app.connection_manager import StorageConnection
 from hyrisecockpit.api.app.historical_data_handling import (
+    get_historical_latency_percentiles,
     get_historical_metric,
     get_interval_limits,
 )
 from hyrisecockpit.api.app.shared import _get_active_databases
+from hyrisecockpit.latency_histogram import ALL_QUERIES
 
 from .model import (
+    ConnectionStatistics,
+    DetailedLatencyPercentiles,
     DetailedQueryEntry,
     DetailedQueryInformation,
+    EndToEndLatency,
     Latency,
+    LatencyPercentiles,
     NegativeThroughput,
     QueueLength,
+    QueueWaitTime,
+    ResponseTime,
+    TargetThroughput,
     Throughput,
     TimeInterval,
     MemoryFootprint,
 )
 from .schema import (
+    ConnectionStatisticsSchema,
+    DetailedLatencyPercentilesSchema,
+    EndToEndLatencySchema,
+    LatencyPercentilesSchema,
     LatencySchema,
     NegativeThroughputSchema,
     QueueLengthSchema,
+    QueueWaitTimeSchema,
+    ResponseTimeSchema,
+    TargetThroughputSchema,
     ThroughputSchema,
     MemoryFootprintSchema,
 )
@@ -75,6 +91,20 @@ class MetricService:
             for database_results in results
         ]
 
+    @classmethod
+    def get_target_throughput(
+        cls, time_interval: TimeInterval
+    ) -> List[TargetThroughput]:
+        """Get the throughput targeted by the workload generator."""
+        target_throughput_schema = TargetThroughputSchema()
+        results = cls.get_data(
+            time_interval, "target_throughput", ["target_throughput"]
+        )
+        return [
+            target_throughput_schema.load(database_results)
+            for database_results in results
+        ]
+
     @classmethod
     def get_latency(cls, time_interval: TimeInterval) -> List[Latency]:
         """Get latency data."""
@@ -82,6 +112,55 @@ class MetricService:
         results = cls.get_data(time_interval, "latency", ["latency"])
         return [latency_schema.load(database_results) for database_results in results]
 
+    @classmethod
+    def get_response_time(cls, time_interval: TimeInterval) -> List[ResponseTime]:
+        """Get response time data."""
+        response_time_schema = ResponseTimeSchema()
+        results = cls.get_data(time_interval, "response_time", ["response_time"])
+        return [
+            response_time_schema.load(database_results) for database_results in results
+        ]
+
+    @classmethod
+    def get_queue_wait_time(cls, time_interval: TimeInterval) -> List[QueueWaitTime]:
+        """Get queue wait time data."""
+        queue_wait_time_schema = QueueWaitTimeSchema()
+        results = cls.get_data(time_interval, "queue_wait_time", ["queue_wait_time"])
+        return [
+            queue_wait_time_schema.load(database_results)
+            for database_results in results
+        ]
+
+    @classmethod
+    def get_connection_statistics(
+        cls, time_interval: TimeInterval
+    ) -> List[ConnectionStatistics]:
+        """Get reconnects, rollbacks, retries and rollback latency data."""
+        connection_statistics_schema = ConnectionStatisticsSchema()
+        results = cls.get_data(
+            time_interval,
+            "connection_statistics",
+            ["reconnects", "rollbacks", "retries", "rollback_latency"],
+        )
+        return [
+            connection_statistics_schema.load(database_results)
+            for database_results in results
+        ]
+
+    @classmethod
+    def get_end_to_end_latency(
+        cls, time_interval: TimeInterval
+    ) -> List[EndToEndLatency]:
+        """Get end-to-end latency data."""
+        end_to_end_latency_schema = EndToEndLatencySchema()
+        results = cls.get_data(
+            time_interval, "end_to_end_latency", ["end_to_end_latency"]
+        )
+        return [
+            end_to_end_latency_schema.load(database_results)
+            for database_results in results
+        ]
+
     @classmethod
     def get_queue_length(cls, time_interval: TimeInterval) -> List[QueueLength]:
         """Get queue length data."""
@@ -101,9 +180,97 @@ class MetricService:
             for database_memory_footprint in databases_memory_footprints
         ]
 
+    @staticmethod
+    def get_latency_percentile_data(
+        time_interval: TimeInterval, condition: str
+    ) -> Dict[str, Dict[Tuple[str, str], List[Dict[str, int]]]]:
+        """Return latency percentiles per database in a given time range."""
+        (startts, endts) = get_interval_limits(
+            time_interval.startts, time_interval.endts, time_interval.precision
+        )
+        with StorageConnection() as client:
+            return {
+                database: get_historical_latency_percentiles(
+                    startts,
+                    endts,
+                    time_interval.precision,
+                    condition,
+                    database,
+                    client,
+                )
+                for database in _get_active_databases()
+            }
+
+    @classmethod
+    def get_latency_percentiles(
+        cls, time_interval: TimeInterval
+    ) -> List[LatencyPercentiles]:
+        """Get latency percentiles of all queries."""
+        latency_percentiles_schema = LatencyPercentilesSchema()
+        results = cls.get_latency_percentile_data(
+            time_interval, f"benchmark = '{ALL_QUERIES}'"
+        )
+        return [
+            latency_percentiles_schema.load(
+                {
+                    "id": database,
+                    "latency_percentiles": percentiles.get(
+                        (ALL_QUERIES, ALL_QUERIES), []
+                    ),
+                }
+            )
+            for database, percentiles in results.items()
+        ]
+
+    @classmethod
+    def _get_detailed_latency_percentiles(
+        cls, time_interval: TimeInterval, condition: str
+    ) -> List[DetailedLatencyPercentiles]:
+        detailed_latency_percentiles_schema = DetailedLatencyPercentilesSchema()
+        results = cls.get_latency_percentile_data(time_interval, condition)
+        return [
+            detailed_latency_percentiles_schema.load(
+                {
+                    "id": database,
+                    "detailed_latency_percentiles": [
+                        {
+                            "benchmark": benchmark,
+                            "query_number": query_number,
+                            "latency_percentiles": entries,
+                        }
+                        for (benchmark, query_number), entries in percentiles.items()
+                    ],
+                }
+            )
+            for database, percentiles in results.items()
+        ]
+
+    @classmethod
+    def get_benchmark_latency_percentiles(
+        cls, time_interval: TimeInterval
+    ) -> List[DetailedLatencyPercentiles]:
+        """Get latency percentiles per benchmark."""
+        return cls._get_detailed_latency_percentiles(
+            time_interval,
+            f"benchmark != '{ALL_QUERIES}' AND query_no = '{ALL_QUERIES}'",
+        )
+
+    @classmethod
+    def get_query_latency_percentiles(
+        cls, time_interval: TimeInterval
+    ) -> List[DetailedLatencyPercentiles]:
+        """Get latency percentiles per benchmark and query type."""
+        return cls._get_detailed_latency_percentiles(
+            time_interval, f"query_no != '{ALL_QUERIES}'"
+        )
+
     @classmethod
     def get_detailed_query_information(cls) -> List[DetailedQueryInformation]:
-        """Return detailed throughput and latency information from the stored queries."""
+        """Return detailed throughput and latency information from the query aggregates.
+
+        The abort rate is the share of the queries or transactions of a type
+        that weren't committed.
+        """
         interval_length_sec = 5
         currentts = time_ns()
         offset = 3_000_000_000
@@ -115,20 +282,35 @@ class MetricService:
         with StorageConnection() as client:
             for database in _get_active_databases():
                 result = client.query(
-                    'SELECT COUNT("latency") as "throughput", MEAN("latency") as "latency" FROM successful_queries WHERE time > $startts AND time <= $endts GROUP BY benchmark, query_no, scalefactor;',
+                    'SELECT SUM("count") as "count", SUM("latency_sum") as "latency_sum" FROM aggregated_queries WHERE time > $startts AND time <= $endts GROUP BY benchmark, query_no, scalefactor, commited;',
                     database=database,
                     bind_params={"startts": startts, "endts": endts},
                 )
+                aggregates: Dict[Tuple[str, str, str], List[int]] = {}
+                for table, tags in list(result.keys()):
+                    point = list(result[table, tags])[0]
+                    aggregate = aggregates.setdefault(
+                        (tags["benchmark"], tags["query_no"], tags["scalefactor"]),
+                        [0, 0, 0],
+                    )
+                    aggregate[0] += point["count"]
+                    aggregate[1] += point["latency_sum"]
+                    if tags["commited"] == "False":
+                        aggregate[2] += point["count"]
                 query_information: List[DetailedQueryEntry] = [
                     DetailedQueryEntry(
-                        benchmark=tags["benchmark"],
-                        query_number=tags["query_no"],
-                        throughput=list(result[table, tags])[0]["throughput"]
-                        / interval_length_sec,
-                        latency=list(result[table, tags])[0]["latency"],
-                        scale_factor=tags["scalefactor"],
+                        benchmark=benchmark,
+                        query_number=query_number,
+                        throughput=count / interval_length_sec,
+                        latency=latency_sum / count,
+                        scale_factor=scale_factor,  # type: ignore
+                        abort_rate=aborted / count,
                     )
-                    for table, tags in list(result.keys())
+                    for (benchmark, query_number, scale_factor), (
+                        count,
+                        latency_sum,
+                        aborted,
+                    ) in aggregates.items()
                 ]
                 response.append(
                     DetailedQueryInformation(
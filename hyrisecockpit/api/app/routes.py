@@ -5,6 +5,7 @@ from flask_restx import Api
 
 def register_routes(api: Api, app: Flask, root: str = "/api") -> None:
     """Register all sub-routes."""
+    from .capacity import register_routes as attach_capacity
     from .database import register_routes as attach_database
     from .metric import register_routes as attach_metric
     from .monitor import register_routes as attach_monitor
@@ -13,6 +14,7 @@ def register_routes(api: Api, app: Flask, root: str = "/api") -> None:
     from .status import register_routes as attach_status
     from .workload import register_routes as attach_workload
 
+    attach_capacity(api, app, root)
     attach_database(api, app, root)
     attach_monitor(api, app, root)
     attach_plugin(api, app, root)
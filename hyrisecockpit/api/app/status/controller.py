@@ -4,8 +4,13 @@ from typing import List
 from flask_accepts import responds
 from flask_restx import Namespace, Resource
 
-from .model import DatabaseStatus, FailedTask, WorkloadTablesStatus
-from .schema import DatabaseStatusSchema, FailedTaskSchema, WorkloadTablesStatusSchema
+from .model import CallStatistics, DatabaseStatus, FailedTask, WorkloadTablesStatus
+from .schema import (
+    CallStatisticsSchema,
+    DatabaseStatusSchema,
+    FailedTaskSchema,
+    WorkloadTablesStatusSchema,
+)
 from .service import StatusService
 
 api = Namespace("status", description="Get status information.")
@@ -39,3 +44,13 @@ class FailedTaskController(Resource):
     def get(self) -> List[FailedTask]:
         """Get all failed tasks."""
         return StatusService.get_failed_tasks()
+
+
+@api.route("/manager_calls")
+class ManagerCallStatisticsController(Resource):
+    """Controller for returning the latencies of the database manager calls."""
+
+    @responds(schema=CallStatisticsSchema(many=True), api=api)
+    def get(self) -> List[CallStatistics]:
+        """Get the latencies of the calls of the database manager."""
+        return StatusService.get_manager_call_statistics()
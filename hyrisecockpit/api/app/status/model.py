@@ -47,10 +47,14 @@ class WorkloadTablesStatus:
         self,
         id: str,
         workload_tables_status: List[TablesStatus],
+        version: int,
+        age: int,
     ):
         """Initialize a Workload tables model."""
         self.id: str = id
         self.workload_tables_status: List[TablesStatus] = workload_tables_status
+        self.version: int = version
+        self.age: int = age
 
 
 class FailedQuery:
@@ -71,3 +75,28 @@ class FailedTask:
         """Initialize a FailedTask model."""
         self.id: str = id
         self.failed_queries: List[FailedQuery] = failed_queries
+
+
+class CallStatistics:
+    """Model of the latencies of a call of the database manager."""
+
+    def __init__(
+        self,
+        call: str,
+        concurrency: str,
+        count: int,
+        errors: int,
+        mean_latency: int,
+        p99_latency: int,
+        max_latency: int,
+        mean_queue_wait: int,
+    ):
+        """Initialize a CallStatistics model."""
+        self.call: str = call
+        self.concurrency: str = concurrency
+        self.count: int = count
+        self.errors: int = errors
+        self.mean_latency: int = mean_latency
+        self.p99_latency: int = p99_latency
+        self.max_latency: int = max_latency
+        self.mean_queue_wait: int = mean_queue_wait
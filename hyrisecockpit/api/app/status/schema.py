@@ -1,7 +1,7 @@
 """Schema's for status module."""
 
 from marshmallow import Schema
-from marshmallow.fields import Boolean, Dict, Float, List, Nested, String
+from marshmallow.fields import Boolean, Dict, Float, Integer, List, Nested, String
 
 
 class DatabaseStatusSchema(Schema):
@@ -87,6 +87,18 @@ class WorkloadTablesStatusSchema(Schema):
         example="hyrise-1",
     )
     workload_tables_status = List(Nested(TablesStatusSchema))
+    version = Integer(
+        title="Version",
+        description="Version of the snapshot of the tables, increases with every refresh.",
+        required=True,
+        example=12,
+    )
+    age = Integer(
+        title="Age",
+        description="Time (ns) since the tables were queried from the database.",
+        required=True,
+        example=1200000000,
+    )
 
 
 class FailedQuerySchema(Schema):
@@ -128,3 +140,56 @@ class FailedTaskSchema(Schema):
         example="hyrise-1",
     )
     failed_queries = List(Nested(FailedQuerySchema))
+
+
+class CallStatisticsSchema(Schema):
+    """Schema of the latencies of a call of the database manager."""
+
+    call = String(
+        title="Call",
+        description="Name of the call.",
+        required=True,
+        example="database status",
+    )
+    concurrency = String(
+        title="Concurrency class",
+        description="Whether the call is answered inline, offloaded to a thread or runs exclusively.",
+        required=True,
+        example="inline",
+    )
+    count = Integer(
+        title="Count",
+        description="Number of handled requests.",
+        required=True,
+        example=120,
+    )
+    errors = Integer(
+        title="Errors",
+        description="Number of requests that raised an exception.",
+        required=True,
+        example=0,
+    )
+    mean_latency = Integer(
+        title="Mean latency",
+        description="Mean time (ns) the call took.",
+        required=True,
+        example=52000,
+    )
+    p99_latency = Integer(
+        title="99th percentile latency",
+        description="99th percentile of the time (ns) the call took.",
+        required=True,
+        example=180000,
+    )
+    max_latency = Integer(
+        title="Maximum latency",
+        description="Maximum time (ns) the call took.",
+        required=True,
+        example=410000,
+    )
+    mean_queue_wait = Integer(
+        title="Mean queue wait",
+        description="Mean time (ns) the call waited for a thread.",
+        required=True,
+        example=0,
+    )
@@ -10,6 +10,7 @@ from hyrisecockpit.request import Header, Request
 from hyrisecockpit.response import Response
 
 from .model import (
+    CallStatistics,
     DatabaseStatus,
     FailedQuery,
     FailedTask,
@@ -52,7 +53,12 @@ class StatusService:
                 TablesStatus(**status) for status in database["workload_tables_status"]
             ]
             workload_tables.append(
-                WorkloadTablesStatus(database["id"], workload_tables_status)
+                WorkloadTablesStatus(
+                    database["id"],
+                    workload_tables_status,
+                    database["version"],
+                    database["age"],
+                )
             )
         return workload_tables
 
@@ -75,3 +81,11 @@ class StatusService:
                     FailedTask(id=database, failed_queries=serialized_failed_queries)
                 )
         return results
+
+    @classmethod
+    def get_manager_call_statistics(cls) -> List[CallStatistics]:
+        """Get the latencies of the calls of the database manager."""
+        response = cls._send_message(
+            Request(header=Header(message="get server statistics"), body={})
+        )
+        return [CallStatistics(**interface) for interface in response["body"]["calls"]]
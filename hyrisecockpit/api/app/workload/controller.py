@@ -6,9 +6,20 @@ from flask.wrappers import Response
 from flask_accepts import accepts, responds
 from flask_restx import Namespace, Resource
 
-from .interface import BaseWorkloadInterface
-from .model import BaseWorkload, DetailedWorkload, Workload
-from .schema import BaseWorkloadSchema, DetailedWorkloadSchema, WorkloadSchema
+from .interface import (
+    BaseWorkloadInterface,
+    TraceRecordingInterface,
+    TraceReplayInterface,
+)
+from .model import BaseWorkload, DetailedWorkload, GeneratorStatistics, Workload
+from .schema import (
+    BaseWorkloadSchema,
+    DetailedWorkloadSchema,
+    GeneratorStatisticsSchema,
+    TraceRecordingSchema,
+    TraceReplaySchema,
+    WorkloadSchema,
+)
 from .service import WorkloadService
 
 api = Namespace("Workload", description="Control workload execution.")
@@ -33,6 +44,52 @@ class WorkloadController(Resource):
         return Response(status=404) if workload is None else workload
 
 
+@api.route("/trace/recording")
+class TraceRecordingController(Resource):
+    """Controller of the trace recording."""
+
+    @api.response(409, "A trace is already recorded or replayed.")
+    @accepts(schema=TraceRecordingSchema, api=api)
+    def post(self) -> Response:
+        """Record the published queries to a trace."""
+        interface: TraceRecordingInterface = request.parsed_obj  # type: ignore
+        return Response(status=WorkloadService.start_trace_recording(interface))
+
+    @api.response(404, "No trace is recorded.")
+    def delete(self) -> Response:
+        """Stop recording the published queries."""
+        return Response(status=WorkloadService.stop_trace_recording())
+
+
+@api.route("/trace/replay")
+class TraceReplayController(Resource):
+    """Controller of the trace replay."""
+
+    @api.response(400, "The rate isn't positive.")
+    @api.response(404, "A trace with the given name doesn't exist.")
+    @api.response(409, "A trace is already recorded or replayed.")
+    @accepts(schema=TraceReplaySchema, api=api)
+    def post(self) -> Response:
+        """Replay a trace instead of the generated workloads."""
+        interface: TraceReplayInterface = request.parsed_obj  # type: ignore
+        return Response(status=WorkloadService.start_trace_replay(interface))
+
+    @api.response(404, "No trace is replayed.")
+    def delete(self) -> Response:
+        """Stop replaying a trace."""
+        return Response(status=WorkloadService.stop_trace_replay())
+
+
+@api.route("/generator")
+class GeneratorStatisticsController(Resource):
+    """Controller of the workload generator statistics."""
+
+    @responds(schema=GeneratorStatisticsSchema, api=api)
+    def get(self) -> GeneratorStatistics:
+        """Get the tick lateness and generation time of the workload generator."""
+        return WorkloadService.get_generator_statistics()
+
+
 @api.response(404, "A Workload with the given folder name does not exist.")
 @api.route("/<string:workload_type>")
 @api.param("workload_type", "Workload type")
@@ -1,8 +1,37 @@
 """Interface of a Workload."""
-from typing import Dict, List, TypedDict
+from typing import Dict, List, Optional, TypedDict
 
 
-class BaseWorkloadInterface(TypedDict):
+class SeededWorkloadInterface(TypedDict, total=False):
+    """Interface of the optional seed of a Workload."""
+
+    seed: Optional[int]
+
+
+class ProfileInterface(TypedDict, total=False):
+    """Interface of a load profile of a Workload."""
+
+    shape: str
+    start: float
+    end: float
+    duration: float
+    step: float
+    interval: float
+    steps: float
+    mean: float
+    amplitude: float
+    period: float
+    base: float
+    peak: float
+
+
+class ProfiledWorkloadInterface(SeededWorkloadInterface, total=False):
+    """Interface of the optional load profile of a Workload."""
+
+    profile: Optional[ProfileInterface]
+
+
+class BaseWorkloadInterface(ProfiledWorkloadInterface):
     """Interface of a base Workload."""
 
     workload_type: str
@@ -22,3 +51,15 @@ class DetailedWorkloadInterface(WorkloadInterface):
 
     supported_scale_factors: List[float]
     default_weights: Dict[str, float]
+
+
+class TraceRecordingInterface(TypedDict):
+    """Interface of a trace recording."""
+
+    trace_name: str
+
+
+class TraceReplayInterface(TraceRecordingInterface):
+    """Interface of a trace replay."""
+
+    rate: float
@@ -1,5 +1,5 @@
 """Model of a Workload."""
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class BaseWorkload:
@@ -11,12 +11,16 @@ class BaseWorkload:
         frequency: int,
         scale_factor: float,
         weights: Dict[str, float],
+        seed: Optional[int] = None,
+        profile: Optional[Dict] = None,
     ):
         """Initialize a base Workload model."""
         self.workload_type: str = workload_type
         self.frequency: int = frequency
         self.scale_factor: float = scale_factor
         self.weights: Dict[str, float] = weights
+        self.seed: Optional[int] = seed
+        self.profile: Optional[Dict] = profile
 
 
 class Workload(BaseWorkload):
@@ -29,10 +33,12 @@ class Workload(BaseWorkload):
         scale_factor: float,
         weights: Dict[str, float],
         running: bool,
+        seed: Optional[int] = None,
+        profile: Optional[Dict] = None,
     ):
         """Initialize a Workload model."""
         self.running: bool = running
-        super().__init__(workload_type, frequency, scale_factor, weights)
+        super().__init__(workload_type, frequency, scale_factor, weights, seed, profile)
 
 
 class DetailedWorkload(Workload):
@@ -47,9 +53,42 @@ class DetailedWorkload(Workload):
         running: bool,
         supported_scale_factors: List[float],
         default_weights: Dict[str, float],
+        seed: Optional[int] = None,
+        profile: Optional[Dict] = None,
     ):
         """Initialize a detailed Workload model."""
         self.supported_scale_factors: List[float] = supported_scale_factors
         self.default_weights: Dict[str, float] = default_weights
 
-        super().__init__(workload_type, frequency, scale_factor, weights, running)
+        super().__init__(
+            workload_type, frequency, scale_factor, weights, running, seed, profile
+        )
+
+
+class ShardStatistics:
+    """Model of the statistics of a workload generator shard."""
+
+    def __init__(self, shard: int, tick_lateness: int, generation_time: int):
+        """Initialize a ShardStatistics model."""
+        self.shard: int = shard
+        self.tick_lateness: int = tick_lateness
+        self.generation_time: int = generation_time
+
+
+class GeneratorStatistics:
+    """Model of the statistics of the workload generator."""
+
+    def __init__(
+        self,
+        shards: int,
+        tick_lateness: int,
+        generation_time: int,
+        missed_ticks: int,
+        shard_statistics: List[ShardStatistics],
+    ):
+        """Initialize a GeneratorStatistics model."""
+        self.shards: int = shards
+        self.tick_lateness: int = tick_lateness
+        self.generation_time: int = generation_time
+        self.missed_ticks: int = missed_ticks
+        self.shard_statistics: List[ShardStatistics] = shard_statistics
@@ -1,6 +1,30 @@
 """Schema of a Workload."""
 from marshmallow import Schema
-from marshmallow.fields import Boolean, Dict, Float, Integer, List, String
+from marshmallow.fields import Boolean, Dict, Float, Integer, List, Nested, String
+from marshmallow.validate import OneOf
+
+
+class ProfileSchema(Schema):
+    """Schema of a load profile of a Workload."""
+
+    shape = String(
+        description="Shape of the rate over time.",
+        required=True,
+        validate=OneOf(["ramp", "step", "sine", "burst"]),
+    )
+    start = Float(description="Rate of a ramp or step profile at the start.")
+    end = Float(description="Rate of a ramp profile at the end.")
+    duration = Float(
+        description="Seconds of a ramp profile or of the peak of a burst profile."
+    )
+    step = Float(description="Rate added by every step of a step profile.")
+    interval = Float(description="Seconds between the steps of a step profile.")
+    steps = Float(description="Maximum number of steps of a step profile.")
+    mean = Float(description="Mean rate of a sine profile.")
+    amplitude = Float(description="Amplitude of the rate of a sine profile.")
+    period = Float(description="Seconds of a period of a sine or burst profile.")
+    base = Float(description="Rate of a burst profile between the peaks.")
+    peak = Float(description="Rate of a burst profile during the peaks.")
 
 
 class BaseWorkloadSchema(Schema):
@@ -19,6 +43,15 @@ class BaseWorkloadSchema(Schema):
         values=Float(description="Weight of the query."),
         description="Weights of queries used for generation.",
     )
+    seed = Integer(
+        description="Seed of the generation, the same seed generates the same queries.",
+        allow_none=True,
+    )
+    profile = Nested(
+        ProfileSchema,
+        description="Load profile replacing the constant frequency.",
+        allow_none=True,
+    )
 
 
 class WorkloadSchema(BaseWorkloadSchema):
@@ -43,3 +76,54 @@ class DetailedWorkloadSchema(BaseWorkloadSchema):
         values=Float(description="Weight of the query."),
         description="Default weights of queries used for generation.",
     )
+
+
+class TraceRecordingSchema(Schema):
+    """Schema of a trace recording."""
+
+    trace_name = String(
+        description="Name of the trace the published queries are recorded to.",
+        required=True,
+    )
+
+
+class TraceReplaySchema(TraceRecordingSchema):
+    """Schema of a trace replay."""
+
+    rate = Float(
+        description="Replay rate relative to the recorded rate, 2.0 replays twice as fast.",
+        required=True,
+    )
+
+
+class ShardStatisticsSchema(Schema):
+    """Schema of the statistics of a workload generator shard."""
+
+    shard = Integer(description="Number of the shard.", required=True)
+    tick_lateness = Integer(
+        description="Time (ns) from the last tick to the start of the generation of the shard.",
+        required=True,
+    )
+    generation_time = Integer(
+        description="Time (ns) the shard took to generate and send the tasks of the last tick.",
+        required=True,
+    )
+
+
+class GeneratorStatisticsSchema(Schema):
+    """Schema of the statistics of the workload generator."""
+
+    shards = Integer(description="Number of generator processes.", required=True)
+    tick_lateness = Integer(
+        description="Time (ns) the generation of the last second started after it was due.",
+        required=True,
+    )
+    generation_time = Integer(
+        description="Time (ns) the generation of the last second took.",
+        required=True,
+    )
+    missed_ticks = Integer(
+        description="Number of seconds that weren't generated because a tick was late.",
+        required=True,
+    )
+    shard_statistics = List(Nested(ShardStatisticsSchema), required=True)
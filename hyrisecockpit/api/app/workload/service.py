@@ -5,8 +5,18 @@ from hyrisecockpit.api.app.connection_manager import GeneratorSocket, ManagerSoc
 from hyrisecockpit.request import Header, Request
 from hyrisecockpit.response import Response
 
-from .interface import BaseWorkloadInterface
-from .model import BaseWorkload, DetailedWorkload, Workload
+from .interface import (
+    BaseWorkloadInterface,
+    TraceRecordingInterface,
+    TraceReplayInterface,
+)
+from .model import (
+    BaseWorkload,
+    DetailedWorkload,
+    GeneratorStatistics,
+    ShardStatistics,
+    Workload,
+)
 
 
 class WorkloadService:
@@ -93,3 +103,53 @@ class WorkloadService:
             if response["header"]["status"] == 404
             else BaseWorkload(**response["body"]["workload"])
         )
+
+    @classmethod
+    def start_trace_recording(cls, interface: TraceRecordingInterface) -> int:
+        """Record the published queries to a trace."""
+        response = cls._send_message_to_gen(
+            Request(
+                header=Header(message="start trace recording"), body=dict(interface)
+            ),
+        )
+        return response["header"]["status"]
+
+    @classmethod
+    def stop_trace_recording(cls) -> int:
+        """Stop recording the published queries."""
+        response = cls._send_message_to_gen(
+            Request(header=Header(message="stop trace recording"), body={}),
+        )
+        return response["header"]["status"]
+
+    @classmethod
+    def start_trace_replay(cls, interface: TraceReplayInterface) -> int:
+        """Replay a trace instead of the generated workloads."""
+        response = cls._send_message_to_gen(
+            Request(header=Header(message="start trace replay"), body=dict(interface)),
+        )
+        return response["header"]["status"]
+
+    @classmethod
+    def stop_trace_replay(cls) -> int:
+        """Stop replaying a trace."""
+        response = cls._send_message_to_gen(
+            Request(header=Header(message="stop trace replay"), body={}),
+        )
+        return response["header"]["status"]
+
+    @classmethod
+    def get_generator_statistics(cls) -> GeneratorStatistics:
+        """Get the tick lateness and generation time of the workload generator."""
+        response = cls._send_message_to_gen(
+            Request(header=Header(message="get generator statistics"), body={}),
+        )
+        statistics = response["body"]["generator"]
+        return GeneratorStatistics(
+            **{
+                **statistics,
+                "shard_statistics": [
+                    ShardStatistics(**shard) for shard in statistics["shard_statistics"]
+                ],
+            }
+        )
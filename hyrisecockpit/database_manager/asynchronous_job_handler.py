@@ -2,7 +2,7 @@
 
 from multiprocessing import Value
 from threading import Thread
-from typing import Dict
+from typing import Callable, Dict, Tuple
 
 from hyrisecockpit.database_manager.cursor import ConnectionFactory
 
@@ -11,6 +11,10 @@ from .job.deactivate_plugin import deactivate_plugin as deactivate_plugin_job
 from .job.delete_tables import delete_tables as delete_tables_job
 from .job.load_tables import load_tables as load_tables_job
 from .job.get_detailed_plugins import get_plugins as get_active_plugin_names
+from .status_snapshots import StatusSnapshots
+
+TABLE_SNAPSHOTS: Tuple[str, ...] = ("loaded_tables", "workload_tables_status")
+PLUGIN_SNAPSHOTS: Tuple[str, ...] = ("detailed_plugins",)
 
 
 class AsynchronousJobHandler:
@@ -19,7 +23,8 @@ class AsynchronousJobHandler:
     All jobs in this class are executed with python threads in the background.
     If a method from this class is called it will only response if the job
     was started successfully or not. All jobs in this class do not need to return a
-    result.
+    result. The jobs invalidate the status snapshots they change when they
+    start and when they finish.
     """
 
     def __init__(
@@ -27,6 +32,7 @@ class AsynchronousJobHandler:
         database_blocked: Value,
         connection_factory: ConnectionFactory,
         workload_drivers: Dict,
+        status_snapshots: StatusSnapshots,
     ):
         """Initialize asynchronous job handler object.
 
@@ -37,10 +43,22 @@ class AsynchronousJobHandler:
                 database. All connection relevant information (port, host) is
                 saved in this object.
             workload_drivers: A dictionary containing all workload drivers (TPCC,...)
+            status_snapshots: The snapshots of the loaded tables and plug-ins of
+                the Hyrise instance.
         """
         self._database_blocked: Value = database_blocked
         self._connection_factory: ConnectionFactory = connection_factory
         self._workload_drivers: Dict = workload_drivers
+        self._status_snapshots: StatusSnapshots = status_snapshots
+
+    def _run_job(
+        self, job: Callable[..., None], args: Tuple, snapshot_names: Tuple[str, ...]
+    ) -> None:
+        """Run a job and invalidate the status snapshots it changed."""
+        try:
+            job(*args)
+        finally:
+            self._status_snapshots.invalidate(*snapshot_names)
 
     def load_tables(self, workload_type: str, scalefactor: float) -> bool:
         """Start load tabled job.
@@ -54,14 +72,19 @@ class AsynchronousJobHandler:
         """
         if not self._database_blocked.value:
             self._database_blocked.value = True
+            self._status_snapshots.invalidate(*TABLE_SNAPSHOTS)
             job_thread = Thread(
-                target=load_tables_job,
+                target=self._run_job,
                 args=(
-                    self._database_blocked,
-                    workload_type,
-                    scalefactor,
-                    self._connection_factory,
-                    self._workload_drivers,
+                    load_tables_job,
+                    (
+                        self._database_blocked,
+                        workload_type,
+                        scalefactor,
+                        self._connection_factory,
+                        self._workload_drivers,
+                    ),
+                    TABLE_SNAPSHOTS,
                 ),
             )
             job_thread.start()
@@ -81,14 +104,19 @@ class AsynchronousJobHandler:
         """
         if not self._database_blocked.value:
             self._database_blocked.value = True
+            self._status_snapshots.invalidate(*TABLE_SNAPSHOTS)
             job_thread = Thread(
-                target=delete_tables_job,
+                target=self._run_job,
                 args=(
-                    self._database_blocked,
-                    workload_type,
-                    scalefactor,
-                    self._connection_factory,
-                    self._workload_drivers,
+                    delete_tables_job,
+                    (
+                        self._database_blocked,
+                        workload_type,
+                        scalefactor,
+                        self._connection_factory,
+                        self._workload_drivers,
+                    ),
+                    TABLE_SNAPSHOTS,
                 ),
             )
             job_thread.start()
@@ -110,11 +138,13 @@ class AsynchronousJobHandler:
         if active_plugin_names is None or plugin in active_plugin_names:
             return False
         if not self._database_blocked.value:
+            self._status_snapshots.invalidate(*PLUGIN_SNAPSHOTS)
             job_thread = Thread(
-                target=activate_plugin_job,
+                target=self._run_job,
                 args=(
-                    self._connection_factory,
-                    plugin,
+                    activate_plugin_job,
+                    (self._connection_factory, plugin),
+                    PLUGIN_SNAPSHOTS,
                 ),
             )
             job_thread.start()
@@ -136,11 +166,13 @@ class AsynchronousJobHandler:
         if active_plugins is None or plugin not in active_plugins:
             return False
         if not self._database_blocked.value:
+            self._status_snapshots.invalidate(*PLUGIN_SNAPSHOTS)
             job_thread = Thread(
-                target=deactivate_plugin_job,
+                target=self._run_job,
                 args=(
-                    self._connection_factory,
-                    plugin,
+                    deactivate_plugin_job,
+                    (self._connection_factory, plugin),
+                    PLUGIN_SNAPSHOTS,
                 ),
             )
             job_thread.start()
@@ -1,5 +1,9 @@
 """CLI used to start the database manager."""
 from hyrisecockpit.settings import (
+    DB_MANAGER_CALL_WORKERS,
+    DB_MANAGER_CONNECTION_POOL_SIZE,
+    DB_MANAGER_FAN_OUT_TIMEOUT,
+    DB_MANAGER_FAN_OUT_WORKERS,
     DB_MANAGER_LISTENING,
     DB_MANAGER_PORT,
     STORAGE_HOST,
@@ -25,6 +29,10 @@ def main() -> None:
             STORAGE_PASSWORD,
             STORAGE_PORT,
             STORAGE_USER,
+            DB_MANAGER_CALL_WORKERS,
+            DB_MANAGER_FAN_OUT_WORKERS,
+            DB_MANAGER_FAN_OUT_TIMEOUT,
+            DB_MANAGER_CONNECTION_POOL_SIZE,
         ) as database_manager:
             database_manager.start()
     except KeyboardInterrupt:
@@ -0,0 +1,160 @@
+"""Bounded pool of connections to a Hyrise instance.
+
+The jobs of a database connect to its Hyrise instance several times per
+second. The pool keeps their connections open between the jobs instead of
+connecting for every job. It holds at most max_size connections, a job that
+needs a connection while all of them are in use waits for one. Connections
+are replaced when they get older than their maximum lifetime, and checked
+with a query before they are handed out after they were idle for a while.
+"""
+from collections import deque
+from threading import Condition
+from time import time_ns
+from typing import Any, Callable, Deque, Dict, Tuple
+
+from psycopg2 import DatabaseError, InterfaceError, OperationalError
+
+
+class ConnectionPool:
+    """Thread-safe pool of psycopg2 connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int,
+        max_lifetime: float,
+        health_check_interval: float,
+        acquire_timeout: float,
+    ) -> None:
+        """Initialize an empty ConnectionPool.
+
+        The lifetime, health check interval and acquire timeout are in
+        seconds. An idle connection is checked if it wasn't used for the
+        health check interval.
+        """
+        if max_size < 1:
+            raise ValueError("The pool needs room for at least one connection")
+        self._connect = connect
+        self._max_size = max_size
+        self._max_lifetime = int(max_lifetime * 1_000_000_000)
+        self._health_check_interval = int(health_check_interval * 1_000_000_000)
+        self._acquire_timeout = acquire_timeout
+        self._condition: Condition = Condition()
+        self._idle: Deque[Tuple[Any, int, int]] = deque()
+        self._created: Dict[int, int] = {}
+        self._size: int = 0
+        self._closed: bool = False
+        self._statistics: Dict[str, int] = {
+            "creates": 0,
+            "discards": 0,
+            "waits": 0,
+            "wait_time": 0,
+        }
+
+    def _is_expired(self, createdts: int, now: int) -> bool:
+        return now - createdts >= self._max_lifetime
+
+    def _is_healthy(self, connection: Any) -> bool:
+        """Return whether the connection still answers a query."""
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT 1;")
+        except (DatabaseError, InterfaceError):
+            return False
+        return True
+
+    def _discard(self, connection: Any) -> None:
+        """Close a connection and free its place in the pool."""
+        try:
+            connection.close()
+        except (DatabaseError, InterfaceError):
+            pass
+        with self._condition:
+            self._created.pop(id(connection), None)
+            self._size -= 1
+            self._statistics["discards"] += 1
+            self._condition.notify()
+
+    def _take_idle_or_reserve(self) -> Tuple[Any, int]:
+        """Return an idle connection, or None after reserving a new place.
+
+        Waits if the pool is full, raises an OperationalError if no
+        connection becomes free in time.
+        """
+        with self._condition:
+            if not self._idle and self._size >= self._max_size:
+                self._statistics["waits"] += 1
+                startts = time_ns()
+                available = self._condition.wait_for(
+                    lambda: self._idle or self._size < self._max_size,
+                    timeout=self._acquire_timeout,
+                )
+                self._statistics["wait_time"] += time_ns() - startts
+                if not available:
+                    raise OperationalError("No pooled connection became free in time")
+            if self._idle:
+                connection, _, last_usedts = self._idle.pop()
+                return connection, last_usedts
+            self._size += 1
+            return None, 0
+
+    def acquire(self) -> Any:
+        """Return a healthy connection of the pool."""
+        while True:
+            connection, last_usedts = self._take_idle_or_reserve()
+            if connection is None:
+                break
+            now = time_ns()
+            if (
+                connection.closed
+                or self._is_expired(self._created[id(connection)], now)
+                or (
+                    now - last_usedts >= self._health_check_interval
+                    and not self._is_healthy(connection)
+                )
+            ):
+                self._discard(connection)
+                continue
+            return connection
+        try:
+            connection = self._connect()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created[id(connection)] = time_ns()
+            self._statistics["creates"] += 1
+        return connection
+
+    def release(self, connection: Any, broken: bool = False) -> None:
+        """Return a connection to the pool, close it if it is broken."""
+        if (
+            broken
+            or self._closed
+            or connection.closed
+            or self._is_expired(self._created[id(connection)], time_ns())
+        ):
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, self._created[id(connection)], time_ns()))
+            self._condition.notify()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Return the connections in use and idle and the counters of the pool."""
+        with self._condition:
+            return {
+                **self._statistics,
+                "in_use": self._size - len(self._idle),
+                "idle": len(self._idle),
+            }
+
+    def close(self) -> None:
+        """Close the idle connections, connections in use close on release."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for connection, _, _ in idle:
+            self._discard(connection)
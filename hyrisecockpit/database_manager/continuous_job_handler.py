@@ -1,9 +1,11 @@
 from multiprocessing import Value
+from typing import Dict
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from .cursor import ConnectionFactory, StorageConnectionFactory
 from .job.ping_hyrise import ping_hyrise
+from .job.update_latency_percentiles import update_latency_percentiles
 from .job.update_chunks_data import update_chunks_data
 from .job.update_plugin_log import update_plugin_log
 from .job.update_queue_length import update_queue_length
@@ -17,6 +19,9 @@ from .job.update_workload_statement_information import (
     update_workload_statement_information,
 )
 from .job.update_memory_footprint import update_memory_footprint
+from .job.update_status_snapshots import update_status_snapshots
+from .job.update_connection_pool import update_connection_pool
+from .status_snapshots import StatusSnapshots
 from .worker_pool import WorkerPool
 
 
@@ -35,6 +40,8 @@ class ContinuousJobHandler:
         worker_pool: WorkerPool,
         storage_connection_factory: StorageConnectionFactory,
         database_blocked: Value,
+        workload_drivers: Dict,
+        status_snapshots: StatusSnapshots,
     ):
         """Initialize continuous Job Handler.
 
@@ -51,12 +58,17 @@ class ContinuousJobHandler:
                 saved in this object.
             database_blocked: Flag stored in a shared memory map. This flag
                 stores if the Hyrise instance is blocked or not.
+            workload_drivers: A dictionary containing all workload drivers (TPCC,...)
+            status_snapshots: The snapshots of the loaded tables and plug-ins of
+                the Hyrise instance that requests are answered with.
         """
         self._connection_factory = connection_factory
         self._hyrise_active = hyrise_active
         self._worker_pool = worker_pool
         self._storage_connection_factory = storage_connection_factory
         self._database_blocked: Value = database_blocked
+        self._workload_drivers: Dict = workload_drivers
+        self._status_snapshots: StatusSnapshots = status_snapshots
         self._previous_system_data = {
             "previous_system_usage": None,
             "previous_process_usage": None,
@@ -85,6 +97,12 @@ class ContinuousJobHandler:
             seconds=1,
             args=(self._worker_pool, self._storage_connection_factory),
         )
+        self._update_latency_percentiles_job = self._scheduler.add_job(
+            func=update_latency_percentiles,
+            trigger="interval",
+            seconds=1,
+            args=(self._storage_connection_factory,),
+        )
         self._update_system_data_job = self._scheduler.add_job(
             func=update_system_data,
             trigger="interval",
@@ -166,6 +184,25 @@ class ContinuousJobHandler:
                 self._storage_connection_factory,
             ),
         )
+        self._update_connection_pool_job = self._scheduler.add_job(
+            func=update_connection_pool,
+            trigger="interval",
+            seconds=1,
+            args=(
+                self._connection_factory,
+                self._storage_connection_factory,
+            ),
+        )
+        self._update_status_snapshots_job = self._scheduler.add_job(
+            func=update_status_snapshots,
+            trigger="interval",
+            seconds=5,
+            args=(
+                self._connection_factory,
+                self._workload_drivers,
+                self._status_snapshots,
+            ),
+        )
 
     def start(self) -> None:
         """Start background scheduler."""
@@ -183,7 +220,10 @@ class ContinuousJobHandler:
         self._update_storage_data_job.remove()
         self._update_plugin_log_job.remove()
         self._update_queue_length_job.remove()
+        self._update_latency_percentiles_job.remove()
         self._update_workload_operator_information_job.remove()
         self._update_memory_footprint_job.remove()
+        self._update_status_snapshots_job.remove()
+        self._update_connection_pool_job.remove()
         self._ping_hyrise_job.remove()
         self._scheduler.shutdown()
@@ -1,13 +1,29 @@
 """Utility custom cursors."""
+from time import time_ns
 from types import TracebackType
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypedDict, Union
 
 from pandas import DataFrame
 from pandas.io.sql import read_sql_query as read_sql_query_pandas
-from psycopg2 import Error, connect
+from psycopg2 import Error, InterfaceError, OperationalError, connect
 
 from influxdb import InfluxDBClient
 
+from hyrisecockpit.settings import (
+    STORAGE_WRITER_BUFFER_SIZE,
+    STORAGE_WRITER_FLUSH_INTERVAL,
+    STORAGE_WRITER_FLUSH_SIZE,
+)
+
+from .connection_pool import ConnectionPool
+from .storage_writer import StorageWriter
+
+
+SuccessfulQuery = Tuple[int, int, str, float, str, str, bool, int, int, int]
+AggregatedQueries = Tuple[
+    int, str, float, str, str, bool, int, int, int, int, str, int, str, int, int
+]
+
 
 class PointBase(TypedDict):
     """Minimal type of an Influx point for write_points."""
@@ -42,6 +58,7 @@ class HyriseCursor:
         self._port: str = port
         self._dbname: str = dbname
         self._autocommit: bool = autocommit
+        self._statistics: Dict[str, int] = {}
 
     def __enter__(self) -> "HyriseCursor":
         """Return self for a context manager."""
@@ -67,8 +84,32 @@ class HyriseCursor:
         self.connection.close()
         return None
 
+    def count(self, name: str, value: int = 1) -> None:
+        """Add a value to a connection statistic."""
+        self._statistics[name] = self._statistics.get(name, 0) + value
+
+    def take_statistics(self) -> Dict[str, int]:
+        """Return the connection statistics since the last call and reset them."""
+        statistics, self._statistics = self._statistics, {}
+        return statistics
+
+    def rollback(self) -> None:
+        """Roll back the current transaction and keep the connection.
+
+        The connection is only reset if the rollback itself fails.
+        """
+        startts = time_ns()
+        try:
+            self.connection.rollback()
+        except Error:
+            self.reset()
+            return
+        self.count("rollbacks")
+        self.count("rollback_latency", time_ns() - startts)
+
     def reset(self) -> None:
         """Reset connection."""
+        self.count("reconnects")
         self._cur.close()
         self.connection.close()
         self.connection = connect(
@@ -121,29 +162,141 @@ class HyriseCursor:
         return True
 
 
+class PooledHyriseCursor(HyriseCursor):
+    """Context manager for a connection of a connection pool.
+
+    The connection is taken from the pool on enter and returned on exit. A
+    connection that failed with an OperationalError or InterfaceError is
+    closed instead of returned.
+    """
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        """Initialize a PooledHyriseCursor."""
+        self._pool: ConnectionPool = pool
+        self._statistics: Dict[str, int] = {}
+
+    def __enter__(self) -> "PooledHyriseCursor":
+        """Take a connection of the pool for a context manager."""
+        self.connection = self._pool.acquire()
+        self._cur = self.connection.cursor()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        """Return the connection to the pool."""
+        broken = exc_type is not None and issubclass(
+            exc_type, (OperationalError, InterfaceError)
+        )
+        try:
+            self._cur.close()
+        except Error:
+            broken = True
+        self._pool.release(self.connection, broken)
+        return None
+
+    def reset(self) -> None:
+        """Replace the connection with another one of the pool."""
+        self.count("reconnects")
+        self._pool.release(self.connection, broken=True)
+        self.connection = self._pool.acquire()
+        self._cur = self.connection.cursor()
+
+
 class ConnectionFactory:
-    """Factory for creating cursors."""
+    """Factory for creating cursors.
+
+    With a pool size, autocommit cursors share a bounded pool of
+    connections instead of connecting for every cursor. Cursors without
+    autocommit always get their own connection, as they keep it for a long
+    time, like the task workers do.
+    """
 
-    def __init__(self, user: str, password: str, host: str, port: str, dbname: str):
+    def __init__(
+        self,
+        user: str,
+        password: str,
+        host: str,
+        port: str,
+        dbname: str,
+        pool_size: int = 0,
+        pool_max_lifetime: float = 300.0,
+        pool_health_check_interval: float = 10.0,
+        pool_acquire_timeout: float = 5.0,
+    ):
         """Initialize the connection attributes."""
         self._user: str = user
         self._password: str = password
         self._host: str = host
         self._port: str = port
         self._dbname: str = dbname
+        self._pool: Optional[ConnectionPool] = (
+            ConnectionPool(
+                self._connect,
+                pool_size,
+                pool_max_lifetime,
+                pool_health_check_interval,
+                pool_acquire_timeout,
+            )
+            if pool_size > 0
+            else None
+        )
 
-    def create_cursor(self, autocommit: bool = True) -> HyriseCursor:
-        """Create new HyriseCursor."""
+    def _connect(self) -> Any:
+        """Open a connection with autocommit for the pool."""
+        connection = connect(
+            host=self._host,
+            port=self._port,
+            user=self._user,
+            password=self._password,
+            dbname=self._dbname,
+        )
+        connection.set_session(autocommit=True)
+        return connection
+
+    def create_cursor(
+        self, autocommit: bool = True, pooled: bool = True
+    ) -> HyriseCursor:
+        """Create new HyriseCursor.
+
+        The cursor uses the pool if there is one, it has autocommit and it
+        isn't explicitly unpooled.
+        """
+        if self._pool is not None and autocommit and pooled:
+            return PooledHyriseCursor(self._pool)
         return HyriseCursor(
             self._host, self._port, self._user, self._password, self._dbname, autocommit
         )
 
+    def get_pool_statistics(self) -> Optional[Dict[str, int]]:
+        """Return the statistics of the pool, None without a pool."""
+        return self._pool.get_statistics() if self._pool is not None else None
+
+    def close(self) -> None:
+        """Close the connections of the pool."""
+        if self._pool is not None:
+            self._pool.close()
+
 
 class StorageCursor:
-    """Context Manager for a connection to log queries persistently."""
+    """Context Manager for a connection to log queries persistently.
+
+    With a writer, the cursor uses the long-lived client of the writer and
+    hands its points to the writer, which writes them in batches. Without a
+    writer, it connects on enter and writes its points right away.
+    """
 
     def __init__(
-        self, host: str, port: str, user: str, password: str, database_id: str
+        self,
+        host: str,
+        port: str,
+        user: str,
+        password: str,
+        database_id: str,
+        writer: Optional[StorageWriter] = None,
     ) -> None:
         """Initialize a StorageCursor."""
         self._host: str = host
@@ -151,11 +304,15 @@ class StorageCursor:
         self._user: str = user
         self._password: str = password
         self._database_id: str = database_id
+        self._writer: Optional[StorageWriter] = writer
 
     def __enter__(self) -> "StorageCursor":
         """Establish a connection."""
-        self._connection: InfluxDBClient = InfluxDBClient(
-            self._host, self._port, self._user, self._password
+        if self._writer is not None:
+            self._connection: InfluxDBClient = self._writer.client
+            return self
+        self._connection = InfluxDBClient(
+            self._host, self._port, self._user, self._password, gzip=True
         )
         self._connection.create_database(self._database_id)
         return self
@@ -167,11 +324,14 @@ class StorageCursor:
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
         """Call close with a context manager."""
-        self._connection.close()
+        if self._writer is None:
+            self._connection.close()
         return None
 
     def __write_points(self, points: Iterable[Point]) -> None:
         """Write multiple points to the database."""
+        if self._writer is not None:
+            return self._writer.write(list(points))
         return self._connection.write_points(list(points), database=self._database_id)
 
     def __write_point(self, point: Point) -> None:
@@ -205,9 +365,7 @@ class StorageCursor:
             Point(measurement=measurement, fields=fields, time=time_stamp)
         )
 
-    def log_queries(
-        self, query_list: List[Tuple[int, int, str, float, str, str, bool]]
-    ) -> None:
+    def log_queries(self, query_list: List[SuccessfulQuery]) -> None:
         """Log a couple of succesfully executed queries."""
         self.__write_points(
             Point(
@@ -219,12 +377,80 @@ class StorageCursor:
                     "worker_id": query[5],
                     "commited": query[6],
                 },
-                fields={"latency": query[1]},
+                fields={
+                    "latency": query[1],
+                    "response_time": query[7],
+                    "queue_wait_time": query[8],
+                    "end_to_end_latency": query[9],
+                },
                 time=query[0],
             )
             for query in query_list
         )
 
+    def log_aggregated_queries(self, aggregate_list: List[AggregatedQueries]) -> None:
+        """Log the aggregated latencies of succesfully executed queries."""
+        self.__write_points(
+            Point(
+                measurement="aggregated_queries",
+                tags={
+                    "benchmark": aggregate[1],
+                    "scalefactor": aggregate[2],
+                    "query_no": aggregate[3],
+                    "worker_id": aggregate[4],
+                    "commited": aggregate[5],
+                },
+                fields={
+                    "count": aggregate[6],
+                    "latency_sum": aggregate[7],
+                    "latency_min": aggregate[8],
+                    "latency_max": aggregate[9],
+                    "latency_histogram": aggregate[10],
+                    "response_time_sum": aggregate[11],
+                    "response_time_histogram": aggregate[12],
+                    "queue_wait_time_sum": aggregate[13],
+                    "end_to_end_latency_sum": aggregate[14],
+                },
+                time=aggregate[0],
+            )
+            for aggregate in aggregate_list
+        )
+
+    def log_latency_percentiles(
+        self, percentile_list: List[Tuple[int, str, str, Dict[str, Any]]]
+    ) -> None:
+        """Log latency percentiles per second, benchmark and query type."""
+        self.__write_points(
+            Point(
+                measurement="latency_percentiles",
+                tags={"benchmark": percentiles[1], "query_no": percentiles[2]},
+                fields=percentiles[3],
+                time=percentiles[0],
+            )
+            for percentiles in percentile_list
+        )
+
+    def get_latency_histograms(
+        self, startts: int, endts: int
+    ) -> List[Tuple[int, str, str, str]]:
+        """Get the latency histograms of the aggregated queries in a time range."""
+        result = self._connection.query(
+            'SELECT "latency_histogram" FROM aggregated_queries WHERE time >= $startts AND time < $endts GROUP BY benchmark, query_no;',
+            database=self._database_id,
+            bind_params={"startts": startts, "endts": endts},
+            epoch="ns",
+        )
+        return [
+            (
+                point["time"],
+                tags["benchmark"],
+                tags["query_no"],
+                point["latency_histogram"],
+            )
+            for (_, tags), points in result.items()
+            for point in points
+        ]
+
     def log_failed_queries(self, query_list: List[Tuple[int, str, str, str]]):
         """Log failed queries."""
         self.__write_points(
@@ -237,6 +463,32 @@ class StorageCursor:
             for query in query_list
         )
 
+    def log_result_log_statistics(
+        self, worker_id: str, fields: Dict[str, int], time_stamp: int
+    ) -> None:
+        """Log statistics of the result logger of a task worker."""
+        self.__write_point(
+            Point(
+                measurement="result_log",
+                tags={"worker_id": worker_id},
+                fields=fields,
+                time=time_stamp,
+            )
+        )
+
+    def log_connection_statistics(
+        self, worker_id: str, fields: Dict[str, int], time_stamp: int
+    ) -> None:
+        """Log statistics of the database connection of a task worker."""
+        self.__write_point(
+            Point(
+                measurement="connection",
+                tags={"worker_id": worker_id},
+                fields=fields,
+                time=time_stamp,
+            )
+        )
+
     def log_plugin_log(self, plugin_log: List[Tuple[int, str, str, str]]) -> None:
         """Log a couple of succesfully executed queries."""
         self.__write_points(
@@ -251,7 +503,12 @@ class StorageCursor:
 
 
 class StorageConnectionFactory:
-    """Factory for creating storage cursors."""
+    """Factory for creating storage cursors.
+
+    All cursors of the factory share one writer, so the continuous jobs of a
+    database don't connect to the storage on every run and their points are
+    written in batches.
+    """
 
     def __init__(
         self,
@@ -260,6 +517,9 @@ class StorageConnectionFactory:
         host: str,
         port: str,
         database_id: str,
+        buffer_size: int = STORAGE_WRITER_BUFFER_SIZE,
+        flush_size: int = STORAGE_WRITER_FLUSH_SIZE,
+        flush_interval: float = STORAGE_WRITER_FLUSH_INTERVAL,
     ):
         """Initialize the connection attributes."""
         self._host: str = host
@@ -267,9 +527,29 @@ class StorageConnectionFactory:
         self._user: str = user
         self._password: str = password
         self._database_id: str = database_id
+        self._writer: StorageWriter = StorageWriter(
+            host,
+            port,
+            user,
+            password,
+            database_id,
+            buffer_size,
+            flush_size,
+            flush_interval,
+        )
 
     def create_cursor(self) -> StorageCursor:
-        """Create new StorageCursor."""
+        """Create new StorageCursor, start the writer on the first one."""
+        self._writer.start()
         return StorageCursor(
-            self._host, self._port, self._user, self._password, self._database_id
+            self._host,
+            self._port,
+            self._user,
+            self._password,
+            self._database_id,
+            self._writer,
         )
+
+    def close(self) -> None:
+        """Write the buffered points and close the writer."""
+        self._writer.close()
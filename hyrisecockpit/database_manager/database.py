@@ -11,6 +11,7 @@ from .cursor import ConnectionFactory, StorageConnectionFactory
 from .synchronous_job_handler import SynchronousJobHandler
 from .worker_pool import WorkerPool
 from .interfaces import SqlResultInterface
+from .status_snapshots import StatusSnapshot, StatusSnapshots
 
 PluginSetting = TypedDict(
     "PluginSetting",
@@ -43,6 +44,7 @@ class Database(object):
         storage_password: str,
         storage_port: str,
         storage_user: str,
+        connection_pool_size: int = 4,
     ) -> None:
         """Initialize database object.
 
@@ -62,6 +64,8 @@ class Database(object):
             storage_password: Password to connect to the influx database.
             storage_port: Port of the influx database.
             storage_user: User of the influx database.
+            connection_pool_size: Number of connections the jobs share with the
+                Hyrise instance. The task workers have their own connections.
 
         Note:
             The attributes user, password, host, port and dbname are the same attributes
@@ -70,6 +74,8 @@ class Database(object):
         Attributes:
             _connection_factory: This factory builds a Hyrise connection.
             _storage_connection_factory: This factory builds a influx connection.
+            _status_snapshots: The loaded tables and plug-ins of the Hyrise
+                instance that requests are answered with.
         """
         self._id = id
         self.number_workers: int = number_workers
@@ -83,7 +89,7 @@ class Database(object):
         }
 
         self._connection_factory: ConnectionFactory = ConnectionFactory(
-            **self.connection_information
+            **self.connection_information, pool_size=connection_pool_size
         )
 
         self._storage_connection_factory: StorageConnectionFactory = (
@@ -99,6 +105,7 @@ class Database(object):
         self._database_blocked: Value = Value("b", False)
         self._hyrise_active: Value = Value("b", True)
         self._workload_drivers: Dict = Connector.get_workload_drivers()  # type: ignore
+        self._status_snapshots: StatusSnapshots = StatusSnapshots()
         self._worker_pool: WorkerPool = WorkerPool(
             self._connection_factory,
             self.number_workers,
@@ -113,17 +120,21 @@ class Database(object):
             self._worker_pool,
             self._storage_connection_factory,
             self._database_blocked,
+            self._workload_drivers,
+            self._status_snapshots,
         )
         self._asynchronous_job_handler = AsynchronousJobHandler(
             self._database_blocked,
             self._connection_factory,
             self._workload_drivers,
+            self._status_snapshots,
         )
         self._synchronous_job_handler = SynchronousJobHandler(  # type: ignore
             self._connection_factory,
             self._database_blocked,
             self._id,
             self._workload_drivers,
+            self._status_snapshots,
         )
         self._initialize_influx()
         self._continuous_job_handler.start()
@@ -136,15 +147,15 @@ class Database(object):
         runs. Then we create a new database inside influx with the database id
         (Hyrise). After that we create a continuous query that the influx is running
         every x seconds. For example, to automatically calculate the throughput
-        per second.
+        per second from the per second aggregates written by the task workers.
         """
         with self._storage_connection_factory.create_cursor() as cursor:
             cursor.drop_database()
             cursor.create_database()
 
-            throughput_continuous_query = """SELECT count("latency") AS "throughput"
+            throughput_continuous_query = """SELECT sum("count") AS "throughput"
                 INTO "throughput"
-                FROM "successful_queries"
+                FROM "aggregated_queries"
                 WHERE commited='True'
                 GROUP BY time(1s)"""
             throughput_resample_options = "EVERY 1s FOR 5s"
@@ -154,9 +165,9 @@ class Database(object):
                 throughput_resample_options,
             )
 
-            negative_throughput_continuous_query = """SELECT count("latency") AS "negative_throughput"
+            negative_throughput_continuous_query = """SELECT sum("count") AS "negative_throughput"
                 INTO "negative_throughput"
-                FROM "successful_queries"
+                FROM "aggregated_queries"
                 WHERE commited='False'
                 GROUP BY time(1s)"""
             negative_throughput_resample_options = "EVERY 1s FOR 5s"
@@ -166,9 +177,9 @@ class Database(object):
                 negative_throughput_resample_options,
             )
 
-            latency_continuous_query = """SELECT mean("latency") AS "latency"
+            latency_continuous_query = """SELECT sum("latency_sum") / sum("count") AS "latency"
                 INTO "latency"
-                FROM "successful_queries"
+                FROM "aggregated_queries"
                 GROUP BY time(1s)"""
             latency_resample_options = "EVERY 1s FOR 5s"
             cursor.create_continuous_query(
@@ -177,6 +188,50 @@ class Database(object):
                 latency_resample_options,
             )
 
+            response_time_continuous_query = """SELECT sum("response_time_sum") / sum("count") AS "response_time"
+                INTO "response_time"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+            response_time_resample_options = "EVERY 1s FOR 5s"
+            cursor.create_continuous_query(
+                "response_time_calculation",
+                response_time_continuous_query,
+                response_time_resample_options,
+            )
+
+            queue_wait_time_continuous_query = """SELECT sum("queue_wait_time_sum") / sum("count") AS "queue_wait_time"
+                INTO "queue_wait_time"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+            queue_wait_time_resample_options = "EVERY 1s FOR 5s"
+            cursor.create_continuous_query(
+                "queue_wait_time_calculation",
+                queue_wait_time_continuous_query,
+                queue_wait_time_resample_options,
+            )
+
+            end_to_end_latency_continuous_query = """SELECT sum("end_to_end_latency_sum") / sum("count") AS "end_to_end_latency"
+                INTO "end_to_end_latency"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+            end_to_end_latency_resample_options = "EVERY 1s FOR 5s"
+            cursor.create_continuous_query(
+                "end_to_end_latency_calculation",
+                end_to_end_latency_continuous_query,
+                end_to_end_latency_resample_options,
+            )
+
+            connection_statistics_continuous_query = """SELECT sum("reconnects") AS "reconnects", sum("rollbacks") AS "rollbacks", sum("retries") AS "retries", sum("rollback_latency") / sum("rollbacks") AS "rollback_latency"
+                INTO "connection_statistics"
+                FROM "connection"
+                GROUP BY time(1s)"""
+            connection_statistics_resample_options = "EVERY 1s FOR 5s"
+            cursor.create_continuous_query(
+                "connection_statistics_calculation",
+                connection_statistics_continuous_query,
+                connection_statistics_resample_options,
+            )
+
             queue_length_continuous_query = """SELECT mean("queue_length") AS "queue_length"
                 INTO "queue_length"
                 FROM "raw_queue_length"
@@ -189,6 +244,18 @@ class Database(object):
                 queue_length_resample_options,
             )
 
+            target_throughput_continuous_query = """SELECT mean("target_throughput") AS "target_throughput"
+                INTO "target_throughput"
+                FROM "raw_target_throughput"
+                GROUP BY time(1s)
+                FILL(previous)"""
+            target_throughput_resample_options = "EVERY 1s FOR 5s"
+            cursor.create_continuous_query(
+                "target_throughput_calculation",
+                target_throughput_continuous_query,
+                target_throughput_resample_options,
+            )
+
             system_data_metrics = [
                 "available_memory",
                 "cpu_count",
@@ -306,6 +373,10 @@ class Database(object):
         """Get loaded benchmark data."""
         return self._synchronous_job_handler.get_workload_tables_status()
 
+    def get_status_snapshot(self, name: str) -> StatusSnapshot:
+        """Return the snapshot of the loaded tables, workload tables or plug-ins."""
+        return self._synchronous_job_handler.get_status_snapshot(name)
+
     def start_worker(self) -> bool:
         """Start worker."""
         return self._worker_pool.start()
@@ -334,3 +405,5 @@ class Database(object):
         """Close the database."""
         self._worker_pool.terminate()
         self._continuous_job_handler.close()
+        self._connection_factory.close()
+        self._storage_connection_factory.close()
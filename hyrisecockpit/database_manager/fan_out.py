@@ -0,0 +1,69 @@
+"""Fan-out of calls of the database manager to all databases.
+
+Most calls of the database manager connect to every database. The fan-out
+runs them for all databases at once in a bounded thread pool, so the time of
+a call doesn't grow with the number of databases. A database that raises an
+exception or doesn't answer within the timeout doesn't fail the whole call,
+its result is missing and its status tells what happened.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Tuple, TypedDict
+
+from .database import Database
+
+FAN_OUT_STATUSES: Tuple[str, ...] = ("succeeded", "failed", "error", "timeout")
+
+
+class FanOutResult(TypedDict):
+    """Result of a call on one database and its status."""
+
+    status: str
+    result: Optional[Any]
+
+
+def fan_out(
+    databases: Dict[str, Database],
+    function: Callable[[Database], Any],
+    workers: int,
+    timeout: float,
+) -> Dict[str, FanOutResult]:
+    """Call the function for every database in at most workers threads.
+
+    The status of a database is "succeeded" if the function returned a
+    result other than False, "failed" if it returned False, "error" if it
+    raised an exception and "timeout" if it didn't return within timeout
+    seconds from the start of the fan-out. A timed-out call keeps its thread
+    until it returns, but the fan-out doesn't wait for it.
+    """
+    if not databases:
+        return {}
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(databases)))
+    futures = {
+        database_id: executor.submit(function, database)
+        for database_id, database in databases.items()
+    }
+    wait(futures.values(), timeout=timeout)
+    executor.shutdown(wait=False)
+    results: Dict[str, FanOutResult] = {}
+    for database_id, future in futures.items():
+        if not future.done():
+            future.cancel()
+            results[database_id] = FanOutResult(status="timeout", result=None)
+        elif future.exception() is not None:
+            results[database_id] = FanOutResult(status="error", result=None)
+        else:
+            result = future.result()
+            results[database_id] = FanOutResult(
+                status="failed" if result is False else "succeeded", result=result
+            )
+    return results
+
+
+def get_statuses(results: Dict[str, FanOutResult]) -> Dict[str, str]:
+    """Return the status of every database of a fan-out."""
+    return {database_id: result["status"] for database_id, result in results.items()}
+
+
+def all_succeeded(results: Dict[str, FanOutResult]) -> bool:
+    """Return whether the call succeeded on all databases."""
+    return all(result["status"] == "succeeded" for result in results.values())
@@ -24,11 +24,15 @@ def _format_query_parameters(parameters) -> Optional[Tuple[Any, ...]]:
 def _execute_table_query(
     query_tuple: Tuple, connection_factory: ConnectionFactory
 ) -> None:
-    """Execute loading or deleting table query."""
+    """Execute loading or deleting table query.
+
+    The queries run for minutes, so they don't take connections of the pool
+    the monitoring jobs need.
+    """
     query, parameters = query_tuple
     formatted_parameters = _format_query_parameters(parameters)
     try:
-        with connection_factory.create_cursor() as cur:
+        with connection_factory.create_cursor(pooled=False) as cur:
             cur.execute(query, formatted_parameters)
     except (DatabaseError, InterfaceError, ProgrammingError):
         return None  # TODO: log error
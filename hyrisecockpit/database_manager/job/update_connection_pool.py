@@ -0,0 +1,19 @@
+"""This job logs the statistics of the connection pool of the Hyrise."""
+from time import time_ns
+
+from hyrisecockpit.database_manager.cursor import (
+    ConnectionFactory,
+    StorageConnectionFactory,
+)
+
+
+def update_connection_pool(
+    connection_factory: ConnectionFactory,
+    storage_connection_factory: StorageConnectionFactory,
+) -> None:
+    """Log the connections in use and idle, the creates and the waits of the pool."""
+    statistics = connection_factory.get_pool_statistics()
+    if statistics is None:
+        return
+    with storage_connection_factory.create_cursor() as log:
+        log.log_meta_information("connection_pool", statistics, time_ns())
@@ -0,0 +1,59 @@
+"""This job rolls up the latency histograms into latency percentiles."""
+from time import time_ns
+from typing import Any, Dict, List, Tuple
+
+from hyrisecockpit.database_manager.cursor import StorageConnectionFactory
+from hyrisecockpit.latency_histogram import (
+    ALL_QUERIES,
+    LATENCY_PERCENTILES,
+    LatencyHistogram,
+)
+
+# like the continuous queries, recent seconds are recalculated to include late results
+ROLLUP_WINDOW: int = 5_000_000_000
+
+
+def _roll_up_histograms(
+    histograms: List[Tuple[int, str, str, str]]
+) -> Dict[Tuple[int, str, str], LatencyHistogram]:
+    """Merge the histograms of all task workers per query type, benchmark and database."""
+    rollups: Dict[Tuple[int, str, str], LatencyHistogram] = {}
+    for time_stamp, benchmark, query_no, encoded_histogram in histograms:
+        histogram = LatencyHistogram.decode(encoded_histogram)
+        for key in (
+            (time_stamp, benchmark, query_no),
+            (time_stamp, benchmark, ALL_QUERIES),
+            (time_stamp, ALL_QUERIES, ALL_QUERIES),
+        ):
+            rollups.setdefault(key, LatencyHistogram()).merge(histogram)
+    return rollups
+
+
+def _get_fields(histogram: LatencyHistogram) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {
+        name: histogram.get_percentile(percentile)
+        for name, percentile in LATENCY_PERCENTILES.items()
+    }
+    fields["count"] = histogram.count
+    fields["latency_histogram"] = histogram.encode()
+    return fields
+
+
+def update_latency_percentiles(
+    storage_connection_factory: StorageConnectionFactory,
+) -> None:
+    """Update latency percentiles of the last completed seconds."""
+    current_time_stamp = time_ns()
+    endts = current_time_stamp - current_time_stamp % 1_000_000_000
+    startts = endts - ROLLUP_WINDOW
+    with storage_connection_factory.create_cursor() as log:
+        histograms = log.get_latency_histograms(startts, endts)
+        if not histograms:
+            return
+        rollups = _roll_up_histograms(histograms)
+        log.log_latency_percentiles(
+            [
+                (time_stamp, benchmark, query_no, _get_fields(histogram))
+                for (time_stamp, benchmark, query_no), histogram in rollups.items()
+            ]
+        )
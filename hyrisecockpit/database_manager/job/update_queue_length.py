@@ -1,4 +1,4 @@
-"""This job updates the queue length."""
+"""This job updates the queue length and the targeted throughput."""
 from time import time_ns
 
 from hyrisecockpit.database_manager.cursor import StorageConnectionFactory
@@ -8,8 +8,9 @@ def update_queue_length(
     worker_pool,
     storage_connection_factory: StorageConnectionFactory,
 ) -> None:
-    """Update queue length."""
+    """Update queue length and the throughput the workload generator targets."""
     queue_length: int = worker_pool.get_queue_length()
+    target_throughput: float = worker_pool.get_target_throughput()
     time_stamp: int = time_ns()
     with storage_connection_factory.create_cursor() as log:
         log.log_meta_information(
@@ -17,3 +18,8 @@ def update_queue_length(
             {"queue_length": queue_length},
             time_stamp,
         )
+        log.log_meta_information(
+            "raw_target_throughput",
+            {"target_throughput": target_throughput},
+            time_stamp,
+        )
@@ -0,0 +1,28 @@
+"""This job refreshes the status snapshots of the Hyrise."""
+from typing import Dict
+
+from hyrisecockpit.database_manager.status_snapshots import StatusSnapshots
+
+from .get_detailed_plugins import get_detailed_plugins
+from .get_loaded_tables_in_database import get_loaded_tables_in_database
+from .get_workload_tables_status import workload_tables_status
+
+
+def update_status_snapshots(
+    connection_factory, workload_drivers: Dict, status_snapshots: StatusSnapshots
+) -> None:
+    """Refresh the loaded tables, the workload tables status and the plug-ins.
+
+    The workload tables status is derived from the loaded tables, so both
+    snapshots need one query.
+    """
+    loaded_tables = status_snapshots.refresh(
+        "loaded_tables", lambda: get_loaded_tables_in_database(connection_factory)
+    )
+    status_snapshots.refresh(
+        "workload_tables_status",
+        lambda: workload_tables_status(loaded_tables["value"], workload_drivers),
+    )
+    status_snapshots.refresh(
+        "detailed_plugins", lambda: get_detailed_plugins(connection_factory)
+    )
@@ -1,7 +1,7 @@
 """Module for managing databases."""
 
 from types import TracebackType
-from typing import Callable, Dict, Optional, Tuple, Type, TypedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypedDict
 
 from hyrisecockpit.api.app.plugin.interface import UpdatePluginSettingInterface
 from hyrisecockpit.message import (
@@ -17,10 +17,11 @@ from hyrisecockpit.server import Server
 
 from .cursor import HyriseCursor
 from .database import Database, Plugins
+from .fan_out import FanOutResult, all_succeeded, fan_out, get_statuses
 
 DatabaseActivatedPlugins = TypedDict(
     "DatabaseActivatedPlugins",
-    {"id": str, "plugins": Plugins},
+    {"id": str, "plugins": Plugins, "version": int, "age": int},
 )
 
 
@@ -37,20 +38,46 @@ class DatabaseManager(object):
         storage_password: str,
         storage_port: str,
         storage_user: str,
+        call_workers: int = 4,
+        fan_out_workers: int = 8,
+        fan_out_timeout: float = 10.0,
+        connection_pool_size: int = 4,
     ) -> None:
-        """Initialize a DatabaseManager."""
+        """Initialize a DatabaseManager.
+
+        The status calls are answered by the server loop right away. Calls
+        that connect to the databases run in a pool of call_workers threads,
+        calls that change the databases one at a time. The dictionary of the
+        databases is replaced instead of changed, so calls can iterate it
+        while a database is added or deleted.
+
+        Calls for all databases fan out to them in up to fan_out_workers
+        threads and report the status of every database, a database that
+        doesn't answer within fan_out_timeout seconds is left out.
+
+        The jobs of every database share connection_pool_size connections.
+        """
         self._workload_sub_host = workload_sub_host
         self._workload_pubsub_port = workload_pubsub_port
         self._storage_host = storage_host
         self._storage_password = storage_password
         self._storage_port = storage_port
         self._storage_user = storage_user
+        self._fan_out_workers = fan_out_workers
+        self._fan_out_timeout = fan_out_timeout
+        self._connection_pool_size = connection_pool_size
 
         self._databases: Dict[str, Database] = {}
         server_calls: Dict[
             str, Tuple[Callable[[Body], Response], Optional[Dict]]
         ] = self._get_server_calls()
-        self._server = Server(db_manager_listening, db_manager_port, server_calls)
+        self._server = Server(
+            db_manager_listening,
+            db_manager_port,
+            server_calls,
+            concurrency=self._get_call_concurrency(),
+            workers=call_workers,
+        )
 
     def __enter__(self) -> "DatabaseManager":
         """Return self for a context manager."""
@@ -90,6 +117,39 @@ class DatabaseManager(object):
             "workload tables status": (self._call_workload_tables_status, None),
         }
 
+    @staticmethod
+    def _get_call_concurrency() -> Dict[str, str]:
+        return {
+            "add database": "exclusive",
+            "delete database": "exclusive",
+            "start worker": "exclusive",
+            "close worker": "exclusive",
+            "queue length": "inline",
+            "get databases": "inline",
+            "load data": "exclusive",
+            "delete data": "exclusive",
+            "get plugins": "offloaded",
+            "activate plugin": "exclusive",
+            "deactivate plugin": "exclusive",
+            "set plugin setting": "exclusive",
+            "execute sql query": "offloaded",
+            "database status": "inline",
+            "workload tables status": "offloaded",
+        }
+
+    def _fan_out(self, function: Callable[[Database], Any]) -> Dict[str, FanOutResult]:
+        """Call the function for all databases at once."""
+        return fan_out(
+            self._databases, function, self._fan_out_workers, self._fan_out_timeout
+        )
+
+    @staticmethod
+    def _get_fan_out_response(results: Dict[str, FanOutResult]) -> Response:
+        """Return 200 if the call succeeded on all databases, 400 otherwise."""
+        response = get_response(200 if all_succeeded(results) else 400)
+        response["body"]["databases"] = get_statuses(results)
+        return response
+
     def _call_add_database(self, body: Body) -> Response:
         """Add database and initialize driver for it."""
         user = body["user"]
@@ -121,8 +181,9 @@ class DatabaseManager(object):
             self._storage_password,
             self._storage_port,
             self._storage_user,
+            self._connection_pool_size,
         )
-        self._databases[body["id"]] = db_instance
+        self._databases = {**self._databases, body["id"]: db_instance}
         return get_response(200)
 
     def _call_get_databases(self, body: Body) -> Response:
@@ -153,8 +214,13 @@ class DatabaseManager(object):
 
     def _call_delete_database(self, body: Body) -> Response:
         id: str = body["id"]
-        database: Optional[Database] = self._databases.pop(id, None)
+        database: Optional[Database] = self._databases.get(id)
         if database:
+            self._databases = {
+                database_id: other_database
+                for database_id, other_database in self._databases.items()
+                if database_id != id
+            }
             database.close()
             del database
             return get_response(200)
@@ -164,25 +230,34 @@ class DatabaseManager(object):
     def _call_load_data(self, body: Body) -> Response:
         if self._check_if_database_blocked():
             return get_error_response(400, "Already loading data")
-        for database in list(self._databases.values()):
-            if not database.load_data(body):
-                return get_response(400)  # TODO return which DB couldn't import
-        return get_response(200)
+        return self._get_fan_out_response(
+            self._fan_out(lambda database: database.load_data(body))
+        )
 
     def _call_delete_data(self, body: Body) -> Response:
         if self._check_if_database_blocked():
             return get_error_response(400, "Already loading data")
-        for database in list(self._databases.values()):
-            if not database.delete_data(body):
-                return get_response(400)
-        return get_response(200)
+        return self._get_fan_out_response(
+            self._fan_out(lambda database: database.delete_data(body))
+        )
 
     def _call_get_plugins(self, body: Body) -> Response:
+        results = self._fan_out(
+            lambda database: database.get_status_snapshot("detailed_plugins")
+        )
         response = get_response(200)
         response["body"]["plugins"] = [
-            DatabaseActivatedPlugins(id=id, plugins=database.get_detailed_plugins())
-            for id, database in self._databases.items()
+            DatabaseActivatedPlugins(
+                id=id,
+                plugins=result["result"]["value"],
+                version=result["result"]["version"],
+                age=result["result"]["age"],
+            )
+            if result["status"] == "succeeded"
+            else DatabaseActivatedPlugins(id=id, plugins=None, version=0, age=0)
+            for id, result in results.items()
         ]
+        response["body"]["databases"] = get_statuses(results)
         return response
 
     def _call_activate_plugin(self, body: Body) -> Response:
@@ -233,16 +308,14 @@ class DatabaseManager(object):
         return database_blocked_status
 
     def _call_start_worker(self, body: Body) -> Response:
-        for database in self._databases.values():
-            if not database.start_worker():
-                return get_response(400)
-        return get_response(200)
+        return self._get_fan_out_response(
+            self._fan_out(lambda database: database.start_worker())
+        )
 
     def _call_close_worker(self, body: Body) -> Response:
-        for database in self._databases.values():
-            if not database.close_worker():
-                return get_response(400)
-        return get_response(200)
+        return self._get_fan_out_response(
+            self._fan_out(lambda database: database.close_worker())
+        )
 
     def _call_execute_sql_query(self, body: Body) -> Response:
         database_id: str = body["id"]
@@ -269,15 +342,22 @@ class DatabaseManager(object):
         return response
 
     def _call_workload_tables_status(self, body: Body) -> Response:
+        results = self._fan_out(
+            lambda database: database.get_status_snapshot("workload_tables_status")
+        )
         status = [
             {
                 "id": database_id,
-                "workload_tables_status": database.get_workload_tables_status(),
+                "workload_tables_status": result["result"]["value"],
+                "version": result["result"]["version"],
+                "age": result["result"]["age"],
             }
-            for database_id, database in self._databases.items()
+            for database_id, result in results.items()
+            if result["status"] == "succeeded"
         ]
         response = get_response(200)
         response["body"]["workload_tables"] = status
+        response["body"]["databases"] = get_statuses(results)
         return response
 
     def start(self) -> None:
@@ -0,0 +1,78 @@
+"""Snapshots of the status of a Hyrise instance.
+
+Reading the loaded tables or the plug-ins of a Hyrise instance needs
+queries against its meta tables. The snapshots keep the last result of every
+status in memory, so requests are answered without a query. A continuous job
+refreshes them, and jobs that change the status invalidate them, so the next
+read queries the instance again. Every refresh gets a new version, and the
+age of a snapshot tells how long ago it was queried.
+"""
+from threading import Lock
+from time import time_ns
+from typing import Any, Callable, Dict, Optional, Tuple, TypedDict
+
+SNAPSHOT_NAMES: Tuple[str, ...] = (
+    "loaded_tables",
+    "workload_tables_status",
+    "detailed_plugins",
+)
+
+
+class StatusSnapshot(TypedDict):
+    """Status with its version and age (ns)."""
+
+    value: Any
+    version: int
+    age: int
+
+
+class StatusSnapshots:
+    """Thread-safe snapshots of the status of a Hyrise instance."""
+
+    def __init__(self) -> None:
+        """Initialize empty StatusSnapshots."""
+        self._lock: Lock = Lock()
+        self._values: Dict[str, Tuple[Any, int, int]] = {}
+        self._versions: Dict[str, int] = {name: 0 for name in SNAPSHOT_NAMES}
+        self._generations: Dict[str, int] = {name: 0 for name in SNAPSHOT_NAMES}
+
+    def _get_snapshot(self, name: str) -> Optional[StatusSnapshot]:
+        stored = self._values.get(name)
+        if stored is None:
+            return None
+        value, version, takents = stored
+        return StatusSnapshot(value=value, version=version, age=time_ns() - takents)
+
+    def refresh(self, name: str, get_value: Callable[[], Any]) -> StatusSnapshot:
+        """Query the status and store it as the newest snapshot.
+
+        The query runs without the lock. If the snapshot is invalidated while
+        it runs, its result may be outdated and isn't stored.
+        """
+        with self._lock:
+            generation = self._generations[name]
+        takents = time_ns()
+        value = get_value()
+        with self._lock:
+            if self._generations[name] != generation:
+                return StatusSnapshot(value=value, version=self._versions[name], age=0)
+            self._versions[name] += 1
+            self._values[name] = (value, self._versions[name], takents)
+            return StatusSnapshot(
+                value=value, version=self._versions[name], age=time_ns() - takents
+            )
+
+    def get(self, name: str, get_value: Callable[[], Any]) -> StatusSnapshot:
+        """Return the snapshot, query the status if there is none."""
+        with self._lock:
+            snapshot = self._get_snapshot(name)
+        if snapshot is None:
+            snapshot = self.refresh(name, get_value)
+        return snapshot
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the snapshots, so they are queried on the next read."""
+        with self._lock:
+            for name in names:
+                self._values.pop(name, None)
+                self._generations[name] += 1
@@ -0,0 +1,127 @@
+"""Batched writer of the points of a database to the storage.
+
+The continuous jobs of a database log their points every second. Instead of
+connecting to Influx for every job, they hand their points to the one writer
+of the database. The writer buffers the points of all jobs and a flusher
+thread writes them in one request as soon as the buffer holds flush_size
+points or flush_interval seconds have passed. The requests are sent as
+gzipped line protocol over one long-lived client. If the storage can't keep
+up and the buffer is full, new points are dropped and counted. After every
+flush the writer adds its own statistics to the storage_writer measurement.
+"""
+from threading import Condition, Thread
+from time import time_ns
+from typing import Any, Dict, Iterable, List
+
+from influxdb import InfluxDBClient
+from influxdb.exceptions import InfluxDBClientError, InfluxDBServerError
+from requests.exceptions import RequestException
+
+
+class StorageWriter:
+    """Thread-safe writer that batches points for one Influx database."""
+
+    def __init__(
+        self,
+        host: str,
+        port: str,
+        user: str,
+        password: str,
+        database_id: str,
+        buffer_size: int,
+        flush_size: int,
+        flush_interval: float,
+    ) -> None:
+        """Initialize a StorageWriter with its client."""
+        self._database_id: str = database_id
+        self._buffer_size: int = buffer_size
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self.client: InfluxDBClient = InfluxDBClient(
+            host, port, user, password, gzip=True
+        )
+        self._points: List[Dict[str, Any]] = []
+        self._statistics: Dict[str, int] = {}
+        self._running: bool = False
+        self._started: bool = False
+        self._condition: Condition = Condition()
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Create the database and start the flusher thread once."""
+        with self._condition:
+            if self._started:
+                return
+            self._started = True
+            self._running = True
+        try:
+            self.client.create_database(self._database_id)
+        except (InfluxDBClientError, InfluxDBServerError, RequestException):
+            pass
+        self._thread.start()
+
+    def _count(self, name: str, value: int = 1) -> None:
+        self._statistics[name] = self._statistics.get(name, 0) + value
+
+    def write(self, points: Iterable[Dict[str, Any]]) -> None:
+        """Buffer points to be written with the next flush."""
+        with self._condition:
+            for point in points:
+                if len(self._points) >= self._buffer_size:
+                    self._count("dropped_points")
+                    continue
+                self._points.append(point)
+            if len(self._points) >= self._flush_size:
+                self._condition.notify()
+
+    def _flush(self, points: List[Dict[str, Any]]) -> None:
+        startts = time_ns()
+        try:
+            self.client.write_points(points, database=self._database_id)
+            written = True
+        except (InfluxDBClientError, InfluxDBServerError, RequestException):
+            written = False
+        endts = time_ns()
+        with self._condition:
+            self._count("writes")
+            self._count("write_latency", endts - startts)
+            self._statistics["max_write_latency"] = max(
+                self._statistics.get("max_write_latency", 0), endts - startts
+            )
+            if written:
+                self._count("written_points", len(points))
+            else:
+                self._count("failed_writes")
+                self._count("dropped_points", len(points))
+            statistics, self._statistics = self._statistics, {}
+            self._points.append(
+                {"measurement": "storage_writer", "fields": statistics, "time": endts}
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: not self._running or len(self._points) >= self._flush_size,
+                    timeout=self._flush_interval,
+                )
+                running = self._running
+                points, self._points = self._points, []
+            if points:
+                self._flush(points)
+            if not running:
+                return
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Return the statistics since the last flush and the buffered points."""
+        with self._condition:
+            return {**self._statistics, "buffered_points": len(self._points)}
+
+    def close(self) -> None:
+        """Flush the buffered points and close the client."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.client.close()
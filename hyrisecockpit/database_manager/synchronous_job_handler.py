@@ -1,5 +1,5 @@
 """This module handles the synchronous jobs."""
-from typing import Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 
 from hyrisecockpit.database_manager.job.execute_sql_query import (
     execute_sql_query as execute_sql_query_job,
@@ -11,13 +11,14 @@ from hyrisecockpit.database_manager.job.get_loaded_tables_in_database import (
     get_loaded_tables_in_database as get_loaded_tables_in_database_job,
 )
 from hyrisecockpit.database_manager.job.get_workload_tables_status import (
-    get_workload_tables_status as get_workload_tables_status_job,
+    workload_tables_status,
 )
 from hyrisecockpit.database_manager.job.set_plugin_setting import (
     set_plugin_setting as set_plugin_setting_job,
 )
 
 from .interfaces import SqlResultInterface
+from .status_snapshots import StatusSnapshot, StatusSnapshots
 
 PluginSetting = TypedDict(
     "PluginSetting",
@@ -27,42 +28,68 @@ Plugins = Optional[Dict[str, List[PluginSetting]]]
 
 
 class SynchronousJobHandler:
-    """This class handles the synchronous jobs."""
+    """This class handles the synchronous jobs.
+
+    The loaded tables, the workload tables status and the plug-ins are read
+    from the status snapshots, the jobs only run if there is no snapshot.
+    """
 
     def __init__(
-        self, connection_factory, database_blocked, database_id, workload_drivers
+        self,
+        connection_factory,
+        database_blocked,
+        database_id,
+        workload_drivers,
+        status_snapshots,
     ):
         """Initialize synchronous job handler."""
         self._connection_factory = connection_factory
         self._database_blocked = database_blocked
         self._database_id = database_id
         self._workload_drivers = workload_drivers
+        self._status_snapshots: StatusSnapshots = status_snapshots
+        self._snapshot_jobs: Dict[str, Callable[[], Any]] = {
+            "loaded_tables": lambda: get_loaded_tables_in_database_job(
+                self._connection_factory
+            ),
+            "workload_tables_status": lambda: workload_tables_status(
+                self.get_loaded_tables_in_database(), self._workload_drivers
+            ),
+            "detailed_plugins": lambda: get_detailed_plugins_job(
+                self._connection_factory
+            ),
+        }
+
+    def get_status_snapshot(self, name: str) -> StatusSnapshot:
+        """Return a status snapshot, execute its job if there is none."""
+        return self._status_snapshots.get(name, self._snapshot_jobs[name])
 
     def get_loaded_tables_in_database(self) -> List[Dict[str, str]]:
-        """Execute get loaded tables in database job."""
-        return get_loaded_tables_in_database_job(self._connection_factory)
+        """Return the snapshot of the loaded tables in the database."""
+        return self.get_status_snapshot("loaded_tables")["value"]
 
     def get_workload_tables_status(self) -> List:
-        """Execute get workload tables status job."""
-        return get_workload_tables_status_job(
-            self._connection_factory, self._workload_drivers
-        )
+        """Return the snapshot of the workload tables status."""
+        return self.get_status_snapshot("workload_tables_status")["value"]
 
     def get_detailed_plugins(self) -> Plugins:
-        """Execute get detailed plug-ins job."""
-        return get_detailed_plugins_job(self._connection_factory)
+        """Return the snapshot of the detailed plug-ins."""
+        return self.get_status_snapshot("detailed_plugins")["value"]
 
     def set_plugin_setting(
         self, plugin_name: str, setting_name: str, setting_value: str
     ) -> bool:
         """Execute set plug-in settings  job."""
-        return set_plugin_setting_job(
-            plugin_name,
-            setting_name,
-            setting_value,
-            self._connection_factory,
-            self._database_blocked,
-        )
+        try:
+            return set_plugin_setting_job(
+                plugin_name,
+                setting_name,
+                setting_value,
+                self._connection_factory,
+                self._database_blocked,
+            )
+        finally:
+            self._status_snapshots.invalidate("detailed_plugins")
 
     def execute_sql_query(self, query) -> Optional[SqlResultInterface]:
         """Execute execute SQL query job."""
@@ -2,15 +2,33 @@
 
 from multiprocessing import Queue, Value
 from multiprocessing.synchronize import Event as EventType
-from typing import Dict
+from time import time_ns
+from typing import Dict, Optional
 
 from zmq import SUB, SUBSCRIBE, Context
 
+from hyrisecockpit.workload_codec import decode
 
-def handle_published_data(published_data: Dict, task_queue: Queue) -> None:
-    """Fill task queue."""
+
+def update_target_throughput(
+    published_data: Dict, target_throughput: Optional[Value]
+) -> None:
+    """Share the throughput the generator targets in the published second."""
+    if target_throughput is not None and "target_throughput" in published_data["body"]:
+        target_throughput.value = published_data["body"]["target_throughput"]
+
+
+def handle_published_data(
+    published_data: Dict, task_queue: Queue, target_throughput: Optional[Value] = None
+) -> None:
+    """Fill task queue with the tasks of a published chunk.
+
+    Every task is stamped with the time it is put into the queue.
+    """
+    update_target_throughput(published_data, target_throughput)
     tasks = published_data["body"]["querylist"]
     for task in tasks:
+        task["enqueuedts"] = time_ns()
         task_queue.put(task)
 
 
@@ -19,6 +37,7 @@ def fill_queue(
     task_queue: Queue,
     continue_execution_flag: Value,
     worker_wait_for_exit_event: EventType,
+    target_throughput: Optional[Value] = None,
 ) -> None:
     """Fill the queue."""
     context = Context()  # type: ignore
@@ -27,8 +46,8 @@ def fill_queue(
     sub_socket.setsockopt_string(SUBSCRIBE, "")
 
     while True:
-        published_data: Dict = sub_socket.recv_json()
+        published_data: Dict = decode(sub_socket.recv_multipart())
         if not continue_execution_flag.value:
             worker_wait_for_exit_event.wait()
         else:
-            handle_published_data(published_data, task_queue)
+            handle_published_data(published_data, task_queue, target_throughput)
@@ -0,0 +1,309 @@
+"""Buffered logging of task worker results."""
+from random import random
+from threading import Condition, Thread
+from time import time_ns
+from typing import Dict, List, Optional, Tuple
+
+from requests.exceptions import RequestException
+
+from hyrisecockpit.database_manager.cursor import (
+    AggregatedQueries,
+    StorageCursor,
+    SuccessfulQuery,
+)
+from hyrisecockpit.latency_histogram import LatencyHistogram
+from influxdb.exceptions import InfluxDBClientError, InfluxDBServerError
+
+FailedQuery = Tuple[int, str, str, str]
+AggregateKey = Tuple[int, str, float, str, bool]
+
+
+class QueryAggregate:
+    """Aggregated latencies of the queries that fall into one bucket."""
+
+    def __init__(self) -> None:
+        """Initialize an empty QueryAggregate."""
+        self.count: int = 0
+        self.latency_sum: int = 0
+        self.latency_min: int = 0
+        self.latency_max: int = 0
+        self.histogram: LatencyHistogram = LatencyHistogram()
+        self.response_time_sum: int = 0
+        self.response_time_histogram: LatencyHistogram = LatencyHistogram()
+        self.queue_wait_time_sum: int = 0
+        self.end_to_end_latency_sum: int = 0
+
+    def add(
+        self,
+        latency: int,
+        response_time: int,
+        queue_wait_time: int,
+        end_to_end_latency: int,
+    ) -> None:
+        """Add the latency, response time, queue wait time and end-to-end latency."""
+        if self.count == 0 or latency < self.latency_min:
+            self.latency_min = latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        self.count += 1
+        self.latency_sum += latency
+        self.histogram.record(latency)
+        self.response_time_sum += response_time
+        self.response_time_histogram.record(response_time)
+        self.queue_wait_time_sum += queue_wait_time
+        self.end_to_end_latency_sum += end_to_end_latency
+
+
+class ResultLogger:
+    """Logs the results of a task worker from one long-lived thread.
+
+    Successful queries are aggregated per second, benchmark, scale factor,
+    query type and commit state. Every aggregate holds the latencies and the
+    response times, measured from the intended start of the query, as well as
+    the time the queries waited in the queue and their end-to-end latency. A
+    flusher thread writes the aggregates of completed seconds to the storage
+    as soon as the buffer holds flush_size entries or flush_interval seconds
+    have passed. Raw queries are only logged for a random sample of
+    raw_query_sample_rate of all queries. If the storage can't keep up and the
+    buffer is full, new entries are dropped and counted instead of slowing
+    down the task worker. After every flush the logger writes its own
+    statistics to the result_log measurement and the statistics of the
+    database connection of the task worker, like reconnects and rollbacks, to
+    the connection measurement.
+    """
+
+    def __init__(
+        self,
+        log: StorageCursor,
+        worker_id: str,
+        buffer_size: int,
+        flush_size: int,
+        flush_interval: float,
+        raw_query_sample_rate: float = 0.0,
+    ) -> None:
+        """Initialize a ResultLogger.
+
+        Args:
+            log: Storage cursor used exclusively by the flusher thread.
+            worker_id: Id of the task worker the results belong to.
+            buffer_size: Maximum number of buffered entries (aggregates,
+                sampled and failed queries).
+            flush_size: Number of buffered entries that triggers a flush.
+            flush_interval: Maximum number of seconds between two flushes.
+            raw_query_sample_rate: Fraction of the successful queries that is
+                additionally logged one by one.
+        """
+        self._log: StorageCursor = log
+        self._worker_id: str = worker_id
+        self._buffer_size: int = buffer_size
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self._raw_query_sample_rate: float = raw_query_sample_rate
+        self._aggregates: Dict[AggregateKey, QueryAggregate] = {}
+        self._succesful_queries: List[SuccessfulQuery] = []
+        self._failed_queries: List[FailedQuery] = []
+        self._open_second: int = 0
+        self._oldest_result: Optional[int] = None
+        self._dropped_results: int = 0
+        self._connection_statistics: Dict[str, int] = {}
+        self._running: bool = False
+        self._condition: Condition = Condition()
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+
+    def _buffered_results(self) -> int:
+        return (
+            len(self._aggregates)
+            + len(self._succesful_queries)
+            + len(self._failed_queries)
+        )
+
+    def _is_full(self) -> bool:
+        if self._buffered_results() >= self._buffer_size:
+            self._dropped_results += 1
+            return True
+        return False
+
+    def _added(self) -> bool:
+        if self._oldest_result is None:
+            self._oldest_result = time_ns()
+        if self._buffered_results() == self._flush_size:
+            self._condition.notify()
+        return True
+
+    def _get_aggregate(self, query: SuccessfulQuery) -> Optional[QueryAggregate]:
+        endts, _, benchmark, scalefactor, query_type, _, commited, *_ = query
+        # results of an already flushed second count to the oldest open second
+        second = max(endts - endts % 1_000_000_000, self._open_second)
+        key = (second, benchmark, scalefactor, query_type, commited)
+        aggregate = self._aggregates.get(key)
+        if aggregate is None and not self._is_full():
+            aggregate = self._aggregates[key] = QueryAggregate()
+        return aggregate
+
+    def log_query(self, query: SuccessfulQuery) -> bool:
+        """Aggregate a successfully executed query.
+
+        Returns false if the query was dropped because the buffer is full.
+        """
+        with self._condition:
+            aggregate = self._get_aggregate(query)
+            if aggregate is None:
+                return False
+            aggregate.add(query[1], query[7], query[8], query[9])
+            if self._raw_query_sample_rate and random() < self._raw_query_sample_rate:
+                if not self._is_full():
+                    self._succesful_queries.append(query)
+            return self._added()
+
+    def log_failed_query(self, query: FailedQuery) -> bool:
+        """Buffer a failed query.
+
+        Returns false if the query was dropped because the buffer is full.
+        """
+        with self._condition:
+            if self._is_full():
+                return False
+            self._failed_queries.append(query)
+            return self._added()
+
+    def log_connection_statistics(self, statistics: Dict[str, int]) -> None:
+        """Add statistics of the database connection."""
+        if not statistics:
+            return
+        with self._condition:
+            for name, value in statistics.items():
+                self._connection_statistics[name] = (
+                    self._connection_statistics.get(name, 0) + value
+                )
+
+    def _take_aggregates(self, take_all: bool) -> List[AggregatedQueries]:
+        """Take the aggregates of all completed seconds out of the buffer."""
+        if not take_all:
+            now = time_ns()
+            self._open_second = max(now - now % 1_000_000_000, self._open_second)
+        completed: List[AggregatedQueries] = []
+        for key in list(self._aggregates):
+            if take_all or key[0] < self._open_second:
+                aggregate = self._aggregates.pop(key)
+                second, benchmark, scalefactor, query_type, commited = key
+                completed.append(
+                    (
+                        second,
+                        benchmark,
+                        scalefactor,
+                        query_type,
+                        self._worker_id,
+                        commited,
+                        aggregate.count,
+                        aggregate.latency_sum,
+                        aggregate.latency_min,
+                        aggregate.latency_max,
+                        aggregate.histogram.encode(),
+                        aggregate.response_time_sum,
+                        aggregate.response_time_histogram.encode(),
+                        aggregate.queue_wait_time_sum,
+                        aggregate.end_to_end_latency_sum,
+                    )
+                )
+        return completed
+
+    def _take_buffer(
+        self, take_all: bool
+    ) -> Tuple[
+        List[AggregatedQueries],
+        List[SuccessfulQuery],
+        List[FailedQuery],
+        Optional[int],
+        int,
+        Dict[str, int],
+    ]:
+        buffer = (
+            self._take_aggregates(take_all),
+            self._succesful_queries,
+            self._failed_queries,
+            self._oldest_result,
+            self._dropped_results,
+            self._connection_statistics,
+        )
+        self._succesful_queries = []
+        self._failed_queries = []
+        self._oldest_result = time_ns() if self._aggregates else None
+        self._dropped_results = 0
+        self._connection_statistics = {}
+        return buffer
+
+    def _write(
+        self,
+        aggregated_queries: List[AggregatedQueries],
+        succesful_queries: List[SuccessfulQuery],
+        failed_queries: List[FailedQuery],
+    ) -> bool:
+        try:
+            if aggregated_queries:
+                self._log.log_aggregated_queries(aggregated_queries)
+            if succesful_queries:
+                self._log.log_queries(succesful_queries)
+            if failed_queries:
+                self._log.log_failed_queries(failed_queries)
+        except (InfluxDBClientError, InfluxDBServerError, RequestException):
+            return False
+        return True
+
+    def _flush(
+        self,
+        aggregated_queries: List[AggregatedQueries],
+        succesful_queries: List[SuccessfulQuery],
+        failed_queries: List[FailedQuery],
+        oldest_result: Optional[int],
+        dropped_results: int,
+        connection_statistics: Optional[Dict[str, int]] = None,
+    ) -> None:
+        flushed_results = (
+            len(aggregated_queries) + len(succesful_queries) + len(failed_queries)
+        )
+        if connection_statistics:
+            try:
+                self._log.log_connection_statistics(
+                    self._worker_id, connection_statistics, time_ns()
+                )
+            except (InfluxDBClientError, InfluxDBServerError, RequestException):
+                pass
+        if not (flushed_results or dropped_results):
+            return
+        startts = time_ns()
+        written = self._write(aggregated_queries, succesful_queries, failed_queries)
+        endts = time_ns()
+        statistics = {
+            "flushed_results": flushed_results if written else 0,
+            "dropped_results": dropped_results + (0 if written else flushed_results),
+            "failed_flushes": 0 if written else 1,
+            "flush_latency": endts - startts,
+            "buffer_lag": startts - oldest_result if oldest_result else 0,
+        }
+        try:
+            self._log.log_result_log_statistics(self._worker_id, statistics, endts)
+        except (InfluxDBClientError, InfluxDBServerError, RequestException):
+            pass
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._running:
+                    self._condition.wait(self._flush_interval)
+                stop = not self._running
+                buffer = self._take_buffer(take_all=stop)
+            self._flush(*buffer)
+            if stop:
+                return
+
+    def start(self) -> None:
+        """Start the flusher thread."""
+        self._running = True
+        self._thread.start()
+
+    def close(self) -> None:
+        """Flush the remaining results and stop the flusher thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
@@ -0,0 +1,170 @@
+"""Functions defining the ZeroMQ task transport of a worker pool.
+
+Instead of a multiprocessing queue that is filled by the queue worker, a task
+dispatcher subscribes to the workload and keeps the tasks of a database. Task
+workers connect to the dispatcher with a DEALER socket and ask for tasks by
+sending a credit, the maximum number of tasks they want to get. The
+dispatcher only sends tasks to workers with an open credit. A worker requests
+the next batch as soon as a batch arrives, so it holds at most two batches and
+no worker hoards tasks while others are idle.
+
+With warehouse scheduling the dispatcher keeps the tasks of every partition
+separately. A task worker connects with its partition as identity and only
+gets the tasks of its partition.
+"""
+from collections import deque
+from multiprocessing import Value
+from multiprocessing.synchronize import Event as EventType
+from queue import Empty
+from tempfile import gettempdir
+from time import time_ns
+from typing import Deque, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from msgpack import packb, unpackb
+from zmq import DEALER, IDENTITY, POLLIN, ROUTER, SUB, SUBSCRIBE, Context, Poller
+
+from hyrisecockpit.database_manager.worker.queue_worker import update_target_throughput
+from hyrisecockpit.database_manager.worker.task_router import TaskRouter
+from hyrisecockpit.workload_codec import decode
+
+
+def get_task_endpoint(database_id: str) -> str:
+    """Return a new endpoint for the task dispatcher of a database."""
+    return f"ipc://{gettempdir()}/hyrisecockpit-{database_id}-{uuid4().hex}"
+
+
+class ZmqTaskQueue:
+    """Task queue of a worker pool backed by a task dispatcher.
+
+    The queue offers the subset of the multiprocessing queue interface the
+    task workers and the worker pool use. The socket is created lazily in the
+    task worker process, the queue length is shared with the dispatcher.
+    """
+
+    def __init__(self, endpoint: str, credit: int, partitions: int = 1) -> None:
+        """Initialize a ZmqTaskQueue.
+
+        Args:
+            endpoint: Endpoint the task dispatcher binds its ROUTER socket to.
+            credit: Number of tasks a task worker asks for at once.
+            partitions: Number of partitions the dispatcher routes tasks to.
+        """
+        self.endpoint: str = endpoint
+        self.partitions: int = partitions
+        self.length: Value = Value("i", 0)
+        self._credit: int = credit
+        self._identity: Optional[bytes] = None
+        self._tasks: Deque[Dict] = deque()
+        self._context: Optional[Context] = None
+        self._socket = None
+        self._credit_open: bool = False
+
+    def _connect(self) -> None:
+        self._context = Context()  # type: ignore
+        self._socket = self._context.socket(DEALER)
+        if self._identity is not None:
+            self._socket.setsockopt(IDENTITY, self._identity)
+        self._socket.connect(self.endpoint)
+
+    def _receive(self, timeout: Optional[float]) -> None:
+        """Ask the dispatcher for tasks and wait up to timeout seconds for them."""
+        if self._socket is None:
+            self._connect()
+        if not self._credit_open:
+            self._socket.send_string(str(self._credit))  # type: ignore
+            self._credit_open = True
+        if self._socket.poll(None if timeout is None else timeout * 1000):  # type: ignore
+            self._tasks.extend(unpackb(self._socket.recv()))  # type: ignore
+            # request the next batch while this one is executed
+            self._socket.send_string(str(self._credit))  # type: ignore
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Dict:
+        """Return the next task or raise Empty."""
+        if not self._tasks and block:
+            self._receive(timeout)
+        if not self._tasks:
+            raise Empty
+        return self._tasks.popleft()
+
+    def put(self, task: Dict) -> None:
+        """Put a task back to be executed again by this task worker."""
+        self._tasks.appendleft(task)
+
+    def get_partition(self, partition: int) -> "ZmqTaskQueue":
+        """Return the queue of a task worker that gets the tasks of a partition."""
+        task_queue = ZmqTaskQueue(self.endpoint, self._credit, self.partitions)
+        task_queue.length = self.length
+        task_queue._identity = str(partition).encode()
+        return task_queue
+
+    def qsize(self) -> int:
+        """Return the number of tasks the dispatcher holds."""
+        return self.length.value
+
+    def close(self) -> None:
+        """Close the socket of the task worker."""
+        if self._socket is not None:
+            self._socket.close()
+            self._context.term()  # type: ignore
+            self._socket = None
+
+
+def _send_tasks(
+    router_socket, tasks: List[Deque[Dict]], credits: Deque[Tuple[bytes, int]]
+) -> None:
+    """Send tasks to the task workers with an open credit.
+
+    Credits of task workers without tasks in their partition stay open.
+    """
+    for _ in range(len(credits)):
+        identity, credit = credits.popleft()
+        partition_tasks = tasks[int(identity) if len(tasks) > 1 else 0]
+        if not partition_tasks:
+            credits.append((identity, credit))
+            continue
+        batch = [
+            partition_tasks.popleft() for _ in range(min(credit, len(partition_tasks)))
+        ]
+        router_socket.send_multipart([identity, packb(batch)])
+
+
+def dispatch_tasks(
+    workload_publisher_url: str,
+    task_queue: ZmqTaskQueue,
+    continue_execution_flag: Value,
+    worker_wait_for_exit_event: EventType,
+    target_throughput: Optional[Value] = None,
+) -> None:
+    """Distribute the published tasks to the task workers."""
+    context = Context()  # type: ignore
+    sub_socket = context.socket(SUB)
+    sub_socket.connect(workload_publisher_url)
+    sub_socket.setsockopt_string(SUBSCRIBE, "")
+    router_socket = context.socket(ROUTER)
+    router_socket.bind(task_queue.endpoint)
+    poller = Poller()
+    poller.register(sub_socket, POLLIN)
+    poller.register(router_socket, POLLIN)
+
+    task_router = TaskRouter(task_queue.partitions)
+    tasks: List[Deque[Dict]] = [deque() for _ in range(task_queue.partitions)]
+    credits: Deque[Tuple[bytes, int]] = deque()
+    while True:
+        sockets = dict(poller.poll())
+        while router_socket in sockets:
+            identity, credit = router_socket.recv_multipart()
+            credits.append((identity, int(credit)))
+            if not router_socket.poll(0):
+                break
+        if sub_socket in sockets:
+            published_data: Dict = decode(sub_socket.recv_multipart())
+            if not continue_execution_flag.value:
+                worker_wait_for_exit_event.wait()
+            else:
+                update_target_throughput(published_data, target_throughput)
+                for task in published_data["body"]["querylist"]:
+                    task["enqueuedts"] = time_ns()
+                    tasks[task_router.route(task)].append(task)
+        _send_tasks(router_socket, tasks, credits)
+        task_queue.length.value = sum(len(partition) for partition in tasks)
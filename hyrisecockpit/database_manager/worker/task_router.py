@@ -0,0 +1,63 @@
+"""Warehouse-affine routing of tasks to the task workers of a worker pool.
+
+With warehouse scheduling every task worker owns a partition of the
+warehouses, like a TPC-C terminal is bound to its warehouse. All tasks of a
+home warehouse are executed by the same task worker, so task workers don't
+collide on the rows of the same warehouse and district. With fewer
+warehouses than task workers some task workers stay idle.
+"""
+from typing import Dict, List
+
+from hyrisecockpit.cross_platform_support.multiprocessing_support import Queue
+
+
+class TaskRouter:
+    """Assigns tasks to partitions.
+
+    Tasks with a home warehouse always get the partition of their warehouse,
+    tasks without one are distributed round robin.
+    """
+
+    def __init__(self, partitions: int) -> None:
+        """Initialize a TaskRouter."""
+        self._partitions: int = partitions
+        self._next_partition: int = 0
+
+    def route(self, task: Dict) -> int:
+        """Return the partition of a task."""
+        warehouse = task.get("warehouse")
+        if warehouse is not None:
+            return (warehouse - 1) % self._partitions
+        partition = self._next_partition
+        self._next_partition = (partition + 1) % self._partitions
+        return partition
+
+
+class PartitionedTaskQueue:
+    """Task queue with one multiprocessing queue per task worker.
+
+    The queue worker puts the tasks into the queue of their partition, every
+    task worker only gets the queue of its own partition.
+    """
+
+    def __init__(self, partitions: int) -> None:
+        """Initialize a PartitionedTaskQueue."""
+        self._queues: List[Queue] = [Queue(0) for _ in range(partitions)]
+        self._router: TaskRouter = TaskRouter(partitions)
+
+    def put(self, task: Dict) -> None:
+        """Put a task into the queue of its partition."""
+        self._queues[self._router.route(task)].put(task)
+
+    def get_partition(self, partition: int) -> Queue:
+        """Return the queue of a partition."""
+        return self._queues[partition]
+
+    def qsize(self) -> int:
+        """Return the number of tasks in all partitions."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    def close(self) -> None:
+        """Close the queues of all partitions."""
+        for queue in self._queues:
+            queue.close()
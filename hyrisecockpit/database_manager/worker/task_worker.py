@@ -2,29 +2,73 @@
 from multiprocessing import Queue, Value
 from multiprocessing.synchronize import Event as EventType
 from queue import Empty
-from threading import Thread
-from time import time_ns
-from typing import List, Tuple
+from time import sleep, time_ns
+from typing import Dict, List, Tuple
 
 from psycopg2 import DatabaseError, InterfaceError, ProgrammingError
 
 from hyrisecockpit.database_manager.cursor import HyriseCursor, StorageCursor
+from hyrisecockpit.database_manager.worker.result_logger import ResultLogger
 from hyrisecockpit.settings import (
+    RAW_QUERY_LOG_SAMPLE_RATE,
+    RESULT_LOG_BUFFER_SIZE,
+    RESULT_LOG_FLUSH_INTERVAL,
+    RESULT_LOG_FLUSH_SIZE,
     STORAGE_HOST,
     STORAGE_PASSWORD,
     STORAGE_PORT,
     STORAGE_USER,
+    WORKER_DEQUEUE_BATCH_SIZE,
+    WORKER_DEQUEUE_TIMEOUT,
 )
 
 
-def log_results(
-    log: StorageCursor,
-    succesful_queries: List[Tuple[int, int, str, float, str, str, bool]],
-    failed_queries: List[Tuple[int, str, str, str]],
-) -> None:
-    """Log results to database."""
-    log.log_queries(succesful_queries)
-    log.log_failed_queries(failed_queries)
+def get_tasks(task_queue: Queue, max_tasks: int, timeout: float) -> List[Dict]:
+    """Get a batch of tasks from the queue.
+
+    Blocks until the first task arrives or the timeout (in seconds) expires and
+    then takes up to max_tasks - 1 further tasks that are already queued. An
+    empty list is returned if no task arrived in time, so the caller can check
+    its flags without spinning on an empty queue.
+    """
+    try:
+        tasks = [task_queue.get(block=True, timeout=timeout)]
+    except Empty:
+        return []
+    while len(tasks) < max_tasks:
+        try:
+            tasks.append(task_queue.get(block=False))
+        except Empty:
+            break
+    return tasks
+
+
+def wait_for_intended_start(task: Dict) -> None:
+    """Wait until the intended start time of an open-loop task.
+
+    Tasks that are already late start immediately, their delay is part of the
+    response time. Tasks without a start time start immediately as well.
+    """
+    startts = task.get("startts")
+    if startts is not None:
+        delay = startts - time_ns()
+        if delay > 0:
+            sleep(delay / 1_000_000_000)
+
+
+def get_task_timings(
+    task: Dict, dequeuedts: int, endts: int, latency: int
+) -> Tuple[int, int, int]:
+    """Return the response time, queue wait time and end-to-end latency of a task.
+
+    The response time is measured from the intended start of a task, the queue
+    wait time from its enqueuing to its dequeuing and the end-to-end latency
+    from its generation. Missing stamps fall back to the latency or zero.
+    """
+    response_time = endts - task.get("startts", endts - latency)
+    queue_wait_time = dequeuedts - task.get("enqueuedts", dequeuedts)
+    end_to_end_latency = endts - task.get("generatedts", endts - latency)
+    return response_time, queue_wait_time, end_to_end_latency
 
 
 def execute_queries(  # noqa
@@ -42,51 +86,56 @@ def execute_queries(  # noqa
         with StorageCursor(
             STORAGE_HOST, STORAGE_PORT, STORAGE_USER, STORAGE_PASSWORD, database_id
         ) as log:
-            succesful_queries: List[Tuple[int, int, str, float, str, str, bool]] = []
-            failed_queries: List[Tuple[int, str, str, str]] = []
-            last_batched = time_ns()
+            result_logger = ResultLogger(
+                log,
+                worker_id,
+                RESULT_LOG_BUFFER_SIZE,
+                RESULT_LOG_FLUSH_SIZE,
+                RESULT_LOG_FLUSH_INTERVAL,
+                RAW_QUERY_LOG_SAMPLE_RATE,
+            )
+            result_logger.start()
 
             while True:
                 if not continue_execution_flag.value:
                     i_am_done_event.set()
                     worker_wait_for_exit_event.wait()
 
-                try:
-                    task = task_queue.get(block=False)
-                    benchmark = task["benchmark"]
-                    (
-                        endts,
-                        latency,
-                        scalefactor,
-                        query_type,
-                        commited,
-                    ) = workload_drivers[benchmark].execute_task(task, cur, worker_id)
-                    succesful_queries.append(
+                tasks = get_tasks(
+                    task_queue, WORKER_DEQUEUE_BATCH_SIZE, WORKER_DEQUEUE_TIMEOUT
+                )
+                dequeuedts = time_ns()
+                for task in tasks:
+                    if not continue_execution_flag.value:
+                        break
+                    wait_for_intended_start(task)
+                    try:
+                        benchmark = task["benchmark"]
                         (
                             endts,
                             latency,
-                            benchmark,
                             scalefactor,
                             query_type,
-                            worker_id,
                             commited,
+                        ) = workload_drivers[benchmark].execute_task(
+                            task, cur, worker_id
                         )
-                    )
-                except Empty:
-                    continue
-                except (ValueError, ProgrammingError) as e:
-                    failed_queries.append((time_ns(), worker_id, str(task), str(e)))
-                except (DatabaseError, InterfaceError):
-                    task_queue.put(task)
-
-                if last_batched < time_ns() - 1_000_000_000 and (
-                    succesful_queries or failed_queries
-                ):
-                    t = Thread(
-                        target=log_results,
-                        args=(log, succesful_queries, failed_queries),
-                    )
-                    t.start()
-                    succesful_queries = []
-                    failed_queries = []
-                    last_batched = time_ns()
+                        result_logger.log_query(
+                            (
+                                endts,
+                                latency,
+                                benchmark,
+                                scalefactor,
+                                query_type,
+                                worker_id,
+                                commited,
+                                *get_task_timings(task, dequeuedts, endts, latency),
+                            )
+                        )
+                    except (ValueError, ProgrammingError) as e:
+                        result_logger.log_failed_query(
+                            (time_ns(), worker_id, str(task), str(e))
+                        )
+                    except (DatabaseError, InterfaceError):
+                        task_queue.put(task)
+                result_logger.log_connection_statistics(cur.take_statistics())
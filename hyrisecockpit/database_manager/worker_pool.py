@@ -1,13 +1,24 @@
 """The WorkerPool object represents the workers."""
 from multiprocessing import Event, Process, Value
 from multiprocessing.synchronize import Event as EventType
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from hyrisecockpit.cross_platform_support.multiprocessing_support import Queue
 from hyrisecockpit.database_manager.worker.queue_worker import fill_queue
+from hyrisecockpit.database_manager.worker.task_dispatcher import (
+    ZmqTaskQueue,
+    dispatch_tasks,
+    get_task_endpoint,
+)
+from hyrisecockpit.database_manager.worker.task_router import PartitionedTaskQueue
 from hyrisecockpit.database_manager.worker.task_worker import execute_queries
+from hyrisecockpit.settings import (
+    WORKER_DEQUEUE_BATCH_SIZE,
+    WORKER_TASK_SCHEDULING,
+    WORKER_TASK_TRANSPORT,
+)
 
 from .cursor import ConnectionFactory
 
@@ -23,8 +34,24 @@ class WorkerPool:
         workload_publisher_url: str,
         database_blocked: Value,
         workload_drivers,
+        task_transport: str = WORKER_TASK_TRANSPORT,
+        task_scheduling: str = WORKER_TASK_SCHEDULING,
     ) -> None:
-        """Initialize WorkerPool object."""
+        """Initialize WorkerPool object.
+
+        The task transport is either "queue", a multiprocessing queue filled
+        by the queue worker, or "zmq", a task dispatcher the task workers
+        request tasks from. The task scheduling is either "shared", all task
+        workers take tasks from the same queue, or "warehouse", every task
+        worker owns a partition of the warehouses and executes the tasks of
+        its warehouses only.
+        """
+        if task_transport not in ("queue", "zmq"):
+            raise ValueError(f"Unknown task transport {task_transport}")
+        if task_scheduling not in ("shared", "warehouse"):
+            raise ValueError(f"Unknown task scheduling {task_scheduling}")
+        self._task_transport: str = task_transport
+        self._task_scheduling: str = task_scheduling
         self._connection_factory: ConnectionFactory = connection_factory
         self._number_worker: int = number_worker
         self._database_id: str = database_id
@@ -33,14 +60,34 @@ class WorkerPool:
         self._workload_publisher_url: str = workload_publisher_url
         self._status: str = "closed"
         self._continue_execution_flag: Value = Value("b", True)
+        self._target_throughput: Value = Value("d", 0.0)
         self._execute_task_workers: List[Process] = []
         self._execute_task_worker_done_event: List[EventType] = []
         self._fill_task_worker: Optional[Process] = None
         self._worker_wait_for_exit_event: EventType = Event()
-        self._task_queue: Queue = Queue(0)
+        self._task_queue: Union[
+            Queue, PartitionedTaskQueue, ZmqTaskQueue
+        ] = self._create_task_queue()
         self._scheduler: BackgroundScheduler = BackgroundScheduler()
         self._scheduler.start()
 
+    def _create_task_queue(self) -> Union[Queue, PartitionedTaskQueue, ZmqTaskQueue]:
+        partitions = self._number_worker if self._task_scheduling == "warehouse" else 1
+        if self._task_transport == "zmq":
+            return ZmqTaskQueue(
+                get_task_endpoint(self._database_id),
+                WORKER_DEQUEUE_BATCH_SIZE,
+                partitions,
+            )
+        if self._task_scheduling == "warehouse":
+            return PartitionedTaskQueue(partitions)
+        return Queue(0)
+
+    def _get_worker_task_queue(self, worker: int) -> Union[Queue, ZmqTaskQueue]:
+        if self._task_scheduling == "warehouse":
+            return self._task_queue.get_partition(worker)  # type: ignore
+        return self._task_queue  # type: ignore
+
     def _generate_execute_task_worker_done_events(self) -> List[EventType]:
         return [Event() for _ in range(self._number_worker)]
 
@@ -50,7 +97,7 @@ class WorkerPool:
                 target=execute_queries,
                 args=(
                     i,
-                    self._task_queue,
+                    self._get_worker_task_queue(i),
                     self._connection_factory.create_cursor(autocommit=False),
                     self._continue_execution_flag,
                     self._database_id,
@@ -64,12 +111,13 @@ class WorkerPool:
 
     def _generate_fill_task_worker(self) -> Process:
         return Process(
-            target=fill_queue,
+            target=dispatch_tasks if self._task_transport == "zmq" else fill_queue,
             args=(
                 self._workload_publisher_url,
                 self._task_queue,
                 self._continue_execution_flag,
                 self._worker_wait_for_exit_event,
+                self._target_throughput,
             ),
         )
 
@@ -87,7 +135,7 @@ class WorkerPool:
             self._execute_task_workers[i].terminate()
         self._execute_task_workers = []
         self._worker_wait_for_exit_event = Event()
-        self._task_queue = Queue(0)
+        self._task_queue = self._create_task_queue()
 
     def _wait_for_worker(self) -> None:
         self._worker_wait_for_exit_event.clear()
@@ -153,3 +201,7 @@ class WorkerPool:
     def get_queue_length(self) -> int:
         """Return queue length."""
         return self._task_queue.qsize()
+
+    def get_target_throughput(self) -> float:
+        """Return the throughput the workload generator targets."""
+        return self._target_throughput.value
@@ -0,0 +1,66 @@
+"""Module for sampling weighted outcomes with the alias method."""
+from random import Random
+from typing import List, Sequence
+
+import numpy as np
+
+
+class AliasSampler:
+    """Samples indices of weights in constant time per sample.
+
+    The alias table of Vose's alias method splits the weights into columns of
+    equal height. Every column holds a share of its own outcome and the rest
+    of one alias outcome, so a sample needs one uniform number: its integer
+    part picks the column and its fraction decides between the outcome and
+    its alias.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """Initialize an AliasSampler with the alias table of the weights.
+
+        Raises a ValueError if a weight is negative or no weight is positive.
+        """
+        total = sum(weights)
+        if total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("The weights must not be negative and not all zero")
+        size = len(weights)
+        scaled = [weight * size / total for weight in weights]
+        probabilities = [1.0] * size
+        aliases = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            column, alias = small.pop(), large[-1]
+            probabilities[column] = scaled[column]
+            aliases[column] = alias
+            scaled[alias] -= 1.0 - scaled[column]
+            if scaled[alias] < 1.0:
+                small.append(large.pop())
+        self._size: int = size
+        self._probabilities: List[float] = probabilities
+        self._aliases: List[int] = aliases
+        self._probability_array: np.ndarray = np.array(probabilities)
+        self._alias_array: np.ndarray = np.array(aliases)
+
+    def sample(self, random: Random, k: int) -> List[int]:
+        """Return k indices drawn with the random number generator."""
+        samples = []
+        for _ in range(k):
+            position = random.random() * self._size
+            column = int(position)
+            samples.append(
+                column
+                if position - column < self._probabilities[column]
+                else self._aliases[column]
+            )
+        return samples
+
+    def sample_batch(self, rng: np.random.Generator, k: int) -> List[int]:
+        """Return k indices drawn at once with a NumPy random number generator."""
+        positions = rng.random(k) * self._size
+        columns = positions.astype(np.int64)
+        return np.where(
+            positions - columns < self._probability_array[columns],
+            columns,
+            self._alias_array[columns],
+        ).tolist()
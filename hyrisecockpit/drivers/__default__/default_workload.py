@@ -1,34 +1,162 @@
 """Module for default workload."""
 from collections import OrderedDict
-from random import choice, choices
-from typing import List
+from random import Random
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from zlib import crc32
 
+import numpy as np
+
+from hyrisecockpit.drivers.__default__.alias_sampler import AliasSampler
+from hyrisecockpit.drivers.__default__.query_template import Parameters, QueryTemplate
 from hyrisecockpit.drivers.__default__.task_types import DefaultTask
 from hyrisecockpit.drivers.__default__.workload_reader import WorkloadReader
 
+# number of parameter sets per query type that are kept to be repeated
+PARAMETER_POOL_SIZE: int = 100
+# number of tasks from which the query variants are drawn with NumPy at once
+BATCH_SAMPLING_SIZE: int = 100
+
 
 class DefaultWorkload:
-    """Generates workloads from queries."""
+    """Generates workloads from queries.
+
+    The queries of a workload form its query catalog. Tasks only reference a
+    query by its type and the index of the variant, the task workers resolve
+    the query from their own catalog. The catalog version is a checksum of all
+    queries, so a task is never executed with a different query than the one
+    it was generated from.
+
+    Query types with a template replace the variants of their file by the
+    template. Their tasks get generated parameters as args, a fraction of
+    repeated_parameter_fraction of them repeat one of the last parameter sets
+    of the query type, the others get fresh parameters.
 
-    def __init__(self, benchmark: str, scalefactor: float, query_path: str):
+    Every task is copied from an immutable template of its query variant.
+    The variants are drawn with an alias table of the weights, which is kept
+    until the weights change. The weight of a query type is shared by its
+    variants. From BATCH_SAMPLING_SIZE tasks on, the variants of a second are
+    drawn with NumPy at once.
+
+    All random decisions are drawn from the random number generators of the
+    workload, so a seeded workload generates the same tasks in every run.
+    """
+
+    def __init__(
+        self,
+        benchmark: str,
+        scalefactor: float,
+        query_path: str,
+        templates: Optional[Dict[str, QueryTemplate]] = None,
+        repeated_parameter_fraction: float = 0.0,
+    ):
         """Initialize a Workload."""
         self._benchmark = benchmark
         self._scalefactor = scalefactor
         self._queries = OrderedDict(WorkloadReader.get(query_path))  # type: ignore
+        self._templates: Dict[str, QueryTemplate] = templates or {}
+        self._repeated_parameter_fraction = repeated_parameter_fraction
+        self._parameter_sets: Dict[str, List[Parameters]] = {}
+        self._random: Random = Random()  # nosec
+        self._rng: np.random.Generator = np.random.default_rng()
+        self._task_templates: Optional[List[Mapping]] = None
+        self._sampled_weights: Optional[Dict[str, float]] = None
+        self._sampler: Optional[AliasSampler] = None
+        for query_type, template in self._templates.items():
+            self._queries[query_type] = [template.query]
+            self._parameter_sets[query_type] = []
+        self.catalog_version: int = crc32(
+            "".join(
+                f"{query_type}{query}"
+                for query_type in sorted(self._queries)
+                for query in self._queries[query_type]
+            ).encode()
+        )
+
+    def seed(self, seed: Optional[int]) -> None:
+        """Restart the random number generator with a seed.
+
+        The repeatable parameter sets are dropped as well, so the tasks after
+        seeding only depend on the seed.
+        """
+        self._random.seed(seed)
+        self._rng = np.random.default_rng(seed)
+        for parameter_sets in self._parameter_sets.values():
+            parameter_sets.clear()
+
+    def _get_parameters(self, query_type: str) -> Optional[Parameters]:
+        """Get repeated or fresh parameters of a templated query type."""
+        template = self._templates.get(query_type)
+        if template is None:
+            return None
+        parameter_sets = self._parameter_sets[query_type]
+        if parameter_sets and self._random.random() < self._repeated_parameter_fraction:
+            return self._random.choice(parameter_sets)
+        parameters = template.generate_parameters(self._random)
+        if len(parameter_sets) < PARAMETER_POOL_SIZE:
+            parameter_sets.append(parameters)
+        else:
+            parameter_sets[self._random.randrange(PARAMETER_POOL_SIZE)] = parameters
+        return parameters
+
+    def _get_task_templates(self) -> List[Mapping]:
+        """Get the task templates of all query variants of the catalog."""
+        if self._task_templates is None:
+            self._task_templates = [
+                MappingProxyType(
+                    DefaultTask(
+                        variant=variant,
+                        catalog_version=self.catalog_version,
+                        args=None,
+                        query_type=query_type,
+                        benchmark=self._benchmark,
+                        scalefactor=self._scalefactor,
+                    )
+                )
+                for query_type, queries in self._queries.items()
+                for variant in range(len(queries))
+            ]
+        return self._task_templates
+
+    def _get_sampler(self, weights: Dict[str, float]) -> AliasSampler:
+        """Get the sampler of the task templates for the weights."""
+        if self._sampler is None or weights != self._sampled_weights:
+            self._sampler = AliasSampler(
+                [
+                    weights.get(template["query_type"], 0.0)
+                    / len(self._queries[template["query_type"]])
+                    for template in self._get_task_templates()
+                ]
+            )
+            self._sampled_weights = dict(weights)
+        return self._sampler
 
     def get(self, frequency, weights) -> List[DefaultTask]:
         """Get a list of queries with the frequency and weights."""
-        return [
-            DefaultTask(
-                query=choice(self._queries[query_type]),  # nosec
-                args=None,
-                query_type=query_type,
-                benchmark=self._benchmark,
-                scalefactor=self._scalefactor,
+        sampler = self._get_sampler(weights)
+        if frequency >= BATCH_SAMPLING_SIZE:
+            indices = sampler.sample_batch(self._rng, frequency)
+        else:
+            indices = sampler.sample(self._random, frequency)
+        templates = self._get_task_templates()
+        tasks: List[DefaultTask] = [
+            templates[index].copy() for index in indices  # type: ignore
+        ]
+        if self._templates:
+            for task in tasks:
+                task["args"] = self._get_parameters(task["query_type"])
+        return tasks
+
+    def get_query(self, query_type: str, variant: int, catalog_version: int) -> str:
+        """Get a query of the catalog."""
+        if catalog_version != self.catalog_version:
+            raise ValueError(
+                f"Catalog version {catalog_version} of the task doesn't match "
+                f"{self.catalog_version} of the {self._benchmark} catalog"
             )
-            for query_type in choices(
-                population=list(self._queries.keys()),
-                weights=list(weights.values()),
-                k=frequency,
+        try:
+            return self._queries[query_type][variant]
+        except (KeyError, IndexError):
+            raise ValueError(
+                f"Query {query_type} variant {variant} isn't in the catalog"
             )
-        ]
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Tuple, Union
 from psycopg2.extensions import AsIs
 
 from hyrisecockpit.drivers.__default__.default_workload import DefaultWorkload
+from hyrisecockpit.drivers.__default__.query_template import QueryTemplate
 
 
 class DefaultDriver:
@@ -17,13 +18,22 @@ class DefaultDriver:
         scale_factor_query_path: Dict,
         benchmark_type: str,
         table_names: List[str],
+        templates: Optional[Dict[str, QueryTemplate]] = None,
+        repeated_parameter_fraction: float = 0.0,
     ):
-        """Initialize DefaultDriver."""
+        """Initialize DefaultDriver.
+
+        Query types with a template are generated from it instead of the
+        queries of their file, see DefaultWorkload.
+        """
         self._query_path: str = query_path
         self._scale_factor_query_path: Dict = scale_factor_query_path
         self._benchmark_type: str = benchmark_type
         self._workloads: Dict = {}
         self._table_names = table_names
+        self._templates: Dict[str, QueryTemplate] = templates or {}
+        self._repeated_parameter_fraction = repeated_parameter_fraction
+        self._seed: Optional[int] = None
 
     def _get_workload_for_scale_factor(self, scalefactor):
         workload = self._workloads.get(scalefactor)
@@ -31,11 +41,29 @@ class DefaultDriver:
             query_path = (
                 f"{self._query_path}/{self._scale_factor_query_path[scalefactor]}"
             )
-            workload = DefaultWorkload(self._benchmark_type, scalefactor, query_path)
+            formatted_scalefactor = self._get_formatted_scalefactor(scalefactor)
+            workload = DefaultWorkload(
+                self._benchmark_type,
+                scalefactor,
+                query_path,
+                {
+                    query_type: template.render(formatted_scalefactor)
+                    for query_type, template in self._templates.items()
+                },
+                self._repeated_parameter_fraction,
+            )
+            if self._seed is not None:
+                workload.seed(self._seed)
             self._workloads[scalefactor] = workload
 
         return workload
 
+    def seed(self, seed: Optional[int]) -> None:
+        """Seed the workloads of all scale factors."""
+        self._seed = seed
+        for workload in self._workloads.values():
+            workload.seed(seed)
+
     def generate(self, scalefactor, frequency, weights):
         """Generate workload queries."""
         workload = self._get_workload_for_scale_factor(scalefactor)
@@ -122,7 +150,9 @@ class DefaultDriver:
         self, task, cursor, worker_id
     ) -> Tuple[int, int, float, str, bool]:
         """Execute task of the query type."""
-        query = task["query"]
+        query = self._get_workload_for_scale_factor(task["scalefactor"]).get_query(
+            task["query_type"], task["variant"], task["catalog_version"]
+        )
         query = query.replace("[STREAM_ID]", str(worker_id))
 
         not_formatted_parameters = task["args"]
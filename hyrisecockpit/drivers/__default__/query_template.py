@@ -0,0 +1,26 @@
+"""Module for parameterized query templates."""
+from random import Random
+from typing import Callable, Optional, Tuple, Union
+
+Parameters = Tuple[Tuple[Union[str, int, float], Optional[str]], ...]
+
+
+class QueryTemplate:
+    """Query with placeholders and a generator for its parameters.
+
+    The query uses %s as placeholder for every parameter and [SF] for the
+    formatted scale factor in table names. The generator draws a new tuple of
+    parameters with their protocol (None or "as_is") from the random number
+    generator it is called with.
+    """
+
+    def __init__(self, query: str, generate_parameters: Callable[[Random], Parameters]):
+        """Initialize a QueryTemplate."""
+        self.query: str = " ".join(query.split())
+        self.generate_parameters: Callable[[Random], Parameters] = generate_parameters
+
+    def render(self, formatted_scalefactor: str) -> "QueryTemplate":
+        """Return the template for the tables of a scale factor."""
+        return QueryTemplate(
+            self.query.replace("[SF]", formatted_scalefactor), self.generate_parameters
+        )
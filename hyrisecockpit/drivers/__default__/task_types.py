@@ -2,22 +2,45 @@
 from typing import Optional, Tuple, TypedDict
 
 
-class AbstractTask(TypedDict):
-    """Abstract task."""
+class AbstractTaskBase(TypedDict):
+    """Required fields of a task."""
 
     benchmark: str
     scalefactor: float
     args: Optional[Tuple]
 
 
+class AbstractTask(AbstractTaskBase, total=False):
+    """Abstract task.
+
+    Tasks are stamped when they are generated (generatedts) and put into the
+    queue of a worker pool (enqueuedts). Tasks of an open-loop workload carry
+    their intended start time (startts).
+    """
+
+    generatedts: int
+    enqueuedts: int
+    startts: int
+
+
 class DefaultTask(AbstractTask):
-    """Type of a generated Query."""
+    """Type of a generated Query.
+
+    The query is referenced by its type and variant in the query catalog of
+    the given version.
+    """
 
     query_type: str
-    query: str
+    variant: int
+    catalog_version: int
 
 
 class TPCCTask(AbstractTask):
-    """TPC-C task."""
+    """TPC-C task.
+
+    The warehouse is the home warehouse of the transaction, task workers can
+    be scheduled by it.
+    """
 
     transaction_type: str
+    warehouse: int
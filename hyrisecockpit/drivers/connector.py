@@ -14,24 +14,38 @@ class Workload:
         self.scale_factor = 0
         self.weights = driver.get_default_weights()
         self.frequency = 0
+        self.seed = None
+        self.profile = None
         self.driver = driver
 
     def get_default_weights(self):
         """Return default weights."""
         return self.driver.get_default_weights()
 
-    def update(self, scale_factor, frequency, weights):
-        """Update workload object."""
+    def update(self, scale_factor, frequency, weights, seed=None, profile=None):
+        """Update workload object.
+
+        An update with a seed restarts the generation of the driver with it,
+        so the same updates produce the same tasks in every run. A profile
+        replaces the constant frequency with a time-varying rate, an update
+        without one returns to the frequency.
+        """
         if weights:
             self.weights = weights
         self.scale_factor = scale_factor
         self.frequency = frequency
+        self.profile = profile
+        if seed is not None:
+            self.seed = seed
+            self.driver.seed(seed)
 
     def reset(self):
         """Reset attributes."""
         self.scale_factor = 0
         self.weights = self.driver.get_default_weights()
         self.frequency = 0
+        self.seed = None
+        self.profile = None
 
 
 class Connector:
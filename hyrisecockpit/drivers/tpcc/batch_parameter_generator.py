@@ -0,0 +1,271 @@
+"""Module for vectorized TPC-C parameters generation."""
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+import hyrisecockpit.drivers.tpcc.constants as constants
+from hyrisecockpit.drivers.__default__.task_types import TPCCTask
+from hyrisecockpit.drivers.tpcc.util import nurand, rand, scaleparameters  # type: ignore
+
+LAST_NAMES = np.array([rand.makeLastName(number) for number in range(1000)])
+
+
+class TPCCBatchParameterGenerator:
+    """Generates TPC-C parameters for a batch of transactions with NumPy.
+
+    The parameters of all transactions of a type are drawn at once from the
+    same distributions as in TPCCParameterGenerator. Both generators share the
+    NURand constants of the util.rand module.
+    """
+
+    def __init__(self, warehouses: float = 5, seed: Optional[int] = None):
+        """Initialize a batch parameter generator."""
+        self._rng = np.random.default_rng(seed)
+        self.apply_scalefactor(warehouses)
+
+    def apply_scalefactor(self, warehouses: float) -> None:
+        """Apply number of the warehouses as scalefactor."""
+        self._warehouses = warehouses
+        self._scale_parameters = scaleparameters.makeDefault(int(warehouses))
+
+    def seed(self, seed: Optional[int]) -> None:
+        """Restart the random number generator with a seed.
+
+        The NURand constants shared with TPCCParameterGenerator are drawn from
+        the seeded generator as well.
+        """
+        self._rng = np.random.default_rng(seed)
+        rand.setNURand(
+            nurand.NURandC(*self._number(0, [255, 1023, 8191], 3).tolist())
+        )
+
+    def _number(self, minimum: int, maximum: int, size) -> np.ndarray:
+        """Draw uniform integers in the range [minimum, maximum]."""
+        return self._rng.integers(minimum, maximum, size, endpoint=True)
+
+    def _number_excluding(self, minimum: int, maximum: int, excluding: np.ndarray):
+        """Draw uniform integers in the range [minimum, maximum] but excluding."""
+        numbers = self._number(minimum, maximum - 1, excluding.shape)
+        return numbers + (numbers >= excluding)
+
+    def _nurand(self, a: int, x: int, y: int, size) -> np.ndarray:
+        """Draw non-uniform random integers as defined by TPC-C 2.1.6."""
+        if rand.nurandVar is None:
+            rand.setNURand(nurand.makeForLoad())
+        c = {
+            255: rand.nurandVar.cLast,
+            1023: rand.nurandVar.cId,
+            8191: rand.nurandVar.orderLineItemId,
+        }[a]
+        return (
+            ((self._number(0, a, size) | self._number(x, y, size)) + c) % (y - x + 1)
+        ) + x
+
+    def _fixed_point(
+        self, decimal_places: int, minimum: float, maximum: float, size
+    ) -> np.ndarray:
+        multiplier = 10 ** decimal_places
+        return (
+            self._number(
+                int(minimum * multiplier + 0.5), int(maximum * multiplier + 0.5), size
+            )
+            / multiplier
+        )
+
+    def _make_warehouse_ids(self, size) -> np.ndarray:
+        return self._number(
+            self._scale_parameters.starting_warehouse,
+            self._scale_parameters.ending_warehouse,
+            size,
+        )
+
+    def _make_remote_warehouse_ids(self, w_ids: np.ndarray) -> np.ndarray:
+        return self._number_excluding(
+            self._scale_parameters.starting_warehouse,
+            self._scale_parameters.ending_warehouse,
+            w_ids,
+        )
+
+    def _make_district_ids(self, size) -> np.ndarray:
+        return self._number(1, self._scale_parameters.districtsPerWarehouse, size)
+
+    def _make_customer_ids(self, size) -> np.ndarray:
+        return self._nurand(1023, 1, self._scale_parameters.customersPerDistrict, size)
+
+    def _make_last_names(self, size) -> np.ndarray:
+        max_cid = min(999, self._scale_parameters.customersPerDistrict - 1)
+        return LAST_NAMES[self._nurand(255, 0, max_cid, size)]
+
+    def _make_item_ids(self, size) -> np.ndarray:
+        return self._nurand(8191, 1, self._scale_parameters.items, size)
+
+    def _make_unique_item_ids(self, ol_cnts: np.ndarray) -> List[int]:
+        """Draw ol_cnt distinct item ids per transaction.
+
+        Redrawing an item id until it is new keeps the first distinct values
+        of a stream of item ids, so the ids of a transaction are the first
+        occurrences in a row of draws. Rows with too few distinct ids get
+        more draws. Returns the ids of all transactions concatenated.
+        """
+        draws = self._make_item_ids((len(ol_cnts), constants.MAX_OL_CNT))
+        while True:
+            order = draws.argsort(axis=1, kind="stable")
+            sorted_draws = np.take_along_axis(draws, order, axis=1)
+            first_sorted = np.ones(draws.shape, dtype=bool)
+            first_sorted[:, 1:] = sorted_draws[:, 1:] != sorted_draws[:, :-1]
+            first = np.empty(draws.shape, dtype=bool)
+            np.put_along_axis(first, order, first_sorted, axis=1)
+            found = np.cumsum(first, axis=1)
+            if (found[:, -1] >= ol_cnts).all():
+                break
+            draws = np.concatenate(
+                (draws, self._make_item_ids((len(ol_cnts), constants.MAX_OL_CNT))),
+                axis=1,
+            )
+        return draws[first & (found <= ol_cnts[:, None])].tolist()
+
+    def _generate_delivery_params(self, count: int, now: int) -> List[Dict]:
+        w_ids = self._make_warehouse_ids(count).tolist()
+        o_carrier_ids = self._number(
+            constants.MIN_CARRIER_ID, constants.MAX_CARRIER_ID, count
+        ).tolist()
+        return [
+            {"w_id": w_id, "o_carrier_id": o_carrier_id, "ol_delivery_d": now}
+            for w_id, o_carrier_id in zip(w_ids, o_carrier_ids)
+        ]
+
+    def _generate_new_order_params(self, count: int, now: int) -> List[Dict]:
+        w_ids = self._make_warehouse_ids(count)
+        d_ids = self._make_district_ids(count).tolist()
+        c_ids = self._make_customer_ids(count).tolist()
+        ol_cnts = self._number(constants.MIN_OL_CNT, constants.MAX_OL_CNT, count)
+
+        i_ids = self._make_unique_item_ids(ol_cnts)
+        i_w_ids = np.repeat(w_ids, ol_cnts)
+        if self._scale_parameters.warehouses > 1:
+            remote = self._number(1, 100, len(i_w_ids)) == 1
+            i_w_ids = np.where(
+                remote, self._make_remote_warehouse_ids(i_w_ids), i_w_ids
+            )
+        i_w_ids = i_w_ids.tolist()
+        i_qtys = self._number(1, constants.MAX_OL_QUANTITY, len(i_w_ids)).tolist()
+
+        params = []
+        end = 0
+        for w_id, d_id, c_id, ol_cnt in zip(
+            w_ids.tolist(), d_ids, c_ids, ol_cnts.tolist()
+        ):
+            start, end = end, end + ol_cnt
+            params.append(
+                {
+                    "w_id": w_id,
+                    "d_id": d_id,
+                    "c_id": c_id,
+                    "o_entry_d": now,
+                    "i_ids": i_ids[start:end],
+                    "i_w_ids": i_w_ids[start:end],
+                    "i_qtys": i_qtys[start:end],
+                }
+            )
+        return params
+
+    def _generate_order_status_params(self, count: int, now: int) -> List[Dict]:
+        w_ids = self._make_warehouse_ids(count).tolist()
+        d_ids = self._make_district_ids(count).tolist()
+        by_last_name = (self._number(1, 100, count) <= 60).tolist()
+        c_ids = self._make_customer_ids(count).tolist()
+        c_lasts = self._make_last_names(count).tolist()
+        return [
+            {
+                "w_id": w_id,
+                "d_id": d_id,
+                "c_id": None if by_name else c_id,
+                "c_last": c_last if by_name else None,
+            }
+            for w_id, d_id, by_name, c_id, c_last in zip(
+                w_ids, d_ids, by_last_name, c_ids, c_lasts
+            )
+        ]
+
+    def _generate_payment_params(self, count: int, now: int) -> List[Dict]:
+        w_ids = self._make_warehouse_ids(count)
+        d_ids = self._make_district_ids(count)
+        h_amounts = self._fixed_point(
+            2, constants.MIN_PAYMENT, constants.MAX_PAYMENT, count
+        ).tolist()
+        c_w_ids, c_d_ids = w_ids, d_ids
+        if self._scale_parameters.warehouses > 1:
+            remote = self._number(1, 100, count) > 85
+            c_w_ids = np.where(remote, self._make_remote_warehouse_ids(w_ids), w_ids)
+            c_d_ids = np.where(remote, self._make_district_ids(count), d_ids)
+        by_last_name = (self._number(1, 100, count) <= 60).tolist()
+        c_ids = self._make_customer_ids(count).tolist()
+        c_lasts = self._make_last_names(count).tolist()
+        return [
+            {
+                "w_id": w_id,
+                "d_id": d_id,
+                "h_amount": h_amount,
+                "c_w_id": c_w_id,
+                "c_d_id": c_d_id,
+                "c_id": None if by_name else c_id,
+                "c_last": c_last if by_name else None,
+                "h_date": now,
+            }
+            for w_id, d_id, h_amount, c_w_id, c_d_id, by_name, c_id, c_last in zip(
+                w_ids.tolist(),
+                d_ids.tolist(),
+                h_amounts,
+                c_w_ids.tolist(),
+                c_d_ids.tolist(),
+                by_last_name,
+                c_ids,
+                c_lasts,
+            )
+        ]
+
+    def _generate_stock_level_params(self, count: int, now: int) -> List[Dict]:
+        w_ids = self._make_warehouse_ids(count).tolist()
+        d_ids = self._make_district_ids(count).tolist()
+        thresholds = self._number(
+            constants.MIN_STOCK_LEVEL_THRESHOLD,
+            constants.MAX_STOCK_LEVEL_THRESHOLD,
+            count,
+        ).tolist()
+        return [
+            {"w_id": w_id, "d_id": d_id, "threshold": threshold}
+            for w_id, d_id, threshold in zip(w_ids, d_ids, thresholds)
+        ]
+
+    def generate_transactions(
+        self, frequency: int, weights: Dict[str, float]
+    ) -> List[TPCCTask]:
+        """Generate random transactions."""
+        generators: Dict[str, Callable[[int, int], List[Dict]]] = {
+            "stock_level": self._generate_stock_level_params,
+            "delivery": self._generate_delivery_params,
+            "order_status": self._generate_order_status_params,
+            "payment": self._generate_payment_params,
+            "new_order": self._generate_new_order_params,
+        }
+        transaction_types = list(weights.keys())
+        probabilities = np.array(list(weights.values()), dtype=float)
+        generated_transaction_types = self._rng.choice(
+            len(transaction_types), frequency, p=probabilities / probabilities.sum()
+        )
+        now = int(datetime.now().timestamp())
+
+        tasks: List[TPCCTask] = [None] * frequency  # type: ignore
+        for i, transaction_type in enumerate(transaction_types):
+            indices = np.flatnonzero(generated_transaction_types == i).tolist()
+            parameters = generators[transaction_type](len(indices), now)
+            for index, args in zip(indices, parameters):
+                tasks[index] = TPCCTask(
+                    args=args,  # type: ignore
+                    benchmark="tpcc",
+                    scalefactor=self._warehouses,
+                    transaction_type=transaction_type,
+                    warehouse=args["w_id"],
+                )
+        return tasks
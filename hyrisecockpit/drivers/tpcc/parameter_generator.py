@@ -10,6 +10,7 @@
 # -----------------------------------------------------------------------
 
 """Module for TPC-C parameters generation."""
+import random
 from datetime import datetime as d_datetime
 from random import choices
 from typing import Tuple
@@ -40,6 +41,14 @@ class TPCCParameterGenerator:  # noqa
         self._warehouses = warehouses
         self.scaleParameters = scaleparameters.makeDefault(warehouses)
 
+    def seed(self, seed):
+        """Seed the random module that all parameters are drawn from.
+
+        The NURand constants are drawn again from the seeded module.
+        """
+        random.seed(seed)
+        rand.setNURand(nurand.makeForLoad())
+
     ## DEF
 
     ## ----------------------------------------------
@@ -238,15 +247,19 @@ class TPCCParameterGenerator:  # noqa
             "new_order": self.generateNewOrderParams,
         }
 
-        return [
-            TPCCTask(
-                args=generators[transaction_type](),
-                benchmark="tpcc",
-                scalefactor=self._warehouses,
-                transaction_type=transaction_type,
+        tasks = []
+        for transaction_type in generated_transaction_types:
+            args = generators[transaction_type]()
+            tasks.append(
+                TPCCTask(
+                    args=args,
+                    benchmark="tpcc",
+                    scalefactor=self._warehouses,
+                    transaction_type=transaction_type,
+                    warehouse=args["w_id"],
+                )
             )
-            for transaction_type in generated_transaction_types
-        ]
+        return tasks
 
 
 ## CLASS
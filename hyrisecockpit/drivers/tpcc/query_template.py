@@ -1,4 +1,5 @@
 """Module for query templates."""
+from functools import lru_cache
 
 # -----------------------------------------------------------------------
 # Title: py-tpcc source code
@@ -62,8 +63,17 @@ TXN_QUERIES = {
 }
 
 
+# getStockInfo selects the S_DIST column of the district, a column name can't be
+# a parameter of a prepared statement
+UNPREPARED_QUERIES = {("NEW_ORDER", "getStockInfo")}
+
+
+@lru_cache(maxsize=None)
 def get_queries_for_scale_factor(scalefactor):
-    """Get query dictionary for a scalefactor."""
+    """Get query dictionary for a scalefactor.
+
+    The dictionary is cached per scalefactor and must not be changed.
+    """
     assert scalefactor == int(  # nosec
         scalefactor
     ), "TPC-C Error: Number of the warehouses has fractional part"
@@ -75,3 +85,35 @@ def get_queries_for_scale_factor(scalefactor):
         }
         for transaction_type, transaction_queries in TXN_QUERIES.items()
     }
+
+
+@lru_cache(maxsize=None)
+def get_prepared_queries_for_scale_factor(scalefactor):
+    """Get query dictionary of prepared statements for a scalefactor.
+
+    Returns the dictionary of EXECUTE statements and the list of PREPARE
+    statements that have to run once per connection before. Both are cached
+    per scalefactor and must not be changed.
+    """
+    queries = get_queries_for_scale_factor(scalefactor)
+    formatted_scalefactor = str(int(scalefactor))
+    prepared_queries = {}
+    prepare_statements = []
+    for transaction_type, transaction_queries in queries.items():
+        prepared_queries[transaction_type] = {}
+        for query_name, query in transaction_queries.items():
+            if (transaction_type, query_name) in UNPREPARED_QUERIES:
+                prepared_queries[transaction_type][query_name] = query
+                continue
+            statement_name = (
+                f"tpcc_{formatted_scalefactor}_{transaction_type.lower()}_{query_name}"
+            )
+            statement = " ".join(query.split()).replace("%s", "?")
+            prepare_statements.append(f"PREPARE {statement_name} FROM '{statement}'")
+            parameters = ", ".join(["%s"] * query.count("%s"))
+            prepared_queries[transaction_type][query_name] = (
+                f"EXECUTE {statement_name} ({parameters})"
+                if parameters
+                else f"EXECUTE {statement_name}"
+            )
+    return prepared_queries, prepare_statements
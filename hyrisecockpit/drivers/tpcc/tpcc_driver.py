@@ -2,25 +2,45 @@
 from os import getcwd
 from os.path import abspath
 from time import time_ns
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from psycopg2.errors import SerializationFailure
 
 from hyrisecockpit.drivers.__default__.driver import DefaultDriver
 from hyrisecockpit.drivers.__default__.task_types import DefaultTask
+from hyrisecockpit.drivers.tpcc.batch_parameter_generator import (
+    TPCCBatchParameterGenerator,
+)
 from hyrisecockpit.drivers.tpcc.parameter_generator import (  # type: ignore
     TPCCParameterGenerator,
 )
 from hyrisecockpit.drivers.tpcc.transaction_handler import (  # type: ignore
     TPCCTransactionHandler,
 )
+from hyrisecockpit.settings import (
+    TPCC_MAX_RETRIES,
+    TPCC_PREPARED_STATEMENTS,
+    TPCC_VECTORIZED_PARAMETERS,
+)
 
 
 class TpccDriver:
     """Tpch driver."""
 
-    def __init__(self):
-        """Initialize a tpch driver."""
+    def __init__(
+        self,
+        prepared_statements: bool = TPCC_PREPARED_STATEMENTS,
+        vectorized_parameters: bool = TPCC_VECTORIZED_PARAMETERS,
+        max_retries: int = TPCC_MAX_RETRIES,
+    ):
+        """Initialize a tpch driver.
+
+        With prepared statements the transactions are reported with the
+        _prepared suffix, so they show up as separate series. Vectorized
+        parameters are generated for all transactions of a type at once.
+        Transactions aborted with a serialization failure are retried up to
+        max_retries times.
+        """
         # TODO Move queries to driver folder
         self._query_path: str = f"{abspath(getcwd())}/workload_generator/workloads"
         self._benchmark_type: str = "tpcc"
@@ -36,8 +56,14 @@ class TpccDriver:
             "stock",
         ]
         self.scale_factors = [5.0]
-        self._transaction_handler = TPCCTransactionHandler()
-        self._parameter_generator = TPCCParameterGenerator()
+        self._prepared_statements = prepared_statements
+        self._max_retries = max_retries
+        self._transaction_handler = TPCCTransactionHandler(prepared_statements)
+        self._parameter_generator = (
+            TPCCBatchParameterGenerator()
+            if vectorized_parameters
+            else TPCCParameterGenerator()
+        )
 
         self._default_driver: DefaultDriver = DefaultDriver(
             self._query_path,
@@ -60,6 +86,10 @@ class TpccDriver:
             "new_order": 0.45,
         }
 
+    def seed(self, seed: Optional[int]) -> None:
+        """Seed the generation of the tpcc tasks."""
+        self._parameter_generator.seed(seed)
+
     def generate(self, scalefactor, frequency, weights) -> List[DefaultTask]:
         """Generate tpch tasks."""
         self._parameter_generator.apply_scalefactor(scalefactor)
@@ -80,21 +110,31 @@ class TpccDriver:
     def execute_task(
         self, task, cursor, worker_id
     ) -> Tuple[int, int, float, str, bool]:
-        """Execute task of the transaction type."""
+        """Execute task of the transaction type.
+
+        An aborted transaction is rolled back on the same connection. The
+        latency includes all retries and the outcome of the last attempt is
+        reported, retries are counted as a connection statistic.
+        """
         transaction_type = task["transaction_type"]
         scalefactor = task["scalefactor"]
         parameters = task["args"]
-        commited = True
+        commited = False
         startts = time_ns()
-        try:
-            self._transaction_handler.execute_transaction(
-                cursor, transaction_type, scalefactor, parameters
-            )
-        except SerializationFailure:
-            endts = time_ns()
-            commited = False
-            cursor.reset()
-        else:
-            endts = time_ns()
+        for attempt in range(self._max_retries + 1):
+            try:
+                self._transaction_handler.execute_transaction(
+                    cursor, transaction_type, scalefactor, parameters
+                )
+            except SerializationFailure:
+                cursor.rollback()
+            else:
+                commited = True
+                break
+        endts = time_ns()
+        if attempt:
+            cursor.count("retries", attempt)
         latency = endts - startts
-        return endts, latency, scalefactor, task["transaction_type"], commited
+        if self._prepared_statements:
+            transaction_type = f"{transaction_type}_prepared"
+        return endts, latency, scalefactor, transaction_type, commited
@@ -18,14 +18,24 @@ from psycopg2.extensions import AsIs
 
 import hyrisecockpit.drivers.tpcc.constants as constants
 from hyrisecockpit.drivers.tpcc.parameter_generator import TPCCParameterGenerator
-from hyrisecockpit.drivers.tpcc.query_template import get_queries_for_scale_factor
+from hyrisecockpit.drivers.tpcc.query_template import (
+    get_prepared_queries_for_scale_factor,
+    get_queries_for_scale_factor,
+)
 
 
 class TPCCTransactionHandler:
     """Handler for processing of the transaction tasks."""
 
-    def __init__(self):
-        """Initialize TransactionHandler."""
+    def __init__(self, prepared_statements=False):
+        """Initialize TransactionHandler.
+
+        With prepared statements every connection prepares the statements of a
+        scalefactor once and then only executes them with the parameters.
+        """
+        self._prepared_statements = prepared_statements
+        self._prepared_connection = None
+        self._prepared_scalefactors = set()
         self._handlers = {
             "stock_level": self.doStockLevel,
             "delivery": self.doDelivery,
@@ -45,10 +55,27 @@ class TPCCTransactionHandler:
         )
         handler(cursor, parameters, scalefactor)
 
+    def _get_queries(self, cursor, scalefactor):
+        """Get the queries of a scalefactor for the connection of the cursor."""
+        if not self._prepared_statements:
+            return get_queries_for_scale_factor(scalefactor)
+        queries, prepare_statements = get_prepared_queries_for_scale_factor(
+            scalefactor
+        )
+        if cursor.connection is not self._prepared_connection:
+            self._prepared_connection = cursor.connection
+            self._prepared_scalefactors = set()
+        if scalefactor not in self._prepared_scalefactors:
+            for prepare_statement in prepare_statements:
+                cursor.execute(prepare_statement, None)
+            self.conn.commit()
+            self._prepared_scalefactors.add(scalefactor)
+        return queries
+
     # ____________________________________________
 
     def doDelivery(self, cursor, params, scalefactor):  # noqa
-        q = get_queries_for_scale_factor(scalefactor)["DELIVERY"]
+        q = self._get_queries(cursor, scalefactor)["DELIVERY"]
 
         w_id = params["w_id"]
         o_carrier_id = params["o_carrier_id"]
@@ -96,7 +123,7 @@ class TPCCTransactionHandler:
     ## doNewOrder
     ## ----------------------------------------------
     def doNewOrder(self, cursor, params, scalefactor):  # noqa
-        q = get_queries_for_scale_factor(scalefactor)["NEW_ORDER"]
+        q = self._get_queries(cursor, scalefactor)["NEW_ORDER"]
 
         w_id = params["w_id"]
         d_id = params["d_id"]
@@ -248,7 +275,7 @@ class TPCCTransactionHandler:
     ## doOrderStatus
     ## ----------------------------------------------
     def doOrderStatus(self, cursor, params, scalefactor):  # noqa
-        q = get_queries_for_scale_factor(scalefactor)["ORDER_STATUS"]
+        q = self._get_queries(cursor, scalefactor)["ORDER_STATUS"]
 
         w_id = params["w_id"]
         d_id = params["d_id"]
@@ -288,7 +315,7 @@ class TPCCTransactionHandler:
     ## doPayment
     ## ----------------------------------------------
     def doPayment(self, cursor, params, scalefactor):  # noqa
-        q = get_queries_for_scale_factor(scalefactor)["PAYMENT"]
+        q = self._get_queries(cursor, scalefactor)["PAYMENT"]
 
         w_id = params["w_id"]
         d_id = params["d_id"]
@@ -367,7 +394,7 @@ class TPCCTransactionHandler:
     ## doStockLevel
     ## ----------------------------------------------
     def doStockLevel(self, cursor, params, scalefactor):  # noqa
-        q = get_queries_for_scale_factor(scalefactor)["STOCK_LEVEL"]
+        q = self._get_queries(cursor, scalefactor)["STOCK_LEVEL"]
 
         w_id = params["w_id"]
         d_id = params["d_id"]
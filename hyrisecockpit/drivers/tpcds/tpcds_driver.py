@@ -1,7 +1,7 @@
 """TPCDS driver."""
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from hyrisecockpit.drivers.__default__.driver import DefaultDriver
 from hyrisecockpit.drivers.__default__.task_types import DefaultTask
@@ -36,6 +36,10 @@ class TpcdsDriver:
         """Get default weights."""
         return OrderedDict(default_weights)  # TODO why OrderedDict
 
+    def seed(self, seed: Optional[int]) -> None:
+        """Seed the generation of the tpcds tasks."""
+        self._default_driver.seed(seed)
+
     def generate(self, scalefactor, frequency, weights) -> List[DefaultTask]:
         """Generate tpcds tasks."""
         return self._default_driver.generate(scalefactor, frequency, weights)  # type: ignore
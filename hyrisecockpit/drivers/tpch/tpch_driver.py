@@ -1,17 +1,30 @@
 """TPC-H driver."""
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from hyrisecockpit.drivers.__default__.driver import DefaultDriver
 from hyrisecockpit.drivers.__default__.task_types import DefaultTask
+from hyrisecockpit.drivers.tpch.tpch_templates import templates
+from hyrisecockpit.settings import (
+    WORKLOAD_QUERY_TEMPLATES,
+    WORKLOAD_REPEATED_PARAMETER_FRACTION,
+)
 
 
 class TpchDriver:
     """Tpch driver."""
 
-    def __init__(self):
-        """Initialize a tpch driver."""
+    def __init__(
+        self,
+        query_templates: bool = WORKLOAD_QUERY_TEMPLATES,
+        repeated_parameter_fraction: float = WORKLOAD_REPEATED_PARAMETER_FRACTION,
+    ):
+        """Initialize a tpch driver.
+
+        With query templates the queries that have a template get generated
+        parameters instead of the fixed query variants.
+        """
         # TODO Move queries to driver folder
         self._query_path: str = (
             f"{Path(__file__).parent.parent.parent}/workload_generator/workloads"
@@ -34,6 +47,8 @@ class TpchDriver:
             self._scale_factor_query_path,
             self._benchmark_type,
             self._table_names,
+            templates if query_templates else None,
+            repeated_parameter_fraction,
         )
 
     def get_scalefactors(self):
@@ -46,6 +61,10 @@ class TpchDriver:
             ("{:02d}".format(i), 1.0) for i in range(1, 23)
         )  # TODO why OrderedDict
 
+    def seed(self, seed: Optional[int]) -> None:
+        """Seed the generation of the tpch tasks."""
+        self._default_driver.seed(seed)
+
     def generate(self, scalefactor, frequency, weights) -> List[DefaultTask]:
         """Generate tpch tasks."""
         return self._default_driver.generate(scalefactor, frequency, weights)  # type: ignore
@@ -0,0 +1,204 @@
+"""Query templates for the tpch workload.
+
+The parameters are drawn from the substitution parameter distributions of the
+TPC-H specification (section 2.4), as qgen does.
+"""
+from datetime import date, timedelta
+from random import Random
+from typing import Dict
+
+from hyrisecockpit.drivers.__default__.query_template import Parameters, QueryTemplate
+
+SEGMENTS = ["AUTOMOBILE", "BUILDING", "FURNITURE", "MACHINERY", "HOUSEHOLD"]
+REGIONS = ["AFRICA", "AMERICA", "ASIA", "EUROPE", "MIDDLE EAST"]
+SHIPMODES = ["REG AIR", "AIR", "RAIL", "SHIP", "TRUCK", "MAIL", "FOB"]
+
+
+def _get_month(year: int, month: int, offset: int) -> date:
+    """Return the first day of the month offset months after year-month."""
+    months = year * 12 + month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def _get_month_range(year: int, month: int, offset: int, months: int) -> Parameters:
+    return (
+        (_get_month(year, month, offset).isoformat(), None),
+        (_get_month(year, month, offset + months).isoformat(), None),
+    )
+
+
+def _get_year_range(rng: Random) -> Parameters:
+    year = rng.randint(1993, 1997)
+    return ((f"{year}-01-01", None), (f"{year + 1}-01-01", None))
+
+
+def _get_q1_parameters(rng: Random) -> Parameters:
+    delta = rng.randint(60, 120)
+    return (((date(1998, 12, 1) - timedelta(days=delta)).isoformat(), None),)
+
+
+def _get_q3_parameters(rng: Random) -> Parameters:
+    orderdate = (date(1995, 3, 1) + timedelta(days=rng.randint(0, 30))).isoformat()
+    return ((rng.choice(SEGMENTS), None), (orderdate, None), (orderdate, None))
+
+
+def _get_q4_parameters(rng: Random) -> Parameters:
+    return _get_month_range(1993, 1, rng.randint(0, 57), 3)
+
+
+def _get_q5_parameters(rng: Random) -> Parameters:
+    return ((rng.choice(REGIONS), None),) + _get_year_range(rng)
+
+
+def _get_q6_parameters(rng: Random) -> Parameters:
+    discount = rng.randint(2, 9) / 100
+    quantity = rng.randint(24, 25)
+    return _get_year_range(rng) + ((discount, None), (discount, None), (quantity, None))
+
+
+def _get_q10_parameters(rng: Random) -> Parameters:
+    return _get_month_range(1993, 2, rng.randint(0, 23), 3)
+
+
+def _get_q12_parameters(rng: Random) -> Parameters:
+    first_shipmode, second_shipmode = rng.sample(SHIPMODES, 2)
+    return ((first_shipmode, None), (second_shipmode, None)) + _get_year_range(rng)
+
+
+def _get_q14_parameters(rng: Random) -> Parameters:
+    return _get_month_range(1993, 1, rng.randint(0, 59), 1)
+
+
+templates: Dict[str, QueryTemplate] = {
+    "01": QueryTemplate(
+        """
+        SELECT l_returnflag, l_linestatus, SUM(l_quantity) AS sum_qty,
+            SUM(l_extendedprice) AS sum_base_price,
+            SUM(l_extendedprice * (1 - l_discount)) AS sum_disc_price,
+            SUM(l_extendedprice * (1 - l_discount) * (1 + l_tax)) AS sum_charge,
+            AVG(l_quantity) AS avg_qty, AVG(l_extendedprice) AS avg_price,
+            AVG(l_discount) AS avg_disc, COUNT(*) AS count_order
+        FROM lineitem_tpch_[SF]
+        WHERE l_shipdate <= %s
+        GROUP BY l_returnflag, l_linestatus
+        ORDER BY l_returnflag, l_linestatus;
+        """,
+        _get_q1_parameters,
+    ),
+    "03": QueryTemplate(
+        """
+        SELECT l_orderkey, SUM(l_extendedprice * (1 - l_discount)) AS revenue,
+            o_orderdate, o_shippriority
+        FROM customer_tpch_[SF], orders_tpch_[SF], lineitem_tpch_[SF]
+        WHERE c_mktsegment = %s
+            AND c_custkey = o_custkey
+            AND l_orderkey = o_orderkey
+            AND o_orderdate < %s
+            AND l_shipdate > %s
+        GROUP BY l_orderkey, o_orderdate, o_shippriority
+        ORDER BY revenue DESC, o_orderdate
+        LIMIT 10;
+        """,
+        _get_q3_parameters,
+    ),
+    "04": QueryTemplate(
+        """
+        SELECT o_orderpriority, count(*) AS order_count
+        FROM orders_tpch_[SF]
+        WHERE o_orderdate >= %s
+            AND o_orderdate < %s
+            AND EXISTS
+                (SELECT *
+                FROM lineitem_tpch_[SF]
+                WHERE l_orderkey = o_orderkey
+                    AND l_commitdate < l_receiptdate)
+        GROUP BY o_orderpriority
+        ORDER BY o_orderpriority;
+        """,
+        _get_q4_parameters,
+    ),
+    "05": QueryTemplate(
+        """
+        SELECT n_name, SUM(l_extendedprice * (1 - l_discount)) AS revenue
+        FROM customer_tpch_[SF], orders_tpch_[SF], lineitem_tpch_[SF],
+            supplier_tpch_[SF], nation_tpch_[SF], region_tpch_[SF]
+        WHERE c_custkey = o_custkey
+            AND l_orderkey = o_orderkey
+            AND l_suppkey = s_suppkey
+            AND c_nationkey = s_nationkey
+            AND s_nationkey = n_nationkey
+            AND n_regionkey = r_regionkey
+            AND r_name = %s
+            AND o_orderdate >= %s
+            AND o_orderdate < %s
+        GROUP BY n_name
+        ORDER BY revenue DESC;
+        """,
+        _get_q5_parameters,
+    ),
+    "06": QueryTemplate(
+        """
+        SELECT sum(l_extendedprice * l_discount) AS revenue
+        FROM lineitem_tpch_[SF]
+        WHERE l_shipdate >= %s
+            AND l_shipdate < %s
+            AND l_discount BETWEEN %s - 0.01 AND %s + 0.01001
+            AND l_quantity < %s;
+        """,
+        _get_q6_parameters,
+    ),
+    "10": QueryTemplate(
+        """
+        SELECT c_custkey, c_name, SUM(l_extendedprice * (1 - l_discount)) AS revenue,
+            c_acctbal, n_name, c_address, c_phone, c_comment
+        FROM customer_tpch_[SF], orders_tpch_[SF], lineitem_tpch_[SF], nation_tpch_[SF]
+        WHERE c_custkey = o_custkey
+            AND l_orderkey = o_orderkey
+            AND o_orderdate >= %s
+            AND o_orderdate < %s
+            AND l_returnflag = 'R'
+            AND c_nationkey = n_nationkey
+        GROUP BY c_custkey, c_name, c_acctbal, c_phone, n_name, c_address, c_comment
+        ORDER BY revenue DESC
+        LIMIT 20;
+        """,
+        _get_q10_parameters,
+    ),
+    "12": QueryTemplate(
+        """
+        SELECT l_shipmode,
+            SUM(CASE
+                WHEN o_orderpriority = '1-URGENT' OR o_orderpriority = '2-HIGH' THEN 1
+                ELSE 0
+            END) AS high_line_count,
+            SUM(CASE
+                WHEN o_orderpriority <> '1-URGENT' AND o_orderpriority <> '2-HIGH'
+                THEN 1
+                ELSE 0
+            END) AS low_line_count
+        FROM orders_tpch_[SF], lineitem_tpch_[SF]
+        WHERE o_orderkey = l_orderkey
+            AND l_shipmode IN (%s, %s)
+            AND l_commitdate < l_receiptdate
+            AND l_shipdate < l_commitdate
+            AND l_receiptdate >= %s
+            AND l_receiptdate < %s
+        GROUP BY l_shipmode
+        ORDER BY l_shipmode;
+        """,
+        _get_q12_parameters,
+    ),
+    "14": QueryTemplate(
+        """
+        SELECT 100.00 * SUM(CASE
+                WHEN p_type like 'PROMO%%' THEN l_extendedprice * (1 - l_discount)
+                ELSE 0
+            END) / SUM(l_extendedprice * (1 - l_discount)) AS promo_revenue
+        FROM lineitem_tpch_[SF], part_tpch_[SF]
+        WHERE l_partkey = p_partkey
+            AND l_shipdate >= %s
+            AND l_shipdate < %s;
+        """,
+        _get_q14_parameters,
+    ),
+}
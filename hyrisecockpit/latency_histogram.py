@@ -0,0 +1,107 @@
+"""Module for mergeable latency histograms.
+
+The histogram uses log-linear buckets like an HDR histogram: every power of two
+is split into SUB_BUCKETS equally wide buckets. Values below SUB_BUCKETS are
+recorded exactly, larger values with a relative error below 1 / SUB_BUCKETS.
+Histograms of the same layout are merged by adding up the bucket counts, so
+histograms of different task workers and seconds can be combined into one.
+"""
+from math import ceil
+from typing import Dict, Iterable, Optional, Tuple
+
+SUB_BUCKET_BITS: int = 5
+SUB_BUCKETS: int = 1 << SUB_BUCKET_BITS
+
+LATENCY_PERCENTILES: Dict[str, float] = {
+    "p50": 50.0,
+    "p95": 95.0,
+    "p99": 99.0,
+    "p999": 99.9,
+}
+# tag value of the latency percentiles of all benchmarks or query types
+ALL_QUERIES: str = "all"
+
+
+def get_bucket_index(value: int) -> int:
+    """Return the index of the bucket a non-negative value belongs to."""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - SUB_BUCKETS
+
+
+def get_bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the smallest and the largest value of a bucket."""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = (index & (SUB_BUCKETS - 1)) + SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Histogram of latencies in nanoseconds."""
+
+    def __init__(self, buckets: Optional[Dict[int, int]] = None) -> None:
+        """Initialize a LatencyHistogram."""
+        self._buckets: Dict[int, int] = dict(buckets) if buckets else {}
+
+    @property
+    def buckets(self) -> Dict[int, int]:
+        """Return the counts per bucket index."""
+        return self._buckets
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded values."""
+        return sum(self._buckets.values())
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Record a value count times."""
+        index = get_bucket_index(max(value, 0))
+        self._buckets[index] = self._buckets.get(index, 0) + count
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add the counts of another histogram to this histogram."""
+        for index, count in other.buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        return self
+
+    def get_percentile(self, percentile: float) -> int:
+        """Return the value at the given percentile (0 to 100).
+
+        The value is the middle of the bucket that holds the percentile. An
+        empty histogram returns 0.
+        """
+        total = self.count
+        if total == 0:
+            return 0
+        rank = max(ceil(percentile / 100 * total), 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                break
+        lower, upper = get_bucket_bounds(index)
+        return (lower + upper) // 2
+
+    def get_percentiles(self, percentiles: Iterable[float]) -> Dict[float, int]:
+        """Return the values at the given percentiles."""
+        return {
+            percentile: self.get_percentile(percentile) for percentile in percentiles
+        }
+
+    def encode(self) -> str:
+        """Return a compact string representation of the histogram."""
+        return ",".join(
+            f"{index}:{self._buckets[index]}" for index in sorted(self._buckets)
+        )
+
+    @classmethod
+    def decode(cls, encoded: str) -> "LatencyHistogram":
+        """Create a histogram from its string representation."""
+        buckets: Dict[int, int] = {}
+        for bucket in filter(None, encoded.split(",")):
+            index, count = bucket.split(":")
+            buckets[int(index)] = buckets.get(int(index), 0) + int(count)
+        return cls(buckets)
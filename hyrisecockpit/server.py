@@ -1,15 +1,70 @@
 """Server module handling zmq requests.
 
 Used by Database Manager and Workload Generator.
+
+The server receives the requests on a ROUTER socket, so it can answer them
+in any order. Every call has a concurrency class:
+
+- "inline" calls are cheap and answered by the server loop right away
+- "offloaded" calls run in the thread pool of the server
+- "exclusive" calls run in the thread pool one at a time, so calls that
+  change the state of the server's owner don't overlap
+
+The thread pool sends the responses back to the server loop over an inproc
+socket. A slow offloaded call only occupies a thread of the pool, while the
+server loop keeps answering inline calls. The server measures the time every
+call waits for a thread and the time it takes, "get server statistics"
+returns them.
 """
 
-from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from threading import Lock, local
+from time import time_ns
+from typing import Callable, Dict, List, Optional, Tuple
 
-from zmq import REP, Context
+from zmq import NOBLOCK, POLLIN, PULL, PUSH, ROUTER, Context, Poller, Socket
 
+from hyrisecockpit.latency_histogram import LatencyHistogram
 from hyrisecockpit.request import Body, Request
 from hyrisecockpit.response import Response, get_response
 
+CONCURRENCY_CLASSES: Tuple[str, ...] = ("inline", "offloaded", "exclusive")
+RESPONSES_URL: str = "inproc://server-responses"
+
+
+class CallStatistics:
+    """Latencies (ns) of the handled requests of a call."""
+
+    def __init__(self) -> None:
+        """Initialize a CallStatistics."""
+        self.count: int = 0
+        self.errors: int = 0
+        self.total_latency: int = 0
+        self.max_latency: int = 0
+        self.total_queue_wait: int = 0
+        self.histogram: LatencyHistogram = LatencyHistogram()
+
+    def record(self, latency: int, queue_wait: int, failed: bool) -> None:
+        """Record the latency of a request and the time it waited for a thread."""
+        self.count += 1
+        self.errors += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.total_queue_wait += queue_wait
+        self.histogram.record(latency)
+
+    def get_summary(self) -> Dict:
+        """Return the number of requests and their mean, p99 and max latency."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_latency": self.total_latency // max(self.count, 1),
+            "p99_latency": self.histogram.get_percentile(99.0) if self.count else 0,
+            "max_latency": self.max_latency,
+            "mean_queue_wait": self.total_queue_wait // max(self.count, 1),
+        }
+
 
 class Server:
     """Server component handling zmq requests."""
@@ -20,27 +75,123 @@ class Server:
         port: str,
         calls: Dict[str, Tuple[Callable[[Body], Response], Optional[Dict]]],
         io_threads: int = 1,
+        concurrency: Optional[Dict[str, str]] = None,
+        workers: int = 4,
     ) -> None:
-        """Initialize a Server with a host, port and calls."""
-        self._calls = calls
+        """Initialize a Server with a host, port and calls.
+
+        The concurrency maps calls to their concurrency class, calls without
+        one are answered inline. Offloaded and exclusive calls run in a pool
+        of worker threads.
+        """
+        concurrency = concurrency or {}
+        for concurrency_class in concurrency.values():
+            if concurrency_class not in CONCURRENCY_CLASSES:
+                raise ValueError(f"Unknown concurrency class {concurrency_class}")
+        self._calls = {
+            **calls,
+            "get server statistics": (self._call_get_server_statistics, None),
+        }
+        self._concurrency = concurrency
         self._host = host
         self._port = port
+        self._statistics: Dict[str, CallStatistics] = {}
+        self._statistics_lock: Lock = Lock()
+        self._exclusive_lock: Lock = Lock()
+        self._thread_sockets = local()
+        self._response_sockets: List[Socket] = []
+        self._executor = ThreadPoolExecutor(max_workers=workers)
         self._init_server(io_threads)
 
     def _init_server(self, io_threads: int) -> None:
         self._context = Context(io_threads=io_threads)  # type: ignore
-        self._socket = self._context.socket(REP)
+        self._socket = self._context.socket(ROUTER)
         self._socket.bind("tcp://{:s}:{:s}".format(self._host, self._port))
+        self._responses = self._context.socket(PULL)
+        self._responses.bind(RESPONSES_URL)
 
     def start(self) -> None:
         """Start the server loop."""
+        poller = Poller()
+        poller.register(self._socket, POLLIN)
+        poller.register(self._responses, POLLIN)
         while True:
-            request: Request = self._socket.recv_json()
-            response: Response = self._handle_request(request)
-            self._socket.send_json(response)
+            events = dict(poller.poll())
+            if self._responses in events:
+                self._forward_responses()
+            if self._socket in events:
+                self._receive_request()
 
-    def _handle_request(self, request: Request) -> Response:
+    def _forward_responses(self) -> None:
+        """Send the responses of the thread pool to their clients."""
+        while self._responses.poll(0):
+            self._socket.send_multipart(self._responses.recv_multipart(NOBLOCK))
+
+    def _receive_request(self) -> None:
+        """Answer an inline request or hand it to the thread pool."""
+        identity, delimiter, message = self._socket.recv_multipart()
+        request: Request = loads(message)
+        envelope = [identity, delimiter]
+        call = request["header"]["message"]
+        concurrency_class = self._concurrency.get(call, "inline")
+        if concurrency_class == "inline":
+            response = self._handle_measured_request(request, time_ns())
+            self._socket.send_multipart([*envelope, dumps(response).encode()])
+        else:
+            self._executor.submit(
+                self._handle_offloaded_request,
+                envelope,
+                request,
+                concurrency_class == "exclusive",
+                time_ns(),
+            )
+
+    def _get_response_socket(self) -> Socket:
+        """Return the socket of the current thread to send responses with."""
+        socket = getattr(self._thread_sockets, "socket", None)
+        if socket is None:
+            socket = self._context.socket(PUSH)
+            socket.connect(RESPONSES_URL)
+            self._thread_sockets.socket = socket
+            with self._statistics_lock:
+                self._response_sockets.append(socket)
+        return socket
+
+    def _handle_offloaded_request(
+        self, envelope: List[bytes], request: Request, exclusive: bool, receivedts: int
+    ) -> None:
+        if exclusive:
+            with self._exclusive_lock:
+                response = self._handle_measured_request(request, receivedts)
+        else:
+            response = self._handle_measured_request(request, receivedts)
+        self._get_response_socket().send_multipart(
+            [*envelope, dumps(response).encode()]
+        )
 
+    def _handle_measured_request(self, request: Request, receivedts: int) -> Response:
+        """Handle a request and record its latency.
+
+        A call that raises an exception is answered with 500, so its client
+        doesn't wait forever.
+        """
+        startts = time_ns()
+        failed = False
+        try:
+            response = self._handle_request(request)
+        except Exception:  # noqa
+            failed = True
+            response = get_response(500)
+        endts = time_ns()
+        call = request["header"]["message"]
+        if call in self._calls:
+            with self._statistics_lock:
+                self._statistics.setdefault(call, CallStatistics()).record(
+                    endts - startts, startts - receivedts, failed
+                )
+        return response
+
+    def _handle_request(self, request: Request) -> Response:
         # TODO remove validation schema and call not found. We handle all this stuff in flask.
         function_parameters = self._calls.get(request["header"]["message"])
         if function_parameters is None:
@@ -48,7 +199,25 @@ class Server:
         func, _ = function_parameters
         return func(request["body"])
 
+    def _call_get_server_statistics(self, body: Body) -> Response:
+        with self._statistics_lock:
+            calls = [
+                {
+                    "call": call,
+                    "concurrency": self._concurrency.get(call, "inline"),
+                    **statistics.get_summary(),
+                }
+                for call, statistics in self._statistics.items()
+            ]
+        response = get_response(200)
+        response["body"]["calls"] = calls
+        return response
+
     def close(self) -> None:
         """Close the socket and terminate it."""
+        self._executor.shutdown(wait=True)
+        for socket in self._response_sockets:
+            socket.close(linger=0)
+        self._responses.close()
         self._socket.close()
         self._context.term()
@@ -23,6 +23,12 @@ BACKEND_LISTENING: str = getenv("BACKEND_LISTENING", "0.0.0.0")
 DB_MANAGER_HOST: str = getenv("DB_MANAGER_HOST", "127.0.0.1")
 DB_MANAGER_PORT: str = getenv("DB_MANAGER_PORT", "8001")
 DB_MANAGER_LISTENING: str = getenv("DB_MANAGER_LISTENING", "*")
+DB_MANAGER_CALL_WORKERS: int = int(getenv("DB_MANAGER_CALL_WORKERS", "4"))
+DB_MANAGER_FAN_OUT_WORKERS: int = int(getenv("DB_MANAGER_FAN_OUT_WORKERS", "8"))
+DB_MANAGER_FAN_OUT_TIMEOUT: float = float(getenv("DB_MANAGER_FAN_OUT_TIMEOUT", "10"))
+DB_MANAGER_CONNECTION_POOL_SIZE: int = int(
+    getenv("DB_MANAGER_CONNECTION_POOL_SIZE", "4")
+)
 
 GENERATOR_HOST: str = getenv("GENERATOR_HOST", "127.0.0.1")
 GENERATOR_PORT: str = getenv("GENERATOR_PORT", "8002")
@@ -31,6 +37,15 @@ GENERATOR_LISTENING: str = getenv("GENERATOR_LISTENING", "*")
 WORKLOAD_SUB_HOST: str = getenv("WORKLOAD_SUB_HOST", "127.0.0.1")
 WORKLOAD_PUBSUB_PORT: str = getenv("WORKLOAD_PUBSUB_PORT", "8003")
 WORKLOAD_LISTENING: str = getenv("WORKLOAD_LISTENING", "*")
+WORKLOAD_ARRIVAL_PROCESS: str = getenv("WORKLOAD_ARRIVAL_PROCESS", "burst")
+WORKLOAD_CODEC: str = getenv("WORKLOAD_CODEC", "msgpack")
+WORKLOAD_CHUNK_SIZE: int = int(getenv("WORKLOAD_CHUNK_SIZE", "1000"))
+WORKLOAD_TRACE_DIRECTORY: str = getenv("WORKLOAD_TRACE_DIRECTORY", "traces")
+WORKLOAD_GENERATOR_SHARDS: int = int(getenv("WORKLOAD_GENERATOR_SHARDS", "1"))
+WORKLOAD_QUERY_TEMPLATES: bool = getenv("WORKLOAD_QUERY_TEMPLATES", "false") == "true"
+WORKLOAD_REPEATED_PARAMETER_FRACTION: float = float(
+    getenv("WORKLOAD_REPEATED_PARAMETER_FRACTION", "0")
+)
 
 DEFAULT_TABLES: str = getenv("DEFAULT_TABLES", "tpch_0_1")
 
@@ -39,6 +54,27 @@ STORAGE_PORT: str = getenv("STORAGE_PORT", "8086")
 STORAGE_USER: str = getenv("STORAGE_USER", "root")
 STORAGE_PASSWORD: str = getenv("STORAGE_PASSWORD", "root")
 
+WORKER_DEQUEUE_BATCH_SIZE: int = int(getenv("WORKER_DEQUEUE_BATCH_SIZE", "1"))
+WORKER_DEQUEUE_TIMEOUT: float = float(getenv("WORKER_DEQUEUE_TIMEOUT", "0.1"))
+WORKER_TASK_TRANSPORT: str = getenv("WORKER_TASK_TRANSPORT", "queue")
+WORKER_TASK_SCHEDULING: str = getenv("WORKER_TASK_SCHEDULING", "shared")
+
+RESULT_LOG_BUFFER_SIZE: int = int(getenv("RESULT_LOG_BUFFER_SIZE", "100000"))
+RESULT_LOG_FLUSH_SIZE: int = int(getenv("RESULT_LOG_FLUSH_SIZE", "10000"))
+RESULT_LOG_FLUSH_INTERVAL: float = float(getenv("RESULT_LOG_FLUSH_INTERVAL", "1"))
+RAW_QUERY_LOG_SAMPLE_RATE: float = float(getenv("RAW_QUERY_LOG_SAMPLE_RATE", "0"))
+STORAGE_WRITER_BUFFER_SIZE: int = int(getenv("STORAGE_WRITER_BUFFER_SIZE", "100000"))
+STORAGE_WRITER_FLUSH_SIZE: int = int(getenv("STORAGE_WRITER_FLUSH_SIZE", "5000"))
+STORAGE_WRITER_FLUSH_INTERVAL: float = float(
+    getenv("STORAGE_WRITER_FLUSH_INTERVAL", "1")
+)
+
+TPCC_PREPARED_STATEMENTS: bool = getenv("TPCC_PREPARED_STATEMENTS", "false") == "true"
+TPCC_VECTORIZED_PARAMETERS: bool = (
+    getenv("TPCC_VECTORIZED_PARAMETERS", "true") == "true"
+)
+TPCC_MAX_RETRIES: int = int(getenv("TPCC_MAX_RETRIES", "0"))
+
 FLASK_ENV: str = getenv("FLASK_ENV", "development")
 FLASK_DEBUG: bool = bool(getenv("FLASK_DEBUG", False))
 
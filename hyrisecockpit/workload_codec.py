@@ -0,0 +1,41 @@
+"""Codecs for the workload stream between generator and database manager.
+
+Every message of the workload stream has two frames: a header frame with the
+name of the codec and the encoded body. Subscribers decode a message with the
+codec named in its header, so the generator can change its codec without
+restarting the database manager.
+"""
+from json import dumps, loads
+from typing import Any, Callable, Dict, List, Tuple
+
+from msgpack import packb, unpackb
+
+
+def _encode_json(data: Any) -> bytes:
+    return dumps(data, separators=(",", ":")).encode()
+
+
+def _decode_json(data: bytes) -> Any:
+    return loads(data)
+
+
+CODECS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "msgpack": (packb, unpackb),
+    "json": (_encode_json, _decode_json),
+}
+
+
+def encode(data: Any, codec: str) -> List[bytes]:
+    """Encode data to the frames of a message."""
+    encoder, _ = CODECS[codec]
+    return [codec.encode(), encoder(data)]
+
+
+def decode(frames: List[bytes]) -> Any:
+    """Decode the frames of a message with the codec of its header."""
+    header, body = frames
+    codec = CODECS.get(header.decode())
+    if codec is None:
+        raise ValueError(f"Unknown workload codec {header!r}")
+    _, decoder = codec
+    return decoder(body)
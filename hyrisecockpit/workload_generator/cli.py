@@ -2,8 +2,13 @@
 from hyrisecockpit.settings import (
     GENERATOR_LISTENING,
     GENERATOR_PORT,
+    WORKLOAD_ARRIVAL_PROCESS,
+    WORKLOAD_CHUNK_SIZE,
+    WORKLOAD_CODEC,
+    WORKLOAD_GENERATOR_SHARDS,
     WORKLOAD_LISTENING,
     WORKLOAD_PUBSUB_PORT,
+    WORKLOAD_TRACE_DIRECTORY,
 )
 
 from .generator import WorkloadGenerator
@@ -17,6 +22,11 @@ def main() -> None:
             GENERATOR_PORT,
             WORKLOAD_LISTENING,
             WORKLOAD_PUBSUB_PORT,
+            WORKLOAD_ARRIVAL_PROCESS,
+            WORKLOAD_CODEC,
+            WORKLOAD_CHUNK_SIZE,
+            WORKLOAD_TRACE_DIRECTORY,
+            WORKLOAD_GENERATOR_SHARDS,
         ) as workload_generator:
             workload_generator.start()
     except KeyboardInterrupt:
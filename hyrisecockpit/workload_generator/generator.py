@@ -3,20 +3,37 @@
 Includes the main WorkloadGenerator.
 """
 
-from random import shuffle
+from multiprocessing import Array, Process, Queue
+from os import makedirs
+from os.path import basename, isfile, join
+from threading import Event, Lock, Thread
+from time import time_ns
 from types import TracebackType
-from typing import Callable, Dict, Optional, Tuple, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from zmq import PUB, Context
+from zmq import PUB, PULL, Context
 
 from hyrisecockpit.drivers.connector import Connector
 from hyrisecockpit.request import Body
 from hyrisecockpit.response import Response, get_response
 from hyrisecockpit.server import Server
+from hyrisecockpit.workload_codec import decode
+from hyrisecockpit.workload_generator.profile import Profile
+from hyrisecockpit.workload_generator.shard import (
+    ShardOrder,
+    ShardTick,
+    run_shard,
+    split_order,
+)
+from hyrisecockpit.workload_generator.task_generator import (
+    TaskGenerator,
+    WorkloadOrder,
+)
+from hyrisecockpit.workload_generator.trace import TraceReplay, TraceWriter
 
 
-class WorkloadGenerator(object):
+class WorkloadGenerator(TaskGenerator):
     """Object responsible for generating workload."""
 
     def __init__(
@@ -25,20 +42,71 @@ class WorkloadGenerator(object):
         generator_port: str,
         workload_listening: str,
         workload_pub_port: str,
+        arrival_process: str = "burst",
+        codec: str = "msgpack",
+        chunk_size: int = 1000,
+        trace_directory: str = "traces",
+        shards: int = 1,
     ) -> None:
-        """Initialize a WorkloadGenerator."""
+        """Initialize a WorkloadGenerator.
+
+        The arrival process decides when the tasks of one second should start.
+        With "burst" all tasks are published without a start time and are
+        executed as fast as possible. With "uniform" and "poisson" every task
+        gets an intended start time within the second and the load is open-loop.
+        The codec encodes the published workload, its name is sent with every
+        message. The tasks of one second are published in chunks of chunk_size
+        tasks, so subscribers can start on the first chunk while the rest is
+        still encoded and sent.
+
+        The published tasks can be recorded to a trace in the trace directory
+        and a trace can be replayed instead of the generated workloads. The
+        tasks of all workloads are mixed with a random number generator that
+        is seeded together with a workload, so seeded workloads publish the
+        same tasks in every run.
+
+        A workload with a profile gets the tasks of a second from the rate of
+        its profile in slices of the second. Every published chunk carries
+        the throughput targeted in its second.
+
+        With more than one shard, the tasks are generated by as many shard
+        processes, see the shard module. The generator reports how late its
+        ticks start and how long the generation of a second takes.
+        """
+        super().__init__(arrival_process, codec, chunk_size)
+        if shards < 1:
+            raise ValueError("The generator needs at least one shard")
+        self._shards = shards
         self._workload_listening = workload_listening
         self._workload_pub_port = workload_pub_port
+        self._trace_directory = trace_directory
+        self._publish_lock: Lock = Lock()
+        self._trace_writer: Optional[TraceWriter] = None
+        self._trace_replay: Optional[TraceReplay] = None
+        self._target_throughput: float = 0.0
+        self._seed_versions: Dict[str, int] = {}
+        self._ticks: int = 0
+        self._next_tickts: Optional[int] = None
+        self._missed_ticks: int = 0
+        self._tick_lateness: int = 0
+        self._generation_time: int = 0
+        self._shard_processes: List[Process] = []
         server_calls: Dict[str, Tuple[Callable[[Body], Response], Optional[Dict]]] = {
             "get all workloads": (self._call_get_all_workloads, None),
             "get workload": (self._call_get_workload, None),
             "stop workload": (self._call_stop_workload, None),
             "update workload": (self._call_update_workload, None),
+            "start trace recording": (self._call_start_trace_recording, None),
+            "stop trace recording": (self._call_stop_trace_recording, None),
+            "start trace replay": (self._call_start_trace_replay, None),
+            "stop trace replay": (self._call_stop_trace_replay, None),
+            "get generator statistics": (self._call_get_generator_statistics, None),
         }
         self._server = Server(generator_listening, generator_port, server_calls)
 
         self._workloads: Dict = Connector.get_workload()  # type: ignore
         self._init_server()
+        self._init_shards()
         self._init_scheduler()
 
     def _init_scheduler(self) -> None:
@@ -71,6 +139,59 @@ class WorkloadGenerator(object):
             "tcp://{:s}:{:s}".format(self._workload_listening, self._workload_pub_port)
         )
 
+    def _init_shards(self) -> None:
+        if self._shards == 1:
+            return
+        self._forward_socket = self._context.socket(PULL)
+        forward_port = self._forward_socket.bind_to_random_port("tcp://127.0.0.1")
+        self._shard_ticks: List[Queue] = [Queue() for _ in range(self._shards)]
+        self._shard_tick_lateness: Array = Array("q", self._shards)
+        self._shard_generation_time: Array = Array("q", self._shards)
+        self._shard_processes = [
+            Process(
+                target=run_shard,
+                args=(
+                    shard,
+                    self._shards,
+                    self._shard_ticks[shard],
+                    f"tcp://127.0.0.1:{forward_port}",
+                    self._shard_tick_lateness,
+                    self._shard_generation_time,
+                    self._arrival_process,
+                    self._codec,
+                    self._chunk_size,
+                ),
+                daemon=True,
+            )
+            for shard in range(self._shards)
+        ]
+        for process in self._shard_processes:
+            process.start()
+        self._forward_stop_event: Event = Event()
+        self._forward_thread = Thread(target=self._forward_chunks, daemon=True)
+        self._forward_thread.start()
+
+    def _forward_chunks(self) -> None:
+        """Publish the chunks of the shards and record them to the trace."""
+        while not self._forward_stop_event.is_set():
+            if not self._forward_socket.poll(100):
+                continue
+            frames = self._forward_socket.recv_multipart()
+            with self._publish_lock:
+                self._pub_socket.send_multipart(frames)
+                if self._trace_writer is not None:
+                    self._record_chunk(frames)
+
+    def _record_chunk(self, frames: List[bytes]) -> None:
+        """Record the tasks of a forwarded chunk to the trace.
+
+        The tasks of a second arrive in chunks of several shards, a replay
+        publishes the recorded chunks of a second together.
+        """
+        queries = decode(frames)["body"]["querylist"]
+        if queries:
+            self._trace_writer.write(queries[0]["generatedts"], queries)  # type: ignore
+
     def _call_get_all_workloads(self, body: Body) -> Response:
         response = get_response(200)
         response["body"]["workloads"] = [
@@ -82,6 +203,8 @@ class WorkloadGenerator(object):
                 "supported_scale_factors": properties.driver.get_scalefactors(),
                 "weights": properties.weights,
                 "running": properties.running,
+                "seed": properties.seed,
+                "profile": self._get_profile_definition(properties),
             }
             for workload, properties in self._workloads.items()
         ]
@@ -99,6 +222,8 @@ class WorkloadGenerator(object):
             "scale_factor": self._workloads[workload_type].scale_factor,
             "weights": self._workloads[workload_type].weights,
             "running": self._workloads[workload_type].running,
+            "seed": self._workloads[workload_type].seed,
+            "profile": self._get_profile_definition(workload),
         }
         return response
 
@@ -118,12 +243,31 @@ class WorkloadGenerator(object):
         frequency: int = body["frequency"]
         scale_factor: float = body["scale_factor"]
         weights = body["weights"]
+        seed: Optional[int] = body.get("seed")
+        profile_definition: Optional[Dict] = body.get("profile")
         workload = self._workloads.get(workload_type)
         if workload is None:
             return get_response(404)
         if scale_factor not in self._workloads[workload_type].driver.get_scalefactors():
             return get_response(400)
-        workload.update(scale_factor=scale_factor, frequency=frequency, weights=weights)
+        try:
+            profile = (
+                None if profile_definition is None else Profile(profile_definition)
+            )
+        except ValueError:
+            return get_response(400)
+        workload.update(
+            scale_factor=scale_factor,
+            frequency=frequency,
+            weights=weights,
+            seed=seed,
+            profile=profile,
+        )
+        if seed is not None:
+            self._random.seed(seed)
+            self._seed_versions[workload_type] = (
+                self._seed_versions.get(workload_type, 0) + 1
+            )
         workload.running = True
         response = get_response(200)
         response["body"]["workload"] = {
@@ -131,24 +275,192 @@ class WorkloadGenerator(object):
             "frequency": self._workloads[workload_type].frequency,
             "scale_factor": self._workloads[workload_type].scale_factor,
             "weights": self._workloads[workload_type].weights,
+            "seed": self._workloads[workload_type].seed,
+            "profile": self._get_profile_definition(workload),
         }
         return response
 
-    def _get_workload_queries(self):
-        queries = []
-        for workload in self._workloads.values():
-            if workload.running:
-                queries += workload.driver.generate(
-                    workload.scale_factor, workload.frequency, workload.weights
+    @staticmethod
+    def _get_profile_definition(workload) -> Optional[Dict]:
+        return None if workload.profile is None else workload.profile.definition
+
+    def _get_trace_path(self, trace_name: str) -> str:
+        return join(self._trace_directory, f"{basename(trace_name)}.trace")
+
+    def _is_replaying(self) -> bool:
+        return self._trace_replay is not None and self._trace_replay.is_alive()
+
+    def _call_start_trace_recording(self, body: Body) -> Response:
+        trace_name: str = body["trace_name"]
+        with self._publish_lock:
+            if self._trace_writer is not None or self._is_replaying():
+                return get_response(409)
+            makedirs(self._trace_directory, exist_ok=True)
+            self._trace_writer = TraceWriter(self._get_trace_path(trace_name))
+        response = get_response(200)
+        response["body"]["trace_name"] = trace_name
+        return response
+
+    def _call_stop_trace_recording(self, body: Body) -> Response:
+        with self._publish_lock:
+            if self._trace_writer is None:
+                return get_response(404)
+            self._trace_writer.close()
+            self._trace_writer = None
+        return get_response(200)
+
+    def _call_start_trace_replay(self, body: Body) -> Response:
+        trace_name: str = body["trace_name"]
+        rate: float = body.get("rate", 1.0)
+        path = self._get_trace_path(trace_name)
+        if rate <= 0:
+            return get_response(400)
+        if not isfile(path):
+            return get_response(404)
+        with self._publish_lock:
+            if self._trace_writer is not None or self._is_replaying():
+                return get_response(409)
+            self._trace_replay = TraceReplay(path, rate, self._publish_replayed)
+            self._trace_replay.start()
+        response = get_response(200)
+        response["body"]["trace_name"] = trace_name
+        response["body"]["rate"] = rate
+        return response
+
+    def _call_stop_trace_replay(self, body: Body) -> Response:
+        if not self._is_replaying():
+            return get_response(404)
+        self._trace_replay.stop()  # type: ignore
+        return get_response(200)
+
+    def _call_get_generator_statistics(self, body: Body) -> Response:
+        shards = [
+            {
+                "shard": shard,
+                "tick_lateness": self._shard_tick_lateness[shard],
+                "generation_time": self._shard_generation_time[shard],
+            }
+            for shard in range(len(self._shard_processes))
+        ]
+        response = get_response(200)
+        response["body"]["generator"] = {
+            "shards": self._shards,
+            "tick_lateness": self._tick_lateness
+            + max((shard["tick_lateness"] for shard in shards), default=0),
+            "generation_time": max(
+                (shard["generation_time"] for shard in shards),
+                default=self._generation_time,
+            ),
+            "missed_ticks": self._missed_ticks,
+            "shard_statistics": shards,
+        }
+        return response
+
+    def _get_workload_orders(self) -> List[WorkloadOrder]:
+        """Return the orders of the running workloads for the next second."""
+        orders: List[WorkloadOrder] = []
+        target_throughput = 0.0
+        for workload_type, workload in self._workloads.items():
+            if not workload.running:
+                continue
+            if workload.profile is None:
+                rate, tasks, slices = workload.frequency, workload.frequency, None
+            else:
+                rate, slices = workload.profile.next_second()
+                tasks = sum(slices)
+            target_throughput += rate
+            orders.append(
+                WorkloadOrder(
+                    workload_type=workload_type,
+                    scale_factor=workload.scale_factor,
+                    weights=workload.weights,
+                    tasks=tasks,
+                    slices=slices,
                 )
+            )
+        self._target_throughput = target_throughput
+        return orders
 
-        shuffle(queries)
-        return queries
+    def _get_workload_queries(self):
+        return self._generate_orders(self._get_workload_orders())
+
+    def _record_tick(self, startts: int) -> None:
+        """Measure how late a tick starts after it was due.
+
+        Ticks run every second from the first one. A tick that starts a
+        second or more late means the ticks in between were missed.
+        """
+        if self._next_tickts is None:
+            self._next_tickts = startts
+        missed = max(startts - self._next_tickts, 0) // 1_000_000_000
+        self._tick_lateness = max(
+            startts - self._next_tickts - missed * 1_000_000_000, 0
+        )
+        self._missed_ticks += missed
+        self._next_tickts += (missed + 1) * 1_000_000_000
+
+    def _dispatch_orders(self, startts: int) -> None:
+        """Split the orders of the next second between the shards."""
+        shard_orders: List[List[ShardOrder]] = [[] for _ in range(self._shards)]
+        for order in self._get_workload_orders():
+            seed_version = self._seed_versions.get(order["workload_type"], 0)
+            seed = self._workloads[order["workload_type"]].seed
+            for shard, split in enumerate(
+                split_order(order, self._shards, self._ticks)
+            ):
+                shard_orders[shard].append(
+                    ShardOrder(  # type: ignore
+                        **split, seed=seed, seed_version=seed_version
+                    )
+                )
+        for shard, orders in enumerate(shard_orders):
+            self._shard_ticks[shard].put(
+                ShardTick(
+                    tickts=startts,
+                    target_throughput=self._target_throughput,
+                    orders=orders,
+                )
+            )
 
     def _generate_workload(self) -> None:
-        response = get_response(200)
-        response["body"]["querylist"] = self._get_workload_queries()  # type: ignore
-        self._pub_socket.send_json(response)
+        """Publish and record the tasks of the running workloads.
+
+        Nothing is generated while a trace is replayed.
+        """
+        if self._is_replaying():
+            return
+        startts = time_ns()
+        self._record_tick(startts)
+        self._ticks += 1
+        if self._shard_processes:
+            self._dispatch_orders(startts)
+            return
+        queries = self._get_workload_queries()
+        self._stamp_queries(queries, startts)
+        with self._publish_lock:
+            if self._trace_writer is not None:
+                self._trace_writer.write(startts, queries)
+            self._publish_chunks(queries, self._target_throughput)
+        self._generation_time = time_ns() - startts
+
+    def _publish_replayed(self, queries: List[Dict]) -> None:
+        with self._publish_lock:
+            self._publish_chunks(
+                queries, len(queries) * self._trace_replay.rate  # type: ignore
+            )
+
+    def _close_shards(self) -> None:
+        if not self._shard_processes:
+            return
+        for ticks in self._shard_ticks:
+            ticks.put(None)
+        for process in self._shard_processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._forward_stop_event.set()
+        self._forward_thread.join()
+        self._forward_socket.close()
 
     def start(self) -> None:
         """Start the generator by starting the server."""
@@ -158,5 +470,10 @@ class WorkloadGenerator(object):
         """Close the socket and context."""
         self._generate_workload_job.remove()
         self._scheduler.shutdown()
+        self._close_shards()
+        if self._is_replaying():
+            self._trace_replay.stop()  # type: ignore
+        if self._trace_writer is not None:
+            self._trace_writer.close()
         self._pub_socket.close()
         self._context.term()
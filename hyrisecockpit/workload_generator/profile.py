@@ -0,0 +1,110 @@
+"""Time-varying load profiles of a workload.
+
+A profile replaces the constant frequency of a workload with a rate that
+changes over time. The generator evaluates the profile once per generated
+second in slices of a second, so the tasks of a second follow the shape of
+the profile within it. The time of a profile is counted in generated
+seconds since the profile was set, so a profile takes the same course in
+every run.
+
+The shapes and their parameters (rates in tasks per second, times in
+seconds) are:
+
+- "ramp": from "start" to "end" linearly within "duration", then "end"
+- "step": "start" plus "step" every "interval", at most "steps" times
+- "sine": "mean" plus a sine wave of "amplitude" and "period"
+- "burst": "peak" for the first "duration" of every "period", else "base"
+"""
+from math import floor, pi, sin
+from typing import Callable, Dict, List, Tuple
+
+PROFILE_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+    "ramp": ("start", "end", "duration"),
+    "step": ("start", "step", "interval", "steps"),
+    "sine": ("mean", "amplitude", "period"),
+    "burst": ("base", "peak", "period", "duration"),
+}
+SLICES_PER_SECOND: int = 10
+
+
+def _ramp(parameters: Dict[str, float], elapsed: float) -> float:
+    progress = min(elapsed / parameters["duration"], 1.0)
+    return parameters["start"] + (parameters["end"] - parameters["start"]) * progress
+
+
+def _step(parameters: Dict[str, float], elapsed: float) -> float:
+    steps = min(floor(elapsed / parameters["interval"]), parameters["steps"])
+    return parameters["start"] + parameters["step"] * steps
+
+
+def _sine(parameters: Dict[str, float], elapsed: float) -> float:
+    return parameters["mean"] + parameters["amplitude"] * sin(
+        2 * pi * elapsed / parameters["period"]
+    )
+
+
+def _burst(parameters: Dict[str, float], elapsed: float) -> float:
+    if elapsed % parameters["period"] < parameters["duration"]:
+        return parameters["peak"]
+    return parameters["base"]
+
+
+RATE_FUNCTIONS: Dict[str, Callable[[Dict[str, float], float], float]] = {
+    "ramp": _ramp,
+    "step": _step,
+    "sine": _sine,
+    "burst": _burst,
+}
+
+
+class Profile:
+    """Rate of a workload over its generated seconds."""
+
+    def __init__(self, definition: Dict) -> None:
+        """Initialize a Profile from its definition.
+
+        Raises a ValueError if the shape is unknown or a parameter is missing
+        or out of range.
+        """
+        shape = definition.get("shape")
+        if shape not in PROFILE_PARAMETERS:
+            raise ValueError(f"Unknown profile shape {shape}")
+        parameters: Dict[str, float] = {}
+        for name in PROFILE_PARAMETERS[shape]:
+            value = definition.get(name)
+            if value is None:
+                raise ValueError(f"The {shape} profile needs the parameter {name}")
+            parameters[name] = float(value)
+        for name in ("duration", "interval", "period"):
+            if parameters.get(name, 1.0) <= 0:
+                raise ValueError(f"The {name} of a profile must be positive")
+        if shape == "burst" and parameters["duration"] > parameters["period"]:
+            raise ValueError("The duration of a burst must not exceed its period")
+        self.definition: Dict = {"shape": shape, **parameters}
+        self._rate_function = RATE_FUNCTIONS[shape]
+        self._parameters: Dict[str, float] = parameters
+        self._second: int = 0
+        self._remainder: float = 0.0
+
+    def get_rate(self, elapsed: float) -> float:
+        """Return the rate elapsed seconds after the profile started."""
+        return max(self._rate_function(self._parameters, elapsed), 0.0)
+
+    def next_second(self) -> Tuple[float, List[int]]:
+        """Return the targeted rate and the tasks per slice of the next second.
+
+        Fractions of tasks are carried over to the following slices, so the
+        number of tasks follows the rate without rounding drift.
+        """
+        rates = [
+            self.get_rate(self._second + (part + 0.5) / SLICES_PER_SECOND)
+            for part in range(SLICES_PER_SECOND)
+        ]
+        self._second += 1
+        counts = []
+        for rate in rates:
+            expected = self._remainder + rate / SLICES_PER_SECOND
+            count = floor(expected)
+            self._remainder = expected - count
+            counts.append(count)
+        return sum(rates) / SLICES_PER_SECOND, counts
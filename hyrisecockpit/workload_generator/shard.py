@@ -0,0 +1,186 @@
+"""Shards of the workload generator.
+
+With more than one shard, the WorkloadGenerator coordinates generator
+processes instead of generating the tasks itself. On every tick it splits
+the tasks of the running workloads into one order per shard, so the shards
+generate exactly the configured number of tasks together. The remainder of
+a split is handed to other shards on every tick, so no shard generates more
+tasks than the others over time. The shards stamp their tasks with the tick
+of the coordinator and push the encoded chunks to it, and the coordinator
+forwards them to the one published stream.
+"""
+from multiprocessing import Array, Queue
+from time import time_ns
+from types import TracebackType
+from typing import Dict, List, Optional, Type, TypedDict
+
+from zmq import PUSH, Context
+
+from hyrisecockpit.drivers.connector import Connector
+from hyrisecockpit.workload_generator.task_generator import TaskGenerator, WorkloadOrder
+
+
+class ShardOrder(WorkloadOrder):
+    """Order of a shard with the seed of its workload."""
+
+    seed: Optional[int]
+    seed_version: int
+
+
+class ShardTick(TypedDict):
+    """Orders of a shard for one tick of the coordinator."""
+
+    tickts: int
+    target_throughput: float
+    orders: List[ShardOrder]
+
+
+def split_tasks(tasks: int, shards: int, rotation: int) -> List[int]:
+    """Split tasks into shares that differ by at most one task.
+
+    The shards that get one of the remaining tasks rotate with the rotation.
+    """
+    shares = [tasks // shards] * shards
+    for remainder in range(tasks % shards):
+        shares[(rotation + remainder) % shards] += 1
+    return shares
+
+
+def split_order(
+    order: WorkloadOrder, shards: int, rotation: int
+) -> List[WorkloadOrder]:
+    """Split the tasks of an order and of its slices into one order per shard."""
+    if order["slices"] is None:
+        return [
+            WorkloadOrder(**{**order, "tasks": tasks})  # type: ignore
+            for tasks in split_tasks(order["tasks"], shards, rotation)
+        ]
+    slice_shares = [
+        split_tasks(count, shards, rotation + part)
+        for part, count in enumerate(order["slices"])
+    ]
+    return [
+        WorkloadOrder(  # type: ignore
+            **{
+                **order,
+                "tasks": sum(shares[shard] for shares in slice_shares),
+                "slices": [shares[shard] for shares in slice_shares],
+            }
+        )
+        for shard in range(shards)
+    ]
+
+
+class GeneratorShard(TaskGenerator):
+    """Generates the tasks of its orders and pushes them to the coordinator."""
+
+    def __init__(
+        self,
+        shard: int,
+        shards: int,
+        ticks: Queue,
+        forward_url: str,
+        tick_lateness: Array,
+        generation_time: Array,
+        arrival_process: str,
+        codec: str,
+        chunk_size: int,
+    ) -> None:
+        """Initialize a GeneratorShard.
+
+        The shard shares the time (ns) from the tick to the start of its
+        generation and the time its generation took with the coordinator.
+        """
+        super().__init__(arrival_process, codec, chunk_size, shard, shards)
+        self._shard = shard
+        self._shards = shards
+        self._ticks = ticks
+        self._tick_lateness = tick_lateness
+        self._generation_time = generation_time
+        self._seed_versions: Dict[str, int] = {}
+        self._workloads = Connector.get_workload()
+        self._context = Context(io_threads=1)  # type: ignore
+        self._pub_socket = self._context.socket(PUSH)
+        self._pub_socket.connect(forward_url)
+
+    def __enter__(self) -> "GeneratorShard":
+        """Return self for a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> Optional[bool]:
+        """Call close with a context manager."""
+        self.close()
+        return None
+
+    def _seed(self, order: ShardOrder) -> None:
+        """Seed the workload and the task mixing when the seed of a workload changes.
+
+        Every shard derives its own seed, so the shards generate different
+        tasks that are the same in every run.
+        """
+        workload_type = order["workload_type"]
+        if self._seed_versions.get(workload_type, 0) == order["seed_version"]:
+            return
+        self._seed_versions[workload_type] = order["seed_version"]
+        if order["seed"] is not None:
+            seed = order["seed"] * self._shards + self._shard
+            self._workloads[workload_type].driver.seed(seed)
+            self._random.seed(seed)
+
+    def generate(self, tick: ShardTick) -> None:
+        """Generate and push the tasks of the orders of a tick."""
+        startts = time_ns()
+        for order in tick["orders"]:
+            self._seed(order)
+        queries = self._generate_orders(tick["orders"])  # type: ignore
+        self._stamp_queries(queries, tick["tickts"])
+        self._publish_chunks(queries, tick["target_throughput"])
+        self._tick_lateness[self._shard] = startts - tick["tickts"]
+        self._generation_time[self._shard] = time_ns() - startts
+
+    def run(self) -> None:
+        """Generate the ticks until the coordinator sends None."""
+        while True:
+            tick: Optional[ShardTick] = self._ticks.get()
+            if tick is None:
+                return
+            self.generate(tick)
+
+    def close(self) -> None:
+        """Close the socket and context."""
+        self._pub_socket.close(linger=1000)
+        self._context.term()
+
+
+def run_shard(
+    shard: int,
+    shards: int,
+    ticks: Queue,
+    forward_url: str,
+    tick_lateness: Array,
+    generation_time: Array,
+    arrival_process: str,
+    codec: str,
+    chunk_size: int,
+) -> None:
+    """Run a generator shard in its process."""
+    try:
+        with GeneratorShard(
+            shard,
+            shards,
+            ticks,
+            forward_url,
+            tick_lateness,
+            generation_time,
+            arrival_process,
+            codec,
+            chunk_size,
+        ) as generator_shard:
+            generator_shard.run()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,143 @@
+"""Generation and publishing of the tasks of one second.
+
+The WorkloadGenerator and its shards generate the tasks of a second from
+orders. An order holds the scale factor, the weights and the number of
+tasks of a running workload, for a profiled workload also the tasks of
+every slice of the second. The tasks of all orders are mixed, stamped with
+the start of their second and published in chunks.
+"""
+from math import ceil
+from operator import itemgetter
+from random import Random
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+from hyrisecockpit.response import get_response
+from hyrisecockpit.workload_codec import CODECS, encode
+from hyrisecockpit.workload_generator.profile import SLICES_PER_SECOND
+
+ARRIVAL_PROCESSES: Tuple[str, ...] = ("burst", "uniform", "poisson")
+
+
+class WorkloadOrder(TypedDict):
+    """Tasks of a workload to generate for one second."""
+
+    workload_type: str
+    scale_factor: float
+    weights: Dict[str, float]
+    tasks: int
+    slices: Optional[List[int]]
+
+
+class TaskGenerator:
+    """Generates, schedules and publishes the tasks of workload orders."""
+
+    def __init__(
+        self,
+        arrival_process: str,
+        codec: str,
+        chunk_size: int,
+        phase: int = 0,
+        phases: int = 1,
+    ) -> None:
+        """Initialize a TaskGenerator.
+
+        With the "uniform" arrival process, a generator with a phase of
+        phases spaces its tasks so they interleave with the tasks of the
+        generators of the other phases.
+        """
+        if arrival_process not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process {arrival_process}")
+        if codec not in CODECS:
+            raise ValueError(f"Unknown workload codec {codec}")
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least one task")
+        self._codec = codec
+        self._chunk_size = chunk_size
+        self._arrival_process = arrival_process
+        self._phase = phase
+        self._phases = phases
+        self._random: Random = Random()  # nosec
+        self._workloads: Dict = {}
+
+    def _generate_orders(self, orders: List[WorkloadOrder]) -> List[Dict]:
+        """Return the mixed tasks of the orders."""
+        queries: List[Dict] = []
+        for order in orders:
+            workload = self._workloads[order["workload_type"]]
+            order_queries = workload.driver.generate(
+                order["scale_factor"], order["tasks"], order["weights"]
+            )
+            if order["slices"] is not None and self._arrival_process != "burst":
+                self._set_slice_offsets(order_queries, order["slices"])
+            queries += order_queries
+        self._random.shuffle(queries)
+        return queries
+
+    def _set_slice_offsets(self, queries: List[Dict], counts: List[int]) -> None:
+        """Set the start offsets (ns) of profiled tasks within their slices."""
+        slice_length = 1_000_000_000 // SLICES_PER_SECOND
+        position = 0
+        for part, count in enumerate(counts):
+            for offset in self._get_arrival_offsets(count):
+                queries[position]["startts"] = (
+                    part * slice_length + offset // SLICES_PER_SECOND
+                )
+                position += 1
+
+    def _get_arrival_offsets(self, number_of_tasks: int) -> List[int]:
+        """Return the start offsets (ns) of the tasks within one second.
+
+        Arrivals of a Poisson process that are known to fall into one second
+        are independent and uniformly distributed within it, so sorted random
+        offsets model a Poisson process with the frequency as rate.
+        """
+        if self._arrival_process == "uniform":
+            return [
+                (task_number * self._phases + self._phase)
+                * 1_000_000_000
+                // (number_of_tasks * self._phases)
+                for task_number in range(number_of_tasks)
+            ]
+        return sorted(
+            self._random.randrange(1_000_000_000) for _ in range(number_of_tasks)
+        )
+
+    def _schedule_arrivals(self, queries: List[Dict], startts: int) -> None:
+        """Set the intended start time of every task.
+
+        Tasks of profiled workloads already have their offset within the
+        second. The tasks are ordered by their start time.
+        """
+        unscheduled = [query for query in queries if "startts" not in query]
+        for query in queries:
+            if "startts" in query:
+                query["startts"] += startts
+        offsets = self._get_arrival_offsets(len(unscheduled))
+        for query, offset in zip(unscheduled, offsets):
+            query["startts"] = startts + offset
+        queries.sort(key=itemgetter("startts"))
+
+    def _stamp_queries(self, queries: List[Dict], startts: int) -> None:
+        """Stamp the tasks with the start of their second."""
+        for query in queries:
+            query["generatedts"] = startts
+        if self._arrival_process != "burst":
+            self._schedule_arrivals(queries, startts)
+
+    def _publish_chunks(self, queries: List[Dict], target_throughput: float) -> None:
+        """Publish the tasks in chunks with a sequence number.
+
+        Every chunk carries its sequence number, the number of chunks of the
+        second and the throughput targeted in the second. A second without
+        tasks is published as one empty chunk.
+        """
+        chunks = max(ceil(len(queries) / self._chunk_size), 1)
+        for sequence in range(chunks):
+            response = get_response(200)
+            response["body"]["querylist"] = queries[
+                sequence * self._chunk_size : (sequence + 1) * self._chunk_size
+            ]
+            response["body"]["sequence"] = sequence
+            response["body"]["chunks"] = chunks
+            response["body"]["target_throughput"] = target_throughput
+            self._pub_socket.send_multipart(encode(response, self._codec))
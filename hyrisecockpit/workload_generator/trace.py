@@ -0,0 +1,106 @@
+"""Recording and replay of the published workload.
+
+A trace is a gzip compressed stream of msgpack records, one record per
+published second. A record holds the offset of the second from the first
+recorded second and its tasks. The timestamps of the tasks are stored
+relative to their second, so a replay can stamp them for the time it
+publishes them and scale them with the replay rate.
+"""
+import gzip
+from itertools import groupby
+from operator import itemgetter
+from threading import Event, Thread
+from time import time_ns
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from msgpack import Packer, Unpacker
+
+
+def _make_relative(query: Dict, startts: int) -> Dict:
+    """Return a copy of a task with its start time relative to its second."""
+    recorded = {key: value for key, value in query.items() if key != "generatedts"}
+    if "startts" in recorded:
+        recorded["startts"] -= startts
+    return recorded
+
+
+def _make_absolute(queries: List[Dict], startts: int, rate: float) -> None:
+    """Stamp the tasks of a replayed second that starts at startts."""
+    for query in queries:
+        query["generatedts"] = startts
+        if "startts" in query:
+            query["startts"] = startts + int(query["startts"] / rate)
+
+
+class TraceWriter:
+    """Records the published tasks second by second to a trace file."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize a TraceWriter and create the trace file."""
+        self._file = gzip.open(path, "wb")
+        self._packer: Packer = Packer()
+        self._first_startts: Optional[int] = None
+
+    def write(self, startts: int, queries: List[Dict]) -> None:
+        """Record the tasks of a second that started at startts."""
+        if self._first_startts is None:
+            self._first_startts = startts
+        self._file.write(
+            self._packer.pack(
+                (
+                    startts - self._first_startts,
+                    [_make_relative(query, startts) for query in queries],
+                )
+            )
+        )
+
+    def close(self) -> None:
+        """Close the trace file."""
+        self._file.close()
+
+
+def read_trace(path: str) -> Iterator[Tuple[int, List[Dict]]]:
+    """Read the offsets and tasks of the recorded seconds of a trace."""
+    with gzip.open(path, "rb") as file:
+        for offset, queries in Unpacker(file):
+            yield offset, queries
+
+
+class TraceReplay(Thread):
+    """Publishes the seconds of a trace at the original or a scaled rate.
+
+    With a rate of 2.0 the seconds of the trace and the start times of their
+    tasks are replayed twice as fast, with 0.5 half as fast. The tasks stay
+    the same, so two replays of a trace execute the same queries in the same
+    order.
+    """
+
+    def __init__(
+        self, path: str, rate: float, publish: Callable[[List[Dict]], None]
+    ) -> None:
+        """Initialize a TraceReplay."""
+        super().__init__(daemon=True)
+        self._path: str = path
+        self.rate: float = rate
+        self._publish: Callable[[List[Dict]], None] = publish
+        self._stop_event: Event = Event()
+
+    def run(self) -> None:
+        """Publish every recorded second at its scaled offset.
+
+        Consecutive records of the same second, like the chunks of the
+        shards of a generator, are published together.
+        """
+        startts = time_ns()
+        for offset, records in groupby(read_trace(self._path), key=itemgetter(0)):
+            queries = [query for _, record in records for query in record]
+            replayts = startts + int(offset / self.rate)
+            if self._stop_event.wait(max(replayts - time_ns(), 0) / 1_000_000_000):
+                return
+            _make_absolute(queries, replayts, self.rate)
+            self._publish(queries)
+
+    def stop(self) -> None:
+        """Stop the replay and wait for it."""
+        self._stop_event.set()
+        self.join()
@@ -0,0 +1,106 @@
+"""Tests for the Capacity controller."""
+from json import dumps
+from unittest.mock import patch
+
+from flask import Flask
+from flask.testing import FlaskClient
+from pytest import fixture
+
+from hyrisecockpit.api.app import create_app
+from hyrisecockpit.api.app.capacity import BASE_ROUTE
+from hyrisecockpit.api.app.capacity.model import CapacityResult, DatabaseCapacity
+
+url = f"/{BASE_ROUTE}"
+service_path = "hyrisecockpit.api.app.capacity.controller.CapacityService"
+
+
+@fixture
+def app() -> Flask:
+    """Return a testing app."""
+    app = create_app()
+    app.testing = True
+    return app
+
+
+@fixture
+def client(app: Flask) -> FlaskClient:
+    """Return a test client."""
+    with app.test_client() as client:
+        return client
+
+
+class TestCapacityController:
+    """Tests for the Capacity controller."""
+
+    @patch(service_path)
+    def test_gets_result(self, mock_capacity_service, client: FlaskClient) -> None:
+        """A Capacity controller routes get_result correctly."""
+        mock_capacity_service.get_result.return_value = CapacityResult(
+            status="finished",
+            startts=42,
+            frequency=None,
+            probes=6,
+            databases=[
+                DatabaseCapacity(
+                    id="hyrise-1",
+                    max_sustainable_frequency=750,
+                    failed_frequency=800,
+                    bounded=True,
+                    throughput=748.5,
+                    latency=8.25,
+                    queue_growth=0.5,
+                )
+            ],
+        )
+
+        response = client.get(url, follow_redirects=True)
+
+        assert response.status_code == 200
+        assert response.get_json()["status"] == "finished"
+        assert response.get_json()["databases"][0]["max_sustainable_frequency"] == 750
+
+    @patch(service_path)
+    def test_doesnt_get_missing_result(
+        self, mock_capacity_service, client: FlaskClient
+    ) -> None:
+        """A Capacity controller returns 404 if no search was started."""
+        mock_capacity_service.get_result.return_value = None
+
+        response = client.get(url, follow_redirects=True)
+
+        assert response.status_code == 404
+
+    @patch(service_path)
+    def test_starts_search(self, mock_capacity_service, client: FlaskClient) -> None:
+        """A Capacity controller routes start_search correctly."""
+        mock_capacity_service.start_search.return_value = 409
+        configuration = {
+            "workload_type": "tpcc",
+            "scale_factor": 1.0,
+            "latency_slo": 10.0,
+            "max_queue_growth": 5.0,
+            "min_frequency": 100,
+            "max_frequency": 10000,
+        }
+
+        response = client.post(
+            url,
+            data=dumps(configuration),
+            content_type="application/json",
+            follow_redirects=True,
+        )
+
+        assert response.status_code == 409
+        interface = mock_capacity_service.start_search.call_args[0][0]
+        assert interface["workload_type"] == "tpcc"
+        assert interface["max_frequency"] == 10000
+
+    @patch(service_path)
+    def test_stops_search(self, mock_capacity_service, client: FlaskClient) -> None:
+        """A Capacity controller routes stop_search correctly."""
+        mock_capacity_service.stop_search.return_value = 200
+
+        response = client.delete(url, follow_redirects=True)
+
+        assert response.status_code == 200
+        mock_capacity_service.stop_search.assert_called_once()
@@ -0,0 +1,118 @@
+"""Tests for the capacity search."""
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+from hyrisecockpit.api.app.capacity.interface import CapacitySearchInterface
+from hyrisecockpit.api.app.capacity.search import CapacitySearch, ProbeMeasurement
+
+CAPACITIES = {"hyrise-1": 1000, "hyrise-2": 3000, "hyrise-3": 100_000}
+
+
+def _get_configuration(**changes) -> CapacitySearchInterface:
+    return CapacitySearchInterface(  # type: ignore
+        {
+            "workload_type": "tpcc",
+            "scale_factor": 1.0,
+            "weights": {},
+            "latency_slo": 10.0,
+            "max_queue_growth": 5.0,
+            "min_frequency": 100,
+            "max_frequency": 10_000,
+            "tolerance": 0.05,
+            "settle_duration": 0.0,
+            "probe_duration": 0.0,
+            **changes,
+        }
+    )
+
+
+class TestCapacitySearch:
+    """Tests for the CapacitySearch class."""
+
+    def _run_search(self, configuration: CapacitySearchInterface) -> Dict:
+        self.frequencies: List[int] = []
+
+        def measure(startts: int, endts: int) -> Dict[str, ProbeMeasurement]:
+            frequency = self.frequencies[-1]
+            return {
+                database: ProbeMeasurement(
+                    latency=5_000_000 if frequency <= capacity else 50_000_000,
+                    queue_growth=0.0 if frequency <= capacity else frequency - capacity,
+                    throughput=float(min(frequency, capacity)),
+                )
+                for database, capacity in CAPACITIES.items()
+            }
+
+        self.on_finish = MagicMock()
+        search = CapacitySearch(
+            configuration,
+            list(CAPACITIES.keys()),
+            self.frequencies.append,
+            measure,
+            lambda: {database: 0 for database in CAPACITIES},
+            self.on_finish,
+        )
+        search.run()
+        return search.get_result()
+
+    def test_finds_capacity_of_every_database(self) -> None:
+        """Test every capacity is found within the tolerance."""
+        result = self._run_search(_get_configuration())
+
+        capacities = {
+            database["id"]: database["max_sustainable_frequency"]
+            for database in result["databases"]
+        }
+        assert result["status"] == "finished"
+        assert 950 <= capacities["hyrise-1"] <= 1000
+        assert 2850 <= capacities["hyrise-2"] <= 3000
+        assert capacities["hyrise-3"] == 10_000
+        self.on_finish.assert_called_once()
+
+    def test_reports_measurements_at_capacity(self) -> None:
+        """Test the result holds the measurements of the highest sustained probe."""
+        result = self._run_search(_get_configuration())
+
+        first, _, unbounded = result["databases"]
+        assert first["bounded"]
+        assert first["failed_frequency"] > first["max_sustainable_frequency"]
+        assert first["throughput"] == first["max_sustainable_frequency"]
+        assert first["latency"] == 5.0
+        assert not unbounded["bounded"]
+        assert unbounded["failed_frequency"] is None
+        assert result["probes"] == len(
+            [frequency for frequency in self.frequencies if frequency > 0]
+        )
+
+    def test_drains_queues_after_failed_probe(self) -> None:
+        """Test the workload is paused after a probe a database failed."""
+        self._run_search(_get_configuration())
+
+        assert self.frequencies[:4] == [100, 200, 400, 800]
+        assert self.frequencies[4:6] == [1600, 0]
+
+    def test_stops_at_minimum_frequency(self) -> None:
+        """Test a database that fails the minimum frequency has no capacity."""
+        result = self._run_search(_get_configuration(min_frequency=2000))
+
+        first = result["databases"][0]
+        assert first["max_sustainable_frequency"] == 0
+        assert first["failed_frequency"] == 2000
+        assert first["throughput"] is None
+
+    def test_fails_on_error(self) -> None:
+        """Test an error ends the search and restores the workload."""
+        on_finish = MagicMock()
+        search = CapacitySearch(
+            _get_configuration(),
+            ["hyrise-1"],
+            MagicMock(),
+            MagicMock(side_effect=ConnectionError),
+            MagicMock(),
+            on_finish,
+        )
+
+        search.run()
+
+        assert search.get_result()["status"] == "failed"
+        on_finish.assert_called_once()
@@ -0,0 +1,152 @@
+"""Tests for the capacity service."""
+from unittest.mock import MagicMock, patch
+
+from pytest import fixture
+
+import hyrisecockpit.api.app.capacity.service as service_module
+from hyrisecockpit.api.app.capacity.interface import CapacitySearchInterface
+from hyrisecockpit.api.app.capacity.service import CapacityService
+from hyrisecockpit.api.app.workload.model import DetailedWorkload
+
+service_path = "hyrisecockpit.api.app.capacity.service"
+
+
+def _get_interface(**changes) -> CapacitySearchInterface:
+    return CapacitySearchInterface(  # type: ignore
+        {
+            "workload_type": "tpcc",
+            "scale_factor": 1.0,
+            "latency_slo": 10.0,
+            "max_queue_growth": 5.0,
+            "min_frequency": 100,
+            "max_frequency": 10_000,
+            **changes,
+        }
+    )
+
+
+def _get_workload(running: bool) -> DetailedWorkload:
+    return DetailedWorkload(
+        workload_type="tpcc",
+        frequency=300,
+        scale_factor=1.0,
+        weights={"payment": 1.0},
+        running=running,
+        supported_scale_factors=[1.0, 5.0],
+        default_weights={"payment": 1.0},
+    )
+
+
+class TestCapacityService:
+    """Tests for the CapacityService class."""
+
+    @fixture(autouse=True)
+    def reset_search(self):
+        """Forget the search of other tests."""
+        service_module.capacity_search = None
+        yield
+        service_module.capacity_search = None
+
+    @patch(f"{service_path}.CapacitySearch")
+    @patch(f"{service_path}.WorkloadService")
+    @patch(f"{service_path}._get_active_databases", lambda: ["hyrise-1"])
+    def test_starts_search(self, mock_workload_service, mock_search) -> None:
+        """Test a search starts with the defaults on the active databases."""
+        mock_workload_service.get_all.return_value = [_get_workload(True)]
+        mock_search.return_value.is_alive.return_value = True
+
+        assert CapacityService.start_search(_get_interface()) == 200
+        assert CapacityService.start_search(_get_interface()) == 409
+
+        configuration, databases = mock_search.call_args[0][:2]
+        assert configuration["tolerance"] == 0.05
+        assert configuration["weights"] == {}
+        assert databases == ["hyrise-1"]
+        mock_search.return_value.start.assert_called_once()
+
+    @patch(f"{service_path}.WorkloadService")
+    @patch(f"{service_path}._get_active_databases", lambda: ["hyrise-1"])
+    def test_doesnt_start_invalid_search(self, mock_workload_service) -> None:
+        """Test invalid configurations and unknown workloads are rejected."""
+        mock_workload_service.get_all.return_value = [_get_workload(True)]
+
+        assert CapacityService.start_search(_get_interface(min_frequency=0)) == 400
+        assert CapacityService.start_search(_get_interface(tolerance=1.0)) == 400
+        assert CapacityService.start_search(_get_interface(scale_factor=3.0)) == 400
+        assert CapacityService.start_search(_get_interface(workload_type="x")) == 404
+        assert service_module.capacity_search is None
+
+    @patch(f"{service_path}._get_active_databases", lambda: [])
+    def test_doesnt_start_search_without_databases(self) -> None:
+        """Test a search needs an active database."""
+        assert CapacityService.start_search(_get_interface()) == 400
+
+    @patch(f"{service_path}.WorkloadService")
+    def test_restores_workload(self, mock_workload_service) -> None:
+        """Test a running workload is updated again and a stopped one stopped."""
+        CapacityService.restore_workload(_get_workload(True))
+        CapacityService.restore_workload(_get_workload(False))
+
+        assert mock_workload_service.update_by_id.call_args[0][0]["frequency"] == 300
+        mock_workload_service.delete_by_id.assert_called_once_with("tpcc")
+
+    def test_stops_search(self) -> None:
+        """Test only a running search can be stopped."""
+        assert CapacityService.stop_search() == 404
+        service_module.capacity_search = MagicMock()
+
+        assert CapacityService.stop_search() == 200
+        service_module.capacity_search.stop.assert_called_once()
+
+    def test_gets_result(self) -> None:
+        """Test the result of the search is returned as a model."""
+        assert CapacityService.get_result() is None
+        service_module.capacity_search = MagicMock()
+        service_module.capacity_search.get_result.return_value = {
+            "status": "running",
+            "startts": 42,
+            "frequency": 800,
+            "probes": 3,
+            "databases": [
+                {
+                    "id": "hyrise-1",
+                    "max_sustainable_frequency": 400,
+                    "failed_frequency": None,
+                    "bounded": False,
+                    "throughput": 399.0,
+                    "latency": 3.5,
+                    "queue_growth": 0.0,
+                }
+            ],
+        }
+
+        result = CapacityService.get_result()
+
+        assert result.frequency == 800  # type: ignore
+        assert result.databases[0].max_sustainable_frequency == 400  # type: ignore
+
+    @patch(f"{service_path}.StorageConnection")
+    def test_measures_databases(self, mock_storage_connection) -> None:
+        """Test the latency, queue growth and throughput of a probe are measured."""
+        client = mock_storage_connection.return_value.__enter__.return_value
+        points = {
+            "latency": [{"latency": 2_000_000.0}],
+            "queue_length": [{"first": 10, "last": 30}],
+            "throughput": [{"throughput": 500.0}],
+        }
+        client.query.side_effect = lambda query, **kwargs: {
+            key: value
+            for table, value in points.items()
+            for key in [(table, None)]
+            if f"FROM {table} " in query
+        }
+
+        measurements = CapacityService.measure(["hyrise-1"], 0, 2_000_000_000)
+
+        assert measurements == {
+            "hyrise-1": {
+                "latency": 2_000_000.0,
+                "queue_growth": 10.0,
+                "throughput": 500.0,
+            }
+        }
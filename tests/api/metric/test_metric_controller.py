@@ -8,9 +8,15 @@ from pytest import fixture
 from hyrisecockpit.api.app import create_app
 from hyrisecockpit.api.app.metric import BASE_ROUTE
 from hyrisecockpit.api.app.metric.schema import (
+    ConnectionStatisticsSchema,
+    DetailedLatencyPercentilesSchema,
     DetailedQueryInformationSchema,
+    LatencyPercentilesSchema,
     LatencySchema,
     QueueLengthSchema,
+    EndToEndLatencySchema,
+    QueueWaitTimeSchema,
+    ResponseTimeSchema,
     ThroughputSchema,
     MemoryFootprintSchema,
 )
@@ -134,6 +140,7 @@ class TestMetricController:
                     "query_number": "10a",
                     "throughput": 3,
                     "latency": 2.3,
+                    "abort_rate": 0.1,
                 }
             ],
         }
@@ -150,3 +157,153 @@ class TestMetricController:
 
         assert 200 == response.status_code
         assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_latency_percentiles(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes get_latency_percentiles correctly."""
+        fake_latency_percentiles = {
+            "id": "db1",
+            "latency_percentiles": [
+                {"timestamp": 42, "p50": 1.0, "p95": 2.0, "p99": 3.0, "p999": 4.0}
+            ],
+        }
+        mock_metric_service.get_latency_percentiles.return_value = [
+            fake_latency_percentiles
+        ]
+        expected = LatencyPercentilesSchema(many=True).dump([fake_latency_percentiles])
+
+        parameterized_url = f"{url}/latency_percentiles?startts=1&endts=5&precision=1"
+        response = client.get(parameterized_url, follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_detailed_latency_percentiles(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes the detailed latency percentiles correctly."""
+        fake_detailed_latency_percentiles = {
+            "id": "db1",
+            "detailed_latency_percentiles": [
+                {
+                    "benchmark": "tpch",
+                    "query_number": "01",
+                    "latency_percentiles": [
+                        {
+                            "timestamp": 42,
+                            "p50": 1.0,
+                            "p95": 2.0,
+                            "p99": 3.0,
+                            "p999": 4.0,
+                        }
+                    ],
+                }
+            ],
+        }
+        mock_metric_service.get_benchmark_latency_percentiles.return_value = [
+            fake_detailed_latency_percentiles
+        ]
+        mock_metric_service.get_query_latency_percentiles.return_value = [
+            fake_detailed_latency_percentiles
+        ]
+        expected = DetailedLatencyPercentilesSchema(many=True).dump(
+            [fake_detailed_latency_percentiles]
+        )
+
+        for route in ["benchmark", "query"]:
+            parameterized_url = (
+                f"{url}/latency_percentiles/{route}?startts=1&endts=5&precision=1"
+            )
+            response = client.get(parameterized_url, follow_redirects=True)
+
+            assert 200 == response.status_code
+            assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_response_time(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes get_response_time correctly."""
+        fake_response_time = {
+            "id": "db1",
+            "response_time": [{"timestamp": 42, "response_time": 3.3}],
+        }
+        mock_metric_service.get_response_time.return_value = [fake_response_time]
+        expected = ResponseTimeSchema(many=True).dump([fake_response_time])
+
+        parameterized_url = f"{url}/response_time?startts=1&endts=5&precision=1"
+        response = client.get(parameterized_url, follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_queue_wait_time(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes get_queue_wait_time correctly."""
+        fake_queue_wait_time = {
+            "id": "db1",
+            "queue_wait_time": [{"timestamp": 42, "queue_wait_time": 3.3}],
+        }
+        mock_metric_service.get_queue_wait_time.return_value = [fake_queue_wait_time]
+        expected = QueueWaitTimeSchema(many=True).dump([fake_queue_wait_time])
+
+        parameterized_url = f"{url}/queue_wait_time?startts=1&endts=5&precision=1"
+        response = client.get(parameterized_url, follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_connection_statistics(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes get_connection_statistics correctly."""
+        fake_connection_statistics = {
+            "id": "db1",
+            "connection_statistics": [
+                {
+                    "timestamp": 42,
+                    "reconnects": 0.0,
+                    "rollbacks": 3.0,
+                    "retries": 2.0,
+                    "rollback_latency": 120.5,
+                }
+            ],
+        }
+        mock_metric_service.get_connection_statistics.return_value = [
+            fake_connection_statistics
+        ]
+        expected = ConnectionStatisticsSchema(many=True).dump(
+            [fake_connection_statistics]
+        )
+
+        parameterized_url = f"{url}/connection_statistics?startts=1&endts=5&precision=1"
+        response = client.get(parameterized_url, follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert expected == response.get_json()
+
+    @patch("hyrisecockpit.api.app.metric.controller.MetricService")
+    def test_get_end_to_end_latency(
+        self, mock_metric_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A metric controller routes get_end_to_end_latency correctly."""
+        fake_end_to_end_latency = {
+            "id": "db1",
+            "end_to_end_latency": [{"timestamp": 42, "end_to_end_latency": 3.3}],
+        }
+        mock_metric_service.get_end_to_end_latency.return_value = [
+            fake_end_to_end_latency
+        ]
+        expected = EndToEndLatencySchema(many=True).dump([fake_end_to_end_latency])
+
+        parameterized_url = f"{url}/end_to_end_latency?startts=1&endts=5&precision=1"
+        response = client.get(parameterized_url, follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert expected == response.get_json()
@@ -1,6 +1,10 @@
 """Tests for the metric models."""
 
 from hyrisecockpit.api.app.metric.model import (
+    DetailedLatencyPercentiles,
+    LatencyPercentiles,
+    LatencyPercentilesEntry,
+    QueryLatencyPercentiles,
     DetailedQueryEntry,
     DetailedQueryInformation,
     Latency,
@@ -26,6 +30,7 @@ class TestMetricModel:
             throughput=42.2,
             latency=2.2,
             scale_factor=1.0,
+            abort_rate=0.1,
         )
 
     def test_creates_detailed_query_information(self) -> None:
@@ -36,6 +41,7 @@ class TestMetricModel:
             throughput=42.2,
             latency=2.2,
             scale_factor=1.0,
+            abort_rate=0.1,
         )
         assert DetailedQueryInformation(
             id="What", detailed_query_information=[detailed_query_entry]
@@ -86,3 +92,22 @@ class TestMetricModel:
             timestamp=999999, memory_footprint=12345
         )
         assert MemoryFootprint(id="hi", memory_footprint=[memory_footprint_entry])
+
+    def test_creates_latency_percentiles_entry_model(self) -> None:
+        """A latency percentiles entry model can be created."""
+        assert LatencyPercentilesEntry(timestamp=1, p50=2, p95=3, p99=4, p999=5)
+
+    def test_creates_latency_percentiles_model(self) -> None:
+        """A latency percentiles model can be created."""
+        entry = LatencyPercentilesEntry(timestamp=1, p50=2, p95=3, p99=4, p999=5)
+        assert LatencyPercentiles(id="hi", latency_percentiles=[entry])
+
+    def test_creates_detailed_latency_percentiles_model(self) -> None:
+        """A detailed latency percentiles model can be created."""
+        entry = LatencyPercentilesEntry(timestamp=1, p50=2, p95=3, p99=4, p999=5)
+        query_latency_percentiles = QueryLatencyPercentiles(
+            benchmark="tpch", query_number="01", latency_percentiles=[entry]
+        )
+        assert DetailedLatencyPercentiles(
+            id="hi", detailed_latency_percentiles=[query_latency_percentiles]
+        )
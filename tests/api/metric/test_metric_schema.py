@@ -1,23 +1,41 @@
 """Tests for the metric schema's."""
 from hyrisecockpit.api.app.metric.model import (
+    ConnectionStatistics,
+    ConnectionStatisticsEntry,
+    DetailedLatencyPercentiles,
+    LatencyPercentiles,
+    LatencyPercentilesEntry,
+    QueryLatencyPercentiles,
     DetailedQueryEntry,
     DetailedQueryInformation,
     Latency,
     LatencyEntry,
     QueueLength,
     QueueLengthEntry,
+    EndToEndLatency,
+    EndToEndLatencyEntry,
+    QueueWaitTime,
+    QueueWaitTimeEntry,
+    ResponseTime,
+    ResponseTimeEntry,
     Throughput,
     ThroughputEntry,
     MemoryFootprint,
     MemoryFootprintEntry,
 )
 from hyrisecockpit.api.app.metric.schema import (
+    ConnectionStatisticsSchema,
+    DetailedLatencyPercentilesSchema,
+    LatencyPercentilesSchema,
     DetailedQueryInformationEntrySchema,
     DetailedQueryInformationSchema,
     LatencyEntrySchema,
     LatencySchema,
     QueueLengthEntrySchema,
     QueueLengthSchema,
+    EndToEndLatencySchema,
+    QueueWaitTimeSchema,
+    ResponseTimeSchema,
     ThroughputEntrySchema,
     ThroughputSchema,
     MemoryFootprintEntrySchema,
@@ -145,12 +163,14 @@ class TestMetricSchema:
             "throughput": 42,
             "latency": 24,
             "scale_factor": 1.0,
+            "abort_rate": 0.5,
         }
         deserialized = DetailedQueryInformationEntrySchema().load(interface)
         assert deserialized["benchmark"] == "tpppp"
         assert deserialized["query_number"] == "100"
         assert deserialized["throughput"] == 42
         assert deserialized["latency"] == 24
+        assert deserialized["abort_rate"] == 0.5
 
     def test_deserializes_detailed_query_information_schema(self) -> None:
         """A detailed query information schema can be deserialized."""
@@ -160,6 +180,7 @@ class TestMetricSchema:
             "throughput": 42,
             "latency": 24,
             "scale_factor": 1.0,
+            "abort_rate": 0.5,
         }
         interface = {
             "id": "ha!",
@@ -181,6 +202,7 @@ class TestMetricSchema:
             "throughput": 42,
             "latency": 24,
             "scale_factor": 1.0,
+            "abort_rate": 0.5,
         }
         detailed_query_entry = DetailedQueryEntry(**interface)  # type: ignore
         serialized = DetailedQueryInformationEntrySchema().dump(detailed_query_entry)
@@ -195,6 +217,7 @@ class TestMetricSchema:
             "throughput": 42,
             "latency": 24,
             "scale_factor": 1.0,
+            "abort_rate": 0.5,
         }
         interface = {"id": "ha!", "detailed_query_information": [interface]}
 
@@ -231,3 +254,93 @@ class TestMetricSchema:
         }
         serialized = MemoryFootprintSchema().dump(memory_footprint_model)
         assert serialized == expected
+
+    def test_deserializes_latency_percentiles_schema(self) -> None:
+        """A LatencyPercentilesSchema deserializes latency percentiles."""
+        entry_interface = {
+            "timestamp": 1,
+            "p50": 2.0,
+            "p95": 3.0,
+            "p99": 4.0,
+            "p999": 5.0,
+        }
+        interface = {"id": "ha!", "latency_percentiles": [entry_interface]}
+        deserialized = LatencyPercentilesSchema().load(interface)
+        assert isinstance(deserialized, LatencyPercentiles)
+        assert isinstance(deserialized.latency_percentiles[0], LatencyPercentilesEntry)
+        assert vars(deserialized.latency_percentiles[0]) == entry_interface
+        assert deserialized.id == "ha!"
+
+    def test_deserializes_detailed_latency_percentiles_schema(self) -> None:
+        """A DetailedLatencyPercentilesSchema deserializes latency percentiles."""
+        entry_interface = {
+            "timestamp": 1,
+            "p50": 2.0,
+            "p95": 3.0,
+            "p99": 4.0,
+            "p999": 5.0,
+        }
+        interface = {
+            "id": "ha!",
+            "detailed_latency_percentiles": [
+                {
+                    "benchmark": "tpch",
+                    "query_number": "01",
+                    "latency_percentiles": [entry_interface],
+                }
+            ],
+        }
+        deserialized = DetailedLatencyPercentilesSchema().load(interface)
+        assert isinstance(deserialized, DetailedLatencyPercentiles)
+        query_latency_percentiles = deserialized.detailed_latency_percentiles[0]
+        assert isinstance(query_latency_percentiles, QueryLatencyPercentiles)
+        assert query_latency_percentiles.benchmark == "tpch"
+        assert query_latency_percentiles.query_number == "01"
+        assert vars(query_latency_percentiles.latency_percentiles[0]) == entry_interface
+
+    def test_deserializes_response_time_schema(self) -> None:
+        """A ResponseTimeSchema deserializes a response time."""
+        response_time_entry_interface = {"timestamp": 1, "response_time": 2.0}
+        interface = {"id": "ha!", "response_time": [response_time_entry_interface]}
+        deserialized = ResponseTimeSchema().load(interface)
+        assert isinstance(deserialized, ResponseTime)
+        assert isinstance(deserialized.response_time[0], ResponseTimeEntry)
+        assert vars(deserialized.response_time[0]) == response_time_entry_interface
+        assert deserialized.id == "ha!"
+
+    def test_deserializes_queue_wait_time_schema(self) -> None:
+        """A QueueWaitTimeSchema deserializes a queue wait time."""
+        entry_interface = {"timestamp": 1, "queue_wait_time": 2.0}
+        interface = {"id": "ha!", "queue_wait_time": [entry_interface]}
+        deserialized = QueueWaitTimeSchema().load(interface)
+        assert isinstance(deserialized, QueueWaitTime)
+        assert isinstance(deserialized.queue_wait_time[0], QueueWaitTimeEntry)
+        assert vars(deserialized.queue_wait_time[0]) == entry_interface
+
+    def test_deserializes_connection_statistics_schema(self) -> None:
+        """A ConnectionStatisticsSchema deserializes connection statistics."""
+        entry_interface = {
+            "timestamp": 1,
+            "reconnects": 0.0,
+            "rollbacks": 3.0,
+            "retries": 2.0,
+            "rollback_latency": 120.5,
+        }
+        interface = {"id": "ha!", "connection_statistics": [entry_interface]}
+        deserialized = ConnectionStatisticsSchema().load(interface)
+        assert isinstance(deserialized, ConnectionStatistics)
+        assert isinstance(
+            deserialized.connection_statistics[0], ConnectionStatisticsEntry
+        )
+        assert vars(deserialized.connection_statistics[0]) == entry_interface
+        assert deserialized.id == "ha!"
+
+    def test_deserializes_end_to_end_latency_schema(self) -> None:
+        """A EndToEndLatencySchema deserializes a end-to-end latency."""
+        entry_interface = {"timestamp": 1, "end_to_end_latency": 2.0}
+        interface = {"id": "ha!", "end_to_end_latency": [entry_interface]}
+        deserialized = EndToEndLatencySchema().load(interface)
+        assert isinstance(deserialized, EndToEndLatency)
+        assert isinstance(deserialized.end_to_end_latency[0], EndToEndLatencyEntry)
+        assert vars(deserialized.end_to_end_latency[0]) == entry_interface
+        assert deserialized.id == "ha!"
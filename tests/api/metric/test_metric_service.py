@@ -8,7 +8,20 @@ from hyrisecockpit.api.app.metric.model import TimeInterval
 from hyrisecockpit.api.app.metric.service import MetricService
 from hyrisecockpit.cross_platform_support.testing_support import MagicMock
 
-from hyrisecockpit.api.app.metric.model import MemoryFootprint, MemoryFootprintEntry
+from hyrisecockpit.api.app.metric.model import (
+    DetailedLatencyPercentiles,
+    LatencyPercentiles,
+    MemoryFootprint,
+    MemoryFootprintEntry,
+)
+
+latency_percentiles_entry = {
+    "timestamp": 42,
+    "p50": 1.0,
+    "p95": 2.0,
+    "p99": 3.0,
+    "p999": 4.0,
+}
 
 
 @fixture
@@ -65,6 +78,18 @@ class TestMetricService:
             fake_time_interval, "throughput", ["throughput"]
         )
 
+    def test_get_target_throughput(self, metric_service: MetricService) -> None:
+        """Test get target throughput."""
+        mock_get_data: MagicMock = MagicMock()
+        metric_service.get_data = mock_get_data  # type: ignore
+
+        fake_time_interval = "fake_interval"
+
+        metric_service.get_target_throughput(fake_time_interval)  # type: ignore
+        mock_get_data.assert_called_once_with(
+            fake_time_interval, "target_throughput", ["target_throughput"]
+        )
+
     def test_get_latency(self, metric_service: MetricService) -> None:
         """Test get latency."""
         mock_get_data: MagicMock = MagicMock()
@@ -77,6 +102,56 @@ class TestMetricService:
             fake_time_interval, "latency", ["latency"]
         )
 
+    def test_get_response_time(self, metric_service: MetricService) -> None:
+        """Test get response time."""
+        mock_get_data: MagicMock = MagicMock()
+        metric_service.get_data = mock_get_data  # type: ignore
+
+        fake_time_interval = "fake_interval"
+
+        metric_service.get_response_time(fake_time_interval)  # type: ignore
+        mock_get_data.assert_called_once_with(
+            fake_time_interval, "response_time", ["response_time"]
+        )
+
+    def test_get_queue_wait_time(self, metric_service: MetricService) -> None:
+        """Test get queue wait time."""
+        mock_get_data: MagicMock = MagicMock()
+        metric_service.get_data = mock_get_data  # type: ignore
+
+        fake_time_interval = "fake_interval"
+
+        metric_service.get_queue_wait_time(fake_time_interval)  # type: ignore
+        mock_get_data.assert_called_once_with(
+            fake_time_interval, "queue_wait_time", ["queue_wait_time"]
+        )
+
+    def test_get_connection_statistics(self, metric_service: MetricService) -> None:
+        """Test get connection statistics."""
+        mock_get_data: MagicMock = MagicMock()
+        metric_service.get_data = mock_get_data  # type: ignore
+
+        fake_time_interval = "fake_interval"
+
+        metric_service.get_connection_statistics(fake_time_interval)  # type: ignore
+        mock_get_data.assert_called_once_with(
+            fake_time_interval,
+            "connection_statistics",
+            ["reconnects", "rollbacks", "retries", "rollback_latency"],
+        )
+
+    def test_get_end_to_end_latency(self, metric_service: MetricService) -> None:
+        """Test get end-to-end latency."""
+        mock_get_data: MagicMock = MagicMock()
+        metric_service.get_data = mock_get_data  # type: ignore
+
+        fake_time_interval = "fake_interval"
+
+        metric_service.get_end_to_end_latency(fake_time_interval)  # type: ignore
+        mock_get_data.assert_called_once_with(
+            fake_time_interval, "end_to_end_latency", ["end_to_end_latency"]
+        )
+
     def test_get_queue_length(self, metric_service: MetricService) -> None:
         """Test get queue length."""
         mock_get_data: MagicMock = MagicMock()
@@ -126,13 +201,122 @@ class TestMetricService:
         mock_client: MagicMock = MagicMock()
         mock_storage_connection.return_value.__enter__.return_value = mock_client
 
-        # TODO use better fake data
-        mock_client.query.return_value = MagicMock()
+        points = {
+            "True": {"count": 40, "latency_sum": 400},
+            "False": {"count": 10, "latency_sum": 600},
+        }
+        tags = [
+            {
+                "benchmark": "tpcc",
+                "query_no": "payment",
+                "scalefactor": "5.0",
+                "commited": commited,
+            }
+            for commited in points
+        ]
+        mock_client.query.return_value.keys.return_value = [
+            ("aggregated_queries", tag) for tag in tags
+        ]
+        mock_client.query.return_value.__getitem__.side_effect = lambda key: [
+            points[key[1]["commited"]]
+        ]
 
-        metric_service.get_detailed_query_information()
+        results = metric_service.get_detailed_query_information()
 
         mock_client.query.assert_called_once_with(
-            'SELECT COUNT("latency") as "throughput", MEAN("latency") as "latency" FROM successful_queries WHERE time > $startts AND time <= $endts GROUP BY benchmark, query_no, scalefactor;',
+            'SELECT SUM("count") as "count", SUM("latency_sum") as "latency_sum" FROM aggregated_queries WHERE time > $startts AND time <= $endts GROUP BY benchmark, query_no, scalefactor, commited;',
             database="database",
             bind_params={"startts": 2_000_000_000, "endts": 7_000_000_000},
         )
+        assert results[0].id == "database"
+        assert vars(results[0].detailed_query_information[0]) == {
+            "benchmark": "tpcc",
+            "query_number": "payment",
+            "scale_factor": "5.0",
+            "throughput": 10.0,
+            "latency": 20.0,
+            "abort_rate": 0.2,
+        }
+
+    @patch("hyrisecockpit.api.app.metric.service.get_interval_limits")
+    @patch("hyrisecockpit.api.app.metric.service.get_historical_latency_percentiles")
+    @patch("hyrisecockpit.api.app.metric.service.StorageConnection")
+    @patch("hyrisecockpit.api.app.metric.service._get_active_databases")
+    def test_get_latency_percentile_data(
+        self,
+        mock_get_active_databases: MagicMock,
+        mock_storage_connection: MagicMock,
+        mock_get_historical_latency_percentiles: MagicMock,
+        mock_get_interval_limits: MagicMock,
+        metric_service: MetricService,
+    ) -> None:
+        """Test get latency percentile data of all databases."""
+        mock_get_active_databases.return_value = ["database"]
+        mock_get_interval_limits.return_value = (40, 100)
+        mock_get_historical_latency_percentiles.return_value = "percentiles"
+        mock_client: MagicMock = MagicMock()
+        mock_storage_connection.return_value.__enter__.return_value = mock_client
+
+        response = metric_service.get_latency_percentile_data(
+            TimeInterval(startts=42, endts=100, precision=20), "condition"
+        )
+
+        mock_get_interval_limits.assert_called_once_with(42, 100, 20)
+        mock_get_historical_latency_percentiles.assert_called_once_with(
+            40, 100, 20, "condition", "database", mock_client
+        )
+        assert response == {"database": "percentiles"}
+
+    def test_get_latency_percentiles(self, metric_service: MetricService) -> None:
+        """Test get latency percentiles of all queries."""
+        mock_get_latency_percentile_data: MagicMock = MagicMock()
+        mock_get_latency_percentile_data.return_value = {
+            "database_id": {("all", "all"): [latency_percentiles_entry]},
+            "idle_database_id": {},
+        }
+        metric_service.get_latency_percentile_data = mock_get_latency_percentile_data  # type: ignore
+
+        results = metric_service.get_latency_percentiles("fake_interval")  # type: ignore
+
+        mock_get_latency_percentile_data.assert_called_once_with(
+            "fake_interval", "benchmark = 'all'"
+        )
+        assert isinstance(results[0], LatencyPercentiles)
+        assert results[0].id == "database_id"
+        assert vars(results[0].latency_percentiles[0]) == latency_percentiles_entry
+        assert results[1].latency_percentiles == []
+
+    def test_get_benchmark_latency_percentiles(
+        self, metric_service: MetricService
+    ) -> None:
+        """Test get latency percentiles per benchmark."""
+        mock_get_latency_percentile_data: MagicMock = MagicMock()
+        mock_get_latency_percentile_data.return_value = {
+            "database_id": {("tpch", "all"): [latency_percentiles_entry]}
+        }
+        metric_service.get_latency_percentile_data = mock_get_latency_percentile_data  # type: ignore
+
+        results = metric_service.get_benchmark_latency_percentiles("fake_interval")  # type: ignore
+
+        mock_get_latency_percentile_data.assert_called_once_with(
+            "fake_interval", "benchmark != 'all' AND query_no = 'all'"
+        )
+        assert isinstance(results[0], DetailedLatencyPercentiles)
+        query_latency_percentiles = results[0].detailed_latency_percentiles[0]
+        assert query_latency_percentiles.benchmark == "tpch"
+        assert query_latency_percentiles.query_number == "all"
+
+    def test_get_query_latency_percentiles(self, metric_service: MetricService) -> None:
+        """Test get latency percentiles per query type."""
+        mock_get_latency_percentile_data: MagicMock = MagicMock()
+        mock_get_latency_percentile_data.return_value = {
+            "database_id": {("tpch", "01"): [latency_percentiles_entry]}
+        }
+        metric_service.get_latency_percentile_data = mock_get_latency_percentile_data  # type: ignore
+
+        results = metric_service.get_query_latency_percentiles("fake_interval")  # type: ignore
+
+        mock_get_latency_percentile_data.assert_called_once_with(
+            "fake_interval", "query_no != 'all'"
+        )
+        assert results[0].detailed_latency_percentiles[0].query_number == "01"
@@ -8,6 +8,7 @@ from pytest import fixture
 from hyrisecockpit.api.app import create_app
 from hyrisecockpit.api.app.status import BASE_ROUTE
 from hyrisecockpit.api.app.status.model import (
+    CallStatistics,
     DatabaseStatus,
     FailedTask,
     TablesStatus,
@@ -57,6 +58,30 @@ class TestStatusController:
         assert 200 == response.status_code
         assert expected == response.get_json()
 
+    @patch("hyrisecockpit.api.app.status.controller.StatusService")
+    def test_get_manager_call_statistics(
+        self, mock_status_service: MagicMock, client: FlaskClient
+    ) -> None:
+        """A controller routes get_manager_call_statistics correctly."""
+        interface = {
+            "call": "execute sql query",
+            "concurrency": "offloaded",
+            "count": 2,
+            "errors": 1,
+            "mean_latency": 5000,
+            "p99_latency": 9000,
+            "max_latency": 9000,
+            "mean_queue_wait": 300,
+        }
+        mock_status_service.get_manager_call_statistics.return_value = [
+            CallStatistics(**interface)  # type: ignore
+        ]
+
+        response = client.get(f"{url}/manager_calls", follow_redirects=True)
+
+        assert 200 == response.status_code
+        assert [interface] == response.get_json()
+
     @patch("hyrisecockpit.api.app.status.controller.StatusService")
     def test_get_workload_tables(
         self, mock_status_service: MagicMock, client: FlaskClient
@@ -79,6 +104,8 @@ class TestStatusController:
                     },
                 )
             ],
+            "version": 3,
+            "age": 250000000,
         }
         fake_workload_status = WorkloadTablesStatus(**interface)  # type: ignore
         mock_status_service.get_workload_tables.return_value = [fake_workload_status]
@@ -101,6 +128,8 @@ class TestStatusController:
                         },
                     }
                 ],
+                "version": 3,
+                "age": 250000000,
             }
         ]
 
@@ -51,6 +51,8 @@ class TestStatusModel:
                     },
                 )
             ],
+            version=1,
+            age=0,
         )
 
     def test_creates_failed_query(self) -> None:
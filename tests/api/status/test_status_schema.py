@@ -80,10 +80,14 @@ class TestStatusSchema:
             "workload_tables_status": [
                 TablesStatus(**workload_tables_status_interface)  # type: ignore
             ],
+            "version": 1,
+            "age": 42,
         }
         expected = {
             "id": "SomeID",
             "workload_tables_status": [workload_tables_status_interface],
+            "version": 1,
+            "age": 42,
         }
         workload_status = WorkloadTablesStatus(**interface)  # type: ignore
         serialized = WorkloadTablesStatusSchema().dump(workload_status)
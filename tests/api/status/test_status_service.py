@@ -5,6 +5,7 @@ from unittest.mock import patch
 from pytest import fixture
 
 from hyrisecockpit.api.app.status.model import (
+    CallStatistics,
     DatabaseStatus,
     FailedTask,
     WorkloadTablesStatus,
@@ -92,7 +93,12 @@ class TestStatusService:
         fake_response = {
             "body": {
                 "workload_tables": [
-                    {"id": "fake_id", "workload_tables_status": [fake_workload_table]}
+                    {
+                        "id": "fake_id",
+                        "workload_tables_status": [fake_workload_table],
+                        "version": 2,
+                        "age": 1000,
+                    }
                 ]
             }
         }
@@ -108,6 +114,41 @@ class TestStatusService:
 
         assert isinstance(results[0], WorkloadTablesStatus)
 
+    @patch("hyrisecockpit.api.app.status.service.Header")
+    @patch("hyrisecockpit.api.app.status.service.Request")
+    def test_get_manager_call_statistics(
+        self,
+        mock_request: MagicMock,
+        mock_header: MagicMock,
+        status_service: StatusService,
+    ) -> None:
+        """Test get the latencies of the database manager calls."""
+        mock_header.return_value = "Header"
+        mock_request.return_value = "request"
+        fake_send_message: MagicMock = MagicMock()
+        fake_call_statistics = {
+            "call": "database status",
+            "concurrency": "inline",
+            "count": 3,
+            "errors": 0,
+            "mean_latency": 1000,
+            "p99_latency": 2000,
+            "max_latency": 2000,
+            "mean_queue_wait": 0,
+        }
+        fake_send_message.return_value = {"body": {"calls": [fake_call_statistics]}}
+
+        status_service._send_message = fake_send_message  # type: ignore
+
+        results = status_service.get_manager_call_statistics()
+
+        mock_request.assert_called_once_with(header="Header", body={})
+        fake_send_message.assert_called_once_with("request")
+        mock_header.assert_called_once_with(message="get server statistics")
+
+        assert isinstance(results[0], CallStatistics)
+        assert vars(results[0]) == fake_call_statistics
+
     @patch("hyrisecockpit.api.app.status.service.StorageConnection")
     @patch("hyrisecockpit.api.app.status.service._get_active_databases")
     def test_get_failed_tasks(
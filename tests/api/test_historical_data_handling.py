@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 from hyrisecockpit.api.app.historical_data_handling import (
     _fill_missing_points,
     _get_historical_data,
+    get_historical_latency_percentiles,
     get_historical_metric,
     get_interval_limits,
 )
@@ -144,3 +145,74 @@ class TestMonitor:
             bind_params={"startts": startts, "endts": endts},
             epoch=True,
         )
+
+    def test_gets_precalculated_latency_percentiles(self) -> None:
+        """Test the precalculated percentiles are used for a precision of 1s."""
+        mock_storage_connection: MagicMock = MagicMock()
+        mock_storage_connection.query.return_value.items.return_value = [
+            (
+                ("latency_percentiles", {"benchmark": "tpch", "query_no": "all"}),
+                iter(
+                    [
+                        {
+                            "time": 2_000_000_000,
+                            "p50": 5,
+                            "p95": 6,
+                            "p99": 7,
+                            "p999": 8,
+                        }
+                    ]
+                ),
+            )
+        ]
+
+        result = get_historical_latency_percentiles(
+            1_000_000_000,
+            3_000_000_000,
+            1_000_000_000,
+            "query_no = 'all'",
+            "database",
+            mock_storage_connection,
+        )
+
+        assert result == {
+            ("tpch", "all"): [
+                {"timestamp": 1_000_000_000, "p50": 0, "p95": 0, "p99": 0, "p999": 0},
+                {"timestamp": 2_000_000_000, "p50": 5, "p95": 6, "p99": 7, "p999": 8},
+            ]
+        }
+        query = mock_storage_connection.query.call_args[0][0]
+        assert '"p50","p95","p99","p999"' in query
+        assert "query_no = 'all'" in query
+
+    def test_merges_latency_histograms_of_an_interval(self) -> None:
+        """Test percentiles of longer intervals are calculated from the histograms."""
+        mock_storage_connection: MagicMock = MagicMock()
+        mock_storage_connection.query.return_value.items.return_value = [
+            (
+                ("latency_percentiles", {"benchmark": "all", "query_no": "all"}),
+                iter(
+                    [
+                        {"time": 0, "latency_histogram": "1:98"},
+                        {"time": 1_000_000_000, "latency_histogram": "3:2"},
+                    ]
+                ),
+            )
+        ]
+
+        result = get_historical_latency_percentiles(
+            0,
+            4_000_000_000,
+            2_000_000_000,
+            "benchmark = 'all'",
+            "database",
+            mock_storage_connection,
+        )
+
+        assert result == {
+            ("all", "all"): [
+                {"timestamp": 0, "p50": 1, "p95": 1, "p99": 3, "p999": 3},
+                {"timestamp": 2_000_000_000, "p50": 0, "p95": 0, "p99": 0, "p999": 0},
+            ]
+        }
+        assert '"latency_histogram"' in mock_storage_connection.query.call_args[0][0]
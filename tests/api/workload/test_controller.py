@@ -10,7 +10,12 @@ from pytest import fixture
 from hyrisecockpit.api.app import create_app
 from hyrisecockpit.api.app.workload import BASE_ROUTE
 from hyrisecockpit.api.app.workload.interface import BaseWorkloadInterface
-from hyrisecockpit.api.app.workload.model import DetailedWorkload, Workload
+from hyrisecockpit.api.app.workload.model import (
+    DetailedWorkload,
+    GeneratorStatistics,
+    ShardStatistics,
+    Workload,
+)
 from hyrisecockpit.api.app.workload.schema import (
     BaseWorkloadSchema,
     DetailedWorkloadSchema,
@@ -182,3 +187,72 @@ class TestWorkloadIdController:
         response = client.delete(url + f"/{workload_id}", follow_redirects=True)
         assert 404 == response.status_code
         assert not response.is_json
+
+    @patch("hyrisecockpit.api.app.workload.controller.WorkloadService")
+    def test_starts_trace_recording(
+        self, mock_workload_service: WorkloadService, client: FlaskClient
+    ):
+        """A TraceRecording controller routes post correctly."""
+        mock_workload_service.start_trace_recording.return_value = 409  # type: ignore
+        response = client.post(
+            url + "/trace/recording",
+            data=dumps({"trace_name": "run"}),
+            content_type="application/json",
+        )
+        mock_workload_service.start_trace_recording.assert_called_once_with(  # type: ignore
+            {"trace_name": "run"}
+        )
+        assert 409 == response.status_code
+
+    @patch("hyrisecockpit.api.app.workload.controller.WorkloadService")
+    def test_stops_trace_recording(
+        self, mock_workload_service: WorkloadService, client: FlaskClient
+    ):
+        """A TraceRecording controller routes delete correctly."""
+        mock_workload_service.stop_trace_recording.return_value = 200  # type: ignore
+        response = client.delete(url + "/trace/recording")
+        assert 200 == response.status_code
+
+    @patch("hyrisecockpit.api.app.workload.controller.WorkloadService")
+    def test_starts_trace_replay(
+        self, mock_workload_service: WorkloadService, client: FlaskClient
+    ):
+        """A TraceReplay controller routes post correctly."""
+        mock_workload_service.start_trace_replay.return_value = 200  # type: ignore
+        response = client.post(
+            url + "/trace/replay",
+            data=dumps({"trace_name": "run", "rate": 2.0}),
+            content_type="application/json",
+        )
+        mock_workload_service.start_trace_replay.assert_called_once_with(  # type: ignore
+            {"trace_name": "run", "rate": 2.0}
+        )
+        assert 200 == response.status_code
+
+    @patch("hyrisecockpit.api.app.workload.controller.WorkloadService")
+    def test_stops_trace_replay(
+        self, mock_workload_service: WorkloadService, client: FlaskClient
+    ):
+        """A TraceReplay controller routes delete correctly."""
+        mock_workload_service.stop_trace_replay.return_value = 404  # type: ignore
+        response = client.delete(url + "/trace/replay")
+        assert 404 == response.status_code
+
+    @patch("hyrisecockpit.api.app.workload.controller.WorkloadService")
+    def test_gets_generator_statistics(
+        self, mock_workload_service: WorkloadService, client: FlaskClient
+    ):
+        """A GeneratorStatistics controller routes get correctly."""
+        mock_workload_service.get_generator_statistics.return_value = GeneratorStatistics(  # type: ignore
+            shards=1,
+            tick_lateness=2_000_000,
+            generation_time=300_000_000,
+            missed_ticks=0,
+            shard_statistics=[
+                ShardStatistics(shard=0, tick_lateness=0, generation_time=5)
+            ],
+        )
+        response = client.get(url + "/generator")
+        assert 200 == response.status_code
+        assert response.get_json()["generation_time"] == 300_000_000
+        assert response.get_json()["shard_statistics"][0]["generation_time"] == 5
@@ -8,6 +8,7 @@ from pytest import fixture
 from hyrisecockpit.api.app.workload.interface import (
     BaseWorkloadInterface,
     DetailedWorkloadInterface,
+    TraceReplayInterface,
     WorkloadInterface,
 )
 from hyrisecockpit.api.app.workload.schema import DetailedWorkloadSchema
@@ -36,6 +37,8 @@ class TestWorkloadService:
             running=True,
             supported_scale_factors=[0.1, 1.0],
             default_weights={"01": 1.0, "02": 1.0},
+            seed=None,
+            profile=None,
         )
         detailed_workload_two = DetailedWorkloadInterface(
             workload_type="tpcc",
@@ -45,6 +48,8 @@ class TestWorkloadService:
             running=True,
             supported_scale_factors=[1.0, 5.0],
             default_weights={"01": 1.0, "02": 1.0},
+            seed=42,
+            profile={"shape": "ramp", "start": 0.0, "end": 200.0, "duration": 60.0},
         )
         response = get_response(200)
         response["body"]["workloads"] = [detailed_workload_one, detailed_workload_two]
@@ -68,6 +73,8 @@ class TestWorkloadService:
             scale_factor=1.0,
             weights={"01": 1.0, "02": 1.0},
             running=True,
+            seed=None,
+            profile=None,
         )
         response = get_response(200)
         response["body"]["workload"] = workoad
@@ -143,6 +150,8 @@ class TestWorkloadService:
             frequency=200,
             scale_factor=1.0,
             weights={"01": 1.0, "02": 1.0},
+            seed=42,
+            profile={"shape": "ramp", "start": 0.0, "end": 200.0, "duration": 60.0},
         )
         response = get_response(200)
         response["body"]["workload"] = base_workload
@@ -173,3 +182,56 @@ class TestWorkloadService:
             )
         )
         assert result is None
+
+    def test_starts_trace_replay(self, service: WorkloadService):
+        """A Workload service starts a trace replay."""
+        service._send_message_to_gen.return_value = get_response(404)  # type: ignore
+
+        result = service.start_trace_replay(
+            TraceReplayInterface(trace_name="run", rate=2.0)
+        )
+
+        service._send_message_to_gen.assert_called_once_with(  # type: ignore
+            Request(
+                header=Header(message="start trace replay"),
+                body={"trace_name": "run", "rate": 2.0},
+            )
+        )
+        assert 404 == result
+
+    def test_stops_trace_recording(self, service: WorkloadService):
+        """A Workload service stops a trace recording."""
+        service._send_message_to_gen.return_value = get_response(200)  # type: ignore
+
+        result = service.stop_trace_recording()
+
+        service._send_message_to_gen.assert_called_once_with(  # type: ignore
+            Request(header=Header(message="stop trace recording"), body={})
+        )
+        assert 200 == result
+
+    def test_gets_generator_statistics(self, service: WorkloadService):
+        """A Workload service gets the statistics of the workload generator."""
+        response = get_response(200)
+        response["body"]["generator"] = {
+            "shards": 2,
+            "tick_lateness": 3_000_000,
+            "generation_time": 400_000_000,
+            "missed_ticks": 1,
+            "shard_statistics": [
+                {"shard": 0, "tick_lateness": 1_000_000, "generation_time": 10},
+                {"shard": 1, "tick_lateness": 2_000_000, "generation_time": 20},
+            ],
+        }
+        service._send_message_to_gen.return_value = response  # type: ignore
+
+        result = service.get_generator_statistics()
+
+        service._send_message_to_gen.assert_called_once_with(  # type: ignore
+            Request(header=Header(message="get generator statistics"), body={})
+        )
+        assert result.missed_ticks == 1
+        assert [shard.generation_time for shard in result.shard_statistics] == [
+            10,
+            20,
+        ]
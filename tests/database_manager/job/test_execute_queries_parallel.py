@@ -73,6 +73,7 @@ class TestExecuteQueriesParallel:
 
         _execute_table_query(query_tuple, mock_connection_factory)
 
+        mock_connection_factory.create_cursor.assert_called_once_with(pooled=False)
         mock_cursor.execute.assert_called_once_with(
             "COPY %s FROM '/usr/local/hyrise/cached_tables/%s/%s.bin';",
             (
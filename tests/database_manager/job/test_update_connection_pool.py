@@ -0,0 +1,40 @@
+"""Tests for the update connection pool job."""
+from unittest.mock import patch
+
+from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.job.update_connection_pool import (
+    update_connection_pool,
+)
+
+
+class TestUpdateConnectionPoolJob:
+    """Tests for the update connection pool job."""
+
+    @patch(
+        "hyrisecockpit.database_manager.job.update_connection_pool.time_ns", lambda: 42
+    )
+    def test_logs_pool_statistics(self) -> None:
+        """Test the statistics of the pool are logged."""
+        mock_connection_factory = MagicMock()
+        statistics = {"creates": 2, "waits": 1, "in_use": 1, "idle": 1}
+        mock_connection_factory.get_pool_statistics.return_value = statistics
+        mock_storage_connection_factory = MagicMock()
+        mock_log = (
+            mock_storage_connection_factory.create_cursor.return_value.__enter__.return_value
+        )
+
+        update_connection_pool(mock_connection_factory, mock_storage_connection_factory)
+
+        mock_log.log_meta_information.assert_called_once_with(
+            "connection_pool", statistics, 42
+        )
+
+    def test_logs_nothing_without_pool(self) -> None:
+        """Test nothing is logged without a pool."""
+        mock_connection_factory = MagicMock()
+        mock_connection_factory.get_pool_statistics.return_value = None
+        mock_storage_connection_factory = MagicMock()
+
+        update_connection_pool(mock_connection_factory, mock_storage_connection_factory)
+
+        mock_storage_connection_factory.create_cursor.assert_not_called()
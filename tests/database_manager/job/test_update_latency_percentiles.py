@@ -0,0 +1,67 @@
+"""Tests for the update latency percentiles job."""
+from unittest.mock import patch
+
+from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.job.update_latency_percentiles import (
+    update_latency_percentiles,
+)
+
+
+class TestUpdateLatencyPercentiles:
+    """Tests for the update latency percentiles job."""
+
+    @patch(
+        "hyrisecockpit.database_manager.job.update_latency_percentiles.time_ns",
+        lambda: 10_500_000_000,
+    )
+    def test_logs_latency_percentiles(self) -> None:
+        """Test histograms of all task workers are merged into percentiles."""
+        mock_cursor = MagicMock()
+        mock_storage_connection_factory = MagicMock()
+        mock_storage_connection_factory.create_cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+        mock_cursor.get_latency_histograms.return_value = [
+            (9_000_000_000, "tpch", "01", "1:2"),
+            (9_000_000_000, "tpch", "01", "3:2"),
+            (9_000_000_000, "tpch", "02", "10:1"),
+        ]
+
+        update_latency_percentiles(mock_storage_connection_factory)
+
+        mock_cursor.get_latency_histograms.assert_called_once_with(
+            5_000_000_000, 10_000_000_000
+        )
+        logged_percentiles = mock_cursor.log_latency_percentiles.call_args[0][0]
+        percentiles = {
+            (time_stamp, benchmark, query_no): fields
+            for time_stamp, benchmark, query_no, fields in logged_percentiles
+        }
+        assert percentiles[(9_000_000_000, "tpch", "01")] == {
+            "p50": 1,
+            "p95": 3,
+            "p99": 3,
+            "p999": 3,
+            "count": 4,
+            "latency_histogram": "1:2,3:2",
+        }
+        assert percentiles[(9_000_000_000, "tpch", "all")]["count"] == 5
+        assert percentiles[(9_000_000_000, "tpch", "all")]["p999"] == 10
+        assert percentiles[(9_000_000_000, "all", "all")]["count"] == 5
+
+    @patch(
+        "hyrisecockpit.database_manager.job.update_latency_percentiles.time_ns",
+        lambda: 10_500_000_000,
+    )
+    def test_doesnt_log_without_histograms(self) -> None:
+        """Test nothing is logged if no queries were executed."""
+        mock_cursor = MagicMock()
+        mock_storage_connection_factory = MagicMock()
+        mock_storage_connection_factory.create_cursor.return_value.__enter__.return_value = (
+            mock_cursor
+        )
+        mock_cursor.get_latency_histograms.return_value = []
+
+        update_latency_percentiles(mock_storage_connection_factory)
+
+        mock_cursor.log_latency_percentiles.assert_not_called()
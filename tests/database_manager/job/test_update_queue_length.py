@@ -10,7 +10,7 @@ class TestUpdateQueueLength:
 
     @patch("hyrisecockpit.database_manager.job.update_queue_length.time_ns", lambda: 42)
     def test_logs_queue_length(self) -> None:
-        """Test logging of the queue length."""
+        """Test logging of the queue length and the targeted throughput."""
         mock_cursor = MagicMock()
         mock_storage_connection_factory = MagicMock()
         mock_storage_connection_factory.create_cursor.return_value.__enter__.return_value = (
@@ -18,12 +18,16 @@ class TestUpdateQueueLength:
         )
         mock_worker_pool = MagicMock()
         mock_worker_pool.get_queue_length.return_value = 100
+        mock_worker_pool.get_target_throughput.return_value = 120.0
 
         update_queue_length(
             mock_worker_pool,
             mock_storage_connection_factory,
         )
 
-        mock_cursor.log_meta_information.assert_called_once_with(
+        mock_cursor.log_meta_information.assert_any_call(
             "raw_queue_length", {"queue_length": 100}, 42
         )
+        mock_cursor.log_meta_information.assert_any_call(
+            "raw_target_throughput", {"target_throughput": 120.0}, 42
+        )
@@ -0,0 +1,51 @@
+"""Tests for the update status snapshots job."""
+from unittest.mock import patch
+
+from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.job.update_status_snapshots import (
+    update_status_snapshots,
+)
+from hyrisecockpit.database_manager.status_snapshots import StatusSnapshots
+
+JOB_MODULE = "hyrisecockpit.database_manager.job.update_status_snapshots"
+
+
+class TestUpdateStatusSnapshotsJob:
+    """Tests for the update status snapshots job."""
+
+    @patch(f"{JOB_MODULE}.get_detailed_plugins")
+    @patch(f"{JOB_MODULE}.workload_tables_status")
+    @patch(f"{JOB_MODULE}.get_loaded_tables_in_database")
+    def test_refreshes_snapshots(
+        self,
+        mock_get_loaded_tables_in_database: MagicMock,
+        mock_workload_tables_status: MagicMock,
+        mock_get_detailed_plugins: MagicMock,
+    ) -> None:
+        """Test the snapshots are refreshed with one query for the tables."""
+        mock_connection_factory = MagicMock()
+        workload_drivers = {"tpch": MagicMock()}
+        mock_get_loaded_tables_in_database.return_value = ["region_tpch_1"]
+        mock_workload_tables_status.return_value = [{"workload_type": "tpch"}]
+        mock_get_detailed_plugins.return_value = {"Compression": []}
+        status_snapshots = StatusSnapshots()
+
+        update_status_snapshots(
+            mock_connection_factory, workload_drivers, status_snapshots
+        )
+
+        mock_get_loaded_tables_in_database.assert_called_once_with(
+            mock_connection_factory
+        )
+        mock_workload_tables_status.assert_called_once_with(
+            ["region_tpch_1"], workload_drivers
+        )
+        mock_get_detailed_plugins.assert_called_once_with(mock_connection_factory)
+        for name, value in [
+            ("loaded_tables", ["region_tpch_1"]),
+            ("workload_tables_status", [{"workload_type": "tpch"}]),
+            ("detailed_plugins", {"Compression": []}),
+        ]:
+            snapshot = status_snapshots.get(name, MagicMock())
+            assert snapshot["value"] == value
+            assert snapshot["version"] == 1
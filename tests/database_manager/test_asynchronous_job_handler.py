@@ -21,6 +21,7 @@ from hyrisecockpit.database_manager.job.delete_tables import (
 from hyrisecockpit.database_manager.job.load_tables import (
     load_tables as load_tables_job,
 )
+from hyrisecockpit.database_manager.status_snapshots import StatusSnapshots
 
 
 class TestAsynchronousJobHandler:
@@ -35,7 +36,7 @@ class TestAsynchronousJobHandler:
         )
         workload_drivers = {"TPC-C": "some_driver"}
         return AsynchronousJobHandler(
-            database_blocked, connection_factory, workload_drivers
+            database_blocked, connection_factory, workload_drivers, StatusSnapshots()
         )
 
     def test_initializes_start_asynchronous_job_handler(self) -> None:
@@ -46,7 +47,7 @@ class TestAsynchronousJobHandler:
         )
         workload_drivers = {"TPC-C": "some_driver"}
         asynchronous_job_handler = AsynchronousJobHandler(
-            database_blocked, connection_factory, workload_drivers
+            database_blocked, connection_factory, workload_drivers, StatusSnapshots()
         )
 
         assert asynchronous_job_handler._database_blocked == database_blocked
@@ -78,13 +79,17 @@ class TestAsynchronousJobHandler:
         )
 
         mock_thread.assert_called_once_with(
-            target=load_tables_job,
+            target=asynchronous_job_handler._run_job,
             args=(
-                asynchronous_job_handler._database_blocked,
-                fake_workload_type,
-                fake_scale_factor,
-                asynchronous_job_handler._connection_factory,
-                {"TPC-C": "some_driver"},
+                load_tables_job,
+                (
+                    asynchronous_job_handler._database_blocked,
+                    fake_workload_type,
+                    fake_scale_factor,
+                    asynchronous_job_handler._connection_factory,
+                    {"TPC-C": "some_driver"},
+                ),
+                ("loaded_tables", "workload_tables_status"),
             ),
         )
         mock_job_thread.start.assert_called_once()
@@ -146,13 +151,17 @@ class TestAsynchronousJobHandler:
         )
 
         mock_thread.assert_called_once_with(
-            target=delete_tables_job,
+            target=asynchronous_job_handler._run_job,
             args=(
-                asynchronous_job_handler._database_blocked,
-                fake_workload_type,
-                fake_scale_factor,
-                asynchronous_job_handler._connection_factory,
-                {"TPC-C": "some_driver"},
+                delete_tables_job,
+                (
+                    asynchronous_job_handler._database_blocked,
+                    fake_workload_type,
+                    fake_scale_factor,
+                    asynchronous_job_handler._connection_factory,
+                    {"TPC-C": "some_driver"},
+                ),
+                ("loaded_tables", "workload_tables_status"),
             ),
         )
         mock_job_thread.start.assert_called_once()
@@ -219,8 +228,12 @@ class TestAsynchronousJobHandler:
         result: bool = asynchronous_job_handler.activate_plugin(fake_plugin)
 
         mock_thread.assert_called_once_with(
-            target=activate_plugin_job,
-            args=(asynchronous_job_handler._connection_factory, fake_plugin),
+            target=asynchronous_job_handler._run_job,
+            args=(
+                activate_plugin_job,
+                (asynchronous_job_handler._connection_factory, fake_plugin),
+                ("detailed_plugins",),
+            ),
         )
         mock_job_thread.start.assert_called_once()
         assert result
@@ -327,8 +340,12 @@ class TestAsynchronousJobHandler:
         result: bool = asynchronous_job_handler.deactivate_plugin(fake_plugin)
 
         mock_thread.assert_called_once_with(
-            target=deactivate_plugin_job,
-            args=(asynchronous_job_handler._connection_factory, fake_plugin),
+            target=asynchronous_job_handler._run_job,
+            args=(
+                deactivate_plugin_job,
+                (asynchronous_job_handler._connection_factory, fake_plugin),
+                ("detailed_plugins",),
+            ),
         )
         mock_job_thread.start.assert_called_once()
         assert result
@@ -0,0 +1,130 @@
+"""Tests for the connection_pool module."""
+from threading import Thread
+from typing import List
+
+from psycopg2 import OperationalError
+from pytest import fixture, raises
+
+from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.connection_pool import ConnectionPool
+
+
+def fake_connect() -> MagicMock:
+    """Return a fake open connection."""
+    connection = MagicMock()
+    connection.closed = 0
+    return connection
+
+
+class TestConnectionPool:
+    """Tests for the ConnectionPool class."""
+
+    @fixture
+    def connect(self) -> MagicMock:
+        """Return a mock that opens fake connections."""
+        return MagicMock(side_effect=lambda: fake_connect())
+
+    @fixture
+    def pool(self, connect: MagicMock) -> ConnectionPool:
+        """Return a pool of two connections."""
+        return ConnectionPool(connect, 2, 300.0, 10.0, 0.05)
+
+    def test_needs_room_for_a_connection(self, connect: MagicMock) -> None:
+        """A pool without room raises a ValueError."""
+        with raises(ValueError):
+            ConnectionPool(connect, 0, 300.0, 10.0, 1.0)
+
+    def test_reuses_released_connection(
+        self, pool: ConnectionPool, connect: MagicMock
+    ) -> None:
+        """A released connection is handed out again."""
+        connection = pool.acquire()
+        pool.release(connection)
+
+        assert pool.acquire() is connection
+        connect.assert_called_once()
+        assert pool.get_statistics() == {
+            "creates": 1,
+            "discards": 0,
+            "waits": 0,
+            "wait_time": 0,
+            "in_use": 1,
+            "idle": 0,
+        }
+
+    def test_closes_broken_connection(
+        self, pool: ConnectionPool, connect: MagicMock
+    ) -> None:
+        """A broken connection is closed and replaced."""
+        connection = pool.acquire()
+        pool.release(connection, broken=True)
+
+        assert pool.acquire() is not connection
+        connection.close.assert_called_once()
+        assert connect.call_count == 2
+        assert pool.get_statistics()["discards"] == 1
+
+    def test_replaces_expired_connection(self, connect: MagicMock) -> None:
+        """A connection older than its lifetime is replaced."""
+        pool = ConnectionPool(connect, 2, 0.0, 10.0, 1.0)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        connection.close.assert_called_once()
+        assert pool.get_statistics()["idle"] == 0
+
+    def test_checks_idle_connection(self, connect: MagicMock) -> None:
+        """A connection that was idle is checked before it is handed out."""
+        pool = ConnectionPool(connect, 2, 300.0, 0.0, 1.0)
+        connection = pool.acquire()
+        pool.release(connection)
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = OperationalError()
+
+        assert pool.acquire() is not connection
+        connection.close.assert_called_once()
+
+    def test_times_out_when_full(self, pool: ConnectionPool) -> None:
+        """Waiting for a connection of a full pool times out."""
+        pool.acquire()
+        pool.acquire()
+
+        with raises(OperationalError):
+            pool.acquire()
+        assert pool.get_statistics()["waits"] == 1
+        assert pool.get_statistics()["in_use"] == 2
+
+    def test_waits_for_released_connection(self) -> None:
+        """A waiting job gets the connection another job releases."""
+        pool = ConnectionPool(fake_connect, 1, 300.0, 10.0, 1.0)
+        connection = pool.acquire()
+        acquired: List = []
+        waiter = Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        pool.release(connection)
+        waiter.join()
+
+        assert acquired == [connection]
+
+    def test_frees_place_if_connect_fails(self, connect: MagicMock) -> None:
+        """A failed connect doesn't take a place of the pool."""
+        pool = ConnectionPool(connect, 1, 300.0, 10.0, 0.05)
+        connect.side_effect = OperationalError()
+
+        with raises(OperationalError):
+            pool.acquire()
+        connect.side_effect = lambda: fake_connect()
+        assert pool.acquire()
+
+    def test_closes_connections(self, pool: ConnectionPool) -> None:
+        """Closing the pool closes idle connections and released ones."""
+        idle_connection = pool.acquire()
+        used_connection = pool.acquire()
+        pool.release(idle_connection)
+
+        pool.close()
+        pool.release(used_connection)
+
+        idle_connection.close.assert_called_once()
+        used_connection.close.assert_called_once()
+        assert pool.get_statistics()["in_use"] == 0
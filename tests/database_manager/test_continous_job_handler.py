@@ -10,6 +10,9 @@ from hyrisecockpit.database_manager.continuous_job_handler import ContinuousJobH
 from hyrisecockpit.database_manager.job.ping_hyrise import ping_hyrise
 from hyrisecockpit.database_manager.job.update_chunks_data import update_chunks_data
 from hyrisecockpit.database_manager.job.update_plugin_log import update_plugin_log
+from hyrisecockpit.database_manager.job.update_latency_percentiles import (
+    update_latency_percentiles,
+)
 from hyrisecockpit.database_manager.job.update_queue_length import update_queue_length
 from hyrisecockpit.database_manager.job.update_storage_data import update_storage_data
 from hyrisecockpit.database_manager.job.update_system_data import update_system_data
@@ -22,6 +25,12 @@ from hyrisecockpit.database_manager.job.update_workload_statement_information im
 from hyrisecockpit.database_manager.job.update_memory_footprint import (
     update_memory_footprint,
 )
+from hyrisecockpit.database_manager.job.update_connection_pool import (
+    update_connection_pool,
+)
+from hyrisecockpit.database_manager.job.update_status_snapshots import (
+    update_status_snapshots,
+)
 
 
 class TestContinuousJobHandler:
@@ -40,6 +49,8 @@ class TestContinuousJobHandler:
             "worker_pool",
             "storage_connection_factory",
             "database_blocked",
+            "workload_drivers",
+            "status_snapshots",
         )
 
         assert continuous_job_handler._connection_factory == "connection_factory"
@@ -56,6 +67,8 @@ class TestContinuousJobHandler:
         assert continuous_job_handler._previous_chunk_data == {
             "value": None,
         }
+        assert continuous_job_handler._workload_drivers == "workload_drivers"
+        assert continuous_job_handler._status_snapshots == "status_snapshots"
         assert continuous_job_handler._scheduler == mock_background_scheduler_obj
 
     @patch(
@@ -70,6 +83,8 @@ class TestContinuousJobHandler:
             "worker_pool",
             "storage_connection_factory",
             "database_blocked",
+            "workload_drivers",
+            "status_snapshots",
         )
         mock_scheduler: MagicMock = MagicMock()
         mock_scheduler.add_job.return_value = None
@@ -85,6 +100,12 @@ class TestContinuousJobHandler:
                     continuous_job_handler._hyrise_active,
                 ),
             ),
+            (
+                update_latency_percentiles,
+                "interval",
+                1,
+                (continuous_job_handler._storage_connection_factory,),
+            ),
             (
                 update_workload_statement_information,
                 "interval",
@@ -160,6 +181,25 @@ class TestContinuousJobHandler:
                     continuous_job_handler._storage_connection_factory,
                 ),
             ),
+            (
+                update_connection_pool,
+                "interval",
+                1,
+                (
+                    continuous_job_handler._connection_factory,
+                    continuous_job_handler._storage_connection_factory,
+                ),
+            ),
+            (
+                update_status_snapshots,
+                "interval",
+                5,
+                (
+                    continuous_job_handler._connection_factory,
+                    continuous_job_handler._workload_drivers,
+                    continuous_job_handler._status_snapshots,
+                ),
+            ),
             (
                 ping_hyrise,
                 "interval",
@@ -188,6 +228,8 @@ class TestContinuousJobHandler:
             "worker_pool",
             "storage_connection_factory",
             "database_blocked",
+            "workload_drivers",
+            "status_snapshots",
         )
         mock_scheduler: MagicMock = MagicMock()
         mock_scheduler.shutdown.return_value = None
@@ -198,8 +240,11 @@ class TestContinuousJobHandler:
         continuous_job_handler._update_storage_data_job = MagicMock()
         continuous_job_handler._update_plugin_log_job = MagicMock()
         continuous_job_handler._update_memory_footprint_job = MagicMock()
+        continuous_job_handler._update_status_snapshots_job = MagicMock()
+        continuous_job_handler._update_connection_pool_job = MagicMock()
         continuous_job_handler._ping_hyrise_job = MagicMock()
         continuous_job_handler._update_queue_length_job = MagicMock()
+        continuous_job_handler._update_latency_percentiles_job = MagicMock()
         continuous_job_handler._update_workload_operator_information_job = MagicMock()
 
         continuous_job_handler.close()
@@ -211,6 +256,9 @@ class TestContinuousJobHandler:
         continuous_job_handler._update_plugin_log_job.remove.assert_called_once()
         continuous_job_handler._ping_hyrise_job.remove.assert_called_once()
         continuous_job_handler._update_queue_length_job.remove.assert_called_once()
+        continuous_job_handler._update_latency_percentiles_job.remove.assert_called_once()
         continuous_job_handler._update_workload_operator_information_job.remove.assert_called_once()
         continuous_job_handler._update_memory_footprint_job.remove.assert_called_once()
+        continuous_job_handler._update_status_snapshots_job.remove.assert_called_once()
+        continuous_job_handler._update_connection_pool_job.remove.assert_called_once()
         mock_scheduler.shutdown.assert_called_once()
@@ -3,11 +3,13 @@ from typing import Any, Dict, List, Tuple
 from unittest.mock import MagicMock, patch
 
 from pandas import DataFrame
-from pytest import fixture, mark
+from psycopg2 import Error, OperationalError, ProgrammingError
+from pytest import fixture, mark, raises
 
 from hyrisecockpit.database_manager.cursor import (
     ConnectionFactory,
     HyriseCursor,
+    PooledHyriseCursor,
     StorageConnectionFactory,
     StorageCursor,
 )
@@ -31,15 +33,16 @@ class TestCursor:
     @mark.parametrize(
         "queries",
         [
-            [(1, 2, "benchmark1", 1.0, "query_no_1", "worker1", True)],
+            [(1, 2, "benchmark1", 1.0, "query_no_1", "worker1", True, 3, 1, 4)],
             [
-                (1, 2, "benchmark1", 1.0, "query_no_1", "worker1", True),
-                (3, 4, "benchmark2", 1.0, "query_no_2", "worker2", True),
+                (1, 2, "benchmark1", 1.0, "query_no_1", "worker1", True, 3, 1, 4),
+                (3, 4, "benchmark2", 1.0, "query_no_2", "worker2", True, 5, 0, 6),
             ],
         ],
     )
     def test_logs_queries(
-        self, queries: List[Tuple[int, int, str, float, str, str, bool]]
+        self,
+        queries: List[Tuple[int, int, str, float, str, str, bool, int, int, int]],
     ):
         """Test queries logging."""
         expected_points = [
@@ -52,7 +55,12 @@ class TestCursor:
                     "worker_id": query[5],
                     "commited": query[6],
                 },
-                "fields": {"latency": query[1]},
+                "fields": {
+                    "latency": query[1],
+                    "response_time": query[7],
+                    "queue_wait_time": query[8],
+                    "end_to_end_latency": query[9],
+                },
                 "time": query[0],
             }
             for query in queries
@@ -67,6 +75,108 @@ class TestCursor:
             expected_points, database="database"
         )
 
+    def test_logs_aggregated_queries(self):
+        """Test aggregated queries logging."""
+        aggregates = [
+            (
+                1,
+                "benchmark1",
+                1.0,
+                "query_no_1",
+                "worker1",
+                True,
+                3,
+                30,
+                5,
+                15,
+                "5:1",
+                40,
+                "7:1",
+                6,
+                50,
+            )
+        ]
+        expected_points = [
+            {
+                "measurement": "aggregated_queries",
+                "tags": {
+                    "benchmark": "benchmark1",
+                    "scalefactor": 1.0,
+                    "query_no": "query_no_1",
+                    "worker_id": "worker1",
+                    "commited": True,
+                },
+                "fields": {
+                    "count": 3,
+                    "latency_sum": 30,
+                    "latency_min": 5,
+                    "latency_max": 15,
+                    "latency_histogram": "5:1",
+                    "response_time_sum": 40,
+                    "response_time_histogram": "7:1",
+                    "queue_wait_time_sum": 6,
+                    "end_to_end_latency_sum": 50,
+                },
+                "time": 1,
+            }
+        ]
+
+        cursor = StorageCursor("host", "port", "user", "password", "database")
+        cursor._connection = MagicMock()
+        cursor._connection.write_points.return_value = None
+        cursor.log_aggregated_queries(aggregates)
+
+        cursor._connection.write_points.assert_called_once_with(
+            expected_points, database="database"
+        )
+
+    def test_logs_latency_percentiles(self):
+        """Test latency percentiles logging."""
+        percentiles = [(1, "benchmark1", "query_no_1", {"p50": 5, "count": 3})]
+        expected_points = [
+            {
+                "measurement": "latency_percentiles",
+                "tags": {"benchmark": "benchmark1", "query_no": "query_no_1"},
+                "fields": {"p50": 5, "count": 3},
+                "time": 1,
+            }
+        ]
+
+        cursor = StorageCursor("host", "port", "user", "password", "database")
+        cursor._connection = MagicMock()
+        cursor._connection.write_points.return_value = None
+        cursor.log_latency_percentiles(percentiles)
+
+        cursor._connection.write_points.assert_called_once_with(
+            expected_points, database="database"
+        )
+
+    def test_gets_latency_histograms(self):
+        """Test getting the latency histograms of the aggregated queries."""
+        cursor = StorageCursor("host", "port", "user", "password", "database")
+        cursor._connection = MagicMock()
+        cursor._connection.query.return_value.items.return_value = [
+            (
+                ("aggregated_queries", {"benchmark": "tpch", "query_no": "01"}),
+                iter(
+                    [
+                        {"time": 1, "latency_histogram": "5:1"},
+                        {"time": 2, "latency_histogram": "7:2"},
+                    ]
+                ),
+            )
+        ]
+
+        histograms = cursor.get_latency_histograms(1, 3)
+
+        cursor._connection.query.assert_called_once_with(
+            'SELECT "latency_histogram" FROM aggregated_queries WHERE time >= $startts AND time < $endts GROUP BY benchmark, query_no;',
+            database="database",
+            bind_params={"startts": 1, "endts": 3},
+            epoch="ns",
+        )
+        assert histograms == [(1, "tpch", "01", "5:1"), (2, "tpch", "01", "7:2")]
+
     @mark.parametrize(
         "queries",
         [
@@ -165,6 +275,42 @@ class TestCursor:
             [expected_point], database="database"
         )
 
+    def test_logs_result_log_statistics(self):
+        """Test result logger statistics logging."""
+        expected_point = {
+            "measurement": "result_log",
+            "tags": {"worker_id": "worker1"},
+            "fields": {"flushed_results": 10, "dropped_results": 0},
+            "time": 123,
+        }
+        cursor = StorageCursor("host", "port", "user", "password", "database")
+        cursor._connection = MagicMock()
+        cursor._connection.write_points.return_value = None
+        cursor.log_result_log_statistics(
+            "worker1", {"flushed_results": 10, "dropped_results": 0}, 123
+        )
+        cursor._connection.write_points.assert_called_once_with(
+            [expected_point], database="database"
+        )
+
+    def test_logs_connection_statistics(self):
+        """Test connection statistics logging."""
+        expected_point = {
+            "measurement": "connection",
+            "tags": {"worker_id": "worker1"},
+            "fields": {"rollbacks": 2, "rollback_latency": 50},
+            "time": 123,
+        }
+        cursor = StorageCursor("host", "port", "user", "password", "database")
+        cursor._connection = MagicMock()
+        cursor._connection.write_points.return_value = None
+        cursor.log_connection_statistics(
+            "worker1", {"rollbacks": 2, "rollback_latency": 50}, 123
+        )
+        cursor._connection.write_points.assert_called_once_with(
+            [expected_point], database="database"
+        )
+
     def test_creates_database(self):
         """Test creating of an Influx database."""
         cursor = StorageCursor("host", "port", "user", "password", "database_id")
@@ -230,6 +376,39 @@ class TestCursor:
         mocked_cursor.close.assert_called_once()
         mocked_connection.close.assert_called_once()
 
+    @patch("hyrisecockpit.database_manager.cursor.time_ns")
+    def test_rolls_back(self, mock_time_ns: MagicMock, hyrise_cursor) -> None:
+        """Test rollback keeps the connection and counts the rollback."""
+        mock_time_ns.side_effect = [10, 25]
+        hyrise_cursor.connection = MagicMock()
+
+        hyrise_cursor.rollback()
+
+        hyrise_cursor.connection.rollback.assert_called_once()
+        hyrise_cursor.connection.close.assert_not_called()
+        assert hyrise_cursor.take_statistics() == {
+            "rollbacks": 1,
+            "rollback_latency": 15,
+        }
+        assert hyrise_cursor.take_statistics() == {}
+
+    @patch("hyrisecockpit.database_manager.cursor.connect")
+    def test_resets_if_rollback_fails(
+        self, mock_connect: MagicMock, hyrise_cursor
+    ) -> None:
+        """Test a failed rollback reconnects and counts the reconnect."""
+        connection = MagicMock()
+        connection.rollback.side_effect = Error
+        hyrise_cursor.connection = connection
+        hyrise_cursor._cur = MagicMock()
+
+        hyrise_cursor.rollback()
+
+        connection.close.assert_called_once()
+        mock_connect.assert_called_once()
+        assert hyrise_cursor.connection == mock_connect.return_value
+        assert hyrise_cursor.take_statistics() == {"reconnects": 1}
+
     def test_executes(self, hyrise_cursor) -> None:
         """Test execute witch valid pool cursor and no exception."""
         hyrise_cursor._cur = MagicMock()
@@ -364,7 +543,66 @@ class TestCursor:
             "host", "port", "user", "password", "dbname", False
         )
 
-    def test_storage_connection_factory_initializes(self) -> None:
+    @patch("hyrisecockpit.database_manager.cursor.connect")
+    def test_creates_pooled_cursor(self, mock_connect: MagicMock) -> None:
+        """Test autocommit cursors of a pooled factory share connections."""
+        mock_connect.return_value.closed = 0
+        factory = ConnectionFactory("user", "password", "host", "port", "dbname", 2)
+
+        for _ in range(3):
+            with factory.create_cursor() as cur:
+                assert isinstance(cur, PooledHyriseCursor)
+                cur.execute("SELECT 1;", None)
+
+        mock_connect.assert_called_once_with(
+            host="host", port="port", user="user", password="password", dbname="dbname"
+        )
+        mock_connect.return_value.set_session.assert_called_once_with(autocommit=True)
+        assert factory.get_pool_statistics()["creates"] == 1
+        assert factory.get_pool_statistics()["idle"] == 1
+
+    def test_creates_unpooled_cursors(self) -> None:
+        """Test cursors without autocommit or unpooled get their own connection."""
+        factory = ConnectionFactory("user", "password", "host", "port", "dbname", 2)
+
+        assert not isinstance(
+            factory.create_cursor(autocommit=False), PooledHyriseCursor
+        )
+        assert not isinstance(factory.create_cursor(pooled=False), PooledHyriseCursor)
+        assert (
+            ConnectionFactory(
+                "user", "password", "host", "port", "dbname"
+            ).get_pool_statistics()
+            is None
+        )
+
+    def test_pooled_cursor_discards_broken_connection(self) -> None:
+        """Test a connection that failed is not returned to the pool."""
+        mock_pool = MagicMock()
+        mock_connection = mock_pool.acquire.return_value
+
+        with raises(OperationalError):
+            with PooledHyriseCursor(mock_pool):
+                raise OperationalError()
+
+        mock_connection.cursor.return_value.close.assert_called_once()
+        mock_pool.release.assert_called_once_with(mock_connection, True)
+
+    def test_pooled_cursor_returns_connection(self) -> None:
+        """Test a connection is returned after a failed query."""
+        mock_pool = MagicMock()
+        mock_connection = mock_pool.acquire.return_value
+
+        with raises(ProgrammingError):
+            with PooledHyriseCursor(mock_pool):
+                raise ProgrammingError()
+
+        mock_pool.release.assert_called_once_with(mock_connection, False)
+
+    @patch("hyrisecockpit.database_manager.cursor.StorageWriter")
+    def test_storage_connection_factory_initializes(
+        self, mock_storage_writer_constructor: MagicMock
+    ) -> None:
         """Test initialization of StorageConnectionFactory."""
         fake_user: str = "user"
         fake_password: str = "password"
@@ -381,12 +619,18 @@ class TestCursor:
         assert factory._host == "host"
         assert factory._port == "port"
         assert factory._database_id == "database_id"
+        mock_storage_writer_constructor.assert_called_once_with(
+            "host", "port", "user", "password", "database_id", 100000, 5000, 1.0
+        )
 
+    @patch("hyrisecockpit.database_manager.cursor.StorageWriter")
     @patch(
         "hyrisecockpit.database_manager.cursor.StorageCursor",
     )
     def test_create_storage_cursor(
-        self, mock_storage_cursor_constructor: MagicMock
+        self,
+        mock_storage_cursor_constructor: MagicMock,
+        mock_storage_writer_constructor: MagicMock,
     ) -> None:
         """Test creation of StorageCursor."""
         fake_user: str = "user"
@@ -403,6 +647,40 @@ class TestCursor:
         cursor = factory.create_cursor()
 
         assert cursor == mock_cursor
+        mock_writer = mock_storage_writer_constructor.return_value
+        mock_writer.start.assert_called_once()
         mock_storage_cursor_constructor.assert_called_once_with(
-            fake_host, fake_port, fake_user, fake_password, fake_dbname
+            fake_host, fake_port, fake_user, fake_password, fake_dbname, mock_writer
+        )
+
+    @patch("hyrisecockpit.database_manager.cursor.StorageWriter")
+    def test_closes_storage_writer(
+        self, mock_storage_writer_constructor: MagicMock
+    ) -> None:
+        """Test closing the writer of a StorageConnectionFactory."""
+        factory = StorageConnectionFactory(
+            "user", "password", "host", "port", "database_id"
+        )
+        factory.close()
+
+        mock_storage_writer_constructor.return_value.close.assert_called_once()
+
+    def test_storage_cursor_hands_points_to_writer(self) -> None:
+        """A StorageCursor with a writer neither connects nor writes itself."""
+        mock_writer = MagicMock()
+        cursor = StorageCursor(
+            "host", "port", "user", "password", "database_id", mock_writer
+        )
+
+        with patch(
+            "hyrisecockpit.database_manager.cursor.InfluxDBClient"
+        ) as mock_client_constructor:
+            with cursor:
+                cursor.log_meta_information("measurement", {"field": 1}, 42)
+
+        mock_client_constructor.assert_not_called()
+        mock_writer.client.write_points.assert_not_called()
+        mock_writer.client.close.assert_not_called()
+        mock_writer.write.assert_called_once_with(
+            [{"measurement": "measurement", "fields": {"field": 1}, "time": 42}]
         )
@@ -97,7 +97,7 @@ class TestDatabase(object):
             storage_user,
         )
         mock_connection_factory.assert_called_once_with(
-            **database.connection_information
+            **database.connection_information, pool_size=4
         )
         mock_storage_connection_factory.assert_called_once_with(
             storage_user, storage_password, storage_host, storage_port, database_id
@@ -117,11 +117,14 @@ class TestDatabase(object):
             database._worker_pool,
             database._storage_connection_factory,
             database._database_blocked,
+            database._workload_drivers,
+            database._status_snapshots,
         )
         mock_asynchronous_job_handler.assert_called_once_with(
             database._database_blocked,
             database._connection_factory,
             database._workload_drivers,
+            database._status_snapshots,
         )
         database._continuous_job_handler.start.assert_called_once()  # type: ignore
         mock_initialize_influx.assert_called_once()
@@ -512,13 +515,16 @@ class TestDatabase(object):
         mock_worker_pool.terminate.return_value = None
         mock_continuous_job_handler: MagicMock = MagicMock()
         mock_continuous_job_handler.close.return_value = None
+        mock_storage_connection_factory: MagicMock = MagicMock()
 
         database._worker_pool = mock_worker_pool
         database._continuous_job_handler = mock_continuous_job_handler
+        database._storage_connection_factory = mock_storage_connection_factory
         database.close()
 
         mock_worker_pool.terminate.assert_called_once()
         mock_continuous_job_handler.close.assert_called_once()
+        mock_storage_connection_factory.close.assert_called_once()
 
     def test_initializes_influx(self, database: Database) -> None:
         """Test intialization of the corresponding influx database."""
@@ -532,15 +538,36 @@ class TestDatabase(object):
         )
         database._storage_connection_factory = mock_storage_cursor_constructor
 
-        throughput_query = """SELECT count("latency") AS "throughput"
+        throughput_query = """SELECT sum("count") AS "throughput"
                 INTO "throughput"
-                FROM "successful_queries"
+                FROM "aggregated_queries"
                 WHERE commited='True'
                 GROUP BY time(1s)"""
-        latency_query = """SELECT mean("latency") AS "latency"
+        latency_query = """SELECT sum("latency_sum") / sum("count") AS "latency"
                 INTO "latency"
-                FROM "successful_queries"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+        response_time_query = """SELECT sum("response_time_sum") / sum("count") AS "response_time"
+                INTO "response_time"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+        queue_wait_time_query = """SELECT sum("queue_wait_time_sum") / sum("count") AS "queue_wait_time"
+                INTO "queue_wait_time"
+                FROM "aggregated_queries"
+                GROUP BY time(1s)"""
+        end_to_end_latency_query = """SELECT sum("end_to_end_latency_sum") / sum("count") AS "end_to_end_latency"
+                INTO "end_to_end_latency"
+                FROM "aggregated_queries"
                 GROUP BY time(1s)"""
+        connection_statistics_query = """SELECT sum("reconnects") AS "reconnects", sum("rollbacks") AS "rollbacks", sum("retries") AS "retries", sum("rollback_latency") / sum("rollbacks") AS "rollback_latency"
+                INTO "connection_statistics"
+                FROM "connection"
+                GROUP BY time(1s)"""
+        target_throughput_query = """SELECT mean("target_throughput") AS "target_throughput"
+                INTO "target_throughput"
+                FROM "raw_target_throughput"
+                GROUP BY time(1s)
+                FILL(previous)"""
         resample_options = "EVERY 1s FOR 5s"
 
         database._initialize_influx()
@@ -554,3 +581,24 @@ class TestDatabase(object):
         mock_storage_cursor.create_continuous_query.assert_any_call(
             "latency_calculation", latency_query, resample_options
         )
+        mock_storage_cursor.create_continuous_query.assert_any_call(
+            "response_time_calculation", response_time_query, resample_options
+        )
+        mock_storage_cursor.create_continuous_query.assert_any_call(
+            "queue_wait_time_calculation", queue_wait_time_query, resample_options
+        )
+        mock_storage_cursor.create_continuous_query.assert_any_call(
+            "end_to_end_latency_calculation",
+            end_to_end_latency_query,
+            resample_options,
+        )
+        mock_storage_cursor.create_continuous_query.assert_any_call(
+            "connection_statistics_calculation",
+            connection_statistics_query,
+            resample_options,
+        )
+        mock_storage_cursor.create_continuous_query.assert_any_call(
+            "target_throughput_calculation",
+            target_throughput_query,
+            resample_options,
+        )
@@ -7,6 +7,7 @@ from pytest import fixture, mark
 from hyrisecockpit.database_manager.database import Database
 from hyrisecockpit.database_manager.manager import DatabaseManager
 from hyrisecockpit.response import get_error_response, get_response
+from hyrisecockpit.server import CONCURRENCY_CLASSES
 
 DB_MANAGER_LISTENING = "listening_host"
 DB_MANAGER_PORT = "listening_port"
@@ -18,7 +19,7 @@ WORKLOAD_PUBSUB_PORT = "pubsub_port"
 WORKLOAD_SUB_HOST = "pubsub_host"
 
 
-def fake_server_constructor(*args) -> MagicMock:
+def fake_server_constructor(*args, **kwargs) -> MagicMock:
     """Fake server."""
     fake_server = MagicMock()
     fake_server.start.return_value = None
@@ -212,6 +213,14 @@ class TestDatabaseManager:
         for call in database_manager._get_server_calls().keys():
             assert call in calls
 
+    def test_server_calls_have_concurrency_class(
+        self, database_manager: DatabaseManager
+    ) -> None:
+        """Assert every call of the DatabaseManager has a concurrency class."""
+        concurrency = database_manager._get_call_concurrency()
+        assert set(concurrency.keys()) == set(get_server_calls())
+        assert set(concurrency.values()) <= set(CONCURRENCY_CLASSES)
+
     @patch("hyrisecockpit.database_manager.manager.HyriseCursor.validate_connection")
     @patch("hyrisecockpit.database_manager.manager.Database")
     def test_call_add_database(
@@ -249,6 +258,7 @@ class TestDatabaseManager:
             STORAGE_PASSWORD,
             STORAGE_PORT,
             STORAGE_USER,
+            4,
         )
         assert response == get_response(200)
         assert "database_id" in database_manager._databases.keys()
@@ -362,7 +372,9 @@ class TestDatabaseManager:
         response = database_manager._call_load_data(body)
 
         database.load_data.assert_called()
-        assert get_response(200) == response
+        expected = get_response(200)
+        expected["body"]["databases"] = {"db1": "succeeded"}
+        assert expected == response
 
     @patch(
         "hyrisecockpit.database_manager.manager.DatabaseManager._check_if_database_blocked"
@@ -382,7 +394,9 @@ class TestDatabaseManager:
         response = database_manager._call_load_data(body)
 
         database.load_data.assert_called()
-        assert get_response(400) == response
+        expected = get_response(400)
+        expected["body"]["databases"] = {"db1": "failed"}
+        assert expected == response
 
     @patch(
         "hyrisecockpit.database_manager.manager.DatabaseManager._check_if_database_blocked"
@@ -421,7 +435,9 @@ class TestDatabaseManager:
         response = database_manager._call_delete_data(body)
 
         database.delete_data.assert_called()
-        assert get_response(200) == response
+        expected = get_response(200)
+        expected["body"]["databases"] = {"db1": "succeeded"}
+        assert expected == response
 
     @patch(
         "hyrisecockpit.database_manager.manager.DatabaseManager._check_if_database_blocked"
@@ -441,7 +457,9 @@ class TestDatabaseManager:
         response = database_manager._call_delete_data(body)
 
         database.delete_data.assert_called()
-        assert get_response(400) == response
+        expected = get_response(400)
+        expected["body"]["databases"] = {"db1": "failed"}
+        assert expected == response
 
     @patch(
         "hyrisecockpit.database_manager.manager.DatabaseManager._check_if_database_blocked"
@@ -466,11 +484,15 @@ class TestDatabaseManager:
     def test_call_get_detailed_plugins(self, database_manager: DatabaseManager) -> None:
         """Call get plugins."""
         database = fake_database()
-        database.get_detailed_plugins.return_value = {
-            "Compression": [
-                {"name": "MemoryBudget", "value": "55555", "description": "..."}
-            ],
-            "Clustering": [],
+        database.get_status_snapshot.return_value = {
+            "value": {
+                "Compression": [
+                    {"name": "MemoryBudget", "value": "55555", "description": "..."}
+                ],
+                "Clustering": [],
+            },
+            "version": 4,
+            "age": 1000,
         }
         database_manager._databases["db1"] = database
 
@@ -487,13 +509,17 @@ class TestDatabaseManager:
                     ],
                     "Clustering": [],
                 },
+                "version": 4,
+                "age": 1000,
             }
         ]
         expected_response = get_response(200)
         expected_response["body"]["plugins"] = expected_plugins
+        expected_response["body"]["databases"] = {"db1": "succeeded"}
         body: Dict = {}
         response = database_manager._call_get_plugins(body)
 
+        database.get_status_snapshot.assert_called_once_with("detailed_plugins")
         assert expected_response == response
 
     @patch("hyrisecockpit.database_manager.manager.available_plugins", ["pluginName"])
@@ -603,7 +629,9 @@ class TestDatabaseManager:
         body: Dict = {}
         response = database_manager._call_start_worker(body)
 
-        assert get_response(200) == response
+        expected = get_response(200)
+        expected["body"]["databases"] = {"db1": "succeeded"}
+        assert expected == response
 
     def test_call_start_worker_unsuccessful(self, database_manager: DatabaseManager):
         """Test start worker unsuccessful."""
@@ -613,7 +641,9 @@ class TestDatabaseManager:
         body: Dict = {}
         response = database_manager._call_start_worker(body)
 
-        assert get_response(400) == response
+        expected = get_response(400)
+        expected["body"]["databases"] = {"db1": "failed"}
+        assert expected == response
 
     def test_call_close_worker_successful(self, database_manager: DatabaseManager):
         """Test stop worker successful."""
@@ -623,7 +653,9 @@ class TestDatabaseManager:
         body: Dict = {}
         response = database_manager._call_close_worker(body)
 
-        assert get_response(200) == response
+        expected = get_response(200)
+        expected["body"]["databases"] = {"db1": "succeeded"}
+        assert expected == response
 
     def test_call_close_worker_unsuccessful(self, database_manager: DatabaseManager):
         """Test close worker unsuccessful."""
@@ -633,7 +665,9 @@ class TestDatabaseManager:
         body: Dict = {}
         response = database_manager._call_close_worker(body)
 
-        assert get_response(400) == response
+        expected = get_response(400)
+        expected["body"]["databases"] = {"db1": "failed"}
+        assert expected == response
 
     def test_calls_execute_sql_query(self, database_manager: DatabaseManager) -> None:
         """Test call execute sql query."""
@@ -702,19 +736,75 @@ class TestDatabaseManager:
             "completely_loaded": False,
             "database_representation": {"Gary": "gary_rock_1", "Clark": "clark_rock_1"},
         }
-        fake_database.get_workload_tables_status.return_value = (
-            fake_status_workload_tables
-        )
+        fake_database.get_status_snapshot.return_value = {
+            "value": fake_status_workload_tables,
+            "version": 7,
+            "age": 2000,
+        }
         database_manager._databases = {"fake_db_id": fake_database}
 
         response = database_manager._call_workload_tables_status({})
+        fake_database.get_status_snapshot.assert_called_once_with(
+            "workload_tables_status"
+        )
         assert response["body"]["workload_tables"][0]["id"] == "fake_db_id"
         assert (
             response["body"]["workload_tables"][0]["workload_tables_status"]
             == fake_status_workload_tables
         )
+        assert response["body"]["workload_tables"][0]["version"] == 7
+        assert response["body"]["workload_tables"][0]["age"] == 2000
         assert response["header"]["status"] == 200
 
+    def test_calls_workload_tables_status_leaves_out_failed_databases(
+        self, database_manager: DatabaseManager
+    ) -> None:
+        """Test calls workload status with an unreachable database."""
+        database = fake_database()
+        database.get_status_snapshot.return_value = {
+            "value": [],
+            "version": 1,
+            "age": 0,
+        }
+        unreachable_database = fake_database()
+        unreachable_database.get_status_snapshot.side_effect = Exception()
+        database_manager._databases = {
+            "db1": database,
+            "db2": unreachable_database,
+        }
+
+        response = database_manager._call_workload_tables_status({})
+
+        assert response["header"]["status"] == 200
+        assert response["body"]["workload_tables"] == [
+            {"id": "db1", "workload_tables_status": [], "version": 1, "age": 0}
+        ]
+        assert response["body"]["databases"] == {"db1": "succeeded", "db2": "error"}
+
+    @patch(
+        "hyrisecockpit.database_manager.manager.DatabaseManager._check_if_database_blocked"
+    )
+    def test_load_data_reports_status_of_every_database(
+        self,
+        mocked_check_if_database_blocked: MagicMock,
+        database_manager: DatabaseManager,
+    ) -> None:
+        """Test load data continues on the other databases if one fails."""
+        mocked_check_if_database_blocked.return_value = False
+        failing_database = fake_database()
+        failing_database.load_data.return_value = False
+        database = fake_database()
+        database.load_data.return_value = True
+        database_manager._databases = {"db1": failing_database, "db2": database}
+
+        body: Dict = {"workload_type": "tpch", "scale_factor": 1.0}
+        response = database_manager._call_load_data(body)
+
+        failing_database.load_data.assert_called_once_with(body)
+        database.load_data.assert_called_once_with(body)
+        assert response["header"]["status"] == 400
+        assert response["body"]["databases"] == {"db1": "failed", "db2": "succeeded"}
+
     def test_start_server(self, database_manager: DatabaseManager):
         """Test start server."""
         fake_server = MagicMock()
@@ -0,0 +1,95 @@
+"""Tests for the fan_out module."""
+from threading import Barrier, Event, current_thread
+from typing import Dict
+from unittest.mock import MagicMock
+
+from hyrisecockpit.database_manager.fan_out import (
+    all_succeeded,
+    fan_out,
+    get_statuses,
+)
+
+
+def get_databases(*database_ids: str) -> Dict[str, MagicMock]:
+    """Return mock databases with their ids."""
+    return {database_id: MagicMock() for database_id in database_ids}
+
+
+class TestFanOut:
+    """Tests for the fan-out to all databases."""
+
+    def test_fans_out_to_no_databases(self) -> None:
+        """A fan-out to no databases has no results."""
+        assert fan_out({}, MagicMock(), 4, 1.0) == {}
+
+    def test_returns_results_of_all_databases(self) -> None:
+        """A fan-out returns the result of every database."""
+        databases = get_databases("db1", "db2")
+        databases["db1"].get_detailed_plugins.return_value = {"Compression": []}
+        databases["db2"].get_detailed_plugins.return_value = None
+
+        results = fan_out(
+            databases, lambda database: database.get_detailed_plugins(), 4, 1.0
+        )
+
+        assert results == {
+            "db1": {"status": "succeeded", "result": {"Compression": []}},
+            "db2": {"status": "succeeded", "result": None},
+        }
+        assert all_succeeded(results)
+
+    def test_reports_failed_and_raising_databases(self) -> None:
+        """A database that returns False or raises doesn't fail the others."""
+        databases = get_databases("db1", "db2", "db3")
+        databases["db1"].start_worker.return_value = True
+        databases["db2"].start_worker.return_value = False
+        databases["db3"].start_worker.side_effect = RuntimeError("unreachable")
+
+        results = fan_out(databases, lambda database: database.start_worker(), 4, 1.0)
+
+        assert get_statuses(results) == {
+            "db1": "succeeded",
+            "db2": "failed",
+            "db3": "error",
+        }
+        assert results["db3"]["result"] is None
+        assert not all_succeeded(results)
+
+    def test_leaves_out_databases_that_time_out(self) -> None:
+        """A database that doesn't answer in time is reported as timed out."""
+        databases = get_databases("db1", "db2")
+        release = Event()
+        databases["db1"].get_workload_tables_status.return_value = []
+        databases["db2"].get_workload_tables_status.side_effect = lambda: release.wait()
+
+        results = fan_out(
+            databases, lambda database: database.get_workload_tables_status(), 4, 0.05
+        )
+        release.set()
+
+        assert results == {
+            "db1": {"status": "succeeded", "result": []},
+            "db2": {"status": "timeout", "result": None},
+        }
+
+    def test_calls_databases_concurrently(self) -> None:
+        """All databases are called at the same time."""
+        databases = get_databases("db1", "db2", "db3")
+        barrier = Barrier(3, timeout=1.0)
+
+        def call(database: MagicMock) -> str:
+            barrier.wait()
+            return current_thread().name
+
+        results = fan_out(databases, call, 4, 2.0)
+
+        assert set(get_statuses(results).values()) == {"succeeded"}
+        assert len({result["result"] for result in results.values()}) == 3
+
+    def test_bounds_the_threads(self) -> None:
+        """A fan-out uses at most workers threads."""
+        databases = get_databases("db1", "db2", "db3", "db4")
+
+        results = fan_out(databases, lambda _: current_thread().name, 2, 1.0)
+
+        assert len({result["result"] for result in results.values()}) <= 2
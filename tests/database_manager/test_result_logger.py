@@ -0,0 +1,256 @@
+"""Tests for the result logger module."""
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+from influxdb.exceptions import InfluxDBServerError
+from pytest import fixture
+
+from hyrisecockpit.database_manager.worker.result_logger import (
+    QueryAggregate,
+    ResultLogger,
+)
+
+succesful_query = (1_500_000_000, 5, "tpch", 1.0, "01", "worker_01", True, 7, 1, 9)
+other_succesful_query = (
+    1_700_000_000,
+    15,
+    "tpch",
+    1.0,
+    "01",
+    "worker_01",
+    True,
+    15,
+    2,
+    20,
+)
+failed_query = (10, "worker_01", "select ...", "Error")
+aggregated_query = (
+    1_000_000_000,
+    "tpch",
+    1.0,
+    "01",
+    "worker_01",
+    True,
+    2,
+    20,
+    5,
+    15,
+    "5:1,15:1",
+    22,
+    "7:1,15:1",
+    3,
+    29,
+)
+
+
+class TestQueryAggregate:
+    """Tests for the QueryAggregate class."""
+
+    def test_adds_latencies(self) -> None:
+        """Test count, sum, min, max and histograms of the aggregate."""
+        aggregate = QueryAggregate()
+        for latency in [20, 5, 15]:
+            aggregate.add(latency, latency + 10, 1, latency + 20)
+
+        assert aggregate.count == 3
+        assert aggregate.latency_sum == 40
+        assert aggregate.latency_min == 5
+        assert aggregate.latency_max == 20
+        assert aggregate.histogram.count == 3
+        assert aggregate.response_time_sum == 70
+        assert aggregate.response_time_histogram.count == 3
+        assert aggregate.queue_wait_time_sum == 3
+        assert aggregate.end_to_end_latency_sum == 100
+
+
+class TestResultLogger:
+    """Tests for the ResultLogger class."""
+
+    @fixture
+    def result_logger(self) -> ResultLogger:
+        """Get a new ResultLogger with a mocked storage cursor."""
+        return ResultLogger(MagicMock(), "worker_01", 3, 2, 60.0)
+
+    def test_aggregates_queries_per_second(self, result_logger: ResultLogger) -> None:
+        """Test queries of the same second and type share an aggregate."""
+        assert result_logger.log_query(succesful_query)
+        assert result_logger.log_query(other_succesful_query)
+        assert result_logger.log_query(
+            (2_100_000_000, 5, "tpch", 1.0, "01", "worker_01", False, 5, 0, 5)
+        )
+
+        assert list(result_logger._aggregates.keys()) == [
+            (1_000_000_000, "tpch", 1.0, "01", True),
+            (2_000_000_000, "tpch", 1.0, "01", False),
+        ]
+        assert (
+            result_logger._aggregates[(1_000_000_000, "tpch", 1.0, "01", True)].count
+            == 2
+        )
+        assert result_logger._succesful_queries == []
+        assert result_logger._oldest_result is not None
+
+    def test_aggregates_late_queries_in_open_second(
+        self, result_logger: ResultLogger
+    ) -> None:
+        """Test queries of an already flushed second go to the open second."""
+        result_logger._open_second = 3_000_000_000
+        result_logger.log_query(succesful_query)
+
+        assert list(result_logger._aggregates.keys()) == [
+            (3_000_000_000, "tpch", 1.0, "01", True)
+        ]
+
+    def test_samples_raw_queries(self) -> None:
+        """Test raw queries are buffered with a sample rate."""
+        result_logger = ResultLogger(MagicMock(), "worker_01", 3, 2, 60.0, 1.0)
+        result_logger.log_query(succesful_query)
+
+        assert result_logger._succesful_queries == [succesful_query]
+
+    def test_drops_results_if_buffer_is_full(self, result_logger: ResultLogger) -> None:
+        """Test results are dropped and counted if the buffer is full."""
+        for second in range(3):
+            result_logger.log_query(
+                (
+                    second * 1_000_000_000,
+                    5,
+                    "tpch",
+                    1.0,
+                    "01",
+                    "worker_01",
+                    True,
+                    5,
+                    0,
+                    5,
+                )
+            )
+
+        assert result_logger.log_query(succesful_query)
+        assert not result_logger.log_query(
+            (9_000_000_000, 5, "tpch", 1.0, "01", "worker_01", True, 5, 0, 5)
+        )
+        assert not result_logger.log_failed_query(failed_query)
+        assert len(result_logger._aggregates) == 3
+        assert result_logger._failed_queries == []
+        assert result_logger._dropped_results == 2
+
+    @patch("hyrisecockpit.database_manager.worker.result_logger.time_ns")
+    def test_takes_aggregates_of_completed_seconds(
+        self, mock_time_ns: MagicMock, result_logger: ResultLogger
+    ) -> None:
+        """Test only aggregates of completed seconds are taken from the buffer."""
+        mock_time_ns.return_value = 2_500_000_000
+        result_logger.log_query(succesful_query)
+        result_logger.log_query(other_succesful_query)
+        result_logger.log_query(
+            (2_100_000_000, 5, "tpch", 1.0, "01", "worker_01", True, 5, 0, 5)
+        )
+
+        assert result_logger._take_aggregates(take_all=False) == [aggregated_query]
+        assert result_logger._open_second == 2_000_000_000
+        assert list(result_logger._aggregates.keys()) == [
+            (2_000_000_000, "tpch", 1.0, "01", True)
+        ]
+
+    @patch("hyrisecockpit.database_manager.worker.result_logger.time_ns")
+    def test_flushes_buffer(
+        self, mock_time_ns: MagicMock, result_logger: ResultLogger
+    ) -> None:
+        """Test flush writes results and statistics."""
+        mock_time_ns.side_effect = [10, 25]
+        mock_log = result_logger._log
+
+        result_logger._flush([aggregated_query], [], [failed_query], 5, 1)
+
+        mock_log.log_aggregated_queries.assert_called_once_with([aggregated_query])
+        mock_log.log_queries.assert_not_called()
+        mock_log.log_failed_queries.assert_called_once_with([failed_query])
+        mock_log.log_result_log_statistics.assert_called_once_with(
+            "worker_01",
+            {
+                "flushed_results": 2,
+                "dropped_results": 1,
+                "failed_flushes": 0,
+                "flush_latency": 15,
+                "buffer_lag": 5,
+            },
+            25,
+        )
+
+    @patch("hyrisecockpit.database_manager.worker.result_logger.time_ns")
+    def test_flushes_connection_statistics(
+        self, mock_time_ns: MagicMock, result_logger: ResultLogger
+    ) -> None:
+        """Test the summed connection statistics are written without results."""
+        mock_time_ns.return_value = 30
+        result_logger.log_connection_statistics({"rollbacks": 1, "retries": 1})
+        result_logger.log_connection_statistics({})
+        result_logger.log_connection_statistics({"rollbacks": 2})
+
+        result_logger._flush(*result_logger._take_buffer(take_all=True))
+
+        result_logger._log.log_connection_statistics.assert_called_once_with(
+            "worker_01", {"rollbacks": 3, "retries": 1}, 30
+        )
+        result_logger._log.log_result_log_statistics.assert_not_called()
+        assert result_logger._connection_statistics == {}
+
+    def test_doesnt_flush_empty_buffer(self, result_logger: ResultLogger) -> None:
+        """Test nothing is written for an empty buffer."""
+        result_logger._flush([], [], [], None, 0)
+
+        result_logger._log.log_aggregated_queries.assert_not_called()
+        result_logger._log.log_result_log_statistics.assert_not_called()
+
+    @patch("hyrisecockpit.database_manager.worker.result_logger.time_ns")
+    def test_counts_failed_flush(
+        self, mock_time_ns: MagicMock, result_logger: ResultLogger
+    ) -> None:
+        """Test results of a failed flush are counted as dropped."""
+        mock_time_ns.side_effect = [10, 25]
+        mock_log = result_logger._log
+        mock_log.log_aggregated_queries.side_effect = InfluxDBServerError("timeout")
+
+        result_logger._flush([aggregated_query], [], [], 5, 0)
+
+        mock_log.log_result_log_statistics.assert_called_once_with(
+            "worker_01",
+            {
+                "flushed_results": 0,
+                "dropped_results": 1,
+                "failed_flushes": 1,
+                "flush_latency": 15,
+                "buffer_lag": 5,
+            },
+            25,
+        )
+
+    def test_flushes_remaining_results_on_close(
+        self, result_logger: ResultLogger
+    ) -> None:
+        """Test the flusher thread writes the remaining results when closed."""
+        result_logger.start()
+        result_logger.log_query(succesful_query)
+        result_logger.close()
+
+        result_logger._log.log_aggregated_queries.assert_called_once()
+        assert not result_logger._thread.is_alive()
+
+    def test_flushes_when_flush_size_is_reached(
+        self, result_logger: ResultLogger
+    ) -> None:
+        """Test the flusher thread wakes up as soon as flush size is reached."""
+        flushed = Event()
+        result_logger._log.log_failed_queries.side_effect = lambda queries: (
+            flushed.set()
+        )
+        result_logger.start()
+        result_logger.log_failed_query(failed_query)
+        result_logger.log_failed_query(failed_query)
+
+        assert flushed.wait(timeout=10.0)
+        result_logger._log.log_failed_queries.assert_called_once_with(
+            [failed_query, failed_query]
+        )
+        result_logger.close()
@@ -0,0 +1,69 @@
+"""Tests for the status_snapshots module."""
+from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.status_snapshots import StatusSnapshots
+
+
+class TestStatusSnapshots:
+    """Tests for the StatusSnapshots class."""
+
+    def test_queries_status_without_snapshot(self) -> None:
+        """A status without a snapshot is queried."""
+        snapshots = StatusSnapshots()
+        get_value = MagicMock(return_value=["region_tpch_1"])
+
+        snapshot = snapshots.get("loaded_tables", get_value)
+
+        get_value.assert_called_once()
+        assert snapshot["value"] == ["region_tpch_1"]
+        assert snapshot["version"] == 1
+        assert snapshot["age"] >= 0
+
+    def test_answers_from_snapshot(self) -> None:
+        """A status with a snapshot isn't queried again."""
+        snapshots = StatusSnapshots()
+        snapshots.refresh("loaded_tables", lambda: ["region_tpch_1"])
+        get_value = MagicMock()
+
+        snapshot = snapshots.get("loaded_tables", get_value)
+
+        get_value.assert_not_called()
+        assert snapshot["value"] == ["region_tpch_1"]
+        assert snapshot["version"] == 1
+
+    def test_refresh_increases_version(self) -> None:
+        """Every refresh stores a new version."""
+        snapshots = StatusSnapshots()
+        snapshots.refresh("detailed_plugins", lambda: None)
+        snapshots.refresh("detailed_plugins", lambda: {"Compression": []})
+
+        snapshot = snapshots.get("detailed_plugins", MagicMock())
+
+        assert snapshot["value"] == {"Compression": []}
+        assert snapshot["version"] == 2
+
+    def test_invalidate_queries_status_again(self) -> None:
+        """An invalidated snapshot is queried on the next read."""
+        snapshots = StatusSnapshots()
+        snapshots.refresh("loaded_tables", lambda: [])
+        snapshots.refresh("detailed_plugins", lambda: None)
+
+        snapshots.invalidate("loaded_tables")
+
+        assert snapshots.get("loaded_tables", lambda: ["a"])["value"] == ["a"]
+        assert snapshots.get("loaded_tables", lambda: ["b"])["version"] == 2
+        assert snapshots.get("detailed_plugins", MagicMock())["version"] == 1
+
+    def test_drops_refresh_invalidated_while_running(self) -> None:
+        """A refresh that ran while its snapshot was invalidated isn't stored."""
+        snapshots = StatusSnapshots()
+
+        def get_outdated_tables():
+            snapshots.invalidate("loaded_tables")
+            return ["outdated"]
+
+        snapshot = snapshots.refresh("loaded_tables", get_outdated_tables)
+
+        assert snapshot["value"] == ["outdated"]
+        assert snapshots.get("loaded_tables", lambda: ["current"])["value"] == [
+            "current"
+        ]
@@ -0,0 +1,131 @@
+"""Tests for the storage_writer module."""
+from threading import Event
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+from influxdb.exceptions import InfluxDBServerError
+from pytest import fixture
+
+from hyrisecockpit.database_manager.storage_writer import StorageWriter
+
+
+def get_point(number: int) -> dict:
+    """Return a point with a number."""
+    return {"measurement": "test", "fields": {"number": number}, "time": number}
+
+
+@fixture
+def mock_client() -> Iterator[MagicMock]:
+    """Patch the Influx client of the writer."""
+    with patch(
+        "hyrisecockpit.database_manager.storage_writer.InfluxDBClient"
+    ) as mock_client_constructor:
+        yield mock_client_constructor.return_value
+
+
+def get_writer(
+    buffer_size: int = 100, flush_size: int = 10, flush_interval: float = 60.0
+) -> StorageWriter:
+    """Return a writer for the database database_id."""
+    return StorageWriter(
+        "host",
+        "port",
+        "user",
+        "password",
+        "database_id",
+        buffer_size,
+        flush_size,
+        flush_interval,
+    )
+
+
+class TestStorageWriter:
+    """Tests for the StorageWriter."""
+
+    def test_uses_one_gzipped_client(self) -> None:
+        """The writer creates the database once on a gzipped client."""
+        with patch(
+            "hyrisecockpit.database_manager.storage_writer.InfluxDBClient"
+        ) as mock_client_constructor:
+            writer = get_writer()
+            writer.start()
+            writer.start()
+            writer.close()
+
+        mock_client_constructor.assert_called_once_with(
+            "host", "port", "user", "password", gzip=True
+        )
+        writer.client.create_database.assert_called_once_with("database_id")
+        writer.client.close.assert_called_once()
+
+    def test_flushes_when_flush_size_is_reached(self, mock_client: MagicMock) -> None:
+        """The writer writes a batch as soon as it holds flush_size points."""
+        flushed = Event()
+        mock_client.write_points.side_effect = lambda *_, **__: flushed.set()
+        writer = get_writer(flush_size=3)
+        writer.start()
+
+        writer.write([get_point(1), get_point(2)])
+        writer.write([get_point(3)])
+
+        assert flushed.wait(1.0)
+        writer.close()
+        first_batch = mock_client.write_points.call_args_list[0]
+        assert first_batch.args[0] == [get_point(1), get_point(2), get_point(3)]
+        assert first_batch.kwargs == {"database": "database_id"}
+
+    def test_flushes_after_flush_interval(self, mock_client: MagicMock) -> None:
+        """The writer writes fewer than flush_size points after the interval."""
+        flushed = Event()
+        mock_client.write_points.side_effect = lambda *_, **__: flushed.set()
+        writer = get_writer(flush_interval=0.01)
+        writer.start()
+
+        writer.write([get_point(1)])
+
+        assert flushed.wait(1.0)
+        writer.close()
+        assert mock_client.write_points.call_args_list[0].args[0] == [get_point(1)]
+
+    def test_flushes_buffered_points_on_close(self, mock_client: MagicMock) -> None:
+        """Closing the writer writes the points that are still buffered."""
+        writer = get_writer()
+        writer.start()
+        writer.write([get_point(1)])
+
+        writer.close()
+
+        mock_client.write_points.assert_called_once_with(
+            [get_point(1)], database="database_id"
+        )
+
+    def test_drops_points_beyond_buffer_size(self, mock_client: MagicMock) -> None:
+        """Points that don't fit into the buffer are dropped and counted."""
+        writer = get_writer(buffer_size=2)
+
+        writer.write([get_point(1), get_point(2), get_point(3)])
+
+        assert writer.get_statistics() == {"dropped_points": 1, "buffered_points": 2}
+
+    def test_logs_its_statistics(self, mock_client: MagicMock) -> None:
+        """After a flush the writer buffers a point with its statistics."""
+        writer = get_writer()
+        writer._flush([get_point(1), get_point(2)])
+
+        point = writer._points[0]
+        assert point["measurement"] == "storage_writer"
+        assert point["fields"]["writes"] == 1
+        assert point["fields"]["written_points"] == 2
+        assert point["fields"]["write_latency"] == point["fields"]["max_write_latency"]
+        assert writer.get_statistics() == {"buffered_points": 1}
+
+    def test_counts_failed_writes(self, mock_client: MagicMock) -> None:
+        """A failing write drops its points without raising."""
+        mock_client.write_points.side_effect = InfluxDBServerError("unavailable")
+        writer = get_writer()
+        writer._flush([get_point(1), get_point(2)])
+
+        fields = writer._points[0]["fields"]
+        assert fields["failed_writes"] == 1
+        assert fields["dropped_points"] == 2
+        assert "written_points" not in fields
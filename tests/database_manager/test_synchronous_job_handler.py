@@ -5,6 +5,7 @@ from unittest.mock import patch
 from pytest import fixture
 
 from hyrisecockpit.cross_platform_support.testing_support import MagicMock
+from hyrisecockpit.database_manager.status_snapshots import StatusSnapshots
 from hyrisecockpit.database_manager.synchronous_job_handler import SynchronousJobHandler
 
 
@@ -19,7 +20,11 @@ class TestSynchronousJobHandler:
         database_id = "Database A"
         workload_drivers = {"tpch": MagicMock()}
         return SynchronousJobHandler(  # type: ignore
-            mock_connection_factory, database_blocked, database_id, workload_drivers
+            mock_connection_factory,
+            database_blocked,
+            database_id,
+            workload_drivers,
+            StatusSnapshots(),
         )
 
     def test_initializing_synchronous_job_handler_correctly(self) -> None:
@@ -30,13 +35,18 @@ class TestSynchronousJobHandler:
         workload_drivers = {"tpch": MagicMock()}
 
         synchronous_job_handler = SynchronousJobHandler(  # type: ignore
-            mock_connection_factory, database_blocked, database_id, workload_drivers
+            mock_connection_factory,
+            database_blocked,
+            database_id,
+            workload_drivers,
+            StatusSnapshots(),
         )
 
         assert synchronous_job_handler._connection_factory == mock_connection_factory
         assert synchronous_job_handler._database_blocked == database_blocked
         assert synchronous_job_handler._database_id == database_id
         assert synchronous_job_handler._workload_drivers == workload_drivers
+        assert isinstance(synchronous_job_handler._status_snapshots, StatusSnapshots)
 
     @patch(
         "hyrisecockpit.database_manager.synchronous_job_handler.get_loaded_tables_in_database_job"
@@ -53,19 +63,62 @@ class TestSynchronousJobHandler:
         )
 
     @patch(
-        "hyrisecockpit.database_manager.synchronous_job_handler.get_workload_tables_status_job"
+        "hyrisecockpit.database_manager.synchronous_job_handler.get_loaded_tables_in_database_job"
+    )
+    def test_gets_loaded_tables_from_snapshot(
+        self,
+        mock_get_loaded_tables_in_database_job: MagicMock,
+        synchronous_job_handler: SynchronousJobHandler,
+    ) -> None:
+        """Test the loaded tables are queried once and then read from the snapshot."""
+        mock_get_loaded_tables_in_database_job.return_value = ["region_tpch_1"]
+
+        assert synchronous_job_handler.get_loaded_tables_in_database() == [
+            "region_tpch_1"
+        ]
+        assert synchronous_job_handler.get_loaded_tables_in_database() == [
+            "region_tpch_1"
+        ]
+        mock_get_loaded_tables_in_database_job.assert_called_once()
+
+    @patch(
+        "hyrisecockpit.database_manager.synchronous_job_handler.workload_tables_status"
+    )
+    @patch(
+        "hyrisecockpit.database_manager.synchronous_job_handler.get_loaded_tables_in_database_job"
     )
     def test_gets_workload_tables_status(
         self,
-        mock_get_workload_tables_status_job: MagicMock,
+        mock_get_loaded_tables_in_database_job: MagicMock,
+        mock_workload_tables_status: MagicMock,
         synchronous_job_handler: SynchronousJobHandler,
     ) -> None:
         """Test gets workload tables status."""
+        mock_get_loaded_tables_in_database_job.return_value = ["region_tpch_1"]
         synchronous_job_handler.get_workload_tables_status()
-        mock_get_workload_tables_status_job.assert_called_once_with(
-            synchronous_job_handler._connection_factory,
-            synchronous_job_handler._workload_drivers,
+        mock_get_loaded_tables_in_database_job.assert_called_once_with(
+            synchronous_job_handler._connection_factory
         )
+        mock_workload_tables_status.assert_called_once_with(
+            ["region_tpch_1"], synchronous_job_handler._workload_drivers
+        )
+
+    @patch(
+        "hyrisecockpit.database_manager.synchronous_job_handler.get_detailed_plugins_job"
+    )
+    def test_returns_status_snapshot(
+        self,
+        mock_get_detailed_plugins_job: MagicMock,
+        synchronous_job_handler: SynchronousJobHandler,
+    ) -> None:
+        """Test a status snapshot has its value, version and age."""
+        mock_get_detailed_plugins_job.return_value = {"Compression": []}
+
+        snapshot = synchronous_job_handler.get_status_snapshot("detailed_plugins")
+
+        assert snapshot["value"] == {"Compression": []}
+        assert snapshot["version"] == 1
+        assert snapshot["age"] >= 0
 
     @patch(
         "hyrisecockpit.database_manager.synchronous_job_handler.get_detailed_plugins_job"
@@ -104,6 +157,25 @@ class TestSynchronousJobHandler:
             synchronous_job_handler._database_blocked,
         )
 
+    @patch(
+        "hyrisecockpit.database_manager.synchronous_job_handler.set_plugin_setting_job"
+    )
+    @patch(
+        "hyrisecockpit.database_manager.synchronous_job_handler.get_detailed_plugins_job"
+    )
+    def test_setting_plugin_setting_invalidates_plugins(
+        self,
+        mock_get_detailed_plugins_job: MagicMock,
+        mock_set_plugin_setting_job: MagicMock,
+        synchronous_job_handler: SynchronousJobHandler,
+    ) -> None:
+        """Test the plug-ins are queried again after a setting changed."""
+        synchronous_job_handler.get_detailed_plugins()
+        synchronous_job_handler.set_plugin_setting("Compression", "MemoryBudget", "1")
+        synchronous_job_handler.get_detailed_plugins()
+
+        assert mock_get_detailed_plugins_job.call_count == 2
+
     @patch(
         "hyrisecockpit.database_manager.synchronous_job_handler.execute_sql_query_job"
     )
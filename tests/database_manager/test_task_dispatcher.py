@@ -0,0 +1,131 @@
+"""Tests for the task_dispatcher module."""
+from collections import deque
+from queue import Empty
+from typing import Deque, Dict, List, Tuple
+from unittest.mock import MagicMock, call
+
+from msgpack import packb
+from pytest import fixture, raises
+from zmq import ROUTER, Context
+
+from hyrisecockpit.database_manager.worker.task_dispatcher import (
+    ZmqTaskQueue,
+    _send_tasks,
+    get_task_endpoint,
+)
+
+
+class TestZmqTaskQueue:
+    """Tests for the ZmqTaskQueue class."""
+
+    @fixture
+    def task_queue(self) -> ZmqTaskQueue:
+        """Get a new ZmqTaskQueue."""
+        return ZmqTaskQueue(get_task_endpoint("test"), 2)
+
+    def test_doesnt_connect_before_first_get(self, task_queue: ZmqTaskQueue) -> None:
+        """Test the socket is created in the task worker process only."""
+        assert task_queue.endpoint.startswith("ipc://")
+        assert task_queue._socket is None
+        assert task_queue.qsize() == 0
+
+    def test_gets_requested_tasks(self, task_queue: ZmqTaskQueue) -> None:
+        """Test tasks are requested with a credit and arrive in order.
+
+        As soon as a batch arrives the next batch is requested.
+        """
+        context = Context()
+        router_socket = context.socket(ROUTER)
+        router_socket.bind(task_queue.endpoint)
+        try:
+            with raises(Empty):
+                task_queue.get(timeout=0.01)
+            identity, credit = router_socket.recv_multipart()
+            assert credit == b"2"
+            router_socket.send_multipart(
+                [identity, packb([{"query": 1}, {"query": 2}])]
+            )
+
+            assert task_queue.get(timeout=10.0) == {"query": 1}
+            assert task_queue.get(block=False) == {"query": 2}
+            with raises(Empty):
+                task_queue.get(block=False)
+            assert router_socket.recv_multipart() == [identity, b"2"]
+            assert not router_socket.poll(10)
+        finally:
+            task_queue.close()
+            router_socket.close()
+            context.term()
+
+    def test_puts_task_back(self, task_queue: ZmqTaskQueue) -> None:
+        """Test a task put back is the next task of the worker."""
+        task_queue._tasks.append({"query": 2})
+        task_queue.put({"query": 1})
+
+        assert task_queue.get(block=False) == {"query": 1}
+        assert task_queue.get(block=False) == {"query": 2}
+
+    def test_gets_partition(self, task_queue: ZmqTaskQueue) -> None:
+        """Test the queue of a partition shares endpoint and length."""
+        partitioned_queue = ZmqTaskQueue(task_queue.endpoint, 2, 3)
+
+        partition = partitioned_queue.get_partition(2)
+
+        assert partition.endpoint == partitioned_queue.endpoint
+        assert partition.length is partitioned_queue.length
+        assert partition.partitions == 3
+        assert partition._identity == b"2"
+
+    def test_gets_queue_length(self, task_queue: ZmqTaskQueue) -> None:
+        """Test the queue length is the one of the dispatcher."""
+        task_queue.length.value = 42
+
+        assert task_queue.qsize() == 42
+
+
+class TestSendTasks:
+    """Tests for sending tasks to the task workers."""
+
+    def test_sends_at_most_credit_tasks(self) -> None:
+        """Test every waiting worker gets at most as many tasks as requested."""
+        router_socket = MagicMock()
+        tasks: List[Deque[Dict]] = [deque({"query": i} for i in range(5))]
+        credits: Deque[Tuple[bytes, int]] = deque(
+            [(b"worker_1", 2), (b"worker_2", 2), (b"worker_3", 2), (b"worker_4", 2)]
+        )
+
+        _send_tasks(router_socket, tasks, credits)
+
+        router_socket.send_multipart.assert_has_calls(
+            [
+                call([b"worker_1", packb([{"query": 0}, {"query": 1}])]),
+                call([b"worker_2", packb([{"query": 2}, {"query": 3}])]),
+                call([b"worker_3", packb([{"query": 4}])]),
+            ]
+        )
+        assert not tasks[0]
+        assert credits == deque([(b"worker_4", 2)])
+
+    def test_keeps_tasks_without_credits(self) -> None:
+        """Test tasks are kept if no worker is waiting."""
+        router_socket = MagicMock()
+        tasks: List[Deque[Dict]] = [deque([{"query": 1}])]
+
+        _send_tasks(router_socket, tasks, deque())
+
+        router_socket.send_multipart.assert_not_called()
+        assert tasks == [deque([{"query": 1}])]
+
+    def test_sends_tasks_of_partition(self) -> None:
+        """Test workers only get the tasks of their partition."""
+        router_socket = MagicMock()
+        tasks: List[Deque[Dict]] = [deque(), deque([{"query": 1}, {"query": 2}])]
+        credits: Deque[Tuple[bytes, int]] = deque([(b"0", 1), (b"1", 1)])
+
+        _send_tasks(router_socket, tasks, credits)
+
+        router_socket.send_multipart.assert_called_once_with(
+            [b"1", packb([{"query": 1}])]
+        )
+        assert tasks == [deque(), deque([{"query": 2}])]
+        assert credits == deque([(b"0", 1)])
@@ -0,0 +1,57 @@
+"""Tests for the task_router module."""
+from hyrisecockpit.database_manager.worker.task_router import (
+    PartitionedTaskQueue,
+    TaskRouter,
+)
+
+
+class TestTaskRouter:
+    """Tests for the TaskRouter class."""
+
+    def test_routes_warehouse_to_same_partition(self) -> None:
+        """Test the tasks of a warehouse always get the same partition."""
+        task_router = TaskRouter(3)
+
+        partitions = [
+            task_router.route({"warehouse": warehouse})
+            for warehouse in (1, 2, 3, 4, 5, 1, 4)
+        ]
+
+        assert partitions == [0, 1, 2, 0, 1, 0, 0]
+
+    def test_routes_tasks_without_warehouse_round_robin(self) -> None:
+        """Test tasks without a home warehouse are spread over all partitions."""
+        task_router = TaskRouter(3)
+
+        partitions = [task_router.route({"query_type": "01"}) for _ in range(4)]
+
+        assert partitions == [0, 1, 2, 0]
+
+
+class TestPartitionedTaskQueue:
+    """Tests for the PartitionedTaskQueue class."""
+
+    def test_puts_tasks_into_partition(self) -> None:
+        """Test tasks are put into the queue of their partition."""
+        task_queue = PartitionedTaskQueue(2)
+
+        task_queue.put({"warehouse": 2})
+        task_queue.put({"warehouse": 4})
+        task_queue.put({"warehouse": 1})
+
+        assert task_queue.get_partition(1).get(timeout=1) == {"warehouse": 2}
+        assert task_queue.get_partition(1).get(timeout=1) == {"warehouse": 4}
+        assert task_queue.get_partition(0).get(timeout=1) == {"warehouse": 1}
+        task_queue.close()
+
+    def test_gets_queue_length(self) -> None:
+        """Test the queue length covers all partitions."""
+        task_queue = PartitionedTaskQueue(2)
+
+        task_queue.put({"warehouse": 1})
+        task_queue.put({"warehouse": 2})
+
+        while task_queue.qsize() < 2:
+            pass
+        assert task_queue.qsize() == 2
+        task_queue.close()
@@ -1,5 +1,6 @@
 """Tests for the worker module."""
-from multiprocessing import Queue
+from multiprocessing import Queue, Value
+from queue import Empty
 from unittest.mock import MagicMock, patch
 
 from psycopg2 import ProgrammingError
@@ -11,31 +12,11 @@ from hyrisecockpit.database_manager.worker.queue_worker import (
 )
 from hyrisecockpit.database_manager.worker.task_worker import (
     execute_queries,
-    log_results,
+    get_task_timings,
+    get_tasks,
+    wait_for_intended_start,
 )
-
-
-class OverloadTime:
-    """Overload int."""
-
-    def __init__(self, val):
-        """Initialize a OverloadTime."""
-        self.val = val
-
-    def __sub__(self, other):
-        """Overload subtraction."""
-        return self.val + other
-
-    def __int__(self):
-        """Overload int."""
-        return self.val
-
-    def __lt__(self, other):
-        """Overload comparison."""
-        if int(other) < int(self.val):
-            return False
-        else:
-            return True
+from hyrisecockpit.workload_codec import encode
 
 
 class LoopDone(Exception):
@@ -47,14 +28,24 @@ class LoopDone(Exception):
 class TestQueueWorker:
     """Tests for queue worker."""
 
+    @patch("hyrisecockpit.database_manager.worker.queue_worker.time_ns", lambda: 42)
     def test_handle_published_date(self) -> None:
         """Test handle of published data."""
         fake_data = {}  # type: ignore
         fake_data["body"] = {}
-        fake_data["body"]["querylist"] = ["query a"]
+        fake_data["body"]["querylist"] = [{"query": "a"}]
         fake_queue = Queue()  # type: ignore
         handle_published_data(fake_data, fake_queue)
-        assert fake_queue.get() == "query a"
+        assert fake_queue.get() == {"query": "a", "enqueuedts": 42}
+
+    def test_handle_published_data_shares_target_throughput(self) -> None:
+        """Test the targeted throughput of a published chunk is shared."""
+        target_throughput = Value("d", 0.0)
+        fake_data = {"body": {"querylist": [], "target_throughput": 125.5}}
+
+        handle_published_data(fake_data, Queue(), target_throughput)  # type: ignore
+
+        assert target_throughput.value == 125.5
 
     @patch("hyrisecockpit.database_manager.worker.queue_worker.handle_published_data")
     @patch("hyrisecockpit.database_manager.worker.queue_worker.SUB")
@@ -65,7 +56,7 @@ class TestQueueWorker:
     ) -> None:
         """Test of fill queue worker."""
         mock_socket = MagicMock()
-        mock_socket.recv_json.return_value = ["publish_data"]
+        mock_socket.recv_multipart.return_value = encode(["publish_data"], "json")
         mock_context_obj = MagicMock()
         mock_context_obj.socket.return_value = mock_socket
         mock_context.return_value = mock_context_obj
@@ -90,7 +81,9 @@ class TestQueueWorker:
             pass
 
         mock_worker_wait_for_exit_event.wait.assert_not_called()
-        mock_handle_published_data.assert_called_once_with(["publish_data"], task_queue)
+        mock_handle_published_data.assert_called_once_with(
+            ["publish_data"], task_queue, None
+        )
 
     @patch("hyrisecockpit.database_manager.worker.queue_worker.handle_published_data")
     @patch("hyrisecockpit.database_manager.worker.queue_worker.SUB")
@@ -101,7 +94,7 @@ class TestQueueWorker:
     ) -> None:
         """Test of fill queue worker with unset continue execution flag."""
         mock_socket = MagicMock()
-        mock_socket.recv_json.return_value = ["publish_data"]
+        mock_socket.recv_multipart.return_value = encode(["publish_data"], "json")
         mock_context_obj = MagicMock()
         mock_context_obj.socket.return_value = mock_socket
         mock_context.return_value = mock_context_obj
@@ -132,22 +125,63 @@ class TestQueueWorker:
 class TestTaskWorker:
     """Tests for task worker."""
 
-    def test_log_of_results(self) -> None:
-        """Test log of results."""
-        mock_storage_curser = MagicMock()
-        succesful_queries = [
-            (10, 5, "tpch", 1.0, "01", "worker_01", True),
-            (10, 5, "tpch", 1.0, "02", "worker_02", True),
-        ]
-        failed_queries = [(10, "worker_03", "select ...", "Error")]
-        log_results(mock_storage_curser, succesful_queries, failed_queries)
-        mock_storage_curser.log_queries.assert_called_once_with(succesful_queries)
-        mock_storage_curser.log_failed_queries.assert_called_once_with(failed_queries)
+    def test_gets_batch_of_tasks(self) -> None:
+        """Test get tasks takes at most max tasks from the queue."""
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = ["task a", "task b", "task c"]
+
+        tasks = get_tasks(mock_queue, 2, 0.1)
+
+        assert tasks == ["task a", "task b"]
+        mock_queue.get.assert_any_call(block=True, timeout=0.1)
+        mock_queue.get.assert_called_with(block=False)
+
+    def test_gets_partial_batch_of_tasks(self) -> None:
+        """Test get tasks stops at an empty queue."""
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = ["task a", Empty()]
+
+        assert get_tasks(mock_queue, 10, 0.1) == ["task a"]
+
+    def test_gets_no_tasks_on_timeout(self) -> None:
+        """Test get tasks returns an empty list if the queue stays empty."""
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = Empty()
+
+        assert get_tasks(mock_queue, 10, 0.1) == []
+        mock_queue.get.assert_called_once_with(block=True, timeout=0.1)
+
+    @patch("hyrisecockpit.database_manager.worker.task_worker.sleep")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.time_ns", lambda: 100)
+    def test_waits_for_intended_start(self, mock_sleep: MagicMock) -> None:
+        """Test a task worker waits until the intended start of a task."""
+        wait_for_intended_start({"startts": 500_000_100})
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch("hyrisecockpit.database_manager.worker.task_worker.sleep")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.time_ns", lambda: 100)
+    def test_doesnt_wait_for_late_tasks(self, mock_sleep: MagicMock) -> None:
+        """Test late tasks and tasks without start time start immediately."""
+        wait_for_intended_start({"startts": 50})
+        wait_for_intended_start({})
+
+        mock_sleep.assert_not_called()
+
+    def test_gets_task_timings(self) -> None:
+        """Test response time, queue wait time and end-to-end latency of a task."""
+        task = {"generatedts": 5, "enqueuedts": 8, "startts": 10}
+
+        assert get_task_timings(task, 20, 100, 30) == (90, 12, 95)
+
+    def test_gets_task_timings_without_stamps(self) -> None:
+        """Test the timings of a task without stamps fall back to the latency."""
+        assert get_task_timings({}, 20, 100, 30) == (30, 0, 30)
 
     @patch("hyrisecockpit.database_manager.worker.task_worker.StorageCursor")
-    @patch("hyrisecockpit.database_manager.worker.task_worker.Thread")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.ResultLogger")
     def test_execute_queries_with_unset_continue_execution_flag(
-        self, mock_log_results: MagicMock, mock_storage_cursor: MagicMock
+        self, mock_result_logger: MagicMock, mock_storage_cursor: MagicMock
     ) -> None:
         """Test execute queries if continues execution flag is not set."""
         mock_pool_curser = MagicMock()
@@ -182,16 +216,16 @@ class TestTaskWorker:
         mock_worker_wait_for_exit_event.wait.assert_called_once()
 
     @patch("hyrisecockpit.database_manager.worker.task_worker.StorageCursor")
-    @patch("hyrisecockpit.database_manager.worker.task_worker.Thread")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.ResultLogger")
     @patch("hyrisecockpit.database_manager.worker.task_worker.time_ns")
     def test_execute_queries(
         self,
         mock_time_ns: MagicMock,
-        mock_thread: MagicMock,
+        mock_result_logger: MagicMock,
         mock_storage_cursor: MagicMock,
     ) -> None:
         """Test execute queries if continues execution flag is not set."""
-        mock_time_ns.return_value = OverloadTime(0)  # type: ignore
+        mock_time_ns.return_value = 0
         worker_id = "worker_id"
         database_id = "database_id"
         mock_pool_cursor = MagicMock()
@@ -206,7 +240,7 @@ class TestTaskWorker:
         )
         mock_workload_driver = MagicMock()
         mock_workload_driver.execute_task.return_value = (1, 1, 1.0, "01", True)
-        mock_thread.side_effect = MagicMock(side_effect=LoopDone)
+        mock_result_logger.return_value.log_query.side_effect = LoopDone
         task = {"benchmark": "tpch"}
         workload_drivers = {"tpch": mock_workload_driver}
         fake_queue = Queue()  # type: ignore
@@ -227,18 +261,61 @@ class TestTaskWorker:
         mock_workload_driver.execute_task.assert_called_once_with(
             task, mock_pool_cursor, worker_id
         )
+        mock_result_logger.assert_called_once()
+        mock_result_logger.return_value.start.assert_called_once()
+        mock_result_logger.return_value.log_query.assert_called_once_with(
+            (1, 1, "tpch", 1.0, "01", worker_id, True, 1, 0, 1)
+        )
+
+    @patch("hyrisecockpit.database_manager.worker.task_worker.StorageCursor")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.ResultLogger")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.time_ns")
+    def test_execute_queries_logs_connection_statistics(
+        self,
+        mock_time_ns: MagicMock,
+        mock_result_logger: MagicMock,
+        mock_storage_cursor: MagicMock,
+    ) -> None:
+        """Test the connection statistics are logged after every batch of tasks."""
+        mock_time_ns.return_value = 0
+        mock_pool_cursor = MagicMock()
+        mock_pool_cursor.take_statistics.return_value = {"rollbacks": 1}
+        mock_continue_execution_flag = MagicMock()
+        mock_continue_execution_flag.value = True
+        mock_workload_driver = MagicMock()
+        mock_workload_driver.execute_task.return_value = (1, 1, 1.0, "01", False)
+        mock_result_logger.return_value.log_connection_statistics.side_effect = LoopDone
+        fake_queue = Queue()  # type: ignore
+        fake_queue.put({"benchmark": "tpcc"})
+        try:
+            execute_queries(
+                "worker_id",
+                fake_queue,
+                mock_pool_cursor,
+                mock_continue_execution_flag,
+                "database_id",
+                MagicMock(),
+                MagicMock(),
+                {"tpcc": mock_workload_driver},
+            )
+        except LoopDone:
+            pass
+        mock_result_logger.return_value.log_query.assert_called_once()
+        mock_result_logger.return_value.log_connection_statistics.assert_called_once_with(
+            {"rollbacks": 1}
+        )
 
     @mark.parametrize(
         "exception",
         [ProgrammingError(), ValueError()],
     )
     @patch("hyrisecockpit.database_manager.worker.task_worker.StorageCursor")
-    @patch("hyrisecockpit.database_manager.worker.task_worker.Thread")
+    @patch("hyrisecockpit.database_manager.worker.task_worker.ResultLogger")
     @patch("hyrisecockpit.database_manager.worker.task_worker.time_ns")
     def test_execute_task_if_programming_error_occurs(
         self,
         mock_time_ns: MagicMock,
-        mock_thread: MagicMock,
+        mock_result_logger: MagicMock,
         mock_storage_cursor: MagicMock,
         exception,
     ) -> None:
@@ -248,7 +325,7 @@ class TestTaskWorker:
             """Throw exception."""
             raise exception
 
-        mock_time_ns.return_value = OverloadTime(0)  # type: ignore
+        mock_time_ns.return_value = 0
         worker_id = "worker_id"
         database_id = "database_id"
         mock_pool_curser = MagicMock()
@@ -266,7 +343,7 @@ class TestTaskWorker:
         )
         mock_workload_driver = MagicMock()
         mock_workload_driver.execute_task.side_effect = raise_exception
-        mock_thread.side_effect = MagicMock(side_effect=LoopDone)
+        mock_result_logger.return_value.log_failed_query.side_effect = LoopDone
         task = {"benchmark": "tpch"}
         workload_drivers = {"tpch": mock_workload_driver}
         fake_queue = Queue()  # type: ignore
@@ -287,4 +364,4 @@ class TestTaskWorker:
         mock_workload_driver.execute_task.assert_called_once_with(
             task, mock_pool_curser, worker_id
         )
-        mock_thread.assert_called_once()
+        mock_result_logger.return_value.log_failed_query.assert_called_once()
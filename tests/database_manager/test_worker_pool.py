@@ -9,8 +9,14 @@ from sys import platform
 from typing import List, Optional
 from unittest.mock import MagicMock, patch
 
-from pytest import fixture, mark
-
+from pytest import fixture, mark, raises
+
+from hyrisecockpit.database_manager.worker.queue_worker import fill_queue
+from hyrisecockpit.database_manager.worker.task_dispatcher import (
+    ZmqTaskQueue,
+    dispatch_tasks,
+)
+from hyrisecockpit.database_manager.worker.task_router import PartitionedTaskQueue
 from hyrisecockpit.database_manager.worker_pool import WorkerPool
 
 database_blocked_value: Value = Value("b", False)
@@ -66,6 +72,81 @@ class TestWorkerPool(object):
         if platform.startswith("darwin"):
             assert isinstance(worker_pool._task_queue.queue, QueueType)
 
+    @patch(
+        "hyrisecockpit.database_manager.worker_pool.BackgroundScheduler",
+        get_fake_background_scheduler,
+    )
+    def test_initializes_worker_pool_with_zmq_transport(self) -> None:
+        """Test the zmq transport uses a task queue backed by a dispatcher."""
+        worker_pool = WorkerPool(
+            None,  # type: ignore
+            number_worker,
+            database_id,
+            workload_publisher_url,
+            database_blocked_value,
+            mock_drivers,
+            "zmq",
+        )
+
+        assert isinstance(worker_pool._task_queue, ZmqTaskQueue)
+        assert database_id in worker_pool._task_queue.endpoint
+
+    def test_doesnt_initialize_worker_pool_with_unknown_transport(self) -> None:
+        """Test an unknown task transport raises an error."""
+        with raises(ValueError):
+            WorkerPool(
+                None,  # type: ignore
+                number_worker,
+                database_id,
+                workload_publisher_url,
+                database_blocked_value,
+                mock_drivers,
+                "carrier_pigeon",
+            )
+
+    @mark.parametrize("task_transport", ["queue", "zmq"])
+    @patch(
+        "hyrisecockpit.database_manager.worker_pool.BackgroundScheduler",
+        get_fake_background_scheduler,
+    )
+    def test_initializes_worker_pool_with_warehouse_scheduling(
+        self, task_transport: str
+    ) -> None:
+        """Test every task worker gets the queue of its own partition."""
+        worker_pool = WorkerPool(
+            None,  # type: ignore
+            3,
+            database_id,
+            workload_publisher_url,
+            database_blocked_value,
+            mock_drivers,
+            task_transport,
+            "warehouse",
+        )
+
+        if task_transport == "queue":
+            assert isinstance(worker_pool._task_queue, PartitionedTaskQueue)
+            assert worker_pool._get_worker_task_queue(
+                1
+            ) is worker_pool._task_queue.get_partition(1)
+        else:
+            assert worker_pool._task_queue.partitions == 3  # type: ignore
+            assert worker_pool._get_worker_task_queue(1)._identity == b"1"  # type: ignore
+
+    def test_doesnt_initialize_worker_pool_with_unknown_scheduling(self) -> None:
+        """Test an unknown task scheduling raises an error."""
+        with raises(ValueError):
+            WorkerPool(
+                None,  # type: ignore
+                number_worker,
+                database_id,
+                workload_publisher_url,
+                database_blocked_value,
+                mock_drivers,
+                "queue",
+                "by_horoscope",
+            )
+
     def test_generation_of_execute_task_worker_done_events(
         self, worker_pool: WorkerPool
     ) -> None:
@@ -129,6 +210,19 @@ class TestWorkerPool(object):
         """Check if enough processes of type process are generated."""
         process: Process = worker_pool._generate_fill_task_worker()
         assert type(process) is ProcessType
+        assert process._target is fill_queue  # type: ignore
+
+    def test_generates_dispatcher_as_fill_task_worker(
+        self, worker_pool: WorkerPool
+    ) -> None:
+        """Test the zmq transport fills no queue but dispatches the tasks."""
+        worker_pool._task_transport = "zmq"
+        worker_pool._task_queue = worker_pool._create_task_queue()
+
+        process: Process = worker_pool._generate_fill_task_worker()
+
+        assert process._target is dispatch_tasks  # type: ignore
+        assert process._args[1] is worker_pool._task_queue  # type: ignore
 
     def test_initializes_worker(self, worker_pool: WorkerPool) -> None:
         """Check if nothing get changed while both types of worker exists."""
@@ -412,3 +506,12 @@ class TestWorkerPool(object):
 
         assert type(result) is int
         assert result == 42
+
+    def test_gets_target_throughput(self, worker_pool: WorkerPool) -> None:
+        """Test return of the targeted throughput shared by the fill task worker."""
+        worker_pool._target_throughput.value = 250.0
+
+        process: Process = worker_pool._generate_fill_task_worker()
+
+        assert process._args[4] is worker_pool._target_throughput  # type: ignore
+        assert worker_pool.get_target_throughput() == 250.0
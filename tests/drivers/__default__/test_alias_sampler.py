@@ -0,0 +1,32 @@
+"""Tests for the alias sampler."""
+from collections import Counter
+from random import Random
+
+import numpy as np
+from pytest import approx, mark, raises
+
+from hyrisecockpit.drivers.__default__.alias_sampler import AliasSampler
+
+
+class TestAliasSampler:
+    """Tests for the AliasSampler class."""
+
+    @mark.parametrize("weights", [[1.0, 2.0, 0.0, 5.0], [3.0], [0.1] * 7])
+    def test_samples_with_weights(self, weights) -> None:
+        """Test the scalar and the batch samples follow the weights."""
+        sampler = AliasSampler(weights)
+        samples = {
+            "scalar": sampler.sample(Random(1), 40_000),  # nosec
+            "batch": sampler.sample_batch(np.random.default_rng(1), 40_000),
+        }
+
+        for indices in samples.values():
+            counts = Counter(indices)
+            for index, weight in enumerate(weights):
+                assert counts[index] / 40_000 == approx(weight / sum(weights), abs=0.01)
+
+    @mark.parametrize("weights", [[0.0, 0.0], [], [1.0, -1.0, 1.0]])
+    def test_doesnt_create_sampler_with_invalid_weights(self, weights) -> None:
+        """Test negative weights and weights without a positive one are rejected."""
+        with raises(ValueError):
+            AliasSampler(weights)
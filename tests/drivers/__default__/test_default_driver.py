@@ -5,6 +5,7 @@ from psycopg2.extensions import AsIs
 from pytest import fixture
 
 from hyrisecockpit.drivers.__default__.driver import DefaultDriver
+from hyrisecockpit.drivers.__default__.query_template import QueryTemplate
 
 
 @fixture
@@ -56,6 +57,38 @@ class TestDefaultDriver:
 
         assert workload == mock_workload
 
+    @patch("hyrisecockpit.drivers.__default__.driver.DefaultWorkload")
+    def test_renders_templates_for_scale_factor(self, mock_default_workload) -> None:
+        """Test the templates of the workload use the tables of the scale factor."""
+        generate_parameters = MagicMock()
+        default_driver = DefaultDriver(
+            "query_path",
+            {0.1: "workload_0_1"},
+            "benchmark",
+            ["table1"],
+            {"q1": QueryTemplate("SELECT * FROM table1_[SF];", generate_parameters)},
+            0.5,
+        )
+
+        default_driver._get_workload_for_scale_factor(0.1)
+
+        _, _, _, templates, fraction = mock_default_workload.call_args[0]
+        assert templates["q1"].query == "SELECT * FROM table1_0_1;"
+        assert templates["q1"].generate_parameters == generate_parameters
+        assert fraction == 0.5
+
+    @patch("hyrisecockpit.drivers.__default__.driver.DefaultWorkload")
+    def test_seeds_workloads(self, mock_default_workload, default_driver) -> None:
+        """Test the present and new workloads are seeded."""
+        present_workload = MagicMock()
+        default_driver._workloads = {0.1: present_workload}
+
+        default_driver.seed(42)
+        default_driver._get_workload_for_scale_factor(1.0)
+
+        present_workload.seed.assert_called_once_with(42)
+        mock_default_workload.return_value.seed.assert_called_once_with(42)
+
     @patch(
         "hyrisecockpit.drivers.__default__.driver.DefaultDriver._get_workload_for_scale_factor"
     )
@@ -180,8 +213,12 @@ class TestDefaultDriver:
         mock_time_ns.return_value = 10
         mock_cursor = MagicMock()
         mock_worker_id = 10
+        mock_workload = MagicMock()
+        mock_workload.get_query.return_value = "SQL query with worker [STREAM_ID];"
+        default_driver._workloads[1.0] = mock_workload
         mock_task = {
-            "query": "SQL query with worker [STREAM_ID];",
+            "variant": 2,
+            "catalog_version": 42,
             "args": [("param1", None), ("param2", None)],
             "query_type": "query_type",
             "scalefactor": 1.0,
@@ -199,3 +236,4 @@ class TestDefaultDriver:
         assert query_type == "query_type"
         assert commited
         assert mock_cursor.execute.called_once_with(expected_query, expected_parameters)
+        mock_workload.get_query.assert_called_once_with("query_type", 2, 42)
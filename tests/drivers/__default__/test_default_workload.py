@@ -1,7 +1,14 @@
 """Tests for default workload."""
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from hyrisecockpit.drivers.__default__.default_workload import DefaultWorkload
+from pytest import raises
+
+from hyrisecockpit.drivers.__default__.default_workload import (
+    BATCH_SAMPLING_SIZE,
+    PARAMETER_POOL_SIZE,
+    DefaultWorkload,
+)
+from hyrisecockpit.drivers.__default__.query_template import QueryTemplate
 from hyrisecockpit.drivers.__default__.task_types import DefaultTask
 
 
@@ -41,7 +48,8 @@ class TestDefaultWorkload:
         tasks = default_workload.get(frequency, weights)
 
         expected_task = DefaultTask(
-            query="query 1",
+            variant=0,
+            catalog_version=default_workload.catalog_version,
             args=None,
             query_type="q1",
             benchmark="benchmark",
@@ -50,3 +58,160 @@ class TestDefaultWorkload:
 
         assert len(tasks) == 1
         assert tasks[0] == expected_task
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_versions_catalog(self, mock_workload_reader) -> None:
+        """Test the catalog version changes with the queries."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"]}
+        default_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+        same_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+        mock_workload_reader.get.return_value = {"q1": ["query 2"]}
+        other_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+
+        assert default_workload.catalog_version == same_workload.catalog_version
+        assert default_workload.catalog_version != other_workload.catalog_version
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_gets_query_from_catalog(self, mock_workload_reader) -> None:
+        """Test a query is resolved by its type and variant."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1", "query 2"]}
+        default_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+        version = default_workload.catalog_version
+
+        assert default_workload.get_query("q1", 1, version) == "query 2"
+        with raises(ValueError):
+            default_workload.get_query("q1", 1, version + 1)
+        with raises(ValueError):
+            default_workload.get_query("q1", 2, version)
+        with raises(ValueError):
+            default_workload.get_query("q2", 0, version)
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_replaces_queries_with_templates(self, mock_workload_reader) -> None:
+        """Test a templated query type gets its query and generated parameters."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1", "query 2"]}
+        template = QueryTemplate("SELECT %s;", MagicMock(return_value=(("a", None),)))
+        default_workload = DefaultWorkload(
+            "benchmark", 1.0, "query_path", {"q1": template}
+        )
+        untemplated_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+
+        tasks = default_workload.get(3, {"q1": 1.0})
+
+        assert default_workload._queries == {"q1": ["SELECT %s;"]}
+        assert default_workload.catalog_version != untemplated_workload.catalog_version
+        assert [task["args"] for task in tasks] == [(("a", None),)] * 3
+        assert [task["variant"] for task in tasks] == [0] * 3
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_repeats_parameters(self, mock_workload_reader) -> None:
+        """Test the repeated parameter fraction reuses generated parameters."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"]}
+        generate_parameters = MagicMock(side_effect=[((i, None),) for i in range(3)])
+        template = QueryTemplate("SELECT %s;", generate_parameters)
+        default_workload = DefaultWorkload(
+            "benchmark", 1.0, "query_path", {"q1": template}, 1.0
+        )
+
+        tasks = default_workload.get(10, {"q1": 1.0})
+
+        generate_parameters.assert_called_once()
+        assert [task["args"] for task in tasks] == [((0, None),)] * 10
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_bounds_parameter_pool(self, mock_workload_reader) -> None:
+        """Test the pool of repeatable parameters doesn't grow unbounded."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"]}
+        generate_parameters = MagicMock(side_effect=lambda rng: ((object(), None),))
+        template = QueryTemplate("SELECT %s;", generate_parameters)
+        default_workload = DefaultWorkload(
+            "benchmark", 1.0, "query_path", {"q1": template}
+        )
+
+        default_workload.get(2 * PARAMETER_POOL_SIZE, {"q1": 1.0})
+
+        assert generate_parameters.call_count == 2 * PARAMETER_POOL_SIZE
+        assert len(default_workload._parameter_sets["q1"]) == PARAMETER_POOL_SIZE
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_generates_same_tasks_with_same_seed(self, mock_workload_reader) -> None:
+        """Test seeded workloads generate the same tasks and parameters."""
+        mock_workload_reader.get.return_value = {
+            "q1": ["query 1", "query 2"],
+            "q2": ["query 3"],
+        }
+        template = QueryTemplate("SELECT %s;", lambda rng: ((rng.random(), None),))
+        weights = {"q1": 1.0, "q2": 1.0, "q3": 1.0}
+        workloads = [
+            DefaultWorkload("benchmark", 1.0, "query_path", {"q3": template}, 0.5)
+            for _ in range(3)
+        ]
+        workloads[0].get(50, weights)
+        workloads[0].seed(42)
+        workloads[1].seed(42)
+        workloads[2].seed(43)
+
+        tasks = [workload.get(100, weights) for workload in workloads]
+
+        assert tasks[0] == tasks[1]
+        assert tasks[0] != tasks[2]
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_weights_query_types_by_name(self, mock_workload_reader) -> None:
+        """Test query types without a weight aren't drawn."""
+        mock_workload_reader.get.return_value = {
+            "q1": ["query 1"],
+            "README.md": ["not a query"],
+            "q2": ["query 2", "query 3"],
+        }
+        default_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+
+        scalar_tasks = default_workload.get(BATCH_SAMPLING_SIZE - 1, {"q2": 1.0})
+        batch_tasks = default_workload.get(BATCH_SAMPLING_SIZE, {"q2": 1.0})
+
+        for tasks in (scalar_tasks, batch_tasks):
+            assert {task["query_type"] for task in tasks} == {"q2"}
+            assert {task["variant"] for task in tasks} == {0, 1}
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_keeps_sampler_until_weights_change(self, mock_workload_reader) -> None:
+        """Test the alias table is only rebuilt for other weights."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"], "q2": ["query 2"]}
+        default_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+        weights = {"q1": 1.0, "q2": 1.0}
+
+        default_workload.get(1, weights)
+        sampler = default_workload._sampler
+        default_workload.get(1, dict(weights))
+        kept_sampler = default_workload._sampler
+        default_workload.get(1, {"q1": 1.0, "q2": 2.0})
+
+        assert kept_sampler is sampler
+        assert default_workload._sampler is not sampler
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_doesnt_change_templates(self, mock_workload_reader) -> None:
+        """Test changing a generated task doesn't change the following ones."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"]}
+        default_workload = DefaultWorkload("benchmark", 1.0, "query_path")
+
+        task = default_workload.get(1, {"q1": 1.0})[0]
+        task["generatedts"] = 42  # type: ignore
+        tasks = default_workload.get(BATCH_SAMPLING_SIZE, {"q1": 1.0})
+
+        assert all("generatedts" not in task for task in tasks)
+
+    @patch("hyrisecockpit.drivers.__default__.default_workload.WorkloadReader")
+    def test_generates_same_batch_with_same_seed(self, mock_workload_reader) -> None:
+        """Test seeded workloads draw the same batch of tasks with NumPy."""
+        mock_workload_reader.get.return_value = {"q1": ["query 1"], "q2": ["query 2"]}
+        weights = {"q1": 1.0, "q2": 3.0}
+        workloads = [DefaultWorkload("benchmark", 1.0, "query_path") for _ in range(3)]
+        workloads[0].seed(42)
+        workloads[1].seed(42)
+        workloads[2].seed(43)
+
+        tasks = [workload.get(BATCH_SAMPLING_SIZE, weights) for workload in workloads]
+
+        assert tasks[0] == tasks[1]
+        assert tasks[0] != tasks[2]
@@ -71,3 +71,16 @@ class TestWorkload:
         assert worklaod.weights == {"01": 2, "02": 1}
         assert worklaod.frequency == 0
         assert worklaod.scale_factor == 0
+
+    def test_update_workload_with_seed(self) -> None:
+        """Test an update with a seed seeds the driver and only then."""
+        mock_driver = MagicMock()
+        worklaod = Workload(mock_driver)  # type: ignore
+
+        worklaod.update(1.0, 200, {}, 42)
+        worklaod.update(1.0, 300, {})
+
+        assert worklaod.seed == 42
+        mock_driver.seed.assert_called_once_with(42)
+        worklaod.reset()
+        assert worklaod.seed is None
@@ -0,0 +1,211 @@
+"""Tests for the vectorized TPC-C parameter generator."""
+import random
+from typing import Dict, List
+
+import numpy as np
+from msgpack import packb
+from pytest import fixture, mark
+
+import hyrisecockpit.drivers.tpcc.constants as constants
+from hyrisecockpit.drivers.tpcc.batch_parameter_generator import (
+    TPCCBatchParameterGenerator,
+)
+from hyrisecockpit.drivers.tpcc.parameter_generator import (  # type: ignore
+    TPCCParameterGenerator,
+)
+from hyrisecockpit.drivers.tpcc.util import nurand, rand  # type: ignore
+
+TRANSACTIONS = 20_000
+WEIGHTS = {
+    "stock_level": 0.2,
+    "delivery": 0.1,
+    "order_status": 0.2,
+    "payment": 0.25,
+    "new_order": 0.25,
+}
+
+
+def _get_values(tasks: List, transaction_type: str, field: str) -> List:
+    values: List = []
+    for task in tasks:
+        if task["transaction_type"] == transaction_type:
+            value = task["args"][field]
+            values += value if isinstance(value, list) else [value]
+    return values
+
+
+def _assert_same_cdf(first: np.ndarray, second: np.ndarray) -> None:
+    """Assert a two-sample Kolmogorov-Smirnov test at a level of 0.001 passes."""
+    support = np.union1d(first, second)
+    first_cdf = np.searchsorted(np.sort(first), support, "right") / len(first)
+    second_cdf = np.searchsorted(np.sort(second), support, "right") / len(second)
+    critical_value = 1.95 * np.sqrt(
+        (len(first) + len(second)) / (len(first) * len(second))
+    )
+    assert np.abs(first_cdf - second_cdf).max() < critical_value
+
+
+def _assert_same_distribution(first: List, second: List) -> None:
+    """Assert two samples of numbers or strings have the same distribution.
+
+    Integers are additionally compared by their lowest bits, which NURand
+    skews.
+    """
+    first_values, second_values = np.array(first), np.array(second)
+    if first_values.dtype.kind not in "iuf":
+        _, codes = np.unique(
+            np.concatenate((first_values, second_values)), return_inverse=True
+        )
+        first_values, second_values = codes[: len(first)], codes[len(first) :]
+    _assert_same_cdf(first_values, second_values)
+    if first_values.dtype.kind in "iu":
+        _assert_same_cdf(first_values % 16, second_values % 16)
+
+
+@fixture(scope="module")
+def transactions() -> Dict[str, List]:
+    """Generate transactions with both generators and the same constants."""
+    nurand_constants = rand.nurandVar
+    rand.setNURand(nurand.NURandC(123, 259, 7911))
+    random.seed(42)
+    scalar = TPCCParameterGenerator(5).generate_transactions(TRANSACTIONS, WEIGHTS)
+    batch = TPCCBatchParameterGenerator(5, seed=42).generate_transactions(
+        TRANSACTIONS, WEIGHTS
+    )
+    rand.setNURand(nurand_constants)
+    return {"scalar": scalar, "batch": batch}
+
+
+class TestTPCCBatchParameterGenerator:
+    """Tests for the TPCCBatchParameterGenerator class."""
+
+    def test_generates_tasks(self, transactions) -> None:
+        """Test tasks have the fields of the scalar generator."""
+        for scalar_task, batch_task in zip(
+            transactions["scalar"], transactions["batch"]
+        ):
+            assert batch_task.keys() == scalar_task.keys()
+            assert batch_task["benchmark"] == "tpcc"
+            assert batch_task["scalefactor"] == 5
+            assert batch_task["warehouse"] == batch_task["args"]["w_id"]
+            assert scalar_task["warehouse"] == scalar_task["args"]["w_id"]
+        first_tasks = {
+            task["transaction_type"]: task for task in transactions["scalar"]
+        }
+        for task in transactions["batch"]:
+            expected = first_tasks[task["transaction_type"]]["args"]
+            assert list(task["args"].keys()) == list(expected.keys())
+        packb(transactions["batch"])
+
+    def test_draws_unique_items(self, transactions) -> None:
+        """Test a new order has distinct items from its warehouse or others."""
+        for task in transactions["batch"]:
+            if task["transaction_type"] != "new_order":
+                continue
+            args = task["args"]
+            ol_cnt = len(args["i_ids"])
+            assert constants.MIN_OL_CNT <= ol_cnt <= constants.MAX_OL_CNT
+            assert len(set(args["i_ids"])) == ol_cnt
+            assert len(args["i_w_ids"]) == len(args["i_qtys"]) == ol_cnt
+            assert all(1 <= i_id <= constants.NUM_ITEMS for i_id in args["i_ids"])
+
+    def test_mixes_transactions_like_scalar_generator(self, transactions) -> None:
+        """Test the transaction types follow the weights."""
+        _assert_same_distribution(
+            [task["transaction_type"] for task in transactions["scalar"]],
+            [task["transaction_type"] for task in transactions["batch"]],
+        )
+
+    @mark.parametrize(
+        "transaction_type,field",
+        [
+            ("delivery", "w_id"),
+            ("delivery", "o_carrier_id"),
+            ("new_order", "w_id"),
+            ("new_order", "d_id"),
+            ("new_order", "c_id"),
+            ("new_order", "i_ids"),
+            ("new_order", "i_qtys"),
+            ("order_status", "d_id"),
+            ("order_status", "c_id"),
+            ("order_status", "c_last"),
+            ("payment", "w_id"),
+            ("payment", "h_amount"),
+            ("payment", "c_w_id"),
+            ("payment", "c_d_id"),
+            ("payment", "c_id"),
+            ("payment", "c_last"),
+            ("stock_level", "threshold"),
+        ],
+    )
+    def test_draws_parameters_like_scalar_generator(
+        self, transactions, transaction_type: str, field: str
+    ) -> None:
+        """Test the parameters have the distribution of the scalar generator."""
+        scalar = _get_values(transactions["scalar"], transaction_type, field)
+        batch = _get_values(transactions["batch"], transaction_type, field)
+        none_shares = [values.count(None) / len(values) for values in (scalar, batch)]
+        assert abs(none_shares[0] - none_shares[1]) < 0.02
+        _assert_same_distribution(
+            [value for value in scalar if value is not None],
+            [value for value in batch if value is not None],
+        )
+
+    def test_draws_order_lines_like_scalar_generator(self, transactions) -> None:
+        """Test the number of order lines has the distribution of the scalar one."""
+        _assert_same_distribution(
+            *(
+                [
+                    len(task["args"]["i_ids"])
+                    for task in tasks
+                    if task["transaction_type"] == "new_order"
+                ]
+                for tasks in transactions.values()
+            )
+        )
+
+    def test_draws_remote_warehouses(self, transactions) -> None:
+        """Test the share of remote warehouses matches the scalar generator.
+
+        The warehouses of the order lines of a new order aren't independent,
+        so they are compared by their share of remote warehouses.
+        """
+        for transaction_type, field, home_field in (
+            ("new_order", "i_w_ids", "w_id"),
+            ("payment", "c_w_id", "w_id"),
+        ):
+            shares = []
+            for tasks in transactions.values():
+                remote = [
+                    value != task["args"][home_field]
+                    for task in tasks
+                    if task["transaction_type"] == transaction_type
+                    for value in (
+                        task["args"][field]
+                        if isinstance(task["args"][field], list)
+                        else [task["args"][field]]
+                    )
+                ]
+                shares.append(sum(remote) / len(remote))
+            assert abs(shares[0] - shares[1]) < 0.01
+
+    def test_generates_same_transactions_with_same_seed(self) -> None:
+        """Test seeded generators draw the same NURand constants and transactions."""
+        nurand_constants = rand.nurandVar
+        runs = []
+        for _ in range(2):
+            generator = TPCCBatchParameterGenerator(5)
+            generator.seed(42)
+            tasks = generator.generate_transactions(1000, WEIGHTS)
+            runs.append(
+                (
+                    vars(rand.nurandVar),
+                    [
+                        (task["transaction_type"], task["args"].get("i_ids"))
+                        for task in tasks
+                    ],
+                )
+            )
+        rand.setNURand(nurand_constants)
+
+        assert runs[0] == runs[1]
@@ -37,7 +37,7 @@ class TestTpccDriver:
         mock_tpcc_parameter_generator_obj = MagicMock()
         mock_tpcc_parameter_generator.return_value = mock_tpcc_parameter_generator_obj
         mock_abspath.return_value = "/abspath"
-        tpcc_driver = TpccDriver()  # type: ignore
+        tpcc_driver = TpccDriver(vectorized_parameters=False)  # type: ignore
         assert tpcc_driver._query_path == "/abspath/workload_generator/workloads"
         assert tpcc_driver._benchmark_type == "tpcc"
         assert tpcc_driver._table_names == [
@@ -55,6 +55,20 @@ class TestTpccDriver:
         assert tpcc_driver._transaction_handler == mock_tpcc_transaction_handler_obj
         assert tpcc_driver._parameter_generator == mock_tpcc_parameter_generator_obj
 
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.TPCCBatchParameterGenerator")
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.TPCCTransactionHandler", MagicMock())
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.abspath", MagicMock())
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.getcwd", MagicMock())
+    def test_inintializes_tpcc_driver_with_vectorized_parameters(
+        self, mock_batch_parameter_generator: MagicMock
+    ) -> None:
+        """Test the driver uses the batch parameter generator."""
+        tpcc_driver = TpccDriver(vectorized_parameters=True)  # type: ignore
+        assert (
+            tpcc_driver._parameter_generator
+            == mock_batch_parameter_generator.return_value
+        )
+
     def test_get_scalefactors(self, tpcc_driver) -> None:
         """Test gets scalefactors."""
         assert tpcc_driver.get_scalefactors() == [5.0]
@@ -94,6 +108,14 @@ class TestTpccDriver:
         )
         mock_parameter_generator.apply_scalefactor.assert_called_once_with(scalefactor)
 
+    def test_seeds(self, tpcc_driver) -> None:
+        """Test seeding seeds the parameter generator."""
+        tpcc_driver._parameter_generator = MagicMock()
+
+        tpcc_driver.seed(42)
+
+        tpcc_driver._parameter_generator.seed.assert_called_once_with(42)
+
     def test_get_table_names(self, tpcc_driver) -> None:
         """Test get table names for workload."""
         scalefactor = 1.0
@@ -163,3 +185,61 @@ class TestTpccDriver:
         response = tpcc_driver.execute_task(task, mock_cursor, "worker_id")
 
         assert expected == response
+        mock_cursor.rollback.assert_called_once()
+        mock_cursor.reset.assert_not_called()
+        mock_cursor.count.assert_not_called()
+
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.time_ns", lambda: 1)
+    def test_execute_task_retries_after_serialization_failure(
+        self, tpcc_driver
+    ) -> None:
+        """Test an aborted transaction is retried and the retry is counted."""
+        tpcc_driver._max_retries = 3
+        mock_cursor = MagicMock()
+        mock_transaction_handler = MagicMock()
+        mock_transaction_handler.execute_transaction.side_effect = [
+            SerializationFailure,
+            SerializationFailure,
+            None,
+        ]
+        tpcc_driver._transaction_handler = mock_transaction_handler
+        task = {"transaction_type": "tpcc", "scalefactor": 1.0, "args": ["parameters"]}
+
+        response = tpcc_driver.execute_task(task, mock_cursor, "worker_id")
+
+        assert response == (1, 0, 1.0, "tpcc", True)
+        assert mock_transaction_handler.execute_transaction.call_count == 3
+        assert mock_cursor.rollback.call_count == 2
+        mock_cursor.count.assert_called_once_with("retries", 2)
+
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.time_ns", lambda: 1)
+    def test_execute_task_reports_abort_after_last_retry(self, tpcc_driver) -> None:
+        """Test a transaction aborted in every attempt is reported as aborted."""
+        tpcc_driver._max_retries = 2
+        mock_cursor = MagicMock()
+        mock_transaction_handler = MagicMock()
+        mock_transaction_handler.execute_transaction.side_effect = SerializationFailure
+        tpcc_driver._transaction_handler = mock_transaction_handler
+        task = {"transaction_type": "tpcc", "scalefactor": 1.0, "args": ["parameters"]}
+
+        response = tpcc_driver.execute_task(task, mock_cursor, "worker_id")
+
+        assert response == (1, 0, 1.0, "tpcc", False)
+        assert mock_transaction_handler.execute_transaction.call_count == 3
+        assert mock_cursor.rollback.call_count == 3
+        mock_cursor.count.assert_called_once_with("retries", 2)
+
+    @patch("hyrisecockpit.drivers.tpcc.tpcc_driver.time_ns", lambda: 1)
+    def test_execute_task_with_prepared_statements(self, tpcc_driver) -> None:
+        """Test transactions with prepared statements are a separate series."""
+        tpcc_driver._prepared_statements = True
+        tpcc_driver._transaction_handler = MagicMock()
+        task = {
+            "transaction_type": "payment",
+            "scalefactor": 1.0,
+            "args": ["parameters"],
+        }
+
+        response = tpcc_driver.execute_task(task, MagicMock(), "worker_id")
+
+        assert response == (1, 0, 1.0, "payment_prepared", True)
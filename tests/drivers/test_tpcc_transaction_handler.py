@@ -0,0 +1,66 @@
+"""Tests for the tpcc transaction handler and query templates."""
+from unittest.mock import MagicMock
+
+from hyrisecockpit.drivers.tpcc.query_template import (
+    get_prepared_queries_for_scale_factor,
+    get_queries_for_scale_factor,
+)
+from hyrisecockpit.drivers.tpcc.transaction_handler import TPCCTransactionHandler
+
+
+class TestQueryTemplate:
+    """Tests for the tpcc query templates."""
+
+    def test_caches_queries_per_scale_factor(self) -> None:
+        """Test the queries of a scale factor are rendered once."""
+        queries = get_queries_for_scale_factor(5.0)
+
+        assert get_queries_for_scale_factor(5.0) is queries
+        assert queries["PAYMENT"]["getWarehouse"].endswith(
+            "FROM warehouse_tpcc_5 WHERE W_ID = %s"
+        )
+
+    def test_gets_prepared_queries(self) -> None:
+        """Test statements are prepared with placeholders and executed with parameters."""
+        queries, prepare_statements = get_prepared_queries_for_scale_factor(5.0)
+
+        assert (
+            "PREPARE tpcc_5_delivery_getCId FROM 'SELECT O_C_ID FROM order_tpcc_5 "
+            "WHERE O_ID = ? AND O_D_ID = ? AND O_W_ID = ?'"
+        ) in prepare_statements
+        assert queries["DELIVERY"]["getCId"] == (
+            "EXECUTE tpcc_5_delivery_getCId (%s, %s, %s)"
+        )
+        assert queries["NEW_ORDER"]["getStockInfo"] == (
+            get_queries_for_scale_factor(5.0)["NEW_ORDER"]["getStockInfo"]
+        )
+        assert len(prepare_statements) == 31
+
+
+class TestTPCCTransactionHandler:
+    """Tests for the TPCCTransactionHandler class."""
+
+    def test_gets_unprepared_queries(self) -> None:
+        """Test nothing is prepared without prepared statements."""
+        handler = TPCCTransactionHandler()
+        cursor = MagicMock()
+
+        queries = handler._get_queries(cursor, 5.0)
+
+        assert queries is get_queries_for_scale_factor(5.0)
+        cursor.execute.assert_not_called()
+
+    def test_prepares_statements_once_per_connection(self) -> None:
+        """Test statements are prepared again only for a new connection."""
+        handler = TPCCTransactionHandler(prepared_statements=True)
+        handler.conn = MagicMock()
+        cursor = MagicMock()
+        queries, prepare_statements = get_prepared_queries_for_scale_factor(5.0)
+
+        assert handler._get_queries(cursor, 5.0) is queries
+        assert handler._get_queries(cursor, 5.0) is queries
+        assert cursor.execute.call_count == len(prepare_statements)
+
+        cursor.connection = MagicMock()
+        handler._get_queries(cursor, 5.0)
+        assert cursor.execute.call_count == 2 * len(prepare_statements)
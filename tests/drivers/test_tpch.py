@@ -1,10 +1,12 @@
 """Tests for tpch driver."""
 from collections import OrderedDict
+from random import Random
 from unittest.mock import MagicMock, patch
 
 from pytest import fixture
 
 from hyrisecockpit.drivers.tpch.tpch_driver import TpchDriver
+from hyrisecockpit.drivers.tpch.tpch_templates import templates
 
 
 class TestTpchDriver:
@@ -52,6 +54,8 @@ class TestTpchDriver:
             tpch_driver._scale_factor_query_path,
             tpch_driver._benchmark_type,
             tpch_driver._table_names,
+            None,
+            0.0,
         )
 
     def test_get_scalefactors(self, tpch_driver) -> None:
@@ -78,6 +82,14 @@ class TestTpchDriver:
             scalefactor, frequency, weights
         )
 
+    def test_seeds(self, tpch_driver) -> None:
+        """Test seeding seeds the default driver."""
+        tpch_driver._default_driver = MagicMock()
+
+        tpch_driver.seed(42)
+
+        tpch_driver._default_driver.seed.assert_called_once_with(42)
+
     def test_get_table_names(self, tpch_driver) -> None:
         """Test get table names for workload."""
         mock_default_driver = MagicMock()
@@ -133,3 +145,10 @@ class TestTpchDriver:
         mock_default_driver.execute_task.assert_called_once_with(
             task, cursor, worker_id
         )
+
+    def test_generates_parameters_for_templates(self) -> None:
+        """Test every template gets a parameter for each of its placeholders."""
+        for template in templates.values():
+            parameters = template.generate_parameters(Random(42))
+            assert template.query.count("%s") == len(parameters)
+            assert all(protocol is None for _, protocol in parameters)
@@ -0,0 +1,69 @@
+"""Tests for the latency histogram module."""
+from pytest import mark
+
+from hyrisecockpit.latency_histogram import (
+    SUB_BUCKETS,
+    LatencyHistogram,
+    get_bucket_bounds,
+    get_bucket_index,
+)
+
+
+class TestLatencyHistogram:
+    """Tests for the LatencyHistogram class."""
+
+    @mark.parametrize("value", [0, 1, SUB_BUCKETS - 1, SUB_BUCKETS, 1000, 10**9])
+    def test_bucket_contains_value(self, value: int) -> None:
+        """Test the bucket of a value contains the value."""
+        lower, upper = get_bucket_bounds(get_bucket_index(value))
+
+        assert lower <= value <= upper
+
+    def test_buckets_are_contiguous(self) -> None:
+        """Test consecutive buckets don't overlap and leave no gaps."""
+        for index in range(1, 20 * SUB_BUCKETS):
+            assert get_bucket_bounds(index - 1)[1] + 1 == get_bucket_bounds(index)[0]
+
+    def test_relative_error_is_bounded(self) -> None:
+        """Test buckets are narrower than 1 / SUB_BUCKETS of their values."""
+        for value in [1_234, 56_789, 1_000_000, 123_456_789]:
+            lower, upper = get_bucket_bounds(get_bucket_index(value))
+            assert (upper - lower) / lower < 1 / SUB_BUCKETS
+
+    def test_gets_percentiles(self) -> None:
+        """Test percentiles are within the histogram precision."""
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value * 1_000)
+
+        percentiles = histogram.get_percentiles([50, 99, 100])
+
+        assert histogram.count == 10_000
+        assert abs(percentiles[50] - 5_000_000) / 5_000_000 < 1 / SUB_BUCKETS
+        assert abs(percentiles[99] - 9_900_000) / 9_900_000 < 1 / SUB_BUCKETS
+        assert abs(percentiles[100] - 10_000_000) / 10_000_000 < 1 / SUB_BUCKETS
+
+    def test_gets_percentile_of_empty_histogram(self) -> None:
+        """Test an empty histogram returns zero."""
+        assert LatencyHistogram().get_percentile(99) == 0
+
+    def test_merges_histograms(self) -> None:
+        """Test merging adds up the bucket counts."""
+        histogram = LatencyHistogram({1: 1, 40: 2})
+
+        histogram.merge(LatencyHistogram({40: 1, 100: 3}))
+
+        assert histogram.buckets == {1: 1, 40: 3, 100: 3}
+        assert histogram.count == 7
+
+    def test_encodes_and_decodes(self) -> None:
+        """Test the string representation round trip."""
+        histogram = LatencyHistogram()
+        for value in [5, 5, 1_000, 123_456]:
+            histogram.record(value)
+
+        encoded = histogram.encode()
+
+        assert encoded.startswith("5:2,")
+        assert LatencyHistogram.decode(encoded).buckets == histogram.buckets
+        assert LatencyHistogram.decode("").count == 0
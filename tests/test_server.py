@@ -1,7 +1,9 @@
 """Tests for the server module."""
+from threading import Event
 from unittest.mock import patch
 
-from pytest import fixture
+from pytest import fixture, raises
+from zmq import LAST_ENDPOINT, REQ
 
 from hyrisecockpit.request import Body
 from hyrisecockpit.response import get_response
@@ -51,3 +53,64 @@ class TestServer:
             "body": {},
         }
         assert get_response(404) == isolated_server._handle_request(request)
+
+    def test_answers_failed_call_with_500(self, isolated_server):
+        """Returns 500 when a call raises and counts the error."""
+
+        def failing_call(body: Body):
+            raise RuntimeError("failed")
+
+        isolated_server._calls = {"call": (failing_call, None)}
+        request = {"header": {"message": "call"}, "body": {}}
+
+        assert get_response(500) == isolated_server._handle_measured_request(request, 0)
+        statistics = isolated_server._call_get_server_statistics({})["body"]["calls"]
+        assert statistics[0]["call"] == "call"
+        assert statistics[0]["errors"] == 1
+
+    def test_doesnt_create_server_with_unknown_concurrency(self):
+        """Raises a ValueError for an unknown concurrency class."""
+        with raises(ValueError):
+            Server("host", "port", {}, concurrency={"call": "parallel"})
+
+    def test_answers_inline_calls_during_offloaded_calls(self):
+        """Answers an inline call while an offloaded call is still running."""
+        release = Event()
+
+        def slow_call(body: Body):
+            release.wait(5)
+            return get_response(200)
+
+        server = Server(
+            "127.0.0.1",
+            "*",
+            {"slow": (slow_call, None), "fast": (call_function, None)},
+            concurrency={"slow": "offloaded"},
+        )
+        endpoint = server._socket.getsockopt_string(LAST_ENDPOINT)
+        clients = [server._context.socket(REQ) for _ in range(2)]
+        for client, call in zip(clients, ["slow", "fast"]):
+            client.connect(endpoint)
+            client.send_json({"header": {"message": call}, "body": {}})
+            assert server._socket.poll(1000)
+            server._receive_request()
+
+        assert clients[1].poll(1000)
+        assert get_response(200) == clients[1].recv_json()
+        assert not clients[0].poll(10)
+        release.set()
+        assert server._responses.poll(1000)
+        server._forward_responses()
+        assert clients[0].poll(1000)
+        assert get_response(200) == clients[0].recv_json()
+        calls = {
+            statistics["call"]: statistics
+            for statistics in server._call_get_server_statistics({})["body"]["calls"]
+        }
+        assert calls["slow"]["concurrency"] == "offloaded"
+        assert calls["fast"]["concurrency"] == "inline"
+        assert calls["slow"]["max_latency"] > calls["fast"]["max_latency"]
+
+        for client in clients:
+            client.close(linger=0)
+        server.close()
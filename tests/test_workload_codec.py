@@ -0,0 +1,42 @@
+"""Tests for the workload_codec module."""
+from pytest import mark, raises
+
+from hyrisecockpit.workload_codec import CODECS, decode, encode
+
+published_data = {
+    "header": {"status": 200, "message": "OK"},
+    "body": {
+        "querylist": [
+            {
+                "benchmark": "tpch",
+                "scalefactor": 0.1,
+                "query_type": "01",
+                "variant": 0,
+                "catalog_version": 42,
+                "args": None,
+                "generatedts": 1_600_000_000_000_000_000,
+            }
+        ]
+    },
+}
+
+
+class TestWorkloadCodec:
+    """Tests for the workload codecs."""
+
+    @mark.parametrize("codec", list(CODECS))
+    def test_encodes_and_decodes(self, codec: str) -> None:
+        """Test data is the same after encoding and decoding."""
+        frames = encode(published_data, codec)
+
+        assert frames[0] == codec.encode()
+        assert decode(frames) == published_data
+
+    def test_decodes_with_codec_of_header(self) -> None:
+        """Test the header decides how a message is decoded."""
+        assert decode([b"json", b'{"body": 1}']) == {"body": 1}
+
+    def test_doesnt_decode_unknown_codec(self) -> None:
+        """Test a message with an unknown codec is rejected."""
+        with raises(ValueError):
+            decode([b"pickle", b""])
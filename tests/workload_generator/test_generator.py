@@ -1,12 +1,16 @@
 """Module for WorkloadGenerator testing."""
 
+from time import sleep
 from unittest.mock import MagicMock, patch
 
-from pytest import fixture
+from pytest import fixture, raises
 
 from hyrisecockpit.drivers.connector import Workload
 from hyrisecockpit.response import get_response
+from hyrisecockpit.workload_codec import decode, encode
 from hyrisecockpit.workload_generator.generator import WorkloadGenerator
+from hyrisecockpit.workload_generator.profile import Profile
+from hyrisecockpit.workload_generator.trace import TraceWriter, read_trace
 
 
 @fixture
@@ -103,6 +107,8 @@ class TestWorkloadGenerator:
                 "supported_scale_factors": [1.0, 2.0],
                 "weights": {"01": 5.0, "02": 5.0},
                 "running": True,
+                "seed": None,
+                "profile": None,
             }
         ]
         assert response["header"] == get_response(200)["header"]
@@ -126,6 +132,8 @@ class TestWorkloadGenerator:
             "scale_factor": 2.0,
             "weights": {"01": 2, "02": 5},
             "running": True,
+            "seed": None,
+            "profile": None,
         }
 
         response = generator._call_get_workload(fake_body)
@@ -203,10 +211,6 @@ class TestWorkloadGenerator:
 
         assert response["header"] == get_response(404)["header"]
 
-    @patch(
-        "hyrisecockpit.workload_generator.generator.shuffle",
-        lambda x: x,
-    )
     def test_get_workload_queries(self, generator: WorkloadGenerator):
         """Test get workload queries."""
         fake_driver_a = MagicMock()
@@ -231,3 +235,358 @@ class TestWorkloadGenerator:
         response = generator._get_workload_queries()  # type: ignore
 
         assert set(expected_queries) == set(response)
+
+    def test_doesnt_create_generator_with_unknown_arrival_process(
+        self,
+        generator_listening: str,
+        generator_port: str,
+        workload_listening: str,
+        workload_pub_port: str,
+    ):
+        """Test an unknown arrival process is rejected."""
+        with raises(ValueError):
+            WorkloadGenerator(
+                generator_listening,
+                generator_port,
+                workload_listening,
+                workload_pub_port,
+                "closed",
+            )
+
+    def test_doesnt_create_generator_with_unknown_codec(
+        self,
+        generator_listening: str,
+        generator_port: str,
+        workload_listening: str,
+        workload_pub_port: str,
+    ):
+        """Test an unknown workload codec is rejected."""
+        with raises(ValueError):
+            WorkloadGenerator(
+                generator_listening,
+                generator_port,
+                workload_listening,
+                workload_pub_port,
+                "burst",
+                "pickle",
+            )
+
+    def test_doesnt_create_generator_with_empty_chunks(
+        self,
+        generator_listening: str,
+        generator_port: str,
+        workload_listening: str,
+        workload_pub_port: str,
+    ):
+        """Test a chunk size below one task is rejected."""
+        with raises(ValueError):
+            WorkloadGenerator(
+                generator_listening,
+                generator_port,
+                workload_listening,
+                workload_pub_port,
+                chunk_size=0,
+            )
+
+    def test_gets_uniform_arrival_offsets(self, generator: WorkloadGenerator):
+        """Test uniform arrivals are evenly spaced within the second."""
+        generator._arrival_process = "uniform"
+
+        assert generator._get_arrival_offsets(4) == [  # type: ignore
+            0,
+            250_000_000,
+            500_000_000,
+            750_000_000,
+        ]
+
+    def test_gets_poisson_arrival_offsets(self, generator: WorkloadGenerator):
+        """Test Poisson arrivals are sorted random offsets within the second."""
+        generator._arrival_process = "poisson"
+
+        offsets = generator._get_arrival_offsets(1000)  # type: ignore
+
+        assert len(offsets) == 1000
+        assert offsets == sorted(offsets)
+        assert all(0 <= offset < 1_000_000_000 for offset in offsets)
+
+    @patch("hyrisecockpit.workload_generator.generator.time_ns", lambda: 42)
+    def test_publishes_tasks_with_intended_start(self, generator: WorkloadGenerator):
+        """Test tasks of an open-loop workload are published with a start time."""
+        generator._arrival_process = "uniform"
+        generator._pub_socket = MagicMock()
+        generator._get_workload_queries = lambda: [{"query": "a"}, {"query": "b"}]  # type: ignore
+
+        generator._generate_workload()  # type: ignore
+
+        response = decode(generator._pub_socket.send_multipart.call_args[0][0])
+        assert response["body"]["querylist"] == [
+            {"query": "a", "generatedts": 42, "startts": 42},
+            {"query": "b", "generatedts": 42, "startts": 500_000_042},
+        ]
+
+    @patch("hyrisecockpit.workload_generator.generator.time_ns", lambda: 42)
+    def test_publishes_burst_without_start_time(self, generator: WorkloadGenerator):
+        """Test tasks of a burst are published without a start time."""
+        generator._pub_socket = MagicMock()
+        generator._get_workload_queries = lambda: [{"query": "a"}]  # type: ignore
+
+        generator._generate_workload()  # type: ignore
+
+        response = decode(generator._pub_socket.send_multipart.call_args[0][0])
+        assert response["body"]["querylist"] == [{"query": "a", "generatedts": 42}]
+
+    def test_publishes_tasks_in_chunks(self, generator: WorkloadGenerator):
+        """Test tasks are published in chunks with sequence numbers."""
+        generator._chunk_size = 2
+        generator._pub_socket = MagicMock()
+
+        generator._publish_chunks([{"query": "a"}, {"query": "b"}, {"query": "c"}], 3.0)  # type: ignore
+
+        bodies = [
+            decode(call_args[0][0])["body"]
+            for call_args in generator._pub_socket.send_multipart.call_args_list
+        ]
+        assert bodies == [
+            {
+                "querylist": [{"query": "a"}, {"query": "b"}],
+                "sequence": 0,
+                "chunks": 2,
+                "target_throughput": 3.0,
+            },
+            {
+                "querylist": [{"query": "c"}],
+                "sequence": 1,
+                "chunks": 2,
+                "target_throughput": 3.0,
+            },
+        ]
+
+    def test_publishes_empty_second_as_one_chunk(self, generator: WorkloadGenerator):
+        """Test a second without tasks is published as one empty chunk."""
+        generator._pub_socket = MagicMock()
+
+        generator._publish_chunks([], 0.0)  # type: ignore
+
+        response = decode(generator._pub_socket.send_multipart.call_args[0][0])
+        assert response["body"] == {
+            "querylist": [],
+            "sequence": 0,
+            "chunks": 1,
+            "target_throughput": 0.0,
+        }
+
+    def test_update_workload_with_seed(self, generator: WorkloadGenerator):
+        """Test an update with a seed seeds the workload and the task mixing."""
+        fake_driver = MagicMock()
+        fake_driver.get_scalefactors.return_value = [2.0]
+        generator._workloads = {"fake_workoad": Workload(fake_driver)}  # type: ignore
+        fake_body = {
+            "workload_type": "fake_workoad",
+            "frequency": 42,
+            "scale_factor": 2.0,
+            "weights": {},
+            "seed": 7,
+        }
+
+        response = generator._call_update_workload(fake_body)
+        first_mix = generator._random.random()
+        generator._call_update_workload(fake_body)
+
+        assert response["body"]["workload"]["seed"] == 7
+        assert generator._random.random() == first_mix
+        assert fake_driver.seed.call_count == 2
+
+    def test_records_trace(self, generator: WorkloadGenerator, tmp_path):
+        """Test the published tasks are recorded until the recording stops."""
+        generator._trace_directory = str(tmp_path / "traces")
+        generator._pub_socket = MagicMock()
+        generator._get_workload_queries = lambda: [{"query": "a"}]  # type: ignore
+
+        response = generator._call_start_trace_recording({"trace_name": "../run"})
+        conflict = generator._call_start_trace_recording({"trace_name": "other"})
+        generator._generate_workload()  # type: ignore
+        generator._call_stop_trace_recording({})
+        generator._generate_workload()  # type: ignore
+
+        assert response["header"] == get_response(200)["header"]
+        assert conflict["header"] == get_response(409)["header"]
+        assert list(read_trace(str(tmp_path / "traces" / "run.trace"))) == [
+            (0, [{"query": "a"}])
+        ]
+        assert generator._pub_socket.send_multipart.call_count == 2
+        assert (
+            generator._call_stop_trace_recording({})["header"]
+            == get_response(404)["header"]
+        )
+
+    def test_replays_trace(self, generator: WorkloadGenerator, tmp_path):
+        """Test a replay publishes the trace instead of the generated workloads."""
+        generator._trace_directory = str(tmp_path)
+        generator._pub_socket = MagicMock()
+        generator._get_workload_queries = MagicMock()  # type: ignore
+        writer = TraceWriter(str(tmp_path / "run.trace"))
+        writer.write(0, [{"query": "a"}])
+        writer.write(60_000_000_000, [{"query": "b"}])
+        writer.close()
+
+        missing = generator._call_start_trace_replay(
+            {"trace_name": "missing", "rate": 1.0}
+        )
+        invalid = generator._call_start_trace_replay({"trace_name": "run", "rate": 0})
+        response = generator._call_start_trace_replay(
+            {"trace_name": "run", "rate": 2.0}
+        )
+        generator._generate_workload()  # type: ignore
+        for _ in range(100):
+            if generator._pub_socket.send_multipart.called:
+                break
+            sleep(0.01)
+        stopped = generator._call_stop_trace_replay({})
+
+        assert missing["header"] == get_response(404)["header"]
+        assert invalid["header"] == get_response(400)["header"]
+        assert response["header"] == get_response(200)["header"]
+        assert response["body"] == {"trace_name": "run", "rate": 2.0}
+        assert stopped["header"] == get_response(200)["header"]
+        generator._get_workload_queries.assert_not_called()
+        response = decode(generator._pub_socket.send_multipart.call_args[0][0])
+        assert response["body"]["querylist"][0]["query"] == "a"
+        assert (
+            generator._call_stop_trace_replay({})["header"]
+            == get_response(404)["header"]
+        )
+
+    def test_update_workload_with_profile(self, generator: WorkloadGenerator):
+        """Test an update with a profile sets it and rejects an invalid one."""
+        fake_driver = MagicMock()
+        fake_driver.get_scalefactors.return_value = [1.0]
+        generator._workloads = {"fake_workoad": Workload(fake_driver)}  # type: ignore
+        fake_body = {
+            "workload_type": "fake_workoad",
+            "frequency": 0,
+            "scale_factor": 1.0,
+            "weights": {},
+            "profile": {"shape": "ramp", "start": 0, "end": 100, "duration": 10},
+        }
+
+        response = generator._call_update_workload(fake_body)
+        invalid = generator._call_update_workload(
+            {**fake_body, "profile": {"shape": "ramp", "start": 0}}
+        )
+
+        assert response["body"]["workload"]["profile"] == {
+            "shape": "ramp",
+            "start": 0.0,
+            "end": 100.0,
+            "duration": 10.0,
+        }
+        assert invalid["header"] == get_response(400)["header"]
+        assert generator._workloads["fake_workoad"].profile is not None
+
+    @patch("hyrisecockpit.workload_generator.generator.time_ns", lambda: 42)
+    def test_publishes_profiled_tasks_in_their_slices(
+        self, generator: WorkloadGenerator
+    ):
+        """Test profiled tasks start in their slice and the target is published."""
+        generator._arrival_process = "uniform"
+        generator._pub_socket = MagicMock()
+        fake_driver = MagicMock()
+        fake_driver.generate.side_effect = lambda scale_factor, frequency, weights: [
+            {"query": "profiled"} for _ in range(frequency)
+        ]
+        constant_driver = MagicMock()
+        constant_driver.generate.return_value = [{"query": "constant"}]
+        profiled = Workload(fake_driver)  # type: ignore
+        profiled.update(
+            1.0,
+            0,
+            {"01": 1.0},
+            profile=Profile(
+                {"shape": "burst", "base": 0, "peak": 20, "period": 1, "duration": 0.2}
+            ),
+        )
+        profiled.running = True
+        constant = Workload(constant_driver)  # type: ignore
+        constant.update(1.0, 1, {})
+        constant.running = True
+        generator._workloads = {"profiled": profiled, "constant": constant}
+
+        generator._generate_workload()  # type: ignore
+
+        fake_driver.generate.assert_called_once_with(1.0, 4, {"01": 1.0})
+        body = decode(generator._pub_socket.send_multipart.call_args[0][0])["body"]
+        assert body["target_throughput"] == 5.0
+        assert [query["startts"] for query in body["querylist"]] == sorted(
+            query["startts"] for query in body["querylist"]
+        )
+        assert sorted(
+            (query["startts"] - 42, query["query"]) for query in body["querylist"]
+        ) == [
+            (0, "constant"),
+            (0, "profiled"),
+            (50_000_000, "profiled"),
+            (100_000_000, "profiled"),
+            (150_000_000, "profiled"),
+        ]
+
+    def test_measures_tick_lateness(self, generator: WorkloadGenerator):
+        """Test late ticks and the ticks missed in between are counted."""
+        for startts in (0, 1_000_000_500, 3_200_000_000):
+            generator._record_tick(startts)  # type: ignore
+
+        statistics = generator._call_get_generator_statistics({})["body"]["generator"]
+
+        assert statistics["tick_lateness"] == 200_000_000
+        assert statistics["missed_ticks"] == 1
+        assert statistics["shards"] == 1
+        assert statistics["shard_statistics"] == []
+
+    @patch("hyrisecockpit.workload_generator.generator.time_ns", lambda: 42)
+    def test_dispatches_orders_to_shards(self, generator: WorkloadGenerator):
+        """Test every tick splits the exact number of tasks between the shards."""
+        fake_driver = MagicMock()
+        fake_driver.get_scalefactors.return_value = [1.0]
+        generator._workloads = {"fake_workoad": Workload(fake_driver)}  # type: ignore
+        generator._call_update_workload(
+            {
+                "workload_type": "fake_workoad",
+                "frequency": 5,
+                "scale_factor": 1.0,
+                "weights": {"01": 1.0},
+                "seed": 3,
+            }
+        )
+        generator._shards = 2
+        generator._shard_processes = [MagicMock(), MagicMock()]
+        generator._shard_ticks = [MagicMock(), MagicMock()]  # type: ignore
+
+        generator._generate_workload()  # type: ignore
+        generator._generate_workload()  # type: ignore
+
+        ticks = [
+            [call[0][0] for call in shard_ticks.put.call_args_list]
+            for shard_ticks in generator._shard_ticks
+        ]
+        assert [[tick["orders"][0]["tasks"] for tick in shard] for shard in ticks] == [
+            [2, 3],
+            [3, 2],
+        ]
+        assert ticks[0][0]["tickts"] == 42
+        assert ticks[0][0]["target_throughput"] == 5
+        assert ticks[1][0]["orders"][0]["seed"] == 3
+        assert ticks[1][0]["orders"][0]["seed_version"] == 1
+        fake_driver.generate.assert_not_called()
+
+    def test_records_forwarded_chunks(self, generator: WorkloadGenerator, tmp_path):
+        """Test the chunks of the shards are recorded with their second."""
+        path = str(tmp_path / "run.trace")
+        generator._trace_writer = TraceWriter(path)
+        response = get_response(200)
+        response["body"]["querylist"] = [{"query": "a", "generatedts": 7}]
+
+        generator._record_chunk(encode(response, "json"))  # type: ignore
+        response["body"]["querylist"] = []
+        generator._record_chunk(encode(response, "json"))  # type: ignore
+        generator._trace_writer.close()
+
+        assert list(read_trace(path)) == [(0, [{"query": "a"}])]
@@ -0,0 +1,85 @@
+"""Tests for the load profiles."""
+from pytest import approx, mark, raises
+
+from hyrisecockpit.workload_generator.profile import SLICES_PER_SECOND, Profile
+
+
+class TestProfile:
+    """Tests for the Profile class."""
+
+    @mark.parametrize(
+        "definition,rates",
+        [
+            (
+                {"shape": "ramp", "start": 100, "end": 300, "duration": 20},
+                {0: 100, 10: 200, 20: 300, 50: 300},
+            ),
+            (
+                {"shape": "step", "start": 100, "step": 50, "interval": 10, "steps": 2},
+                {0: 100, 9.9: 100, 10: 150, 25: 200, 100: 200},
+            ),
+            (
+                {"shape": "sine", "mean": 100, "amplitude": 50, "period": 40},
+                {0: 100, 10: 150, 20: 100, 30: 50},
+            ),
+            (
+                {
+                    "shape": "burst",
+                    "base": 10,
+                    "peak": 500,
+                    "period": 10,
+                    "duration": 2,
+                },
+                {0: 500, 1.9: 500, 2: 10, 9: 10, 10: 500},
+            ),
+        ],
+    )
+    def test_gets_rate_of_shape(self, definition, rates) -> None:
+        """Test the rate of every shape over time."""
+        profile = Profile(definition)
+
+        for elapsed, rate in rates.items():
+            assert profile.get_rate(elapsed) == approx(rate)
+
+    def test_doesnt_get_negative_rate(self) -> None:
+        """Test a sine wave below zero targets no tasks."""
+        profile = Profile({"shape": "sine", "mean": 0, "amplitude": 10, "period": 4})
+
+        assert profile.get_rate(3) == 0.0
+
+    @mark.parametrize(
+        "definition",
+        [
+            {"shape": "square"},
+            {"shape": "ramp", "start": 0, "end": 10},
+            {"shape": "ramp", "start": 0, "end": 10, "duration": 0},
+            {"shape": "burst", "base": 0, "peak": 10, "period": 1, "duration": 2},
+        ],
+    )
+    def test_doesnt_create_invalid_profile(self, definition) -> None:
+        """Test unknown shapes, missing and invalid parameters are rejected."""
+        with raises(ValueError):
+            Profile(definition)
+
+    def test_gets_tasks_per_slice_of_next_second(self) -> None:
+        """Test the tasks of a second follow the rate within it."""
+        profile = Profile(
+            {"shape": "burst", "base": 0, "peak": 100, "period": 2, "duration": 0.5}
+        )
+
+        first_rate, first_counts = profile.next_second()
+        second_rate, second_counts = profile.next_second()
+
+        assert first_rate == approx(50)
+        assert first_counts == [10] * 5 + [0] * 5
+        assert len(first_counts) == SLICES_PER_SECOND
+        assert second_rate == 0
+        assert second_counts == [0] * SLICES_PER_SECOND
+
+    def test_carries_fractions_of_tasks(self) -> None:
+        """Test fractions of tasks add up over the slices and seconds."""
+        profile = Profile({"shape": "ramp", "start": 2.5, "end": 2.5, "duration": 1})
+
+        counts = [sum(profile.next_second()[1]) for _ in range(4)]
+
+        assert counts == [2, 3, 2, 3]
@@ -0,0 +1,108 @@
+"""Tests for the workload generator shards."""
+from multiprocessing import Array
+from unittest.mock import MagicMock, patch
+
+from pytest import mark
+
+from hyrisecockpit.drivers.connector import Workload
+from hyrisecockpit.workload_codec import decode
+from hyrisecockpit.workload_generator.shard import (
+    GeneratorShard,
+    split_order,
+    split_tasks,
+)
+
+shard_path = "hyrisecockpit.workload_generator.shard"
+
+
+class TestSplit:
+    """Tests for splitting the tasks of a second between the shards."""
+
+    @mark.parametrize(
+        "tasks,rotation,shares",
+        [(9, 0, [3, 3, 3]), (10, 0, [4, 3, 3]), (11, 2, [4, 3, 4]), (1, 4, [0, 1, 0])],
+    )
+    def test_splits_tasks(self, tasks, rotation, shares) -> None:
+        """Test the shares add up to the tasks and differ by at most one."""
+        assert split_tasks(tasks, 3, rotation) == shares
+
+    def test_splits_profiled_order(self) -> None:
+        """Test the tasks of every slice are split and add up per shard."""
+        order = {
+            "workload_type": "tpch",
+            "scale_factor": 1.0,
+            "weights": {},
+            "tasks": 5,
+            "slices": [3, 1, 1],
+        }
+
+        orders = split_order(order, 2, 0)  # type: ignore
+
+        assert [shard_order["slices"] for shard_order in orders] == [
+            [2, 0, 1],
+            [1, 1, 0],
+        ]
+        assert [shard_order["tasks"] for shard_order in orders] == [3, 2]
+        assert all(shard_order["workload_type"] == "tpch" for shard_order in orders)
+
+
+class TestGeneratorShard:
+    """Tests for the GeneratorShard class."""
+
+    @patch(f"{shard_path}.Context")
+    @patch(f"{shard_path}.Connector")
+    def get_shard(self, mock_connector, mock_context) -> GeneratorShard:
+        """Return the second of two shards with a fake driver."""
+        fake_driver = MagicMock()
+        fake_driver.generate.side_effect = lambda scale_factor, frequency, weights: [
+            {"query": "a"} for _ in range(frequency)
+        ]
+        mock_connector.get_workload.return_value = {"tpch": Workload(fake_driver)}
+        return GeneratorShard(
+            1, 2, MagicMock(), "url", Array("q", 2), Array("q", 2), "uniform", "json", 2
+        )
+
+    @patch(f"{shard_path}.time_ns", lambda: 1_000)
+    def test_generates_tick(self) -> None:
+        """Test a shard publishes its tasks scheduled from the tick."""
+        shard = self.get_shard()
+        order = {
+            "workload_type": "tpch",
+            "scale_factor": 1.0,
+            "weights": {},
+            "tasks": 3,
+            "slices": None,
+            "seed": 5,
+            "seed_version": 1,
+        }
+
+        shard.generate({"tickts": 400, "target_throughput": 6.0, "orders": [order]})
+        shard.generate({"tickts": 500, "target_throughput": 6.0, "orders": [order]})
+
+        driver = shard._workloads["tpch"].driver
+        driver.seed.assert_called_once_with(11)
+        bodies = [
+            decode(call[0][0])["body"]
+            for call in shard._pub_socket.send_multipart.call_args_list
+        ]
+        assert [body["sequence"] for body in bodies] == [0, 1, 0, 1]
+        assert all(body["target_throughput"] == 6.0 for body in bodies)
+        assert [query["startts"] for query in bodies[0]["querylist"]] == [
+            166_667_066,
+            500_000_400,
+        ]
+        assert bodies[0]["querylist"][0]["generatedts"] == 400
+        assert shard._tick_lateness[1] == 500
+        assert shard._tick_lateness[0] == 0
+
+    def test_runs_until_none(self) -> None:
+        """Test a shard stops on None."""
+        shard = self.get_shard()
+        shard._ticks.get.side_effect = [
+            {"tickts": 0, "target_throughput": 0.0, "orders": []},
+            None,
+        ]
+
+        shard.run()
+
+        shard._pub_socket.send_multipart.assert_called_once()
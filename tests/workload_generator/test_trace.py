@@ -0,0 +1,87 @@
+"""Tests for the workload trace module."""
+from typing import Dict, List
+from unittest.mock import patch
+
+from hyrisecockpit.workload_generator.trace import TraceReplay, TraceWriter, read_trace
+
+
+class TestTrace:
+    """Tests for recording and replaying traces."""
+
+    def test_records_seconds_relative_to_first_second(self, tmp_path) -> None:
+        """Test a trace stores offsets and start times relative to their second."""
+        path = str(tmp_path / "run.trace")
+        writer = TraceWriter(path)
+        writer.write(
+            1_000,
+            [
+                {"query_type": "01", "generatedts": 1_000, "startts": 1_500},
+                {"query_type": "02", "generatedts": 1_000, "args": (("a", None),)},
+            ],
+        )
+        writer.write(1_000_001_000, [])
+        writer.close()
+
+        assert list(read_trace(path)) == [
+            (
+                0,
+                [
+                    {"query_type": "01", "startts": 500},
+                    {"query_type": "02", "args": [["a", None]]},
+                ],
+            ),
+            (1_000_000_000, []),
+        ]
+
+    @patch("hyrisecockpit.workload_generator.trace.time_ns", lambda: 100)
+    def test_replays_at_scaled_rate(self, tmp_path) -> None:
+        """Test a replay stamps the tasks for the scaled offsets of their second."""
+        path = str(tmp_path / "run.trace")
+        writer = TraceWriter(path)
+        writer.write(0, [{"query_type": "01", "startts": 400}])
+        writer.write(1_000, [{"query_type": "02"}])
+        writer.close()
+        published: List[List[Dict]] = []
+
+        replay = TraceReplay(path, 2.0, published.append)
+        replay.run()
+
+        assert published == [
+            [{"query_type": "01", "startts": 300, "generatedts": 100}],
+            [{"query_type": "02", "generatedts": 600}],
+        ]
+
+    def test_stops_replay(self, tmp_path) -> None:
+        """Test a stopped replay doesn't publish the remaining seconds."""
+        path = str(tmp_path / "run.trace")
+        writer = TraceWriter(path)
+        writer.write(0, [{"query_type": "01"}])
+        writer.write(60_000_000_000, [{"query_type": "02"}])
+        writer.close()
+        published: List[List[Dict]] = []
+
+        replay = TraceReplay(path, 1.0, published.append)
+        replay.start()
+        replay.stop()
+
+        assert not replay.is_alive()
+        assert len(published) <= 1
+
+    @patch("hyrisecockpit.workload_generator.trace.time_ns", lambda: 0)
+    def test_replays_records_of_a_second_together(self, tmp_path) -> None:
+        """Test the recorded chunks of one second are published together."""
+        path = str(tmp_path / "run.trace")
+        writer = TraceWriter(path)
+        writer.write(0, [{"query_type": "01"}])
+        writer.write(0, [{"query_type": "02"}])
+        writer.close()
+        published: List[List[Dict]] = []
+
+        TraceReplay(path, 1.0, published.append).run()
+
+        assert published == [
+            [
+                {"query_type": "01", "generatedts": 0},
+                {"query_type": "02", "generatedts": 0},
+            ]
+        ]
@@ -0,0 +1,91 @@
+"""Micro benchmark for the task generation of the default workloads.
+
+Generates the tasks of a second of a benchmark with its default weights,
+once like the former generation that drew the query types with
+random.choices and built every task from scratch, once with the alias table
+and the task templates drawn one by one and once drawn with NumPy at once,
+and reports the tasks per second.
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, Dict, List
+
+import hyrisecockpit.drivers.__default__.default_workload as default_workload_module
+from hyrisecockpit.drivers.__default__.default_workload import DefaultWorkload
+from hyrisecockpit.drivers.__default__.task_types import DefaultTask
+from hyrisecockpit.drivers.connector import Connector
+
+
+def _get_choices(workload: DefaultWorkload) -> Callable[[int, Dict], List]:
+    """Return the former generation of a workload."""
+    queries = workload._queries
+    random = workload._random
+
+    def get(frequency: int, weights: Dict) -> List[DefaultTask]:
+        return [
+            DefaultTask(
+                variant=random.randrange(len(queries[query_type])),
+                catalog_version=workload.catalog_version,
+                args=workload._get_parameters(query_type),
+                query_type=query_type,
+                benchmark=workload._benchmark,
+                scalefactor=workload._scalefactor,
+            )
+            for query_type in random.choices(
+                population=list(queries.keys()),
+                weights=[weights.get(query_type, 0.0) for query_type in queries],
+                k=frequency,
+            )
+        ]
+
+    return get
+
+
+def _get_sampling(workload: DefaultWorkload, batch_size: int) -> Callable:
+    """Return the generation of a workload that batches from batch_size tasks."""
+
+    def get(frequency: int, weights: Dict) -> List[DefaultTask]:
+        default_workload_module.BATCH_SAMPLING_SIZE = batch_size
+        return workload.get(frequency, weights)
+
+    return get
+
+
+def measure_strategy(get: Callable, weights: Dict, tasks: int, runs: int) -> float:
+    """Return the generated tasks per second after a warm-up second."""
+    get(tasks, weights)
+    startts = perf_counter()
+    for _ in range(runs):
+        get(tasks, weights)
+    return tasks * runs / (perf_counter() - startts)
+
+
+def main() -> None:
+    """Run the benchmark for all strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--benchmark", default="job", choices=["tpch", "tpcds", "job"])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = Connector.get_workload_drivers()[args.benchmark]
+    weights = driver.get_default_weights()
+    workload = driver._default_driver._get_workload_for_scale_factor(
+        driver.get_scalefactors()[0]
+    )
+    strategies = {
+        "choices": _get_choices(workload),
+        "alias": _get_sampling(workload, batch_size=2**62),
+        "numpy": _get_sampling(workload, batch_size=0),
+    }
+
+    print(f"{'strategy':<10} {'tasks':>6} {'tasks/s':>12}")
+    for name, get in strategies.items():
+        for tasks in args.tasks:
+            throughput = measure_strategy(get, weights, tasks, args.runs)
+            print(f"{name:<10} {tasks:>6} {throughput:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Micro benchmark for the transport of tasks to the task workers.
+
+Publishes tasks like the workload generator and measures the number of tasks
+per second a pool of workers receives through the multiprocessing queue that is
+filled by the queue worker and through the ZeroMQ task dispatcher.
+"""
+
+import argparse
+from multiprocessing import Event, Process, Value
+from tempfile import gettempdir
+from time import perf_counter, sleep
+from typing import Dict, List, Union
+
+from zmq import PUB, Context
+
+from hyrisecockpit.cross_platform_support.multiprocessing_support import Queue
+from hyrisecockpit.database_manager.worker.queue_worker import fill_queue
+from hyrisecockpit.database_manager.worker.task_dispatcher import (
+    ZmqTaskQueue,
+    dispatch_tasks,
+    get_task_endpoint,
+)
+from hyrisecockpit.database_manager.worker.task_worker import get_tasks
+from hyrisecockpit.response import get_response
+from hyrisecockpit.workload_codec import encode
+
+TRANSPORTS = ("queue", "zmq")
+
+
+def _worker(
+    task_queue: Union[Queue, ZmqTaskQueue], batch_size: int, timeout: float
+) -> None:
+    while True:
+        for task in get_tasks(task_queue, batch_size, timeout):
+            if task.get("stop"):
+                return
+
+
+def _get_messages(tasks: int, tasks_per_message: int, stop_markers: int) -> List:
+    querylist: List[Dict] = [
+        {"benchmark": "no-ops", "query": "SELECT 1;", "args": i} for i in range(tasks)
+    ]
+    querylist.extend({"stop": True} for _ in range(stop_markers))
+    messages = []
+    for i in range(0, len(querylist), tasks_per_message):
+        response = get_response(200)
+        response["body"]["querylist"] = querylist[i : i + tasks_per_message]
+        messages.append(response)
+    return messages
+
+
+def measure_throughput(
+    transport: str,
+    batch_size: int,
+    timeout: float,
+    workers: int,
+    tasks: int,
+    tasks_per_message: int,
+) -> float:
+    """Return the tasks per second the workers receive from the publisher."""
+    publisher_url = f"ipc://{gettempdir()}/hyrisecockpit-benchmark-publisher"
+    context = Context()
+    pub_socket = context.socket(PUB)
+    pub_socket.bind(publisher_url)
+
+    task_queue: Union[Queue, ZmqTaskQueue] = (
+        ZmqTaskQueue(get_task_endpoint("benchmark"), batch_size)
+        if transport == "zmq"
+        else Queue(0)
+    )
+    worker_wait_for_exit_event = Event()
+    worker_wait_for_exit_event.set()
+    # a batch may take several stop markers and a stopped worker may still
+    # have requested a batch, so every worker still gets one
+    messages = _get_messages(tasks, tasks_per_message, 2 * workers * batch_size)
+
+    filler = Process(
+        target=dispatch_tasks if transport == "zmq" else fill_queue,
+        args=(publisher_url, task_queue, Value("b", True), worker_wait_for_exit_event),
+    )
+    processes: List[Process] = [
+        Process(target=_worker, args=(task_queue, batch_size, timeout))
+        for _ in range(workers)
+    ]
+    filler.start()
+    for process in processes:
+        process.start()
+    sleep(1.0)  # let the subscriber and the workers connect
+
+    startts = perf_counter()
+    for message in messages:
+        pub_socket.send_multipart(encode(message, "msgpack"))
+    for process in processes:
+        process.join()
+    throughput = tasks / (perf_counter() - startts)
+
+    filler.terminate()
+    filler.join()
+    pub_socket.close(linger=0)
+    context.term()
+    return throughput
+
+
+def main() -> None:
+    """Run the benchmark for all transports."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--tasks-per-message", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--timeout", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'transport':<10} {'batch':>5} {'tasks/s':>12}")
+    for transport in TRANSPORTS:
+        for batch_size in args.batch_size:
+            throughput = measure_throughput(
+                transport,
+                batch_size,
+                args.timeout,
+                args.workers,
+                args.tasks,
+                args.tasks_per_message,
+            )
+            print(f"{transport:<10} {batch_size:>5} {throughput:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
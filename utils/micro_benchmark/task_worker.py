@@ -0,0 +1,116 @@
+"""Micro benchmark for the dequeue loop of the task workers.
+
+Compares the previous polling loop (non-blocking get that retries on Empty)
+with the blocking, batched dequeue of get_tasks. For every strategy it reports
+the CPU time an idle worker burns and the number of tasks per second a pool of
+workers takes from a pre-filled queue.
+"""
+
+import argparse
+from multiprocessing import Process, Queue
+from queue import Empty
+from resource import RUSAGE_CHILDREN, getrusage
+from time import perf_counter, sleep
+from typing import Callable, Dict, List
+
+from hyrisecockpit.database_manager.worker.task_worker import get_tasks
+
+STOP = "stop"
+
+
+def _polling_loop(task_queue: Queue, batch_size: int, timeout: float) -> None:
+    while True:
+        try:
+            task = task_queue.get(block=False)
+        except Empty:
+            continue
+        if task == STOP:
+            return
+
+
+def _blocking_loop(task_queue: Queue, batch_size: int, timeout: float) -> None:
+    while True:
+        for task in get_tasks(task_queue, batch_size, timeout):
+            if task == STOP:
+                return
+
+
+STRATEGIES: Dict[str, Callable[[Queue, int, float], None]] = {
+    "polling": _polling_loop,
+    "blocking": _blocking_loop,
+}
+
+
+def _children_cpu_time() -> float:
+    usage = getrusage(RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure_idle_cpu(
+    strategy: str, batch_size: int, timeout: float, seconds: float
+) -> float:
+    """Return the CPU seconds per wall second of one worker on an empty queue."""
+    task_queue: Queue = Queue()
+    cpu_time_before = _children_cpu_time()
+    worker = Process(
+        target=STRATEGIES[strategy], args=(task_queue, batch_size, timeout)
+    )
+    worker.start()
+    sleep(seconds)
+    task_queue.put(STOP)
+    worker.join()
+    return (_children_cpu_time() - cpu_time_before) / seconds
+
+
+def measure_dispatch_throughput(
+    strategy: str, batch_size: int, timeout: float, workers: int, tasks: int
+) -> float:
+    """Return the tasks per second a worker pool takes from a filled queue."""
+    task_queue: Queue = Queue()
+    for i in range(tasks):
+        task_queue.put({"benchmark": "no-ops", "query": "SELECT 1;", "args": i})
+    # a batch may take several stop markers, so every worker still gets one
+    for _ in range(workers * batch_size):
+        task_queue.put(STOP)
+    task_queue.cancel_join_thread()
+    sleep(0.5)  # let the feeder thread flush the queue into the pipe
+
+    processes: List[Process] = [
+        Process(target=STRATEGIES[strategy], args=(task_queue, batch_size, timeout))
+        for _ in range(workers)
+    ]
+    startts = perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return tasks / (perf_counter() - startts)
+
+
+def main() -> None:
+    """Run the benchmark for all strategies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--timeout", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'strategy':<10} {'batch':>5} {'idle cpu/worker':>16} {'tasks/s':>12}")
+    for strategy in STRATEGIES:
+        batch_sizes = args.batch_size if strategy == "blocking" else [1]
+        for batch_size in batch_sizes:
+            idle_cpu = measure_idle_cpu(
+                strategy, batch_size, args.timeout, args.seconds
+            )
+            throughput = measure_dispatch_throughput(
+                strategy, batch_size, args.timeout, args.workers, args.tasks
+            )
+            print(
+                f"{strategy:<10} {batch_size:>5} {idle_cpu:>15.1%} {throughput:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
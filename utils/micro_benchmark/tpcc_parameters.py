@@ -0,0 +1,50 @@
+"""Micro benchmark for the TPC-C parameter generation.
+
+Generates TPC-C transactions with the default mix once with the py-tpcc
+generator that draws the parameters transaction by transaction and once with
+the NumPy batch generator and reports the transactions per second.
+"""
+
+import argparse
+from time import perf_counter
+
+from hyrisecockpit.drivers.tpcc.batch_parameter_generator import (
+    TPCCBatchParameterGenerator,
+)
+from hyrisecockpit.drivers.tpcc.parameter_generator import (  # type: ignore
+    TPCCParameterGenerator,
+)
+from hyrisecockpit.drivers.tpcc.tpcc_driver import TpccDriver
+
+GENERATORS = {
+    "scalar": TPCCParameterGenerator,
+    "batch": TPCCBatchParameterGenerator,
+}
+
+
+def measure_generator(generator, transactions: int, runs: int) -> float:
+    """Return the generated transactions per second."""
+    weights = TpccDriver().get_default_weights()
+    startts = perf_counter()
+    for _ in range(runs):
+        generator.generate_transactions(transactions, weights)
+    return transactions * runs / (perf_counter() - startts)
+
+
+def main() -> None:
+    """Run the benchmark for all generators."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, nargs="+", default=[100, 5000])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'generator':<10} {'batch':>6} {'transactions/s':>15}")
+    for name, generator_type in GENERATORS.items():
+        generator = generator_type(5.0)
+        for transactions in args.transactions:
+            throughput = measure_generator(generator, transactions, args.runs)
+            print(f"{name:<10} {transactions:>6} {throughput:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Micro benchmark for the codecs of the workload stream.
+
+Generates a second of TPC-H and TPC-C tasks like the workload generator and
+reports for every codec the time to encode and to decode 10k tasks as well as
+their encoded size.
+"""
+
+import argparse
+from time import perf_counter
+from typing import Dict, List
+
+from hyrisecockpit.drivers.connector import Connector
+from hyrisecockpit.response import get_response
+from hyrisecockpit.workload_codec import CODECS, decode, encode
+
+TASKS_PER_RUN = 10_000
+
+
+def _get_published_data(benchmarks: List[str]) -> Dict:
+    drivers = Connector.get_workload_drivers()
+    querylist: List = []
+    for benchmark in benchmarks:
+        driver = drivers[benchmark]
+        querylist += driver.generate(
+            driver.get_scalefactors()[0],
+            TASKS_PER_RUN // len(benchmarks),
+            driver.get_default_weights(),
+        )
+    for task in querylist:
+        task["generatedts"] = 1_600_000_000_000_000_000
+    published_data = get_response(200)
+    published_data["body"]["querylist"] = querylist
+    return published_data  # type: ignore
+
+
+def measure_codec(codec: str, published_data: Dict, runs: int) -> Dict[str, float]:
+    """Return the milliseconds to encode and decode 10k tasks and their size."""
+    startts = perf_counter()
+    for _ in range(runs):
+        frames = encode(published_data, codec)
+    encode_time = (perf_counter() - startts) / runs
+    startts = perf_counter()
+    for _ in range(runs):
+        decode(frames)
+    decode_time = (perf_counter() - startts) / runs
+    return {
+        "encode": encode_time * 1_000,
+        "decode": decode_time * 1_000,
+        "size": sum(len(frame) for frame in frames) / 1_000,
+    }
+
+
+def main() -> None:
+    """Run the benchmark for all codecs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--benchmarks", nargs="+", default=["tpch", "tpcc"])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    published_data = _get_published_data(args.benchmarks)
+    print(f"{'codec':<8} {'encode ms':>10} {'decode ms':>10} {'size kB':>10}")
+    for codec in CODECS:
+        result = measure_codec(codec, published_data, args.runs)
+        print(
+            f"{codec:<8} {result['encode']:>10.2f} {result['decode']:>10.2f} "
+            f"{result['size']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()